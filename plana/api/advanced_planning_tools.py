@@ -13,9 +13,10 @@ These tools enhance planning assessments to senior case officer standard.
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
-import re
 import math
 
+from plana.documents.patterns import RuleSet, scan_document
+
 
 # =============================================================================
 # 1. CIL / S106 CALCULATOR
@@ -938,6 +939,35 @@ class DocumentAnalysis:
     recommendations: list[str]
 
 
+# Dimension extraction rules, matched against lowercased text
+_DIMENSION_RULES: dict[str, RuleSet] = {
+    "width": RuleSet("dimensions.width", [
+        r"width[:\s]+(\d+\.?\d*)\s*m",
+        r"(\d+\.?\d*)\s*m\s*wide",
+        r"(\d+\.?\d*)\s*x\s*\d+\.?\d*\s*m",
+    ]),
+    "depth": RuleSet("dimensions.depth", [
+        r"depth[:\s]+(\d+\.?\d*)\s*m",
+        r"(\d+\.?\d*)\s*m\s*deep",
+        r"\d+\.?\d*\s*x\s*(\d+\.?\d*)\s*m",
+    ]),
+    "height": RuleSet("dimensions.height", [
+        r"(?:overall\s+)?height[:\s]+(\d+\.?\d*)\s*m",
+        r"(\d+\.?\d*)\s*m\s*(?:high|tall)",
+        r"ridge\s+height[:\s]+(\d+\.?\d*)\s*m",
+    ]),
+    "eaves_height": RuleSet("dimensions.eaves_height", [
+        r"eaves[:\s]+(\d+\.?\d*)\s*m",
+        r"eaves\s+height[:\s]+(\d+\.?\d*)\s*m",
+    ]),
+    "distance_to_boundary": RuleSet("dimensions.distance_to_boundary", [
+        r"(?:distance\s+to\s+)?boundary[:\s]+(\d+\.?\d*)\s*m",
+        r"(\d+\.?\d*)\s*m\s+from\s+boundary",
+        r"set\s+back\s+(\d+\.?\d*)\s*m",
+    ]),
+}
+
+
 def extract_dimensions_from_text(text: str) -> ExtractedDimensions:
     """
     Extract dimensions from plan descriptions or OCR text.
@@ -949,45 +979,14 @@ def extract_dimensions_from_text(text: str) -> ExtractedDimensions:
     - "distance to boundary: 1.0m"
     """
     notes = []
-
-    # Regex patterns for dimension extraction
-    patterns = {
-        "width": [
-            r"width[:\s]+(\d+\.?\d*)\s*m",
-            r"(\d+\.?\d*)\s*m\s*wide",
-            r"(\d+\.?\d*)\s*x\s*\d+\.?\d*\s*m",
-        ],
-        "depth": [
-            r"depth[:\s]+(\d+\.?\d*)\s*m",
-            r"(\d+\.?\d*)\s*m\s*deep",
-            r"\d+\.?\d*\s*x\s*(\d+\.?\d*)\s*m",
-        ],
-        "height": [
-            r"(?:overall\s+)?height[:\s]+(\d+\.?\d*)\s*m",
-            r"(\d+\.?\d*)\s*m\s*(?:high|tall)",
-            r"ridge\s+height[:\s]+(\d+\.?\d*)\s*m",
-        ],
-        "eaves_height": [
-            r"eaves[:\s]+(\d+\.?\d*)\s*m",
-            r"eaves\s+height[:\s]+(\d+\.?\d*)\s*m",
-        ],
-        "distance_to_boundary": [
-            r"(?:distance\s+to\s+)?boundary[:\s]+(\d+\.?\d*)\s*m",
-            r"(\d+\.?\d*)\s*m\s+from\s+boundary",
-            r"set\s+back\s+(\d+\.?\d*)\s*m",
-        ],
-    }
-
     extracted = {}
-    text_lower = text.lower()
+    scan = scan_document(text)
 
-    for dimension, pattern_list in patterns.items():
-        for pattern in pattern_list:
-            match = re.search(pattern, text_lower)
-            if match:
-                extracted[dimension] = float(match.group(1))
-                notes.append(f"Extracted {dimension}: {match.group(1)}m")
-                break
+    for dimension, rules in _DIMENSION_RULES.items():
+        hit = scan.first(rules)
+        if hit and hit.value:
+            extracted[dimension] = float(hit.value)
+            notes.append(f"Extracted {dimension}: {hit.value}m")
 
     # Calculate derived values
     floor_area = None
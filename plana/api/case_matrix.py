@@ -0,0 +1,384 @@
+"""
+Vectorised similarity scoring over a compiled case-feature table.
+
+``CaseMatrix`` holds the rows of a ``CaseFeatureTable`` as NumPy columns and
+scores every case against a compiled query with array operations:
+
+- Location (coordinates, postcode tiers, ward) is computed per row, with a
+  bounding-box prefilter so haversine distances are only evaluated for
+  cases that can be within the 15km decay radius.
+- Type/scale, proposal-feature and constraint components depend only on a
+  few categorical fields, so each row stores a small interned key per
+  component.  Per query, the exact pure-Python component functions from
+  ``similar_cases`` are evaluated once per distinct key and gathered.
+- Temporal decay is precomputed per row once per day, and top-k selection
+  uses ``argpartition`` rather than a full sort.
+
+Results match ``similar_cases._rank_cases_python``, which remains the
+fallback when NumPy is not installed.
+"""
+
+from __future__ import annotations
+
+import copy
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from .similar_cases import (
+    _FEATURE_GROUP_MASKS,
+    _FEATURE_TERM_BITS,
+    _SCORE_THRESHOLD,
+    _case_adjustments,
+    _constraint_score,
+    _is_comparable_features,
+    _type_scale_score,
+)
+
+if TYPE_CHECKING:
+    from .similar_cases import CaseFeatures, CaseFeatureTable
+
+# Optional dependency: vectorised scoring
+_NUMPY_AVAILABLE = False
+
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+_EARTH_RADIUS_KM = 6371.0
+_KM_PER_DEGREE = 111.19
+_DECAY_RADIUS_KM = 15.0
+
+# Sentinel codes: missing values on the case side never equal the
+# "missing" code used on the query side.
+_CASE_MISSING = -1
+_QUERY_MISSING = -2
+
+
+class _Codes:
+    """Interns hashable values to dense integer codes for one matrix."""
+
+    def __init__(self) -> None:
+        self.codes: dict[Any, int] = {}
+        self.representatives: list[Any] = []
+
+    def copy(self) -> "_Codes":
+        codes = _Codes()
+        codes.codes = dict(self.codes)
+        codes.representatives = list(self.representatives)
+        return codes
+
+    def intern(self, value: Any, representative: Any = None) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+            self.representatives.append(representative)
+        return code
+
+    def case(self, value: str | None) -> int:
+        return self.intern(value) if value else _CASE_MISSING
+
+    def query(self, value: str | None) -> int:
+        return self.codes.get(value, _QUERY_MISSING) if value else _QUERY_MISSING
+
+
+def _type_key(f: "CaseFeatures") -> tuple:
+    return (f.app_type_lower, f.app_type_groups, f.dev_type, f.storeys, f.form)
+
+
+def _comparable_key(f: "CaseFeatures") -> tuple:
+    return (f.dev_type, f.green_belt, f.residential, f.commercial)
+
+
+class CaseMatrix:
+    """Columnar NumPy representation of a ``CaseFeatureTable``."""
+
+    def __init__(self, table: "CaseFeatureTable"):
+        self.table = table
+        self.size = 0
+        self._capacity = 0
+
+        self._postcodes = _Codes()
+        self._sectors = _Codes()
+        self._outcodes = _Codes()
+        self._areas = _Codes()
+        self._wards = _Codes()
+        self._type_keys = _Codes()
+        self._comparable_keys = _Codes()
+        self._feature_keys = _Codes()
+        self._constraint_keys = _Codes()
+
+        self._term_bits = [bit for _term, bit in _FEATURE_TERM_BITS]
+        self._decay: tuple[int, Any] | None = None
+        self._columns: dict[str, Any] = {}
+        self._alloc(max(16, len(table.features)))
+        self.extend(table.features)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    _FLOAT_COLUMNS = ("lat", "lng", "lat_rad", "cos_lat")
+    _INT_COLUMNS = (
+        "postcode", "sector", "outcode", "area", "ward", "decided",
+        "type_key", "comparable_key", "feature_key", "constraint_key",
+    )
+    _BOOL_COLUMNS = ("green_belt", "from_db")
+
+    def _alloc(self, capacity: int) -> None:
+        """(Re)allocate column storage, preserving existing rows."""
+        for name in self._FLOAT_COLUMNS + self._INT_COLUMNS + self._BOOL_COLUMNS:
+            if name in self._FLOAT_COLUMNS:
+                column = np.full(capacity, np.nan)
+            elif name in self._INT_COLUMNS:
+                column = np.full(capacity, _CASE_MISSING, dtype=np.int64)
+            else:
+                column = np.zeros(capacity, dtype=bool)
+            old = self._columns.get(name)
+            if old is not None:
+                column[:self.size] = old[:self.size]
+            self._columns[name] = column
+        self._capacity = capacity
+
+    def extend(self, features: list["CaseFeatures"]) -> None:
+        """Append compiled rows (in table order) to the matrix."""
+        if self.size + len(features) > self._capacity:
+            self._alloc(max(self._capacity * 2, self.size + len(features)))
+        cols = self._columns
+        for offset, f in enumerate(features):
+            i = self.size + offset
+            if f.latitude and f.longitude:
+                cols["lat"][i] = f.latitude
+                cols["lng"][i] = f.longitude
+                cols["lat_rad"][i] = np.radians(f.latitude)
+                cols["cos_lat"][i] = np.cos(cols["lat_rad"][i])
+            if f.postcode_compact:
+                cols["postcode"][i] = self._postcodes.intern(f.postcode_compact)
+                cols["sector"][i] = self._sectors.intern(f.sector)
+                cols["outcode"][i] = self._outcodes.intern(f.outcode)
+            cols["area"][i] = self._areas.case(f.postcode_area)
+            cols["ward"][i] = self._wards.case(f.ward_lower)
+            cols["green_belt"][i] = f.green_belt
+            cols["from_db"][i] = f.from_db
+            cols["decided"][i] = f.decision_ordinal if f.decision_ordinal is not None else _CASE_MISSING
+            cols["type_key"][i] = self._type_keys.intern(_type_key(f), f)
+            cols["comparable_key"][i] = self._comparable_keys.intern(_comparable_key(f), f)
+            cols["feature_key"][i] = self._feature_keys.intern(f.feature_bits, f.feature_bits)
+            cols["constraint_key"][i] = self._constraint_keys.intern(f.constraint_bits, f)
+        self.size += len(features)
+        self._decay = None
+
+    def extended(self, table: "CaseFeatureTable", features: list["CaseFeatures"]) -> "CaseMatrix":
+        """A copy of this matrix for ``table`` with ``features`` appended."""
+        matrix = copy.copy(self)
+        matrix.table = table
+        matrix._columns = {
+            name: column.copy() for name, column in self._columns.items()
+        }
+        for name, value in vars(self).items():
+            if isinstance(value, _Codes):
+                setattr(matrix, name, value.copy())
+        matrix.extend(features)
+        return matrix
+
+    def column(self, name: str, rows: Any = None) -> Any:
+        """One column, trimmed to the populated rows or gathered at ``rows``."""
+        if rows is None:
+            return self._columns[name][:self.size]
+        return self._columns[name][rows]
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def decay_factors(self, today_ordinal: int) -> Any:
+        """Per-row temporal decay, computed once per calendar day."""
+        if self._decay is None or self._decay[0] != today_ordinal:
+            decided = self.column("decided")
+            age_years = (today_ordinal - decided) / 365.25
+            decay = np.full(self.size, 0.75)
+            decay[age_years <= 6] = 0.85
+            decay[age_years <= 4] = 0.95
+            decay[age_years <= 2] = 1.0
+            decay[decided == _CASE_MISSING] = 1.0
+            self._decay = (today_ordinal, decay)
+        return self._decay[1]
+
+    def _feature_lut(self, query_bits: int) -> Any:
+        """``_feature_score(...) * 0.25`` for every distinct feature bitset.
+
+        Evaluated over the distinct bitsets with the same operation order
+        as the pure-Python scorer, so values are identical.
+        """
+        keys = np.array(self._feature_keys.representatives, dtype=np.uint64)
+        k = keys.size
+        total_weight = np.zeros(k)
+        matched_weight = np.zeros(k)
+        for mask, weight in _FEATURE_GROUP_MASKS:
+            q_hits = query_bits & mask
+            c_hits = keys & np.uint64(mask)
+            inter = np.bitwise_count(c_hits & np.uint64(q_hits)).astype(np.float64)
+            union = np.bitwise_count(c_hits | np.uint64(q_hits)).astype(np.float64)
+            active = union > 0
+            total_weight = total_weight + np.where(active, weight, 0.0)
+            ratio = np.divide(inter, union, out=np.zeros(k), where=active)
+            matched_weight = matched_weight + np.where(active, ratio * weight, 0.0)
+        feature = np.divide(matched_weight, total_weight, out=np.full(k, 0.3), where=total_weight > 0)
+        return feature * 0.25
+
+    def location_scores(self, q: "CaseFeatures", rows: Any = None) -> Any:
+        """Vectorised ``_location_score`` for every row (or ``rows``)."""
+        size = self.size if rows is None else len(rows)
+        location = np.zeros(size)
+
+        if q.latitude and q.longitude:
+            lat = self.column("lat", rows)
+            lng = self.column("lng", rows)
+            # Cases outside this box are > 15km away and score 0 on distance
+            lat_span = _DECAY_RADIUS_KM / _KM_PER_DEGREE * 1.01
+            cos_edge = max(np.cos(np.radians(min(89.0, abs(q.latitude) + lat_span))), 1e-6)
+            lng_span = lat_span / cos_edge
+            near = np.flatnonzero(
+                (np.abs(lat - q.latitude) <= lat_span) & (np.abs(lng - q.longitude) <= lng_span)
+            )
+            if near.size:
+                q_lat = np.radians(q.latitude)
+                d_lat = np.radians(lat[near] - q.latitude)
+                d_lng = np.radians(lng[near] - q.longitude)
+                a = np.sin(d_lat / 2) ** 2 + np.cos(q_lat) * self.column("cos_lat", rows)[near] * np.sin(d_lng / 2) ** 2
+                distance = _EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+                coord = np.maximum(0.0, 1.0 - (distance / _DECAY_RADIUS_KM))
+                coord = np.where(distance < 3.0, np.maximum(coord, 0.80), coord)
+                coord = np.where(distance < 1.0, np.maximum(coord, 0.95), coord)
+                location[near] = coord
+
+        if q.postcode_compact:
+            postcode = self.column("postcode", rows)
+            need = (postcode != _CASE_MISSING) & (location < 0.5)
+            if need.any():
+                # Assign lowest tier first so stronger tiers overwrite it
+                tier = np.zeros(size)
+                tier[self.column("area", rows) == self._areas.query(q.postcode_area)] = 0.3
+                tier[self.column("outcode", rows) == self._outcodes.query(q.outcode)] = 0.65
+                same_sector = self.column("sector", rows) == self._sectors.query(q.sector)
+                if same_sector.any():
+                    tier[same_sector] = np.where(
+                        self.column("green_belt", rows)[same_sector] != q.green_belt, 0.4, 0.85,
+                    )
+                tier[postcode == self._postcodes.query(q.postcode_compact)] = 1.0
+                location = np.where(need, np.maximum(location, tier), location)
+
+        if q.ward_lower:
+            same_ward = self.column("ward", rows) == self._wards.query(q.ward_lower)
+            if same_ward.any():
+                location[same_ward] = np.minimum(1.0, np.maximum(location[same_ward], 0.8) + 0.15)
+
+        return location
+
+    def scores(self, q: "CaseFeatures", rows: Any = None) -> Any:
+        """Vectorised ``_score_case_features`` for every row (or ``rows``)."""
+        type_lut = np.array([
+            min(_type_scale_score(rep, q), 1.0) * 0.25
+            for rep in self._type_keys.representatives
+        ])
+        constraint_lut = np.array([
+            _constraint_score(rep, q) * 0.20
+            for rep in self._constraint_keys.representatives
+        ])
+        feature_lut = self._feature_lut(q.feature_bits)
+
+        score = self.location_scores(q, rows) * 0.30
+        score += type_lut[self.column("type_key", rows)]
+        score += feature_lut[self.column("feature_key", rows)]
+        score += constraint_lut[self.column("constraint_key", rows)]
+        return np.minimum(score, 1.0)
+
+    def comparable_mask(self, q: "CaseFeatures", rows: Any = None) -> Any:
+        """Vectorised ``_is_comparable_features`` for every row (or ``rows``)."""
+        lut = np.array([
+            _is_comparable_features(rep, q)[0]
+            for rep in self._comparable_keys.representatives
+        ], dtype=bool)
+        return lut[self.column("comparable_key", rows)]
+
+    # ------------------------------------------------------------------
+    # Ranking
+    # ------------------------------------------------------------------
+
+    def rank(
+        self,
+        q: "CaseFeatures",
+        reference: str = "",
+        limit: int = 5,
+        rows: Any = None,
+        adjustments: tuple[dict[str, float], dict[str, float]] | None = None,
+    ) -> list[tuple[int, float]]:
+        """Score, adjust and select the top ``limit`` rows.
+
+        Only ``rows`` (ascending row indices) are considered when given.
+        ``adjustments`` are the ``_case_adjustments`` to apply (loaded
+        here when not given).  Returns (row index, final score) pairs,
+        best first, in the same order the pure-Python ranking produces.
+        """
+        if rows is not None:
+            rows = np.asarray(rows, dtype=np.int64)
+        if self.size == 0 or limit <= 0 or (rows is not None and rows.size == 0):
+            return []
+
+        scores = self.scores(q, rows)
+        eligible = self.comparable_mask(q, rows) & (scores > _SCORE_THRESHOLD)
+        if reference:
+            self_index = self.table.ref_index.get(reference)
+            if self_index is not None and self.column("from_db")[self_index]:
+                if rows is None:
+                    eligible[self_index] = False
+                else:
+                    pos = np.searchsorted(rows, self_index)
+                    if pos < rows.size and rows[pos] == self_index:
+                        eligible[pos] = False
+
+        positions = np.flatnonzero(eligible)
+        candidates = positions if rows is None else rows[positions]
+        if candidates.size == 0:
+            return []
+        final = scores[positions]
+
+        boosts, learning = adjustments if adjustments is not None else _case_adjustments(reference, True)
+        boost = np.ones(candidates.size)
+        if boosts:
+            boost = self._sparse_factors(boosts, candidates)
+            final = np.minimum(1.0, final * boost)
+        if learning:
+            final = np.minimum(1.0, final * self._sparse_factors(learning, candidates))
+        final = final * self.decay_factors(datetime.now().date().toordinal())[candidates]
+
+        # Top-k without a full sort; rows tied with the k-th score are kept
+        # so the final ordering is deterministic.
+        if candidates.size > limit:
+            kth = np.partition(final, candidates.size - limit)[candidates.size - limit]
+            top = np.flatnonzero(final >= kth)
+        else:
+            top = np.arange(candidates.size)
+        order = np.lexsort((candidates[top], -boost[top], -final[top]))[:limit]
+        return [(int(candidates[top[i]]), float(final[top[i]])) for i in order]
+
+    def _sparse_factors(self, factors: dict[str, float], candidates: Any) -> Any:
+        """Expand a sparse reference -> factor mapping onto candidate rows."""
+        out = np.ones(candidates.size)
+        ref_index = self.table.ref_index
+        for ref, factor in factors.items():
+            row = ref_index.get(ref)
+            if row is None:
+                continue
+            pos = np.searchsorted(candidates, row)
+            if pos < candidates.size and candidates[pos] == row:
+                out[pos] = factor
+        return out
+
+
+def build_case_matrix(table: "CaseFeatureTable") -> CaseMatrix | None:
+    """Build a ``CaseMatrix`` for a table, or None when NumPy is missing."""
+    if not _NUMPY_AVAILABLE:
+        return None
+    return CaseMatrix(table)
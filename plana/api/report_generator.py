@@ -21,8 +21,9 @@ All reports include:
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable
 import re
+import time
 import uuid
 
 from .similar_cases import find_similar_cases, get_precedent_analysis, HistoricCase
@@ -35,6 +36,7 @@ from .reasoning_engine import (
     _extract_proposal_features,
 )
 from .learning import get_learning_system
+from plana.core.concurrent import StepGraph, critical_path
 
 
 # =============================================================================
@@ -3790,6 +3792,7 @@ def generate_professional_report(
     documents_verified: bool = False,
     gis_verified: dict | None = None,
     gis_checked_types: list[str] | None = None,
+    snapshot: Any = None,
 ) -> dict[str, Any]:
     """
     Generate a complete professional case officer report.
@@ -3802,6 +3805,15 @@ def generate_professional_report(
      13. Recommendation      14. Future predictions  15. Plan set detection
      16. Markdown report     17. Record prediction   18. Build response
 
+    Steps 2-17 run as a ``StepGraph``: each starts once the steps it
+    depends on have finished, so independent steps (per-document
+    extraction, similar cases, policies, plan set detection) overlap.
+    Per-step wall times are reported in ``pipeline_audit.step_timings``.
+
+    ``snapshot`` is the caller's ``ApplicationSnapshot`` of the stored
+    application, if it has one; the applicant and plan set steps then use
+    its rows instead of reading the database again.
+
     Returns the full CASE_OUTPUT response structure.
     """
     import structlog
@@ -3848,6 +3860,7 @@ def generate_professional_report(
 
     # Import enhanced analysis functions
     from .reasoning_engine import (
+        ProposalDetails,
         analyse_proposal,
         calculate_amenity_impacts,
         generate_detailed_precedent_analysis,
@@ -3857,7 +3870,7 @@ def generate_professional_report(
 
     # Import document analysis functions
     from .document_analysis import (
-        extract_from_text,
+        cached_extract_from_text,
         merge_document_extractions,
         ExtractedDocumentData,
     )
@@ -3868,52 +3881,72 @@ def generate_professional_report(
     council_name = get_council_name(detected_council)
     council_id = detected_council
 
+    # ── Steps 2-17 run as a dependency graph: independent steps (document
+    # extraction, similar cases, policies, plan set detection, ...) run
+    # concurrently, and each step's wall time goes into pipeline_audit.
+    graph = StepGraph()
+
     # ── Step 2: Extract data from uploaded documents ──
-    document_extractions = []
     document_texts = {}
+    extraction_steps = []
 
-    for doc in documents:
+    def _extraction_step(
+        text: str, dtype: str, name: str,
+    ) -> Callable[[dict[str, Any]], ExtractedDocumentData]:
+        return lambda r: cached_extract_from_text(text, dtype, name)
+
+    for index, doc in enumerate(documents):
         doc_text = doc.get("content_text", "")
         if doc_text:
             doc_type = doc.get("document_type", "other")
             filename = doc.get("filename", "uploaded_document")
-            extraction = extract_from_text(doc_text, doc_type, filename)
-            document_extractions.append(extraction)
             document_texts[filename] = doc_text
+            step_name = f"extract_document[{index}]"
+            graph.add(step_name, _extraction_step(doc_text, doc_type, filename))
+            extraction_steps.append(step_name)
 
-    if document_extractions:
-        extracted_doc_data = merge_document_extractions(document_extractions)
-    else:
-        extracted_doc_data = ExtractedDocumentData()
+    def _merge_extractions(r: dict[str, Any]) -> ExtractedDocumentData:
+        document_extractions = [r[name] for name in extraction_steps]
+        if document_extractions:
+            return merge_document_extractions(document_extractions)
+        return ExtractedDocumentData()
+
+    graph.add("merge_extractions", _merge_extractions, depends_on=extraction_steps)
 
     # ── Step 3: Analyse proposal (dimensions, units, materials) ──
-    proposal_details = analyse_proposal(proposal_description, application_type)
+    graph.add("analyse_proposal", lambda r: analyse_proposal(proposal_description, application_type))
 
     # ── Step 4: Enrich proposal_details with document-extracted data ──
-    if extracted_doc_data.num_bedrooms > 0 and proposal_details.num_bedrooms == 0:
-        proposal_details.num_bedrooms = extracted_doc_data.num_bedrooms
-    if extracted_doc_data.num_units > 0 and proposal_details.num_units == 0:
-        proposal_details.num_units = extracted_doc_data.num_units
-    if extracted_doc_data.total_floor_area_sqm > 0 and proposal_details.floor_area_sqm == 0:
-        proposal_details.floor_area_sqm = extracted_doc_data.total_floor_area_sqm
-    if extracted_doc_data.ridge_height_metres > 0 and proposal_details.height_metres == 0:
-        proposal_details.height_metres = extracted_doc_data.ridge_height_metres
-    if extracted_doc_data.total_parking_spaces > 0 and proposal_details.parking_spaces == 0:
-        proposal_details.parking_spaces = extracted_doc_data.total_parking_spaces
-    if extracted_doc_data.num_storeys > 0 and proposal_details.num_storeys == 0:
-        proposal_details.num_storeys = extracted_doc_data.num_storeys
-    if extracted_doc_data.materials and not proposal_details.materials:
-        # Deduplicate materials preserving order
-        seen = set()
-        proposal_details.materials = []
-        for m in extracted_doc_data.materials:
-            mat = m.material.lower()
-            if mat not in seen:
-                seen.add(mat)
-                proposal_details.materials.append(m.material)
+    def _enrich_proposal(r: dict[str, Any]) -> ProposalDetails:
+        extracted_doc_data: ExtractedDocumentData = r["merge_extractions"]
+        proposal_details: ProposalDetails = r["analyse_proposal"]
+        if extracted_doc_data.num_bedrooms > 0 and proposal_details.num_bedrooms == 0:
+            proposal_details.num_bedrooms = extracted_doc_data.num_bedrooms
+        if extracted_doc_data.num_units > 0 and proposal_details.num_units == 0:
+            proposal_details.num_units = extracted_doc_data.num_units
+        if extracted_doc_data.total_floor_area_sqm > 0 and proposal_details.floor_area_sqm == 0:
+            proposal_details.floor_area_sqm = extracted_doc_data.total_floor_area_sqm
+        if extracted_doc_data.ridge_height_metres > 0 and proposal_details.height_metres == 0:
+            proposal_details.height_metres = extracted_doc_data.ridge_height_metres
+        if extracted_doc_data.total_parking_spaces > 0 and proposal_details.parking_spaces == 0:
+            proposal_details.parking_spaces = extracted_doc_data.total_parking_spaces
+        if extracted_doc_data.num_storeys > 0 and proposal_details.num_storeys == 0:
+            proposal_details.num_storeys = extracted_doc_data.num_storeys
+        if extracted_doc_data.materials and not proposal_details.materials:
+            # Deduplicate materials preserving order
+            seen = set()
+            proposal_details.materials = []
+            for m in extracted_doc_data.materials:
+                mat = m.material.lower()
+                if mat not in seen:
+                    seen.add(mat)
+                    proposal_details.materials.append(m.material)
+        return proposal_details
+
+    graph.add("enrich_proposal", _enrich_proposal, depends_on=["merge_extractions", "analyse_proposal"])
 
     # ── Step 5: Find similar cases ──
-    similar_cases = find_similar_cases(
+    graph.add("similar_cases", lambda r: find_similar_cases(
         proposal=proposal_description,
         application_type=application_type,
         constraints=constraints,
@@ -3922,164 +3955,178 @@ def generate_professional_report(
         limit=5,
         council_id=council_id,
         site_address=site_address,
-    )
+    ))
 
     # ── Step 6: Generate precedent analysis ──
-    precedent_analysis = generate_detailed_precedent_analysis(
-        similar_cases=similar_cases,
-        proposal_details=proposal_details,
+    graph.add("precedent_analysis", lambda r: generate_detailed_precedent_analysis(
+        similar_cases=r["similar_cases"],
+        proposal_details=r["enrich_proposal"],
         constraints=constraints,
-    )
+    ), depends_on=["similar_cases", "enrich_proposal"])
 
     # ── Step 7: Get relevant policies ──
-    policies = get_relevant_policies(
+    graph.add("policies", lambda r: get_relevant_policies(
         proposal=proposal_description,
         application_type=application_type,
         constraints=constraints,
         include_general=True,
         council_id=council_id,
         site_address=site_address,
-    )
+    ))
 
     # ── Step 8: Calculate amenity impacts ──
-    amenity_impacts = calculate_amenity_impacts(proposal_details, constraints)
+    graph.add(
+        "amenity_impacts",
+        lambda r: calculate_amenity_impacts(r["enrich_proposal"], constraints),
+        depends_on=["enrich_proposal"],
+    )
 
     # ── Step 9: Determine assessment topics ──
-    topics = determine_assessment_topics(constraints, application_type, proposal_description)
+    graph.add("assessment_topics", lambda r: determine_assessment_topics(
+        constraints, application_type, proposal_description,
+    ))
 
     # ── Step 10: Generate assessments ──
-    assessments = []
-    for topic in topics:
-        assessment = generate_topic_assessment(
-            topic=topic,
-            proposal=proposal_description,
-            constraints=constraints,
-            policies=policies,
-            similar_cases=similar_cases,
-            application_type=application_type,
-            council_id=council_id,
-            site_address=site_address,
-            extracted_data=extracted_doc_data,
-            proposal_details=proposal_details,
-            document_texts=document_texts,
-        )
-        assessments.append(assessment)
+    def _generate_assessments(r: dict[str, Any]) -> list[AssessmentResult]:
+        assessments = []
+        for topic in r["assessment_topics"]:
+            assessment = generate_topic_assessment(
+                topic=topic,
+                proposal=proposal_description,
+                constraints=constraints,
+                policies=r["policies"],
+                similar_cases=r["similar_cases"],
+                application_type=application_type,
+                council_id=council_id,
+                site_address=site_address,
+                extracted_data=r["merge_extractions"],
+                proposal_details=r["enrich_proposal"],
+                document_texts=document_texts,
+            )
+            assessments.append(assessment)
+        return assessments
+
+    graph.add("assessments", _generate_assessments, depends_on=[
+        "assessment_topics", "policies", "similar_cases", "merge_extractions", "enrich_proposal",
+    ])
 
     # ── Step 11: Calculate planning balance ──
-    planning_weights, balance_summary, balance_recommendation = calculate_planning_balance(
-        assessments=assessments,
+    graph.add("planning_balance", lambda r: calculate_planning_balance(
+        assessments=r["assessments"],
         constraints=constraints,
-        proposal_details=proposal_details,
-        precedent_analysis=precedent_analysis,
+        proposal_details=r["enrich_proposal"],
+        precedent_analysis=r["precedent_analysis"],
         council_name=council_name,
         proposal=proposal_description,
         site_address=site_address,
-    )
+    ), depends_on=["assessments", "precedent_analysis"])
 
     # ── Step 12: Generate conditions ──
-    professional_conditions = generate_professional_conditions(
-        proposal_details=proposal_details,
+    graph.add("conditions", lambda r: generate_professional_conditions(
+        proposal_details=r["enrich_proposal"],
         constraints=constraints,
-        assessments=assessments,
+        assessments=r["assessments"],
         council_id=detected_council,
-    )
+    ), depends_on=["assessments"])
 
     # ── Step 13: Generate recommendation ──
-    reasoning = generate_recommendation(
-        assessments=assessments,
-        constraints=constraints,
-        precedent_analysis=precedent_analysis,
-        proposal=proposal_description,
-        application_type=application_type,
-        site_address=site_address,
-    )
-    reasoning.conditions = professional_conditions
+    def _generate_recommendation(r: dict[str, Any]) -> ReasoningResult:
+        reasoning = generate_recommendation(
+            assessments=r["assessments"],
+            constraints=constraints,
+            precedent_analysis=r["precedent_analysis"],
+            proposal=proposal_description,
+            application_type=application_type,
+            site_address=site_address,
+        )
+        reasoning.conditions = r["conditions"]
+        return reasoning
+
+    graph.add("recommendation", _generate_recommendation, depends_on=[
+        "assessments", "precedent_analysis", "conditions",
+    ])
 
     # ── Step 14: Generate future predictions ──
-    future_predictions = generate_future_predictions(
+    graph.add("future_predictions", lambda r: generate_future_predictions(
         proposal=proposal_description,
         constraints=constraints,
         application_type=application_type,
-        similar_cases=similar_cases,
-        assessments=assessments,
-        proposal_details=proposal_details,
-    )
+        similar_cases=r["similar_cases"],
+        assessments=r["assessments"],
+        proposal_details=r["enrich_proposal"],
+    ), depends_on=["similar_cases", "assessments"])
 
     # ── Step 14b: Enrich applicant_name from document extraction ──
     # If no applicant_name was provided (e.g. from portal or import), try
     # to extract it from the application form text.
-    if not applicant_name and extracted_doc_data.applicant_name:
-        applicant_name = extracted_doc_data.applicant_name
+    def _resolve_applicant(r: dict[str, Any]) -> str | None:
+        name = applicant_name
+        if not name and r["merge_extractions"].applicant_name:
+            name = r["merge_extractions"].applicant_name
+
+        # Also persist the extracted applicant name back to the DB for future use
+        # (the update only fills an empty name, so skip it when one is stored)
+        if name and not (snapshot is not None and snapshot.applicant_name):
+            try:
+                from plana.storage.database import get_database as _get_db_for_applicant
+                _adb = _get_db_for_applicant()
+                _adb.update_applicant_name(reference, name)
+            except Exception:
+                pass  # Non-fatal
+        return name
+
+    graph.add("applicant_name", _resolve_applicant, depends_on=["merge_extractions"])
+
+    # ── Step 15: Determine plan set presence ──
+    #   - Inline request documents (filename / document_type)
+    #   - Stored DB documents: the plan set legs the worker stored for each
+    #     (from categories, metadata guesses and detected labels), read
+    #     in one indexed query
+    def _detect_plan_set(r: dict[str, Any]) -> bool:
+        from plana.documents.processor import (
+            PlanSetLegs,
+            plan_set_legs,
+            stored_document_plan_set_legs,
+            stored_plan_set_legs,
+        )
+
+        _doc_filenames = [doc.get("filename", "") for doc in documents]
+        _doc_type_guesses = [doc.get("document_type", "") for doc in documents]
+        _legs = plan_set_legs(
+            categories=[],
+            filenames=_doc_filenames,
+            metadata_guesses=_doc_type_guesses or None,
+        )
+        _stored_legs = PlanSetLegs.NONE
 
-    # Also persist the extracted applicant name back to the DB for future use
-    if applicant_name:
         try:
-            from plana.storage.database import get_database as _get_db_for_applicant
-            _adb = _get_db_for_applicant()
-            _adb.update_applicant_name(reference, applicant_name)
+            if snapshot is not None:
+                for _sd in snapshot.documents:
+                    _stored_legs |= stored_document_plan_set_legs(_sd)
+            else:
+                from plana.storage.database import get_database as _get_db
+                _stored_legs = stored_plan_set_legs(_get_db(), reference)
         except Exception:
-            pass  # Non-fatal
+            pass  # DB unavailable — fall back to inline signals only
 
-    # ── Step 15: Determine plan set presence ──
-    #   - Inline request documents (filename / document_type)
-    #   - Stored DB documents (categories, metadata_guesses, detected_labels)
-    # Previously only used inline docs — missed DB-processed metadata entirely.
-    from plana.documents.processor import check_plan_set_present as _check_plan_set
-    from plana.documents.ingestion import classify_document as _classify_doc
-
-    _doc_filenames = [doc.get("filename", "") for doc in documents]
-    _doc_type_guesses = [doc.get("document_type", "") for doc in documents]
-    _categories: list = []
-    _all_detected_labels: list[str] = []
-
-    # Enrich from database — stored documents have been processed by the
-    # worker and contain classification categories, metadata_guesses, and
-    # detected_labels from text-content / OCR analysis.
-    try:
-        from plana.storage.database import get_database as _get_db
-        _db = _get_db()
-        _stored_docs = _db.get_documents(reference)
-        for _sd in _stored_docs:
-            _cat, _ = _classify_doc(_sd.title, _sd.doc_type, _sd.title)
-            _categories.append(_cat)
-            if _sd.title and _sd.title not in _doc_filenames:
-                _doc_filenames.append(_sd.title)
-            if _sd.extracted_metadata_json:
-                try:
-                    import json as _json
-                    _meta = _json.loads(_sd.extracted_metadata_json)
-                    _guess = _meta.get("document_type_guess", "")
-                    if _guess:
-                        _doc_type_guesses.append(_guess)
-                    _labels = _meta.get("detected_labels", [])
-                    _all_detected_labels.extend(_labels)
-                except (ValueError, TypeError):
-                    pass
-    except Exception:
-        pass  # DB unavailable — fall back to inline signals only
-
-    _plan_set_present = _check_plan_set(
-        categories=_categories,
-        filenames=_doc_filenames,
-        metadata_guesses=_doc_type_guesses or None,
-        all_detected_labels=_all_detected_labels or None,
-    )
+        _plan_set_present = (_legs | _stored_legs) == PlanSetLegs.ALL
 
-    _logger.info(
-        "plan_set_computed",
-        reference=reference,
-        plan_set_present=_plan_set_present,
-        categories_count=len(_categories),
-        filenames_count=len(_doc_filenames),
-        metadata_guesses_count=len(_doc_type_guesses),
-        detected_labels_count=len(_all_detected_labels),
-        detected_labels=_all_detected_labels[:20],
-        filenames_sample=_doc_filenames[:10],
-        metadata_guesses_sample=_doc_type_guesses[:10],
-    )
+        _logger.info(
+            "plan_set_computed",
+            reference=reference,
+            plan_set_present=_plan_set_present,
+            inline_legs=_legs.name,
+            stored_legs=_stored_legs.name,
+            filenames_count=len(_doc_filenames),
+            filenames_sample=_doc_filenames[:10],
+            metadata_guesses_sample=_doc_type_guesses[:10],
+        )
+        return _plan_set_present
+
+    graph.add("plan_set", _detect_plan_set)
 
     # ── Step 16: Generate markdown report ──
-    markdown_report = generate_full_markdown_report(
+    graph.add("markdown_report", lambda r: generate_full_markdown_report(
         reference=reference,
         address=site_address,
         proposal=proposal_description,
@@ -4087,37 +4134,70 @@ def generate_professional_report(
         constraints=constraints,
         ward=ward,
         postcode=postcode,
-        applicant_name=applicant_name,
-        policies=policies,
-        similar_cases=similar_cases,
-        precedent_analysis=precedent_analysis,
-        assessments=assessments,
-        reasoning=reasoning,
+        applicant_name=r["applicant_name"],
+        policies=r["policies"],
+        similar_cases=r["similar_cases"],
+        precedent_analysis=r["precedent_analysis"],
+        assessments=r["assessments"],
+        reasoning=r["recommendation"],
         documents_count=portal_documents_count if portal_documents_count is not None else len(documents),
         documents_verified=documents_verified,
-        future_predictions=future_predictions,
+        future_predictions=r["future_predictions"],
         council_name=council_name,
         council_id=council_id,
-        proposal_details=proposal_details,
-        amenity_impacts=amenity_impacts,
-        planning_weights=planning_weights,
-        balance_summary=balance_summary,
-        plan_set_present=_plan_set_present,
+        proposal_details=r["enrich_proposal"],
+        amenity_impacts=r["amenity_impacts"],
+        planning_weights=r["planning_balance"][0],
+        balance_summary=r["planning_balance"][1],
+        plan_set_present=r["plan_set"],
         documents=documents,
         gis_verified=gis_verified,
         gis_checked_types=gis_checked_types,
-    )
+    ), depends_on=[
+        "applicant_name", "policies", "similar_cases", "precedent_analysis", "assessments",
+        "recommendation", "future_predictions", "enrich_proposal", "amenity_impacts",
+        "planning_balance", "plan_set",
+    ])
 
     # ── Step 17: Record prediction in learning system ──
-    learning = get_learning_system()
-    learning.record_prediction(
-        run_id=run_id,
+    def _record_prediction(r: dict[str, Any]) -> None:
+        reasoning = r["recommendation"]
+        get_learning_system().record_prediction(
+            run_id=run_id,
+            reference=reference,
+            council_id=council_id,
+            predicted_outcome=reasoning.recommendation,
+            predicted_confidence=reasoning.confidence_score,
+            key_policies=[p.id for p in r["policies"][:10]],
+            similar_cases=[c.reference for c in r["similar_cases"]],
+        )
+
+    graph.add("record_prediction", _record_prediction, depends_on=[
+        "recommendation", "policies", "similar_cases",
+    ])
+
+    pipeline_start = time.perf_counter()
+    step_results, step_timings = graph.run()
+    pipeline_wall_ms = (time.perf_counter() - pipeline_start) * 1000
+    critical_path_ms, critical_steps = critical_path(step_timings)
+
+    similar_cases = step_results["similar_cases"]
+    precedent_analysis = step_results["precedent_analysis"]
+    policies = step_results["policies"]
+    assessments = step_results["assessments"]
+    planning_weights, balance_summary, balance_recommendation = step_results["planning_balance"]
+    reasoning = step_results["recommendation"]
+    future_predictions = step_results["future_predictions"]
+    applicant_name = step_results["applicant_name"]
+    _plan_set_present = step_results["plan_set"]
+    markdown_report = step_results["markdown_report"]
+
+    _logger.info(
+        "report_pipeline_timed",
         reference=reference,
-        council_id=council_id,
-        predicted_outcome=reasoning.recommendation,
-        predicted_confidence=reasoning.confidence_score,
-        key_policies=[p.id for p in policies[:10]],
-        similar_cases=[c.reference for c in similar_cases],
+        wall_ms=round(pipeline_wall_ms, 1),
+        critical_path_ms=round(critical_path_ms, 1),
+        steps_total_ms=round(sum(t.duration_ms for t in step_timings), 1),
     )
 
     # ── Step 18: Build response structure ──
@@ -4147,6 +4227,13 @@ def generate_professional_report(
             ],
             "blocking_gaps": [],
             "non_blocking_gaps": [] if documents else ["No documents submitted"],
+            "step_timings": [t.to_dict() for t in step_timings],
+            "timing": {
+                "wall_ms": round(pipeline_wall_ms, 2),
+                "steps_total_ms": round(sum(t.duration_ms for t in step_timings), 2),
+                "critical_path_ms": round(critical_path_ms, 2),
+                "critical_path": critical_steps,
+            },
         },
         "application_summary": {
             "reference": reference,
@@ -116,6 +116,7 @@ async def worker_health() -> dict:
         "queue_depth": stats.get("queue_length", 0),
         "total_processed": stats.get("total_processed", 0),
         "total_failed": stats.get("total_failed", 0),
+        "report_prebuild": stats.get("report_prebuild"),
     }
 
 
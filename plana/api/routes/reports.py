@@ -7,9 +7,10 @@ Supports two storage backends:
 Both query-parameter and legacy path-parameter URL forms are accepted.
 """
 
+import asyncio
 import uuid
 from datetime import datetime
-from typing import Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 from urllib.parse import unquote
 
 from fastapi import APIRouter, HTTPException, Query
@@ -18,6 +19,10 @@ from pydantic import BaseModel, Field
 
 from plana.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from plana.core.cache import TieredCache
+    from plana.storage.snapshot import ApplicationSnapshot
+
 logger = get_logger(__name__)
 
 router = APIRouter()
@@ -295,6 +300,15 @@ def _all_documents_processed(reference: str) -> bool:
         return False
 
 
+def _load_snapshot(reference: str) -> Optional["ApplicationSnapshot"]:
+    """Snapshot of the stored application, trying the normalised reference too."""
+    from plana.storage.snapshot import ApplicationSnapshot
+
+    normalized = _normalize_ref(reference)
+    alternatives = (normalized,) if normalized != reference else ()
+    return ApplicationSnapshot.load(reference, alternatives=alternatives)
+
+
 def _generate_minimal_report(reference: str) -> Optional[ReportResponse]:
     """Generate a minimal placeholder report when full generation fails.
 
@@ -302,18 +316,12 @@ def _generate_minimal_report(reference: str) -> Optional[ReportResponse]:
     are processed but the full report generator is unavailable.
     """
     try:
-        from plana.storage.database import get_database
-
-        db = get_database()
-        app = db.get_application(reference)
-        if app is None:
-            normalized = _normalize_ref(reference)
-            if normalized != reference:
-                app = db.get_application(normalized)
-        if app is None:
+        snapshot = _load_snapshot(reference)
+        if snapshot is None or snapshot.application is None:
             return None
+        app = snapshot.application
 
-        stored_docs = db.get_documents(app.reference)
+        stored_docs = snapshot.documents
         doc_count = len(stored_docs) if stored_docs else 0
         processed = sum(1 for d in (stored_docs or []) if d.processing_status == "processed")
         with_text = sum(1 for d in (stored_docs or []) if d.extracted_text_chars and d.extracted_text_chars > 0)
@@ -367,6 +375,92 @@ Documents have been processed. {"Text was successfully extracted from " + str(wi
         return None
 
 
+def _remember_report(reference: str, report_dict: dict) -> None:
+    """Keep a generated report in this process's report stores."""
+    # Cache the raw dict so subsequent polls return instantly.
+    # This is the SAME format the import endpoint returns in
+    # ImportApplicationResponse.report — the frontend expects it.
+    normalized = _normalize_ref(reference)
+    _raw_reports[normalized] = report_dict
+
+    # Also cache as ReportResponse for the legacy code path
+    markdown = report_dict.get("report_markdown", "")
+    recommendation = report_dict.get("recommendation", {}).get("outcome", "")
+    meta = report_dict.get("meta", {})
+
+    report_response = ReportResponse(
+        id=meta.get("run_id", str(uuid.uuid4())),
+        application_reference=reference,
+        version=1,
+        sections=[
+            ReportSectionResponse(
+                section_id="full_report",
+                title="Full Planning Assessment Report",
+                content=markdown,
+                order=1,
+            )
+        ],
+        recommendation=recommendation,
+        generated_at=meta.get("generated_at", datetime.now().isoformat()),
+        generation_time_seconds=None,
+        mode="live",
+    )
+    _demo_reports[normalized] = report_response
+
+
+def _report_cache() -> "TieredCache":
+    """Two-tier cache of generated reports, next to the database file.
+
+    The disk tier is shared with every process using the same database
+    (the API and the standalone document worker), so a report built by
+    one is served by the others.
+    """
+    from plana.core.cache import get_tiered_cache
+    from plana.core.constants import CacheConfig
+    from plana.storage.database import get_database
+
+    return get_tiered_cache(
+        "reports",
+        ttl=CacheConfig.REPORT_CACHE_TTL,
+        disk_path=get_database().db_path.with_suffix(".cache.db"),
+        max_size=200,
+        cache_none=False,
+    )
+
+
+def _cached_report_from_db(reference: str) -> Optional[dict]:
+    """``_regenerate_report_from_db`` through the shared report cache.
+
+    Reports are keyed by the stored rows they are built from
+    (``Database.get_report_source_version``), so any change to the
+    application or its documents makes a new entry.  Concurrent callers
+    for the same reference and rows (report polls, the pre-generation
+    worker) share one build.
+    """
+    normalized = _normalize_ref(reference)
+    try:
+        from plana.storage.database import get_database
+
+        db = get_database()
+        version = db.get_report_source_version(reference)
+        if version is None and normalized != reference:
+            version = db.get_report_source_version(normalized)
+        cache = _report_cache()
+    except Exception as exc:
+        logger.debug("report_cache_unavailable", reference=reference, error=str(exc))
+        return _regenerate_report_from_db(reference)
+    if version is None:
+        return None
+
+    report_dict: Optional[dict] = cache.get_or_set(
+        f"{normalized}:{version}",
+        lambda: _regenerate_report_from_db(reference),
+    )
+    if report_dict is not None and _raw_reports.get(normalized) is not report_dict:
+        _remember_report(normalized, report_dict)
+    return report_dict
+
+
 def _regenerate_report_from_db(reference: str) -> Optional[dict]:
     """Regenerate the report from stored application + document data.
 
@@ -380,33 +474,22 @@ def _regenerate_report_from_db(reference: str) -> Optional[dict]:
     """
     try:
         import json as _json
-        from plana.storage.database import get_database
         from plana.api.report_generator import generate_professional_report
 
-        db = get_database()
-
-        # Load stored application
-        app = db.get_application(reference)
-        if app is None:
-            normalized = _normalize_ref(reference)
-            if normalized != reference:
-                app = db.get_application(normalized)
-        if app is None:
+        # Load the stored application and its documents once; the
+        # snapshot is handed to the report generator so its own steps
+        # reuse these rows instead of querying again.
+        snapshot = _load_snapshot(reference)
+        if snapshot is None or snapshot.application is None:
             return None
+        app = snapshot.application
 
-        # Load documents with extracted text
-        stored_docs = db.get_documents(app.reference)
+        stored_docs = snapshot.documents
         if not stored_docs:
             return None
 
         # Build documents list matching generate_professional_report input
-        documents = []
-        for doc in stored_docs:
-            documents.append({
-                "filename": doc.title,
-                "document_type": doc.doc_type or "other",
-                "content_text": doc.extracted_text or "",
-            })
+        documents = snapshot.report_documents()
 
         constraints = _json.loads(app.constraints_json or "[]")
         council_id = (app.council_id or "").strip().lower()
@@ -443,39 +526,11 @@ def _regenerate_report_from_db(reference: str) -> Optional[dict]:
             documents_verified=True,
             gis_verified=gis_verified,
             gis_checked_types=gis_checked_types,
+            snapshot=snapshot,
         )
 
-        # Cache the raw dict so subsequent polls return instantly.
-        # This is the SAME format the import endpoint returns in
-        # ImportApplicationResponse.report — the frontend expects it.
-        normalized = _normalize_ref(app.reference)
-        _raw_reports[normalized] = report_dict
-
-        # Also cache as ReportResponse for the legacy code path
-        markdown = report_dict.get("report_markdown", "")
-        recommendation = report_dict.get("recommendation", {}).get("outcome", "")
-        meta = report_dict.get("meta", {})
-
-        report_response = ReportResponse(
-            id=meta.get("run_id", str(uuid.uuid4())),
-            application_reference=app.reference,
-            version=1,
-            sections=[
-                ReportSectionResponse(
-                    section_id="full_report",
-                    title="Full Planning Assessment Report",
-                    content=markdown,
-                    order=1,
-                )
-            ],
-            recommendation=recommendation,
-            generated_at=meta.get("generated_at", datetime.now().isoformat()),
-            generation_time_seconds=None,
-            mode="live",
-        )
-        _demo_reports[normalized] = report_response
-
-        logger.info("report_stored_after_regeneration", reference=normalized)
+        _remember_report(app.reference, report_dict)
+        logger.info("report_stored_after_regeneration", reference=_normalize_ref(app.reference))
 
         return report_dict
 
@@ -532,7 +587,8 @@ async def _get_report(
 
     # 2. Try to regenerate from stored DB data (same path as import).
     #    Returns the raw dict matching the import endpoint format.
-    regenerated = _regenerate_report_from_db(reference)
+    #    Built off the event loop, once for all concurrent polls.
+    regenerated = await asyncio.to_thread(_cached_report_from_db, reference)
     if regenerated is not None:
         logger.info("report_regenerated_from_db", reference=reference)
         return regenerated
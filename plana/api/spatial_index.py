@@ -0,0 +1,132 @@
+"""
+Spatial candidate index for precedent retrieval.
+
+``SpatialIndex`` buckets a case-feature table's rows into a fixed-size
+lat/lng grid, and indexes rows by postcode district (outcode), postcode
+area and ward for cases without coordinates.  ``find_similar_cases`` uses
+it to score only the rows near the query first, widening the search
+radius when too few comparable precedents are found.
+
+Postcode sectors and full postcodes nest inside their outcode, so the
+outcode index covers every postcode tier above "same area".
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from .similar_cases import CaseFeatures
+
+# Grid cell size in degrees (~5.5km north-south, ~3km east-west in the UK)
+_CELL_DEGREES = 0.05
+_KM_PER_DEGREE = 111.19
+
+# Search radii tried in order before falling back to the whole corpus
+SEARCH_RADII_KM = (15.0, 30.0, 60.0)
+
+# Corpora smaller than this are always scored in full
+_MIN_INDEXED_CORPUS = 1000
+
+
+def _cell(latitude: float, longitude: float) -> tuple[int, int]:
+    return (math.floor(latitude / _CELL_DEGREES), math.floor(longitude / _CELL_DEGREES))
+
+
+class SpatialIndex:
+    """Grid and postcode/ward indexes over compiled case features."""
+
+    def __init__(self, features: list["CaseFeatures"]):
+        self.size = 0
+        self._cells: dict[tuple[int, int], list[int]] = defaultdict(list)
+        self._coords: dict[int, tuple[float, float]] = {}
+        self._outcodes: dict[str, list[int]] = defaultdict(list)
+        self._areas: dict[str, list[int]] = defaultdict(list)
+        self._wards: dict[str, list[int]] = defaultdict(list)
+        self._add(features)
+
+    def extended(self, features: list["CaseFeatures"], start: int) -> "SpatialIndex":
+        """A copy of this index with ``features`` appended as rows ``start``+."""
+        index = SpatialIndex([])
+        for name in ("_cells", "_outcodes", "_areas", "_wards"):
+            setattr(index, name, defaultdict(list, {
+                key: list(rows) for key, rows in getattr(self, name).items()
+            }))
+        index._coords = dict(self._coords)
+        index.size = start
+        index._add(features)
+        return index
+
+    def _add(self, features: list["CaseFeatures"]) -> None:
+        start = self.size
+        self.size += len(features)
+        for index, f in enumerate(features, start):
+            if f.latitude and f.longitude:
+                self._cells[_cell(f.latitude, f.longitude)].append(index)
+                self._coords[index] = (f.latitude, f.longitude)
+            if f.postcode_compact:
+                self._outcodes[f.outcode].append(index)
+                if f.postcode_area:
+                    self._areas[f.postcode_area].append(index)
+            if f.ward_lower:
+                self._wards[f.ward_lower].append(index)
+
+    def within_radius(self, latitude: float, longitude: float, radius_km: float) -> list[int]:
+        """Rows whose coordinates are within ``radius_km`` of a point."""
+        from .similar_cases import _haversine_km
+
+        lat_span = radius_km / _KM_PER_DEGREE
+        edge_lat = min(89.0, abs(latitude) + lat_span)
+        lng_span = lat_span / max(math.cos(math.radians(edge_lat)), 1e-6)
+        lat_lo, lng_lo = _cell(latitude - lat_span, longitude - lng_span)
+        lat_hi, lng_hi = _cell(latitude + lat_span, longitude + lng_span)
+
+        rows: list[int] = []
+        for cell_lat in range(lat_lo, lat_hi + 1):
+            for cell_lng in range(lng_lo, lng_hi + 1):
+                for index in self._cells.get((cell_lat, cell_lng), ()):
+                    case_lat, case_lng = self._coords[index]
+                    if _haversine_km(latitude, longitude, case_lat, case_lng) <= radius_km:
+                        rows.append(index)
+        return rows
+
+    def candidates(
+        self,
+        query: "CaseFeatures",
+        radius_km: float,
+        include_area: bool = False,
+    ) -> set[int]:
+        """Rows near the query: within the radius, same outcode or same ward."""
+        rows: set[int] = set()
+        if query.latitude and query.longitude:
+            rows.update(self.within_radius(query.latitude, query.longitude, radius_km))
+        if query.postcode_compact:
+            rows.update(self._outcodes.get(query.outcode, ()))
+            if include_area and query.postcode_area:
+                rows.update(self._areas.get(query.postcode_area, ()))
+        if query.ward_lower:
+            rows.update(self._wards.get(query.ward_lower, ()))
+        return rows
+
+    def candidate_stages(self, query: "CaseFeatures") -> Iterator[list[int] | None]:
+        """Progressively wider candidate row sets for a query.
+
+        Yields sorted row lists for each radius in ``SEARCH_RADII_KM``
+        (the postcode area joins after the first widening), then None to
+        mean "the whole corpus".  Stages that add no rows are skipped, and
+        the search goes straight to the whole corpus once a stage covers
+        half of it or the corpus is too small to be worth indexing.
+        """
+        located = (query.latitude and query.longitude) or query.postcode_compact or query.ward_lower
+        if self.size >= _MIN_INDEXED_CORPUS and located:
+            previous = -1
+            for stage, radius_km in enumerate(SEARCH_RADII_KM):
+                rows = self.candidates(query, radius_km, include_area=stage > 0)
+                if len(rows) * 2 >= self.size:
+                    break
+                if len(rows) > previous:
+                    previous = len(rows)
+                    yield sorted(rows)
+        yield None
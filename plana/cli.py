@@ -113,6 +113,11 @@ Demo references:
         default="newcastle",
         help=f"Council ID. Supported: {', '.join(SUPPORTED_COUNCILS)}. Default: newcastle",
     )
+    process_parser.add_argument(
+        "--bypass-cache",
+        action="store_true",
+        help="Live mode: fetch portal pages again instead of using cached copies",
+    )
 
     # Report command (convenience alias)
     report_parser = subparsers.add_parser("report", help="Generate report for an application")
@@ -135,6 +140,11 @@ Demo references:
         default="newcastle",
         help=f"Council ID. Supported: {', '.join(SUPPORTED_COUNCILS)}. Default: newcastle",
     )
+    report_parser.add_argument(
+        "--bypass-cache",
+        action="store_true",
+        help="Live mode: fetch portal pages again instead of using cached copies",
+    )
 
     # Feedback command
     feedback_parser = subparsers.add_parser("feedback", help="Submit feedback for an application")
@@ -217,6 +227,17 @@ Demo references:
         default="eval_run",
         help="Output directory for all benchmark files (default: eval_run)",
     )
+    benchmark_parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="References evaluated in parallel worker processes (default: 1)",
+    )
+    benchmark_parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Re-evaluate references completed by an earlier run",
+    )
 
     # Evaluate command (batch processing)
     evaluate_parser = subparsers.add_parser("evaluate", help="Batch evaluate multiple applications")
@@ -238,6 +259,111 @@ Demo references:
         default="eval_results.csv",
         help="Output CSV path for results (default: eval_results.csv)",
     )
+    evaluate_parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="References evaluated in parallel worker processes (default: 1)",
+    )
+    evaluate_parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore the checkpoint and re-evaluate every reference",
+    )
+
+    # GIS cache pre-warm command
+    gis_prewarm_parser = subparsers.add_parser(
+        "gis-prewarm", help="Pre-warm the GIS constraint cache for a list of postcodes",
+    )
+    gis_prewarm_parser.add_argument(
+        "postcodes",
+        nargs="*",
+        help="Postcodes to warm",
+    )
+    gis_prewarm_parser.add_argument(
+        "--file", "-f",
+        type=str,
+        help="Path to a file of postcodes (one per line)",
+    )
+
+    # Offline GIS layer index command
+    gis_index_parser = subparsers.add_parser(
+        "gis-build-index", help="Build an offline GIS constraint index from GeoJSON snapshots",
+    )
+    gis_index_parser.add_argument(
+        "source",
+        type=str,
+        help="Directory of <layer>.geojson snapshots (e.g. conservation_area.geojson)",
+    )
+    gis_index_parser.add_argument(
+        "--out", "-o",
+        type=str,
+        default="gis_layers.idx",
+        help="Output index path (default: gis_layers.idx)",
+    )
+
+    # Offline postcode centroid table command
+    postcode_table_parser = subparsers.add_parser(
+        "postcode-build-table", help="Build an offline postcode centroid table from a CSV extract",
+    )
+    postcode_table_parser.add_argument(
+        "source",
+        type=str,
+        help="CSV with postcode, lat and long columns (e.g. an ONS Postcode Directory extract)",
+    )
+    postcode_table_parser.add_argument(
+        "--out", "-o",
+        type=str,
+        default="postcodes.tbl",
+        help="Output table path (default: postcodes.tbl)",
+    )
+
+    # Historic backfill command
+    backfill_parser = subparsers.add_parser(
+        "backfill", help="Crawl decided applications from the council portal into the database",
+    )
+    backfill_parser.add_argument(
+        "--from", dest="date_from", required=True,
+        help="First decision date (YYYY-MM-DD)",
+    )
+    backfill_parser.add_argument(
+        "--to", dest="date_to", required=True,
+        help="Last decision date (YYYY-MM-DD)",
+    )
+    backfill_parser.add_argument(
+        "--window",
+        choices=["week", "month"],
+        default="month",
+        help="Size of each decided list crawled. Default: month",
+    )
+    backfill_parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=4,
+        help="Application pages fetched at once (all share the portal's rate limit). Default: 4",
+    )
+    backfill_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=25,
+        help="Applications per database write and checkpoint. Default: 25",
+    )
+    backfill_parser.add_argument(
+        "--checkpoint",
+        type=str,
+        help="Checkpoint file (default: backfill_<council>.json next to the database)",
+    )
+    backfill_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Fetch applications already stored with a decision again",
+    )
+    backfill_parser.add_argument(
+        "--council", "-c",
+        choices=SUPPORTED_COUNCILS,
+        default="newcastle",
+        help=f"Council ID. Supported: {', '.join(SUPPORTED_COUNCILS)}. Default: newcastle",
+    )
 
     args = parser.parse_args()
 
@@ -246,9 +372,9 @@ Demo references:
     elif args.command == "demo":
         cmd_demo()
     elif args.command == "process":
-        asyncio.run(cmd_process(args.reference, args.output, args.mode, args.council))
+        asyncio.run(cmd_process(args.reference, args.output, args.mode, args.council, args.bypass_cache))
     elif args.command == "report":
-        asyncio.run(cmd_process(args.reference, args.output, args.mode, args.council))
+        asyncio.run(cmd_process(args.reference, args.output, args.mode, args.council, args.bypass_cache))
     elif args.command == "feedback":
         cmd_feedback(args.reference, args.decision, args.notes, args.conditions, args.reasons)
     elif args.command == "status":
@@ -258,9 +384,20 @@ Demo references:
     elif args.command == "qc":
         cmd_qc(args.gold, args.results, args.out)
     elif args.command == "benchmark":
-        cmd_benchmark(args.refs, args.mode, args.gold, args.out_dir)
+        cmd_benchmark(args.refs, args.mode, args.gold, args.out_dir, args.jobs, args.fresh)
     elif args.command == "evaluate":
-        cmd_evaluate(args.refs, args.mode, args.output)
+        asyncio.run(cmd_evaluate(args.refs, args.mode, args.output, args.jobs, args.fresh))
+    elif args.command == "gis-prewarm":
+        cmd_gis_prewarm(args.postcodes, args.file)
+    elif args.command == "gis-build-index":
+        cmd_gis_build_index(args.source, args.out)
+    elif args.command == "postcode-build-table":
+        cmd_postcode_build_table(args.source, args.out)
+    elif args.command == "backfill":
+        asyncio.run(cmd_backfill(
+            args.date_from, args.date_to, args.window, args.jobs,
+            args.batch_size, args.checkpoint, args.refresh, args.council,
+        ))
     else:
         parser.print_help()
 
@@ -328,6 +465,7 @@ async def cmd_process(
     output: Optional[str],
     mode: str,
     council: str,
+    bypass_cache: bool = False,
 ):
     """Process a planning application and generate report."""
     from plana.progress import ProgressLogger
@@ -349,7 +487,7 @@ async def cmd_process(
 
     # Run the appropriate pipeline
     if effective_mode == "live":
-        await cmd_process_live(reference, output, council)
+        await cmd_process_live(reference, output, council, bypass_cache)
     else:
         await cmd_process_demo(reference, output)
 
@@ -548,8 +686,22 @@ async def cmd_process_demo(reference: str, output: Optional[str]):
         sys.exit(1)
 
 
-async def cmd_process_live(reference: str, output: Optional[str], council: str):
-    """Process in live mode with portal data."""
+async def cmd_process_live(
+    reference: str,
+    output: Optional[str],
+    council: str,
+    bypass_cache: bool = False,
+):
+    """Process in live mode with portal data.
+
+    Portal pages come from the on-disk response cache when fresh there;
+    ``bypass_cache`` fetches them again.
+
+    Steps overlap where their inputs allow: policy retrieval and the
+    similar-case search start in worker threads as soon as the metadata
+    arrives, each document is extracted as soon as its download finishes,
+    and the report is generated once all of these are ready.
+    """
     from plana.progress import ProgressLogger, StepStatus, is_dns_failure, print_live_error_suggestion
     from plana.storage import get_database, StoredRunLog
 
@@ -587,7 +739,7 @@ async def cmd_process_live(reference: str, output: Optional[str], council: str):
 
         # Get adapter
         try:
-            adapter = get_adapter(council)
+            adapter = get_adapter(council, bypass_cache=bypass_cache)
         except ImportError as e:
             logger.fail_step(
                 error_message="Live mode requires additional dependencies",
@@ -640,6 +792,32 @@ async def cmd_process_live(reference: str, output: Optional[str], council: str):
             "type": app_details.application_type.value,
         })
 
+        # Policies and similar cases need only the metadata, so they run
+        # while the documents are fetched, downloaded and extracted
+        from plana.policy import PolicySearch
+        from plana.improvement import rerank_policies
+        from plana.similarity import SimilaritySearch
+
+        def retrieve_policies():
+            policies = PolicySearch().retrieve_relevant_policies(
+                proposal=app_details.proposal,
+                constraints=[c.name for c in app_details.constraints],
+                application_type=app_details.application_type.value,
+                address=app_details.address,
+            )
+            return rerank_policies(policies, reference)
+
+        def find_similar():
+            return SimilaritySearch().find_similar_cases(
+                proposal=app_details.proposal,
+                constraints=[c.name for c in app_details.constraints],
+                address=app_details.address,
+                application_type=app_details.application_type.value,
+            )
+
+        policies_task = _background_step(logger, "retrieve_policies", retrieve_policies)
+        similar_task = _background_step(logger, "find_similar", find_similar)
+
         # Step 2: Fetch document register
         logger.start_step("fetch_documents", "Fetch document register")
         portal_docs = await adapter.fetch_documents(reference)
@@ -649,26 +827,45 @@ async def cmd_process_live(reference: str, output: Optional[str], council: str):
         logger.start_step("download_documents", "Download documents")
         doc_dir = docs_path / reference.replace("/", "_")
 
+        from plana.documents.ingestion import process_document
+        from plana.ingestion import PortalDocument
+
+        # Copies from earlier runs, so unchanged documents are not downloaded again
+        known = {
+            stored.doc_id: PortalDocument(
+                id=stored.doc_id,
+                title=stored.title,
+                doc_type=stored.doc_type or "",
+                url=stored.url or "",
+                local_path=stored.local_path,
+                content_hash=stored.content_hash,
+                etag=stored.etag,
+                size_bytes=stored.size_bytes,
+                content_type=stored.content_type,
+            )
+            for stored in db.get_documents(reference)
+        }
+
         downloaded = 0
         skipped = 0
         failed = 0
         deduped = 0
         retries = 0
+        # Text extraction starts as each download completes
+        extractions: dict[int, asyncio.Future] = {}
 
-        for doc in portal_docs:
-            # Check for duplicate by hash
-            existing = db.get_document_by_hash(doc.content_hash) if doc.content_hash else None
-            if existing and existing.local_path and Path(existing.local_path).exists():
+        async for outcome in adapter.download_documents(portal_docs, str(doc_dir), known=known):
+            if outcome.unchanged:
                 deduped += 1
                 skipped += 1
-                continue
-
-            # Download
-            local_path = await adapter.download_document(doc, str(doc_dir))
-            if local_path:
+            elif outcome.ok:
                 downloaded += 1
             else:
                 failed += 1
+            if outcome.ok:
+                extractions[id(outcome.document)] = asyncio.ensure_future(
+                    asyncio.to_thread(process_document, outcome.document, True)
+                )
 
         logger.print_document_progress(downloaded, skipped, failed, retries, deduped)
         logger.complete_step("", {
@@ -713,6 +910,7 @@ async def cmd_process_live(reference: str, output: Optional[str], council: str):
                     url=doc.url,
                     local_path=doc.local_path,
                     content_hash=doc.content_hash,
+                    etag=doc.etag,
                     size_bytes=doc.size_bytes,
                     content_type=doc.content_type,
                     date_published=doc.date_published,
@@ -728,19 +926,9 @@ async def cmd_process_live(reference: str, output: Optional[str], council: str):
         # Close adapter
         await adapter.close()
 
-        # Step 5: Retrieve policies
+        # Step 5: Retrieve policies (started after step 1)
         logger.start_step("retrieve_policies", "Retrieve relevant policies")
-        from plana.policy import PolicySearch
-        from plana.improvement import rerank_policies
-
-        policy_search = PolicySearch()
-        policies = policy_search.retrieve_relevant_policies(
-            proposal=app_details.proposal,
-            constraints=[c.name for c in app_details.constraints],
-            application_type=app_details.application_type.value,
-            address=app_details.address,
-        )
-        policies = rerank_policies(policies, reference)
+        policies = await policies_task
 
         policy_counts = {
             "NPPF": len([p for p in policies if p.doc_id == "NPPF"]),
@@ -752,17 +940,9 @@ async def cmd_process_live(reference: str, output: Optional[str], council: str):
             {"NPPF": policy_counts["NPPF"], "CSUCP": policy_counts["CSUCP"], "DAP": policy_counts["DAP"]},
         )
 
-        # Step 6: Find similar applications
+        # Step 6: Find similar applications (started after step 1)
         logger.start_step("find_similar", "Find similar applications")
-        from plana.similarity import SimilaritySearch
-
-        similarity_search = SimilaritySearch()
-        similar_cases = similarity_search.find_similar_cases(
-            proposal=app_details.proposal,
-            constraints=[c.name for c in app_details.constraints],
-            address=app_details.address,
-            application_type=app_details.application_type.value,
-        )
+        similar_cases = await similar_task
         logger.complete_step("Done", {
             "similar_cases": len(similar_cases),
         })
@@ -773,11 +953,14 @@ async def cmd_process_live(reference: str, output: Optional[str], council: str):
         from plana.decision_calibration import calibrate_decision
         from plana.improvement import get_confidence_adjustment
         from plana.core.constants import resolve_council_name as _resolve_council_name
-        from plana.documents.ingestion import process_documents as _ingest_docs
+        from plana.documents.ingestion import collect_ingestion
 
-        doc_ingestion = _ingest_docs(
-            portal_docs, extract_text=True,
-        ) if portal_docs else None
+        processed_docs = [
+            await extractions[id(doc)] if id(doc) in extractions
+            else process_document(doc, extract_text=True)
+            for doc in portal_docs
+        ]
+        doc_ingestion = collect_ingestion(processed_docs) if portal_docs else None
 
         application = ApplicationData(
             reference=app_details.reference,
@@ -864,6 +1047,27 @@ async def cmd_process_live(reference: str, output: Optional[str], council: str):
         sys.exit(1)
 
 
+def _background_step(logger, step_name: str, func) -> asyncio.Future:
+    """Run a pipeline step in a worker thread, timed by the progress logger.
+
+    Args:
+        logger: ProgressLogger of the run
+        step_name: Step the work belongs to
+        func: Callable doing the step's work
+
+    Returns:
+        Future with the result of ``func``
+    """
+    def run():
+        try:
+            return func()
+        finally:
+            logger.end_step(step_name)
+
+    logger.begin_step(step_name)
+    return asyncio.ensure_future(asyncio.to_thread(run))
+
+
 def _handle_error(logger, error: Exception, mode: str):
     """Handle pipeline errors gracefully without stack traces."""
     from plana.progress import StepStatus, is_dns_failure, print_live_error_suggestion
@@ -1035,6 +1239,150 @@ def cmd_serve(host: str, port: int, reload: bool):
     )
 
 
+def cmd_gis_prewarm(postcodes: List[str], file_path: Optional[str]):
+    """Pre-warm the GIS constraint cache for a list of postcodes."""
+    from pathlib import Path
+
+    from plana.location.gis import get_gis_cache_stats, prewarm_gis_cache
+
+    postcodes = list(postcodes or [])
+    if file_path:
+        path = Path(file_path)
+        if not path.exists():
+            print(f"Error: Postcode file not found: {file_path}")
+            sys.exit(1)
+        postcodes.extend(
+            line.strip() for line in path.read_text().splitlines()
+            if line.strip() and not line.startswith("#")
+        )
+    if not postcodes:
+        print("Error: No postcodes given")
+        sys.exit(1)
+
+    print(f"Pre-warming GIS cache for {len(postcodes)} postcode(s)...")
+    summary = prewarm_gis_cache(postcodes)
+    print(f"  Warmed:     {summary['warmed']}")
+    print(f"  Partial:    {summary['partial']}")
+    print(f"  Unresolved: {len(summary['unresolved'])}")
+    for postcode in summary["unresolved"]:
+        print(f"    - {postcode}")
+
+    persistent = get_gis_cache_stats().get("persistent")
+    if persistent:
+        print(f"  Cached layers: {persistent['fresh']} ({persistent['negative']} failures)")
+
+
+def cmd_gis_build_index(source_dir: str, output_path: str):
+    """Build an offline GIS constraint index from GeoJSON snapshots."""
+    from pathlib import Path
+
+    from plana.location.offline_layers import LAYERS, build_index
+
+    source = Path(source_dir)
+    if not source.is_dir():
+        print(f"Error: Snapshot directory not found: {source_dir}")
+        sys.exit(1)
+
+    index = build_index(source, Path(output_path))
+    summary = index.summary()
+    if not summary:
+        print(f"Error: No layer snapshots found. Expected files named: "
+              f"{', '.join(f'{name}.geojson' for name in LAYERS)}")
+        sys.exit(1)
+
+    print(f"Built offline GIS index: {output_path}")
+    for layer, count in summary.items():
+        print(f"  {layer:<20} {count} features")
+    print()
+    print(f"Enable with: export PLANA_GIS_LAYERS_PATH={output_path}")
+
+
+def cmd_postcode_build_table(source_path: str, output_path: str):
+    """Build an offline postcode centroid table from a CSV extract."""
+    from pathlib import Path
+
+    from plana.location.postcode_table import build_table
+
+    source = Path(source_path)
+    if not source.is_file():
+        print(f"Error: CSV file not found: {source_path}")
+        sys.exit(1)
+
+    try:
+        table = build_table(source, Path(output_path))
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"Built postcode table: {output_path} ({len(table)} postcodes)")
+    print()
+    print(f"Enable with: export PLANA_POSTCODE_TABLE_PATH={output_path}")
+
+
+async def cmd_backfill(
+    date_from: str,
+    date_to: str,
+    window: str = "month",
+    jobs: int = 4,
+    batch_size: int = 25,
+    checkpoint_path: Optional[str] = None,
+    refresh: bool = False,
+    council: str = "newcastle",
+):
+    """Crawl decided applications from the council portal into the database."""
+    from datetime import date
+
+    from plana.storage import get_database
+
+    try:
+        start, end = date.fromisoformat(date_from), date.fromisoformat(date_to)
+    except ValueError as e:
+        print(f"Error: Invalid date: {e}")
+        sys.exit(1)
+    if end < start:
+        print("Error: --to is before --from")
+        sys.exit(1)
+
+    try:
+        from plana.ingestion import PortalAccessError, get_adapter
+        from plana.ingestion.backfill import BackfillCrawler
+
+        adapter = get_adapter(council)
+    except ImportError:
+        print("Error: Live mode requires additional dependencies")
+        print("Install with: pip install -e '.[live]'")
+        sys.exit(1)
+
+    db = get_database()
+    checkpoint = Path(checkpoint_path) if checkpoint_path else db.db_path.with_name(f"backfill_{council}.json")
+    crawler = BackfillCrawler(
+        adapter, db, checkpoint,
+        window=window, max_concurrent=jobs, batch_size=batch_size, refresh=refresh,
+    )
+    if crawler.checkpoint.completed or crawler.checkpoint.current:
+        print(f"Resuming from {checkpoint} ({len(crawler.checkpoint.completed)} window(s) done)")
+
+    def report(first, last, stats):
+        print(f"  {first} .. {last}: {stats['listed']} listed, {stats['saved']} saved, "
+              f"{stats['skipped']} already stored, {stats['failed']} failed")
+
+    print(f"Backfilling {council} decisions {start} .. {end} by {window} (jobs={jobs})")
+    try:
+        summary = await crawler.run(start, end, on_window=report)
+    except PortalAccessError as e:
+        print(f"Stopped: {e}")
+        print(f"Progress saved to {checkpoint}; run the same command again to resume.")
+        sys.exit(1)
+    finally:
+        await adapter.close()
+
+    print()
+    print(f"Saved {summary['saved']} application(s) in {summary['elapsed_s']}s "
+          f"({summary['per_second']} per second); {summary['failed']} failed")
+    if crawler.checkpoint.failed:
+        print(f"Failed references are listed in {checkpoint}")
+
+
 def cmd_qc(gold_path: str, results_path: str, output_path: str):
     """Run quality control comparison."""
     from pathlib import Path
@@ -1102,6 +1450,8 @@ def cmd_benchmark(
     mode: str,
     gold_path: Optional[str],
     output_dir: str,
+    jobs: int = 1,
+    fresh: bool = False,
 ):
     """Run end-to-end benchmark evaluation."""
     from pathlib import Path
@@ -1119,6 +1469,7 @@ def cmd_benchmark(
     print(f"  Refs file:  {refs or '(auto-generate)'}")
     print(f"  Gold file:  {gold or '(auto-generate template)'}")
     print(f"  Output dir: {out_dir}")
+    print(f"  Jobs:       {jobs}")
     print()
 
     try:
@@ -1127,6 +1478,8 @@ def cmd_benchmark(
             gold_path=gold,
             mode=mode,
             output_dir=out_dir,
+            jobs=jobs,
+            fresh=fresh,
         )
 
         print()
@@ -1155,14 +1508,35 @@ def cmd_benchmark(
         sys.exit(1)
 
 
-def cmd_evaluate(refs_path: str, mode: str, output_path: str):
-    """Batch evaluate multiple applications."""
+# Columns of the `plana evaluate` results CSV
+EVALUATION_COLUMNS = ["reference", "raw_decision", "decision", "status", "started_s", "elapsed_ms"]
+
+
+async def cmd_evaluate(
+    refs_path: str,
+    mode: str,
+    output_path: str,
+    jobs: int = 1,
+    fresh: bool = False,
+):
+    """Batch evaluate multiple applications, ``jobs`` at a time.
+
+    With ``jobs`` > 1 references are evaluated in that many worker
+    processes.  Each result is written to the CSV as soon as it completes
+    and recorded in a checkpoint next to it
+    (``<output>.checkpoint.jsonl``), so a rerun after a crash only
+    evaluates the references not completed yet; ``fresh`` ignores the
+    checkpoint.  ``started_s`` (seconds after the batch started) and
+    ``elapsed_ms`` time each reference.
+    """
     import csv
+    import time
+    from concurrent.futures import ProcessPoolExecutor
     from pathlib import Path
-    from plana.decision_calibration import calibrate_decision
 
     refs_file = Path(refs_path)
     output_file = Path(output_path)
+    checkpoint_file = output_file.with_suffix(".checkpoint.jsonl")
 
     if not refs_file.exists():
         print(f"Error: Refs file not found: {refs_file}")
@@ -1180,6 +1554,13 @@ def cmd_evaluate(refs_path: str, mode: str, output_path: str):
         print("Error: No references found in refs file")
         sys.exit(1)
 
+    # References completed by an earlier run
+    if fresh:
+        checkpoint_file.unlink(missing_ok=True)
+    completed = _load_evaluation_checkpoint(checkpoint_file, mode)
+    results = [completed[ref] for ref in refs if ref in completed]
+    pending = [ref for ref in refs if ref not in completed]
+
     print("=" * 70)
     print("Plana.AI Batch Evaluation")
     print("=" * 70)
@@ -1187,54 +1568,85 @@ def cmd_evaluate(refs_path: str, mode: str, output_path: str):
     print(f"  Mode:       {mode.upper()}")
     print(f"  Refs file:  {refs_file}")
     print(f"  References: {len(refs)}")
+    print(f"  Jobs:       {jobs}")
     print(f"  Output:     {output_file}")
     print(f"  Calibration: Enabled (Newcastle patterns)")
+    if results:
+        print(f"  Resuming:   {len(results)} already evaluated ({checkpoint_file}; --fresh to start over)")
     print()
 
-    # Process each reference and collect results
-    results = []
-    for i, ref in enumerate(refs, 1):
-        print(f"[{i}/{len(refs)}] Processing {ref}... ", end="", flush=True)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    t_start = time.time()
 
-        try:
-            # Get raw decision from report generator
-            raw_decision, status = _evaluate_single(ref, mode)
+    async def evaluate_all(writer, csv_file, checkpoint) -> None:
+        from plana.core.concurrent import TaskResult, stream_concurrent
 
-            # Apply calibration
-            calibrated_decision = calibrate_decision(ref, raw_decision)
+        # Worker processes for CPU-bound evaluation; one job runs in a thread
+        executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and pending else None
+        loop = asyncio.get_running_loop()
 
-            results.append({
-                "reference": ref,
-                "raw_decision": raw_decision,
-                "decision": calibrated_decision,
-                "status": status,
-            })
+        async def evaluate(ref: str) -> tuple[float, dict]:
+            return await loop.run_in_executor(executor, _evaluate_reference, ref, mode)
 
-            # Show both if different
-            if raw_decision != calibrated_decision:
-                print(f"{raw_decision} -> {calibrated_decision}")
-            else:
-                print(f"{calibrated_decision}")
-        except Exception as e:
-            results.append({
-                "reference": ref,
-                "raw_decision": "UNKNOWN",
-                "decision": "UNKNOWN",
-                "status": f"error: {str(e)[:50]}",
-            })
-            print(f"ERROR: {str(e)[:50]}")
-
-    # Write results to CSV with both raw and calibrated decisions
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["reference", "raw_decision", "decision", "status"])
+        done = len(results)
+        result: TaskResult[tuple[float, dict]]
+        try:
+            async for result in stream_concurrent(pending, evaluate, max_concurrent=jobs):
+                if result.index is None:
+                    continue
+                ref = pending[result.index]
+                if result.success and result.value is not None:
+                    started, row = result.value
+                    row["started_s"] = round(started - t_start, 3)
+                else:
+                    row = {
+                        "reference": ref,
+                        "raw_decision": "UNKNOWN",
+                        "decision": "UNKNOWN",
+                        "status": f"error: {(result.error or '')[:50]}",
+                        "started_s": "",
+                        "elapsed_ms": "",
+                    }
+                results.append(row)
+                done += 1
+
+                # Stream the row, and checkpoint it unless it failed
+                writer.writerow(row)
+                csv_file.flush()
+                if not row["status"].startswith("error: "):
+                    checkpoint.write(json.dumps({"mode": mode, **row}) + "\n")
+                    checkpoint.flush()
+
+                # Show both if different
+                if row["status"].startswith("error: "):
+                    outcome = f"ERROR: {row['status'][len('error: '):]}"
+                elif row["raw_decision"] != row["decision"]:
+                    outcome = f"{row['raw_decision']} -> {row['decision']}"
+                else:
+                    outcome = row["decision"]
+                print(f"[{done}/{len(refs)}] {row['reference']}... {outcome}", flush=True)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    # Write rows carried over from the checkpoint, then each result as it completes
+    with open(output_file, "w", newline="", encoding="utf-8") as f, \
+            open(checkpoint_file, "a", encoding="utf-8") as checkpoint:
+        writer = csv.DictWriter(f, fieldnames=EVALUATION_COLUMNS, restval="", extrasaction="ignore")
         writer.writeheader()
         writer.writerows(results)
+        f.flush()
+        await evaluate_all(writer, f, checkpoint)
+
+    elapsed = time.time() - t_start
 
     print()
     print("=" * 70)
     print(f"Evaluation complete: {len(results)} applications processed")
     print(f"Results saved to: {output_file}")
+    if pending:
+        print(f"Throughput: {len(pending)} evaluated in {elapsed:.2f}s "
+              f"({len(pending) / elapsed:.1f}/s with {jobs} job{'s' if jobs != 1 else ''})")
 
     # Summary - show both raw and calibrated
     raw_decisions = [r["raw_decision"] for r in results]
@@ -1247,6 +1659,53 @@ def cmd_evaluate(refs_path: str, mode: str, output_path: str):
     print(f"  UNKNOWN:                 {raw_decisions.count('UNKNOWN')} -> {calibrated_decisions.count('UNKNOWN')}")
 
 
+def _load_evaluation_checkpoint(path: Path, mode: str) -> dict:
+    """Rows completed by earlier ``plana evaluate`` runs in ``mode``, by reference."""
+    rows: dict[str, dict] = {}
+    if not path.exists():
+        return rows
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # A line cut short by a crash
+        if record.pop("mode", None) == mode and record.get("reference"):
+            rows[record["reference"]] = record
+    return rows
+
+
+def _evaluate_reference(reference: str, mode: str) -> tuple[float, dict]:
+    """Evaluate one reference for ``plana evaluate``, timing it.
+
+    Module-level so that worker processes can run it.
+
+    Returns:
+        Tuple of (start time, results row without ``started_s``)
+    """
+    import time
+    from plana.decision_calibration import calibrate_decision
+
+    started = time.time()
+    t0 = time.perf_counter()
+    try:
+        # Get raw decision from report generator
+        raw_decision, status = _evaluate_single(reference, mode)
+
+        # Apply calibration
+        calibrated_decision = calibrate_decision(reference, raw_decision)
+    except Exception as e:
+        raw_decision = calibrated_decision = "UNKNOWN"
+        status = f"error: {str(e)[:50]}"
+
+    return started, {
+        "reference": reference,
+        "raw_decision": raw_decision,
+        "decision": calibrated_decision,
+        "status": status,
+        "elapsed_ms": round((time.perf_counter() - t0) * 1000, 2),
+    }
+
+
 def _evaluate_single(reference: str, mode: str) -> tuple:
     """
     Evaluate a single application and return decision.
@@ -40,6 +40,7 @@ from plana.core.exceptions import (
     PortalError,
     PortalBlockedError,
     PortalUnavailableError,
+    CircuitOpenError,
     ProcessingError,
     DocumentDownloadError,
     ReportGenerationError,
@@ -62,8 +63,11 @@ from plana.core.logging import (
 
 from plana.core.cache import (
     InMemoryCache,
+    TieredCache,
     get_policy_cache,
     get_similarity_cache,
+    get_tiered_cache,
+    get_cache_stats,
     cached,
     async_cached,
     invalidate_policy_cache,
@@ -74,10 +78,18 @@ from plana.core.concurrent import (
     TaskResult,
     BatchProgress,
     ConcurrentDownloader,
+    AdaptiveLimit,
+    stream_concurrent,
     run_concurrent,
     download_with_retry,
 )
 
+from plana.core.resilience import (
+    HostPolicy,
+    get_host_policy,
+    get_resilience_stats,
+)
+
 __all__ = [
     # Models
     "Address",
@@ -115,6 +127,7 @@ __all__ = [
     "PortalError",
     "PortalBlockedError",
     "PortalUnavailableError",
+    "CircuitOpenError",
     "ProcessingError",
     "DocumentDownloadError",
     "ReportGenerationError",
@@ -133,8 +146,11 @@ __all__ = [
     "PortalLogger",
     # Cache
     "InMemoryCache",
+    "TieredCache",
     "get_policy_cache",
     "get_similarity_cache",
+    "get_tiered_cache",
+    "get_cache_stats",
     "cached",
     "async_cached",
     "invalidate_policy_cache",
@@ -143,6 +159,12 @@ __all__ = [
     "TaskResult",
     "BatchProgress",
     "ConcurrentDownloader",
+    "AdaptiveLimit",
+    "stream_concurrent",
     "run_concurrent",
     "download_with_retry",
+    # Resilience
+    "HostPolicy",
+    "get_host_policy",
+    "get_resilience_stats",
 ]
@@ -3,16 +3,42 @@ Caching utilities for Plana.AI.
 
 Provides in-memory caching with TTL support.
 For production, this should be extended to use Redis.
+
+``InMemoryCache`` is split into shards, each with its own lock and an
+``OrderedDict`` kept in least-recently-used order, so get, set and
+eviction are O(1) and concurrent callers only contend on one shard.
+Expired entries are dropped lazily on access and swept from a per-shard
+timing wheel (one bucket per second of expiry time) as the clock moves
+on, so expiry costs nothing per entry that is not already due.
+
+Cached ``None`` results are real hits: ``get`` takes a ``default`` and
+the decorators look values up against a private sentinel.
+
+``TieredCache`` puts a namespaced memory tier in front of an optional
+SQLite file that several processes (the API and the standalone document
+worker) can share.  Its ``get_or_set`` / ``aget_or_set`` load a missing
+key once however many callers ask for it concurrently (single-flight),
+and can keep serving an expired entry for a grace period while one
+background refresh runs (stale-while-revalidate).  ``get_cache_stats``
+reports every namespace.
 """
 
 import asyncio
+import concurrent.futures
+import dataclasses
+import enum
 import functools
 import hashlib
-import json
+import math
+import pickle
+import sqlite3
+import sys
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Callable, Generic, Optional, TypeVar
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Generic, Optional, Protocol, TypeVar, Union, cast
 
 from plana.core.constants import CacheConfig
 from plana.core.logging import get_logger
@@ -21,30 +47,141 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# Marks "no entry"; distinct from a cached None
+_MISSING = object()
+
+# Width of a timing wheel bucket (seconds)
+_WHEEL_TICK = 1.0
+
 
 @dataclass
 class CacheEntry(Generic[T]):
-    """A cached value with metadata."""
+    """A cached value with metadata.
+
+    Times are ``time.monotonic()`` readings.
+    """
 
     value: T
     expires_at: float
     created_at: float
+    size: int = 0  # Estimated bytes (0 unless the cache has a byte limit)
 
     @property
     def is_expired(self) -> bool:
         """Check if the entry has expired."""
-        return time.time() > self.expires_at
+        return time.monotonic() >= self.expires_at
 
     @property
     def age_seconds(self) -> float:
         """Get the age of the entry in seconds."""
-        return time.time() - self.created_at
+        return time.monotonic() - self.created_at
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """Rough size of a value in bytes, following containers and objects.
+
+    Used to enforce ``max_bytes``; it is an estimate (shared objects are
+    counted each time they are reached, and nesting below a few levels
+    is counted shallowly).
+    """
+    size = sys.getsizeof(value)
+    if _depth >= 4 or isinstance(value, (str, bytes, bytearray, int, float, bool)):
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+            for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, _depth + 1) for item in value)
+    attrs = getattr(value, "__dict__", None)
+    if attrs is not None:
+        return size + estimate_size(attrs, _depth + 1)
+    return size
+
+
+class _Shard:
+    """One independently locked part of an ``InMemoryCache``."""
+
+    __slots__ = (
+        "lock", "entries", "wheel", "cursor", "max_size", "max_bytes", "bytes",
+        "hits", "misses", "evictions", "expirations",
+    )
+
+    def __init__(self, max_size: int, max_bytes: Optional[int], now: float):
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[Any, CacheEntry] = OrderedDict()  # LRU first
+        self.wheel: dict[int, set] = {}  # Expiry tick -> keys expiring in it
+        self.cursor = _tick(now)  # Ticks before this have been swept
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # Callers hold ``lock`` for everything below.
+
+    def remove(self, key: Any) -> CacheEntry:
+        entry = self.entries.pop(key)
+        self.bytes -= entry.size
+        tick = _tick(entry.expires_at)
+        bucket = self.wheel.get(tick)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self.wheel[tick]
+        return entry
+
+    def insert(self, key: Any, entry: CacheEntry) -> None:
+        if key in self.entries:
+            self.remove(key)
+        self.entries[key] = entry
+        self.bytes += entry.size
+        self.wheel.setdefault(_tick(entry.expires_at), set()).add(key)
+
+    def sweep(self, now: float) -> int:
+        """Drop entries in wheel buckets that are wholly in the past."""
+        tick = _tick(now)
+        if tick <= self.cursor:
+            return 0
+        if tick - self.cursor > len(self.wheel):
+            due = [t for t in self.wheel if t < tick]
+        else:
+            due = [t for t in range(self.cursor, tick) if t in self.wheel]
+        self.cursor = tick
+        removed = 0
+        for t in due:
+            for key in list(self.wheel.get(t, ())):
+                self.remove(key)
+                removed += 1
+        self.expirations += removed
+        return removed
+
+    def evict(self) -> int:
+        """Drop least recently used entries until within the limits."""
+        removed = 0
+        while self.entries and (
+            len(self.entries) > self.max_size
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            self.remove(next(iter(self.entries)))
+            removed += 1
+        self.evictions += removed
+        return removed
+
+
+def _tick(t: float) -> int:
+    return int(t // _WHEEL_TICK)
 
 
 class InMemoryCache(Generic[T]):
-    """Thread-safe in-memory cache with TTL support.
+    """Thread-safe in-memory LRU cache with TTL support.
 
-    Uses a simple dictionary with periodic cleanup.
+    Keys are spread over ``shards`` independently locked shards, each
+    holding an equal share of ``max_size`` (and ``max_bytes``), so the
+    least recently used entry is evicted per shard rather than globally.
     For production, consider using Redis.
     """
 
@@ -52,69 +189,114 @@ class InMemoryCache(Generic[T]):
         self,
         default_ttl: int = CacheConfig.DEFAULT_TTL,
         max_size: int = CacheConfig.MAX_CACHE_SIZE,
+        max_bytes: Optional[int] = None,
+        shards: int = CacheConfig.SHARDS,
+        sizer: Callable[[Any], int] = estimate_size,
     ):
         """Initialize the cache.
 
         Args:
             default_ttl: Default time-to-live in seconds
             max_size: Maximum number of entries
+            max_bytes: Maximum estimated size of all values, or None for
+                no byte limit
+            shards: Number of independently locked shards (at most
+                ``max_size``)
+            sizer: Estimates a value's size in bytes (used only with
+                ``max_bytes``)
         """
-        self._cache: dict[str, CacheEntry[T]] = {}
-        self._lock = threading.RLock()
         self.default_ttl = default_ttl
         self.max_size = max_size
-        self._hits = 0
-        self._misses = 0
+        self.max_bytes = max_bytes
+        self._sizer = sizer
+
+        count = max(1, min(shards, max_size))
+        now = time.monotonic()
+        self._shards = [
+            _Shard(
+                max_size // count + (1 if i < max_size % count else 0),
+                None if max_bytes is None else max_bytes // count,
+                now,
+            )
+            for i in range(count)
+        ]
 
-    def get(self, key: str) -> Optional[T]:
+    def _shard(self, key: Any) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: Any, default: Any = None) -> Any:
         """Get a value from the cache.
 
         Args:
             key: Cache key
+            default: Returned when the key is not cached (or has expired)
 
         Returns:
-            Cached value or None if not found/expired
+            Cached value, or ``default`` if not found/expired
         """
-        with self._lock:
-            entry = self._cache.get(key)
+        now = time.monotonic()
+        shard = self._shard(key)
+        with shard.lock:
+            shard.sweep(now)
+            entry = shard.entries.get(key)
 
             if entry is None:
-                self._misses += 1
-                return None
+                shard.misses += 1
+                return default
 
-            if entry.is_expired:
-                del self._cache[key]
-                self._misses += 1
-                return None
+            if now >= entry.expires_at:
+                shard.remove(key)
+                shard.expirations += 1
+                shard.misses += 1
+                return default
 
-            self._hits += 1
+            shard.entries.move_to_end(key)
+            shard.hits += 1
             return entry.value
 
+    def __contains__(self, key: Any) -> bool:
+        """Whether an unexpired entry exists (does not count as a hit)."""
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            return entry is not None and time.monotonic() < entry.expires_at
+
     def set(
-        self, key: str, value: T, ttl: Optional[int] = None
+        self, key: Any, value: T, ttl: Optional[float] = None
     ) -> None:
         """Set a value in the cache.
 
+        Values larger than the cache's per-shard byte limit are not
+        stored.
+
         Args:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if not specified)
         """
         ttl = ttl if ttl is not None else self.default_ttl
-        now = time.time()
-
-        with self._lock:
-            # Evict if at capacity
-            if len(self._cache) >= self.max_size and key not in self._cache:
-                self._evict_oldest()
-
-            self._cache[key] = CacheEntry(
+        now = time.monotonic()
+        shard = self._shard(key)
+        size = self._sizer(value) if shard.max_bytes is not None else 0
+
+        with shard.lock:
+            shard.sweep(now)
+            if shard.max_bytes is not None and size > shard.max_bytes:
+                if key in shard.entries:
+                    shard.remove(key)
+                logger.debug("cache_value_too_large", size=size, max_bytes=shard.max_bytes)
+                return
+
+            shard.insert(key, CacheEntry(
                 value=value,
                 expires_at=now + ttl,
                 created_at=now,
-            )
+                size=size,
+            ))
+            if shard.evict():
+                logger.debug("cache_eviction", size=len(shard.entries))
 
-    def delete(self, key: str) -> bool:
+    def delete(self, key: Any) -> bool:
         """Delete a key from the cache.
 
         Args:
@@ -123,9 +305,10 @@ class InMemoryCache(Generic[T]):
         Returns:
             True if key existed, False otherwise
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+        shard = self._shard(key)
+        with shard.lock:
+            if key in shard.entries:
+                shard.remove(key)
                 return True
             return False
 
@@ -135,62 +318,521 @@ class InMemoryCache(Generic[T]):
         Returns:
             Number of entries cleared
         """
-        with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            return count
+        count = 0
+        for shard in self._shards:
+            with shard.lock:
+                count += len(shard.entries)
+                shard.entries.clear()
+                shard.wheel.clear()
+                shard.bytes = 0
+        return count
 
     def cleanup(self) -> int:
         """Remove expired entries.
 
+        Expired entries are also removed as the cache is used; this
+        catches the ones in the current second's bucket too.
+
         Returns:
             Number of entries removed
         """
-        now = time.time()
+        now = time.monotonic()
         removed = 0
 
-        with self._lock:
-            expired_keys = [
-                k for k, v in self._cache.items() if v.expires_at < now
-            ]
-            for key in expired_keys:
-                del self._cache[key]
-                removed += 1
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.sweep(now)
+                current = [
+                    key for key in shard.wheel.get(_tick(now), ())
+                    if shard.entries[key].expires_at <= now
+                ]
+                for key in current:
+                    shard.remove(key)
+                shard.expirations += len(current)
+                removed += len(current)
 
         if removed > 0:
             logger.debug("cache_cleanup", entries_removed=removed)
 
         return removed
 
-    def _evict_oldest(self) -> None:
-        """Evict the oldest entry to make room."""
-        if not self._cache:
-            return
-
-        oldest_key = min(
-            self._cache.keys(), key=lambda k: self._cache[k].created_at
-        )
-        del self._cache[oldest_key]
-        logger.debug("cache_eviction", key=oldest_key)
+    def __len__(self) -> int:
+        return self.size
 
     @property
     def size(self) -> int:
         """Get current cache size."""
-        return len(self._cache)
+        return sum(len(shard.entries) for shard in self._shards)
 
     @property
     def stats(self) -> dict[str, Any]:
         """Get cache statistics."""
-        total = self._hits + self._misses
-        hit_rate = (self._hits / total * 100) if total > 0 else 0
-
-        return {
-            "size": self.size,
+        hits = misses = evictions = expirations = size = nbytes = 0
+        for shard in self._shards:
+            with shard.lock:
+                hits += shard.hits
+                misses += shard.misses
+                evictions += shard.evictions
+                expirations += shard.expirations
+                size += len(shard.entries)
+                nbytes += shard.bytes
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total > 0 else 0
+
+        stats = {
+            "size": size,
             "max_size": self.max_size,
-            "hits": self._hits,
-            "misses": self._misses,
+            "hits": hits,
+            "misses": misses,
             "hit_rate_percent": round(hit_rate, 2),
+            "evictions": evictions,
+            "expirations": expirations,
+            "shards": len(self._shards),
         }
+        if self.max_bytes is not None:
+            stats["bytes"] = nbytes
+            stats["max_bytes"] = self.max_bytes
+        return stats
+
+
+# =============================================================================
+# Disk Tier
+# =============================================================================
+
+
+class SQLiteCacheTier:
+    """Cache entries in a SQLite file, shared by every process that opens it.
+
+    Values are pickled; ones that cannot be pickled are simply not
+    stored.  Times are wall-clock (``time.time()``) so that processes
+    agree on them.  Each thread uses its own connection.
+    """
+
+    # Expired rows are pruned once every this many writes
+    PRUNE_EVERY = 200
+
+    def __init__(self, path: Union[str, Path]):
+        """Open (creating if needed) the cache file.
+
+        Args:
+            path: Path of the SQLite file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._writes = 0
+        with self._connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    fresh_until REAL NOT NULL,
+                    stale_until REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                ) WITHOUT ROWID
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_stale_until "
+                "ON cache_entries(stale_until)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, namespace: str, key: str) -> Optional["_Stored"]:
+        """Stored entry, or None if missing, past its stale window or unreadable."""
+        row = self._connection().execute(
+            "SELECT value, fresh_until, stale_until FROM cache_entries "
+            "WHERE namespace = ? AND key = ? AND stale_until > ?",
+            (namespace, key, time.time()),
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            value = pickle.loads(row[0])
+        except Exception:
+            self.delete(namespace, key)
+            return None
+        return _Stored(value, row[1], row[2])
+
+    def set(self, namespace: str, key: str, stored: "_Stored") -> bool:
+        """Store an entry; returns False if the value cannot be pickled."""
+        try:
+            blob = pickle.dumps(stored.value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as exc:
+            logger.debug("disk_cache_unpicklable", namespace=namespace, error=str(exc))
+            return False
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries "
+            "(namespace, key, value, created_at, fresh_until, stale_until) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (namespace, key, blob, time.time(), stored.fresh_until, stored.stale_until),
+        )
+        self._writes += 1
+        if self._writes % self.PRUNE_EVERY == 0:
+            self.prune()
+        return True
+
+    def delete(self, namespace: str, key: str) -> bool:
+        """Delete an entry; returns True if it existed."""
+        cursor = self._connection().execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        )
+        return cursor.rowcount > 0
+
+    def clear(self, namespace: str) -> int:
+        """Delete every entry in a namespace; returns the number deleted."""
+        cursor = self._connection().execute(
+            "DELETE FROM cache_entries WHERE namespace = ?", (namespace,)
+        )
+        return cursor.rowcount
+
+    def prune(self) -> int:
+        """Delete entries past their stale window; returns the number deleted."""
+        cursor = self._connection().execute(
+            "DELETE FROM cache_entries WHERE stale_until <= ?", (time.time(),)
+        )
+        return cursor.rowcount
+
+    def count(self, namespace: str) -> int:
+        """Number of stored entries in a namespace (including expired ones)."""
+        row = self._connection().execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (namespace,)
+        ).fetchone()
+        return row[0] if row else 0
+
+
+# =============================================================================
+# Two-Tier Cache
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _Stored:
+    """A value with its wall-clock freshness window, as held by a tiered cache."""
+
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+
+class TieredCache:
+    """A namespaced memory tier in front of an optional shared disk tier.
+
+    Lookups try memory, then disk (promoting disk hits into memory).
+    ``get_or_set`` / ``aget_or_set`` run the loader for a missing key
+    once, however many callers (threads or coroutines) ask for it at
+    the same time: later callers wait on the first one's in-flight
+    future.  An entry past its ``ttl`` but within ``stale_ttl`` more
+    seconds is served as-is while a single background refresh runs.
+
+    Keys are strings.  Loader exceptions reach every waiting caller and
+    are not cached.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: float = CacheConfig.DEFAULT_TTL,
+        stale_ttl: float = 0,
+        memory: Optional[InMemoryCache] = None,
+        disk: Optional[SQLiteCacheTier] = None,
+        cache_none: bool = True,
+    ):
+        """Initialize the cache.
+
+        Args:
+            namespace: Name for stats and for the disk tier's rows
+            ttl: Seconds an entry is fresh
+            stale_ttl: Further seconds an entry may be served while it
+                is refreshed
+            memory: Memory tier (a new ``InMemoryCache`` if not given)
+            disk: Disk tier, or None for memory only
+            cache_none: Whether a loader returning None is cached
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.memory = memory if memory is not None else InMemoryCache(
+            default_ttl=int(ttl + stale_ttl),
+        )
+        self.disk = disk
+        self.cache_none = cache_none
+        self._inflight: dict[str, concurrent.futures.Future] = {}
+        self._refreshing: set[str] = set()
+        self._background: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stale_served": 0,
+            "loads": 0,
+            "coalesced": 0,
+            "refreshes": 0,
+            "errors": 0,
+        }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _memory_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _lookup(self, key: str) -> Optional[_Stored]:
+        """Entry within its stale window from memory or disk, else None."""
+        now = time.time()
+        stored = self.memory.get(self._memory_key(key))
+        if isinstance(stored, _Stored) and stored.stale_until > now:
+            self._count("memory_hits")
+            return stored
+        if self.disk is not None:
+            try:
+                stored = self.disk.get(self.namespace, key)
+            except Exception as exc:
+                logger.debug("disk_cache_read_failed", namespace=self.namespace, error=str(exc))
+                stored = None
+            if isinstance(stored, _Stored):
+                self._count("disk_hits")
+                self.memory.set(self._memory_key(key), stored, stored.stale_until - now)
+                return stored
+        return None
+
+    def _store(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        if value is None and not self.cache_none:
+            return
+        now = time.time()
+        fresh_until = now + (self.ttl if ttl is None else ttl)
+        stored = _Stored(value, fresh_until, fresh_until + self.stale_ttl)
+        self.memory.set(self._memory_key(key), stored, stored.stale_until - now)
+        if self.disk is not None:
+            try:
+                self.disk.set(self.namespace, key, stored)
+            except Exception as exc:
+                logger.debug("disk_cache_write_failed", namespace=self.namespace, error=str(exc))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Fresh cached value, or ``default``."""
+        stored = self._lookup(key)
+        if stored is None or stored.fresh_until <= time.time():
+            return default
+        return stored.value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value in both tiers."""
+        self._store(key, value, ttl)
+
+    def delete(self, key: str) -> bool:
+        """Remove a key from both tiers; returns True if either held it."""
+        removed = self.memory.delete(self._memory_key(key))
+        if self.disk is not None:
+            try:
+                removed = self.disk.delete(self.namespace, key) or removed
+            except Exception:
+                pass  # Non-fatal
+        return removed
+
+    def clear(self) -> int:
+        """Remove the namespace's entries from the disk tier and its own memory."""
+        count = 0
+        if self.disk is not None:
+            try:
+                count = self.disk.clear(self.namespace)
+            except Exception:
+                pass  # Non-fatal
+        prefix = f"{self.namespace}:"
+        for shard in self.memory._shards:
+            with shard.lock:
+                keys = [k for k in shard.entries if isinstance(k, str) and k.startswith(prefix)]
+                for k in keys:
+                    shard.remove(k)
+                count += len(keys)
+        return count
+
+    # ---- Single-flight loading ----
+
+    def _claim(self, key: str) -> tuple[concurrent.futures.Future, bool]:
+        """The key's in-flight future, and whether this caller must load it."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                return future, False
+            future = self._inflight[key] = concurrent.futures.Future()
+            return future, True
+
+    def _settle(
+        self,
+        key: str,
+        future: concurrent.futures.Future,
+        value: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        if isinstance(error, asyncio.CancelledError):
+            future.cancel()  # Waiters retry rather than fail
+        elif error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    def _fresh(self, key: str) -> tuple[Optional[_Stored], bool]:
+        """Cached entry (if any) and whether it is still fresh."""
+        stored = self._lookup(key)
+        if stored is None:
+            return None, False
+        return stored, stored.fresh_until > time.time()
+
+    def get_or_set(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Cached value for ``key``, calling ``loader()`` at most once to fill it.
+
+        Args:
+            key: Cache key
+            loader: Computes the value on a miss
+
+        Returns:
+            The cached, stale-but-refreshing, or newly loaded value
+        """
+        stored, fresh = self._fresh(key)
+        if stored is not None:
+            if not fresh:
+                self._count("stale_served")
+                self._refresh_in_thread(key, loader)
+            return stored.value
+
+        future, leader = self._claim(key)
+        if not leader:
+            try:
+                return future.result()
+            except concurrent.futures.CancelledError:
+                return self.get_or_set(key, loader)  # The loading caller was cancelled
+
+        self._count("misses")
+        try:
+            # Another loader may have finished between the lookup and the claim
+            stored, fresh = self._fresh(key)
+            if stored is not None and fresh:
+                value = stored.value
+            else:
+                self._count("loads")
+                value = loader()
+                self._store(key, value)
+        except BaseException as exc:
+            self._count("errors")
+            self._settle(key, future, error=exc)
+            raise
+        self._settle(key, future, value)
+        return value
+
+    async def aget_or_set(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Async ``get_or_set``: ``loader()`` returns an awaitable.
+
+        Concurrent callers, in this or other event loops or threads,
+        wait for a single load.
+        """
+        stored, fresh = self._fresh(key)
+        if stored is not None:
+            if not fresh:
+                self._count("stale_served")
+                self._refresh_in_task(key, loader)
+            return stored.value
+
+        future, leader = self._claim(key)
+        if not leader:
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                return await self.aget_or_set(key, loader)  # The loading caller was cancelled
+
+        self._count("misses")
+        try:
+            stored, fresh = self._fresh(key)
+            if stored is not None and fresh:
+                value = stored.value
+            else:
+                self._count("loads")
+                value = await loader()
+                self._store(key, value)
+        except BaseException as exc:
+            self._count("errors")
+            self._settle(key, future, error=exc)
+            raise
+        self._settle(key, future, value)
+        return value
+
+    # ---- Stale-while-revalidate ----
+
+    def _start_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing or key in self._inflight:
+                return False
+            self._refreshing.add(key)
+            self._stats["refreshes"] += 1
+            return True
+
+    def _finish_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def _refresh_in_thread(self, key: str, loader: Callable[[], Any]) -> None:
+        if not self._start_refresh(key):
+            return
+
+        def run() -> None:
+            try:
+                self._store(key, loader())
+            except Exception as exc:
+                self._count("errors")
+                logger.warning("cache_refresh_failed", namespace=self.namespace, error=str(exc))
+            finally:
+                self._finish_refresh(key)
+
+        threading.Thread(target=run, name=f"cache-refresh-{self.namespace}", daemon=True).start()
+
+    def _refresh_in_task(self, key: str, loader: Callable[[], Awaitable[Any]]) -> None:
+        if not self._start_refresh(key):
+            return
+
+        async def run() -> None:
+            try:
+                self._store(key, await loader())
+            except Exception as exc:
+                self._count("errors")
+                logger.warning("cache_refresh_failed", namespace=self.namespace, error=str(exc))
+            finally:
+                self._finish_refresh(key)
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Counters for this namespace, plus its memory tier's stats."""
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["in_flight"] = len(self._inflight)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        stats["hit_rate_percent"] = round(hits / lookups * 100, 2) if lookups else 0
+        stats["memory"] = self.memory.stats
+        stats["disk"] = str(self.disk.path) if self.disk is not None else None
+        return stats
 
 
 # =============================================================================
@@ -199,16 +841,20 @@ class InMemoryCache(Generic[T]):
 
 _policy_cache: Optional[InMemoryCache] = None
 _similarity_cache: Optional[InMemoryCache] = None
+_global_lock = threading.Lock()
 
 
 def get_policy_cache() -> InMemoryCache:
     """Get the global policy cache."""
     global _policy_cache
     if _policy_cache is None:
-        _policy_cache = InMemoryCache(
-            default_ttl=CacheConfig.POLICY_CACHE_TTL,
-            max_size=500,
-        )
+        with _global_lock:
+            if _policy_cache is None:
+                _policy_cache = InMemoryCache(
+                    default_ttl=CacheConfig.POLICY_CACHE_TTL,
+                    max_size=500,
+                    max_bytes=CacheConfig.POLICY_CACHE_MAX_BYTES,
+                )
     return _policy_cache
 
 
@@ -216,18 +862,105 @@ def get_similarity_cache() -> InMemoryCache:
     """Get the global similarity cache."""
     global _similarity_cache
     if _similarity_cache is None:
-        _similarity_cache = InMemoryCache(
-            default_ttl=CacheConfig.DEFAULT_TTL,
-            max_size=200,
-        )
+        with _global_lock:
+            if _similarity_cache is None:
+                _similarity_cache = InMemoryCache(
+                    default_ttl=CacheConfig.DEFAULT_TTL,
+                    max_size=200,
+                    max_bytes=CacheConfig.SIMILARITY_CACHE_MAX_BYTES,
+                )
     return _similarity_cache
 
 
+_tiered_caches: dict[str, TieredCache] = {}
+
+
+def get_tiered_cache(
+    namespace: str,
+    ttl: float = CacheConfig.DEFAULT_TTL,
+    stale_ttl: float = 0,
+    disk_path: Optional[Union[str, Path]] = None,
+    max_size: int = CacheConfig.MAX_CACHE_SIZE,
+    cache_none: bool = True,
+) -> TieredCache:
+    """Get (creating on first use) the shared two-tier cache for a namespace.
+
+    Args:
+        namespace: Cache namespace (also its name in ``get_cache_stats``)
+        ttl: Seconds an entry is fresh
+        stale_ttl: Further seconds an entry may be served while refreshed
+        disk_path: SQLite file for the disk tier, or None for memory only.
+            Asking again with a different path (e.g. after the database
+            moved) replaces the namespace's cache.
+        max_size: Memory tier size
+        cache_none: Whether loader results of None are cached
+
+    Returns:
+        TieredCache for the namespace
+    """
+    with _global_lock:
+        cache = _tiered_caches.get(namespace)
+        disk_path = Path(disk_path).resolve() if disk_path is not None else None
+        current = cache.disk.path.resolve() if cache is not None and cache.disk else None
+        if cache is None or current != disk_path:
+            cache = _tiered_caches[namespace] = TieredCache(
+                namespace,
+                ttl=ttl,
+                stale_ttl=stale_ttl,
+                memory=InMemoryCache(default_ttl=int(ttl + stale_ttl), max_size=max_size),
+                disk=SQLiteCacheTier(disk_path) if disk_path is not None else None,
+                cache_none=cache_none,
+            )
+        return cache
+
+
+def get_cache_stats() -> dict[str, dict[str, Any]]:
+    """Stats for every cache namespace in this process."""
+    stats: dict[str, dict[str, Any]] = {}
+    if _policy_cache is not None:
+        stats["policy"] = _policy_cache.stats
+    if _similarity_cache is not None:
+        stats["similarity"] = _similarity_cache.stats
+    with _global_lock:
+        tiered = list(_tiered_caches.values())
+    for cache in tiered:
+        stats[cache.namespace] = cache.stats
+    return stats
+
+
 # =============================================================================
 # Caching Decorators
 # =============================================================================
 
 
+def _key_form(value: Any) -> Any:
+    """Hashable, type-tagged structure of a value for cache keys.
+
+    Equal values give equal forms regardless of dict or set ordering,
+    while values that merely print alike (``1`` and ``"1"``, ``[1]`` and
+    ``(1,)``) do not.  Objects with no structure of their own fall back
+    to their ``repr``.
+    """
+    if value is None or isinstance(value, (bool, int, str, bytes)):
+        return (type(value).__name__, value)
+    if isinstance(value, float):
+        return ("float", "nan" if math.isnan(value) else value)
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_key_form(item) for item in value))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted(((_key_form(k), _key_form(v)) for k, v in value.items()), key=repr)))
+    if isinstance(value, (set, frozenset)):
+        return ("set", tuple(sorted((_key_form(item) for item in value), key=repr)))
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (
+            type(value).__qualname__,
+            tuple((f.name, _key_form(getattr(value, f.name))) for f in dataclasses.fields(value)),
+        )
+    if isinstance(value, enum.Enum):
+        return (type(value).__qualname__, _key_form(value.value))
+    return (type(value).__qualname__, repr(value))
+
+
 def make_cache_key(*args, **kwargs) -> str:
     """Create a cache key from function arguments.
 
@@ -238,13 +971,18 @@ def make_cache_key(*args, **kwargs) -> str:
     Returns:
         Hash-based cache key
     """
-    # Create a string representation of args and kwargs
-    key_parts = [str(arg) for arg in args]
-    key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-    key_string = ":".join(key_parts)
+    form = (_key_form(args), _key_form(kwargs))
 
     # Hash for consistent key length
-    return hashlib.md5(key_string.encode()).hexdigest()
+    return hashlib.blake2b(repr(form).encode(), digest_size=16).hexdigest()
+
+
+class _CachedFunction(Protocol):
+    """A function returned by ``cached``/``async_cached``, exposing its cache."""
+
+    cache: Any
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
 
 
 def cached(
@@ -252,7 +990,7 @@ def cached(
     cache: Optional[InMemoryCache] = None,
     key_prefix: str = "",
 ) -> Callable:
-    """Decorator to cache function results.
+    """Decorator to cache function results (including None).
 
     Args:
         ttl: Time-to-live in seconds
@@ -262,17 +1000,17 @@ def cached(
     Returns:
         Decorator function
     """
-    _cache = cache or InMemoryCache(default_ttl=ttl)
+    _cache = cache if cache is not None else InMemoryCache(default_ttl=ttl)
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
-        def wrapper(*args, **kwargs):
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Build cache key
-            cache_key = f"{key_prefix}:{func.__name__}:{make_cache_key(*args, **kwargs)}"
+            cache_key = f"{key_prefix}:{func.__qualname__}:{make_cache_key(*args, **kwargs)}"
 
             # Try to get from cache
-            cached_value = _cache.get(cache_key)
-            if cached_value is not None:
+            cached_value = _cache.get(cache_key, _MISSING)
+            if cached_value is not _MISSING:
                 logger.debug("cache_hit", function=func.__name__, key=cache_key[:20])
                 return cached_value
 
@@ -283,7 +1021,9 @@ def cached(
 
             return result
 
-        return wrapper
+        cached_wrapper = cast(_CachedFunction, wrapper)
+        cached_wrapper.cache = _cache
+        return cached_wrapper
 
     return decorator
 
@@ -292,39 +1032,52 @@ def async_cached(
     ttl: int = CacheConfig.DEFAULT_TTL,
     cache: Optional[InMemoryCache] = None,
     key_prefix: str = "",
+    stale_ttl: float = 0,
+    disk_path: Optional[Union[str, Path]] = None,
 ) -> Callable:
-    """Decorator to cache async function results.
+    """Decorator to cache async function results (including None).
+
+    Concurrent calls with the same arguments share one call of the
+    wrapped coroutine.  The results are listed in ``get_cache_stats``
+    under ``key_prefix`` (or the function's name).
 
     Args:
         ttl: Time-to-live in seconds
-        cache: Cache instance to use
+        cache: Memory cache instance to use
         key_prefix: Prefix for cache keys
+        stale_ttl: Seconds past ``ttl`` that a result is still served
+            while it is recomputed in the background
+        disk_path: SQLite file to also keep results in, shared with
+            other processes (values must be picklable)
 
     Returns:
         Decorator function
     """
-    _cache = cache or InMemoryCache(default_ttl=ttl)
 
     def decorator(func: Callable) -> Callable:
+        namespace = key_prefix or func.__qualname__
+        if cache is None and disk_path is None:
+            tiered = TieredCache(namespace, ttl=ttl, stale_ttl=stale_ttl)
+        else:
+            tiered = TieredCache(
+                namespace,
+                ttl=ttl,
+                stale_ttl=stale_ttl,
+                memory=cache,
+                disk=SQLiteCacheTier(disk_path) if disk_path is not None else None,
+            )
+        with _global_lock:
+            _tiered_caches.setdefault(namespace, tiered)
+
         @functools.wraps(func)
-        async def wrapper(*args, **kwargs):
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Build cache key
-            cache_key = f"{key_prefix}:{func.__name__}:{make_cache_key(*args, **kwargs)}"
-
-            # Try to get from cache
-            cached_value = _cache.get(cache_key)
-            if cached_value is not None:
-                logger.debug("cache_hit", function=func.__name__, key=cache_key[:20])
-                return cached_value
-
-            # Call function and cache result
-            result = await func(*args, **kwargs)
-            _cache.set(cache_key, result, ttl)
-            logger.debug("cache_miss", function=func.__name__, key=cache_key[:20])
-
-            return result
+            cache_key = f"{func.__qualname__}:{make_cache_key(*args, **kwargs)}"
+            return await tiered.aget_or_set(cache_key, lambda: func(*args, **kwargs))
 
-        return wrapper
+        cached_wrapper = cast(_CachedFunction, wrapper)
+        cached_wrapper.cache = tiered
+        return cached_wrapper
 
     return decorator
 
@@ -87,6 +87,23 @@ class RateLimitConfig:
     # Retry backoff multiplier
     RETRY_BACKOFF_MULTIPLIER: Final[float] = 2.0
 
+    # First retry delay and the cap on any one delay (seconds, before jitter)
+    RETRY_BASE_DELAY: Final[float] = 0.5
+    RETRY_MAX_DELAY: Final[float] = 8.0
+
+    # Process-wide retry budget: retries earn RETRY_BUDGET_RATIO per request,
+    # with at most RETRY_BUDGET_RESERVE banked
+    RETRY_BUDGET_RATIO: Final[float] = 0.2
+    RETRY_BUDGET_RESERVE: Final[float] = 10.0
+
+    # Default token bucket for hosts without their own settings
+    HOST_REQUESTS_PER_SECOND: Final[float] = 10.0
+    HOST_BURST: Final[int] = 10
+
+    # Circuit breaker: consecutive failures to open, seconds before a probe
+    CIRCUIT_FAILURE_THRESHOLD: Final[int] = 5
+    CIRCUIT_RESET_TIMEOUT: Final[float] = 30.0
+
 
 # =============================================================================
 # Document Processing
@@ -144,6 +161,22 @@ class CacheConfig:
     # Maximum cache size (number of entries)
     MAX_CACHE_SIZE: Final[int] = 1000
 
+    # Independently locked shards per in-memory cache
+    SHARDS: Final[int] = 8
+
+    # Approximate memory limits for the shared caches (bytes)
+    POLICY_CACHE_MAX_BYTES: Final[int] = 32 * 1024 * 1024
+    SIMILARITY_CACHE_MAX_BYTES: Final[int] = 16 * 1024 * 1024
+
+    # Generated reports (seconds); keys change whenever the documents do
+    REPORT_CACHE_TTL: Final[int] = 86400  # 24 hours
+
+    # Council portal pages (seconds): fresh while an application is
+    # pending, far longer once it is decided; kept for revalidation
+    PORTAL_PENDING_TTL: Final[int] = 3600  # 1 hour
+    PORTAL_DECIDED_TTL: Final[int] = 30 * 86400  # 30 days
+    PORTAL_RETAIN_TTL: Final[int] = 90 * 86400  # 90 days
+
 
 # =============================================================================
 # API Configuration
@@ -191,6 +191,22 @@ class PortalUnavailableError(PortalError):
     safe_message = "Council portal is temporarily unavailable"
 
 
+class CircuitOpenError(PortalUnavailableError):
+    """Calls to an upstream host are failing fast after repeated failures."""
+
+    error_code = "CIRCUIT_OPEN"
+    safe_message = "An upstream service is temporarily unavailable"
+
+    def __init__(self, host: str, retry_after: float, **kwargs):
+        super().__init__(
+            f"Circuit open for {host}; retry in {retry_after:.1f}s",
+            details={"host": host, "retry_after": retry_after},
+            **kwargs,
+        )
+        self.host = host
+        self.retry_after = retry_after
+
+
 # =============================================================================
 # Processing Errors
 # =============================================================================
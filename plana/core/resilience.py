@@ -0,0 +1,485 @@
+"""
+Per-host rate limiting, retries and circuit breaking for outbound HTTP.
+
+Every request to an upstream host (the council portal, the ArcGIS
+services, postcodes.io) goes through that host's ``HostPolicy``, shared
+by every adapter, thread and event loop in the process:
+
+- a **token bucket** spaces requests (``rate`` per second, bursts of
+  ``burst``);
+- **retries** use full-jitter exponential backoff capped at
+  ``max_delay``, and each one is paid for from a process-wide
+  ``RetryBudget`` that only refills as requests are made, so an outage
+  cannot turn into a retry storm;
+- a **circuit breaker** opens after ``failure_threshold`` consecutive
+  failures and fails fast with ``CircuitOpenError`` until a single probe
+  succeeds after ``reset_timeout`` seconds.
+
+When a host struggles, callers spend less time waiting on it, not more:
+a ``Retry-After`` longer than ``max_delay`` is not waited out, and an
+open circuit costs no request at all.
+"""
+
+import asyncio
+import random
+import threading
+import time
+import urllib.error
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+from urllib.parse import urlsplit
+
+from plana.core.constants import RateLimitConfig
+from plana.core.exceptions import CircuitOpenError
+from plana.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Statuses worth retrying: rate limited, or the upstream is struggling
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryableHTTPStatus(Exception):
+    """A response whose status means "try again later".
+
+    Raised by request callables so ``HostPolicy`` can retry the response
+    like a transport error.
+    """
+
+    def __init__(self, status_code: int, url: str = "", retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status_code} from {url}" if url else f"HTTP {status_code}")
+        self.status_code = status_code
+        self.url = url
+        self.retry_after = retry_after
+
+
+def raise_for_retryable_status(response: Any, url: str = "") -> None:
+    """Raise ``RetryableHTTPStatus`` for a 429 or 5xx response.
+
+    Args:
+        response: An httpx response (or anything with ``status_code``/``headers``)
+        url: URL for the error message
+    """
+    if response.status_code in RETRYABLE_STATUS_CODES:
+        raise RetryableHTTPStatus(
+            response.status_code,
+            url=url,
+            retry_after=parse_retry_after(response.headers.get("retry-after")),
+        )
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a ``Retry-After`` header (delay-seconds form only)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """True for timeouts, connection failures and 429/5xx responses.
+
+    Other errors (a 404, a WAF block page) mean the host answered, so
+    retrying would not help.
+    """
+    if isinstance(error, RetryableHTTPStatus):
+        return True
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code in RETRYABLE_STATUS_CODES
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError, urllib.error.URLError)):
+        return True
+    try:
+        import httpx
+
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in RETRYABLE_STATUS_CODES
+        if isinstance(error, httpx.TransportError):
+            return True
+    except ImportError:
+        pass
+    return False
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float = RateLimitConfig.RETRY_BASE_DELAY,
+    max_delay: float = RateLimitConfig.RETRY_MAX_DELAY,
+    multiplier: float = RateLimitConfig.RETRY_BACKOFF_MULTIPLIER,
+) -> float:
+    """Full-jitter exponential backoff before retry number ``attempt + 1``.
+
+    Returns a uniform delay in ``[0, min(max_delay, base * multiplier**attempt)]``,
+    which spreads retries from many callers instead of synchronising them.
+    """
+    return random.uniform(0.0, min(max_delay, base_delay * multiplier ** attempt))
+
+
+def host_of(url_or_host: str) -> str:
+    """Lower-cased host name of a URL (or a bare host)."""
+    if "://" not in url_or_host:
+        return url_or_host.lower()
+    return (urlsplit(url_or_host).hostname or url_or_host).lower()
+
+
+# =============================================================================
+# Building blocks
+# =============================================================================
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    ``reserve()`` takes a token and returns how long the caller must
+    wait for it, so it serves both threads and coroutines; a rate of 0
+    disables the limit.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token; returns the seconds to wait before using it."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RetryBudget:
+    """Process-wide allowance of retries.
+
+    Every request deposits ``ratio`` of a retry, up to ``reserve`` banked;
+    every retry withdraws one.  Healthy traffic keeps the budget full,
+    while during an outage retries are capped at about ``ratio`` of
+    requests instead of multiplying them.
+    """
+
+    def __init__(
+        self,
+        ratio: float = RateLimitConfig.RETRY_BUDGET_RATIO,
+        reserve: float = RateLimitConfig.RETRY_BUDGET_RESERVE,
+    ):
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = reserve
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.denied = 0
+
+    def record_request(self) -> None:
+        """Deposit ``ratio`` of a retry for a request made."""
+        with self._lock:
+            self._balance = min(self.reserve, self._balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Withdraw one retry; False if the budget is exhausted."""
+        with self._lock:
+            if self._balance >= 1.0:
+                self._balance -= 1.0
+                self.retries += 1
+                return True
+            self.denied += 1
+            return False
+
+    @property
+    def balance(self) -> float:
+        """Retries currently available."""
+        return self._balance
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    Closed: calls pass.  After ``failure_threshold`` consecutive failures
+    it opens and ``before_call`` raises ``CircuitOpenError``.  Once
+    ``reset_timeout`` has passed one probe call is let through (half
+    open); its success closes the circuit, its failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = RateLimitConfig.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = RateLimitConfig.CIRCUIT_RESET_TIMEOUT,
+    ):
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` unless a call may go ahead."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            now = time.monotonic()
+            remaining = self._opened_at + self.reset_timeout - now
+            if remaining <= 0:
+                # This caller is the probe; another goes if it never reports back
+                self.state = self.HALF_OPEN
+                self._opened_at = now
+                return
+            self.rejected += 1
+            raise CircuitOpenError(self.host, retry_after=max(0.0, remaining))
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.opened += 1
+                    logger.warning("circuit_opened", host=self.host, failures=self.failures)
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+# =============================================================================
+# Host policies
+# =============================================================================
+
+
+class HostPolicy:
+    """Rate limit, retries and circuit breaker for one upstream host."""
+
+    def __init__(
+        self,
+        host: str,
+        rate: float = RateLimitConfig.HOST_REQUESTS_PER_SECOND,
+        burst: int = RateLimitConfig.HOST_BURST,
+        max_attempts: int = RateLimitConfig.PORTAL_MAX_RETRIES,
+        base_delay: float = RateLimitConfig.RETRY_BASE_DELAY,
+        max_delay: float = RateLimitConfig.RETRY_MAX_DELAY,
+        failure_threshold: int = RateLimitConfig.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = RateLimitConfig.CIRCUIT_RESET_TIMEOUT,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """Initialize the policy.
+
+        Args:
+            host: Host name, for errors and stats
+            rate: Requests per second (0 for no limit)
+            burst: Requests allowed back to back
+            max_attempts: Attempts per call, including the first
+            base_delay: Backoff before the first retry (before jitter)
+            max_delay: Longest single backoff; longer Retry-Afters give up
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+            budget: Retry budget (defaults to the process-wide one)
+        """
+        self.host = host
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(host, failure_threshold, reset_timeout)
+        self.budget = budget or get_retry_budget()
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.requests = 0
+        self.failures = 0
+
+    def _admit(self, throttle: bool) -> float:
+        """Check the breaker and take a token; returns the wait for it."""
+        self.breaker.before_call()
+        self.requests += 1
+        self.budget.record_request()
+        return self.bucket.reserve() if throttle else 0.0
+
+    def _retry_delay(self, error: BaseException, attempt: int, retry_on: Callable[[BaseException], bool]) -> Optional[float]:
+        """Record a failed attempt; returns the backoff, or None to give up."""
+        if not retry_on(error):
+            # The host answered; it is up even if this request was refused
+            self.breaker.record_success()
+            return None
+        self.failures += 1
+        self.breaker.record_failure()
+        if attempt + 1 >= self.max_attempts or self.breaker.state != CircuitBreaker.CLOSED:
+            return None
+        delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            if retry_after > self.max_delay:
+                return None
+            delay = max(delay, retry_after)
+        if not self.budget.try_spend():
+            return None
+        logger.info(
+            "host_retry",
+            host=self.host,
+            attempt=attempt + 1,
+            delay_s=round(delay, 2),
+            error=str(error)[:120],
+        )
+        return delay
+
+    async def throttle(self) -> None:
+        """Wait for a token without retrying or touching the breaker."""
+        delay = self.bucket.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def call(
+        self,
+        func: Callable[[], Awaitable[T]],
+        retry_on: Callable[[BaseException], bool] = is_retryable_error,
+        throttle: bool = True,
+    ) -> T:
+        """Await ``func()`` under this host's limit, retries and breaker.
+
+        Args:
+            func: Makes one attempt; raise (e.g. ``RetryableHTTPStatus``) to fail it
+            retry_on: Decides which errors are retried and count as failures
+            throttle: Take a token from the bucket; pass False for requests
+                whose caller bounds them by concurrency instead (file downloads)
+
+        Returns:
+            The first successful result
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            Exception: The last attempt's error once retries are spent
+        """
+        attempt = 0
+        while True:
+            delay = self._admit(throttle)
+            if delay:
+                await asyncio.sleep(delay)
+            try:
+                result = await func()
+            except Exception as error:
+                backoff = self._retry_delay(error, attempt, retry_on)
+                if backoff is None:
+                    raise
+                await asyncio.sleep(backoff)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+    def call_sync(
+        self,
+        func: Callable[[], T],
+        retry_on: Callable[[BaseException], bool] = is_retryable_error,
+        throttle: bool = True,
+    ) -> T:
+        """Blocking ``call`` for threaded callers."""
+        attempt = 0
+        while True:
+            delay = self._admit(throttle)
+            if delay:
+                time.sleep(delay)
+            try:
+                result = func()
+            except Exception as error:
+                backoff = self._retry_delay(error, attempt, retry_on)
+                if backoff is None:
+                    raise
+                time.sleep(backoff)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Request, failure and circuit counters."""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "circuit": self.breaker.state,
+            "circuit_opened": self.breaker.opened,
+            "rejected": self.breaker.rejected,
+            "rate": self.bucket.rate,
+        }
+
+
+_retry_budget: Optional[RetryBudget] = None
+_host_policies: dict[str, HostPolicy] = {}
+_policies_lock = threading.Lock()
+
+
+def get_retry_budget() -> RetryBudget:
+    """Get the process-wide retry budget."""
+    global _retry_budget
+    if _retry_budget is None:
+        with _policies_lock:
+            if _retry_budget is None:
+                _retry_budget = RetryBudget()
+    return _retry_budget
+
+
+def get_host_policy(url_or_host: str, **settings: Any) -> HostPolicy:
+    """Get the shared policy for a URL's host, creating it on first use.
+
+    Args:
+        url_or_host: A URL or host name
+        **settings: ``HostPolicy`` arguments, used only when the policy
+            is created (the first caller for a host sets its limits)
+
+    Returns:
+        The host's HostPolicy
+    """
+    host = host_of(url_or_host)
+    policy = _host_policies.get(host)
+    if policy is None:
+        budget = get_retry_budget()
+        with _policies_lock:
+            policy = _host_policies.get(host)
+            if policy is None:
+                policy = HostPolicy(host, budget=budget, **settings)
+                _host_policies[host] = policy
+    return policy
+
+
+def get_resilience_stats() -> dict[str, Any]:
+    """Per-host counters and the state of the retry budget."""
+    budget = get_retry_budget()
+    return {
+        "hosts": {host: policy.stats for host, policy in sorted(_host_policies.items())},
+        "retry_budget": {
+            "balance": round(budget.balance, 2),
+            "retries": budget.retries,
+            "denied": budget.denied,
+        },
+    }
+
+
+def reset_host_policies() -> None:
+    """Forget all host policies and the retry budget (used by tests)."""
+    global _retry_budget
+    with _policies_lock:
+        _host_policies.clear()
+        _retry_budget = None
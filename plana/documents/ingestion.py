@@ -7,12 +7,13 @@ produces ProcessedDocument records that feed into the evidence register
 and report generator.
 """
 
-import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
+
+from plana.documents.patterns import RuleSet, first_hit_in, scan_document
 
 
 class DocumentCategory(str, Enum):
@@ -92,6 +93,7 @@ _CLASSIFICATION_RULES: list[tuple[str, DocumentCategory]] = [
     # Photos
     (r"photo", DocumentCategory.PHOTOGRAPH),
 ]
+_CLASSIFICATION_RULE_SET = RuleSet("ingestion.filename_category", _CLASSIFICATION_RULES)
 
 # Which categories count as "plan-type" documents.
 PLAN_CATEGORIES = frozenset({
@@ -233,11 +235,12 @@ def classify_document(title: str, doc_type: str = "", filename: str = "") -> tup
     """
     text = f"{title} {doc_type} {filename}".lower().strip()
 
-    for pattern, category in _CLASSIFICATION_RULES:
-        if re.search(pattern, text):
-            # Higher confidence if the match is in the title (most reliable)
-            confidence = 0.85 if re.search(pattern, title.lower()) else 0.65
-            return category, confidence
+    hit = _CLASSIFICATION_RULE_SET.first(text)
+    if hit is not None:
+        # Higher confidence if the match is in the title (most reliable)
+        pattern, category = _CLASSIFICATION_RULE_SET.rules[hit.rule]
+        confidence = 0.85 if pattern.search(title.lower()) else 0.65
+        return category, confidence
 
     return DocumentCategory.OTHER, 0.3
 
@@ -258,60 +261,79 @@ def process_documents(
     Returns:
         DocumentIngestionResult with classified documents and aggregate stats.
     """
-    result = DocumentIngestionResult()
-    result.total_count = len(documents)
-
-    for doc in documents:
-        title = getattr(doc, "title", "Unknown")
-        doc_id = getattr(doc, "id", "") or getattr(doc, "doc_id", "")
-        doc_type = getattr(doc, "doc_type", "")
-        local_path = getattr(doc, "local_path", None)
-
-        # Build filename from available attributes
-        if hasattr(doc, "filename"):
-            filename = doc.filename
-        elif hasattr(doc, "url") and doc.url:
-            filename = doc.url.rsplit("/", 1)[-1]
-        else:
-            filename = title
+    return collect_ingestion([process_document(doc, extract_text) for doc in documents])
 
-        # Size display
-        if hasattr(doc, "size_kb"):
-            size_display = f"{doc.size_kb} KB"
-        elif hasattr(doc, "size_bytes") and doc.size_bytes:
-            size_display = f"{doc.size_bytes // 1024} KB"
-        else:
-            size_display = ""
 
-        # Date
-        date_received = (
-            getattr(doc, "date_received", None)
-            or getattr(doc, "date_published", None)
-            or ""
-        )
+def process_document(doc: Any, extract_text: bool = False) -> ProcessedDocument:
+    """Classify and optionally extract text from one document.
 
-        # Classify
-        category, confidence = classify_document(title, doc_type, filename)
+    Documents are independent, so callers can run this as each download
+    completes and combine the results with ``collect_ingestion``.
 
-        processed = ProcessedDocument(
-            doc_id=doc_id,
-            title=title,
-            filename=filename,
-            category=category,
-            classification_confidence=confidence,
-            size_display=size_display,
-            date_received=date_received,
-        )
+    Args:
+        doc: An ApplicationDocument or PortalDocument
+        extract_text: Attempt text extraction if the file is on disk
 
-        # Attempt text extraction if requested and file exists
-        if extract_text and local_path and Path(local_path).is_file():
-            processed = _extract_text_from_file(processed, Path(local_path))
+    Returns:
+        The ProcessedDocument
+    """
+    title = getattr(doc, "title", "Unknown")
+    doc_id = getattr(doc, "id", "") or getattr(doc, "doc_id", "")
+    doc_type = getattr(doc, "doc_type", "")
+    local_path = getattr(doc, "local_path", None)
+
+    # Build filename from available attributes
+    if hasattr(doc, "filename"):
+        filename = doc.filename
+    elif hasattr(doc, "url") and doc.url:
+        filename = doc.url.rsplit("/", 1)[-1]
+    else:
+        filename = title
 
-        # Second-pass: reclassify OTHER docs using extracted text content
-        if processed.category == DocumentCategory.OTHER and processed.extracted_text:
-            processed = _reclassify_from_content(processed)
+    # Size display
+    if hasattr(doc, "size_kb"):
+        size_display = f"{doc.size_kb} KB"
+    elif hasattr(doc, "size_bytes") and doc.size_bytes:
+        size_display = f"{doc.size_bytes // 1024} KB"
+    else:
+        size_display = ""
+
+    # Date
+    date_received = (
+        getattr(doc, "date_received", None)
+        or getattr(doc, "date_published", None)
+        or ""
+    )
+
+    # Classify
+    category, confidence = classify_document(title, doc_type, filename)
+
+    processed = ProcessedDocument(
+        doc_id=doc_id,
+        title=title,
+        filename=filename,
+        category=category,
+        classification_confidence=confidence,
+        size_display=size_display,
+        date_received=date_received,
+    )
+
+    # Attempt text extraction if requested and file exists
+    if extract_text and local_path and Path(local_path).is_file():
+        processed = _extract_text_from_file(processed, Path(local_path))
+
+    # Second-pass: reclassify OTHER docs using extracted text content
+    if processed.category == DocumentCategory.OTHER and processed.extracted_text:
+        processed = _reclassify_from_content(processed)
+
+    return processed
 
-        result.documents.append(processed)
+
+def collect_ingestion(processed_documents: List[ProcessedDocument]) -> DocumentIngestionResult:
+    """Combine processed documents into a DocumentIngestionResult with aggregate stats."""
+    result = DocumentIngestionResult()
+    result.total_count = len(processed_documents)
+    result.documents.extend(processed_documents)
 
     # Calculate aggregate statistics
     result.plans_count = sum(1 for d in result.documents if d.is_plan)
@@ -346,6 +368,8 @@ def build_ingestion_from_stored_documents(
     Returns:
         DocumentIngestionResult ready for the report generator.
     """
+    from plana.documents.processor import SIGNALS_VERSION
+
     result = DocumentIngestionResult()
     result.total_count = len(stored_docs)
 
@@ -355,8 +379,13 @@ def build_ingestion_from_stored_documents(
         if doc.url:
             filename = doc.url.rsplit("/", 1)[-1] or title
 
-        # Re-classify using the same rules as the ingestion pipeline
-        category, confidence = classify_document(title, doc.doc_type or "", filename)
+        # Use the category the worker stored; re-classify (same rules as
+        # the ingestion pipeline) when it is missing or out of date
+        if getattr(doc, "signals_version", None) == SIGNALS_VERSION and doc.category:
+            category = DocumentCategory(doc.category)
+            confidence = doc.category_confidence
+        else:
+            category, confidence = classify_document(title, doc.doc_type or "", filename)
 
         # Map DB processing_status → ExtractionStatus
         if doc.processing_status == "processed":
@@ -567,6 +596,7 @@ _CONTENT_CLASSIFICATION_RULES: list[tuple[str, DocumentCategory]] = [
     # Contamination
     (r"contamination|geo[\-\s]*(?:environmental|technical)|phase\s*[12i]\s*(?:report|investigation)", DocumentCategory.CONTAMINATION_REPORT),
 ]
+_CONTENT_CLASSIFICATION_RULE_SET = RuleSet("ingestion.content_category", _CONTENT_CLASSIFICATION_RULES)
 
 
 def _reclassify_from_content(processed: ProcessedDocument) -> ProcessedDocument:
@@ -583,14 +613,13 @@ def _reclassify_from_content(processed: ProcessedDocument) -> ProcessedDocument:
         return processed
 
     sample = processed.extracted_text[:3000].lower()
-    for pattern, category in _CONTENT_CLASSIFICATION_RULES:
-        if re.search(pattern, sample):
-            processed.category = category
-            # Content-based matches are less certain than filename matches
-            processed.classification_confidence = max(
-                processed.classification_confidence, 0.55,
-            )
-            break
+    hit = _CONTENT_CLASSIFICATION_RULE_SET.first(sample)
+    if hit is not None:
+        processed.category = hit.label
+        # Content-based matches are less certain than filename matches
+        processed.classification_confidence = max(
+            processed.classification_confidence, 0.55,
+        )
 
     return processed
 
@@ -654,6 +683,88 @@ _SEARCH_PRIORITY: list[DocumentCategory] = [
 ]
 
 
+# ---- Planning fact rules ----
+# One rule set per ExtractedPlanningFacts field, searched in order over
+# each document's lowercased text.  Each regex has one capture group
+# for the value; a rule without one only records that the field is
+# mentioned.
+_RIDGE_HEIGHT_RULES = RuleSet("ingestion.ridge_height", [
+    (r'ridge\s*(?:height|level|ht)?[:\s=]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'ridge'),
+    (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:to\s*)?ridge', 'ridge'),
+    (r'max(?:imum)?\s*(?:ridge\s*)?height[:\s=]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'height'),
+    (r'(?:proposed\s*)?(?:ridge|overall)\s*(?:height)?[:\s=]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'ridge'),
+    (r'height\s*(?:of\s*)?(?:the\s*)?(?:proposed\s*)?(?:dwelling|building|house|roof)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'height'),
+    (r'(?:ffl|finished\s*floor)\s*.*?ridge\s*.*?(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'ridge'),
+])
+
+_EAVES_HEIGHT_RULES = RuleSet("ingestion.eaves_height", [
+    (r'eaves?\s*(?:height)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'eaves'),
+    (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:to\s*)?eaves?', 'eaves'),
+])
+
+_FLOOR_AREA_RULES = RuleSet("ingestion.floor_area", [
+    (r'(?:total\s*)?(?:floor\s*)?area[:\s]*(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)', 'area'),
+    (r'(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)\s*(?:floor\s*)?area', 'area'),
+    (r'gi(?:f)?a[:\s]*(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)', 'gia'),
+    (r'(\d+(?:\.\d+)?)\s*(?:square\s*)?met(?:re|er)s?\s*(?:floor\s*)?area', 'area'),
+])
+
+_STOREYS_RULES = RuleSet("ingestion.storeys", [
+    (r'(\d+)\s*(?:storey|story|stories|storeys)', 'storeys'),
+    (r'(\d+)[\s\-]*storey', 'storeys'),
+    (r'(?:number\s*of\s*)?(?:floor|storey)s?\s*[:=]\s*(\d+)', 'storeys'),
+    (r'over\s+(\d+)\s+floors?', 'floors'),
+])
+
+_PARKING_RULES = RuleSet("ingestion.parking", [
+    (r'(\d+)\s*(?:no\.?\s*)?(?:car\s*)?(?:parking\s*)?(?:space|bay)s?\s*(?:provided|proposed)?', 'parking'),
+    (r'(?:parking|car\s*park(?:ing)?)\s*(?:provision|spaces?|bays?)?[:\s]*(\d+)', 'parking'),
+    (r'(\d+)\s*(?:off[\-\s]*street|on[\-\s]*site)\s*(?:parking\s*)?(?:space|bay)?s?', 'parking'),
+    (r'(?:provide|provision\s*of)\s*(\d+)\s*(?:car\s*)?(?:parking\s*)?(?:space|bay)s?', 'parking'),
+])
+
+_ACCESS_WIDTH_RULES = RuleSet("ingestion.access_width", [
+    (r'access\s*(?:width)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'access'),
+    (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:wide\s*)?access', 'access'),
+    (r'vehicular\s*access[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:wide)?', 'access'),
+])
+
+_SEPARATION_RULES = RuleSet("ingestion.separation", [
+    (r'separation\s*(?:distance)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'separation'),
+    (r'separation\s*distance\s*(?:to|from)\s*\w+[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'separation'),
+    (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:between|separation|from\s*(?:the\s*)?(?:nearest|adjacent))', 'separation'),
+    (r'(?:distance|gap)\s*(?:to|from|between)\s*(?:the\s*)?(?:nearest|adjacent|neighbouring)\s*(?:dwelling|property|building|boundary)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'separation'),
+    (r'(?:nearest|adjacent)\s*(?:neighbour|dwelling|property|building)\s*.*?(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'separation'),
+    (r'(?:approximately|approx\.?|circa|~)\s*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:to|from)', 'separation'),
+    (r'(?:minimum|min)\s*(?:distance|separation)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'separation'),
+    (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:from|to)\s*(?:no\.?\s*\d+|boundary)', 'separation'),
+    (r'(?:distance\s*(?:to|from)\s*)?(?:no\.?\s*\d+)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'separation'),
+])
+
+_WINDOW_TO_WINDOW_RULES = RuleSet("ingestion.window_to_window", [
+    (r'window[\s\-]*to[\s\-]*window[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'w2w'),
+    (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*window[\s\-]*to[\s\-]*window', 'w2w'),
+    (r'facing\s*(?:habitable\s*)?window[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'w2w'),
+    (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:between|to)\s*(?:nearest\s*)?(?:habitable\s*)?window', 'w2w'),
+    (r'(?:21|18|12)\s*(?:m|metre|meter)s?\s*(?:privacy|overlooking|standard)', 'privacy'),
+])
+
+_WINDOW_POSITIONS_RULES = RuleSet("ingestion.window_positions", [
+    (r'(\d+)\s*(?:no\.?\s*)?(?:new\s*)?windows?\s*(?:on|to|in)\s*(?:the\s*)?(?:rear|side|front|north|south|east|west)', 'windows'),
+    (r'(?:rear|side|front|north|south|east|west)\s*elevation[:\s]*(\d+)\s*(?:no\.?\s*)?windows?', 'windows'),
+    (r'(\d+)\s*(?:no\.?\s*)?(?:proposed\s*)?(?:windows?|openings?|rooflights?)', 'windows'),
+    (r'(?:fenestration|glazing)[:\s].*?(\d+)\s*(?:no\.?\s*)?(?:windows?|openings?)', 'windows'),
+    (r'(?:obscure|obscured|frosted)[\s\-]*glaz(?:ed|ing)', 'obscure'),
+])
+
+_BOUNDARY_DISTANCE_RULES = RuleSet("ingestion.boundary_distance", [
+    (r'(?:from|to)\s*(?:the\s*)?(?:site\s*)?boundary[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'boundary'),
+    (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:from|to)\s*(?:the\s*)?boundary', 'boundary'),
+    (r'(?:set\s*back|offset|clearance)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'boundary'),
+    (r'boundary\s*(?:distance|clearance|setback)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'boundary'),
+])
+
+
 def _prioritised_docs(
     ingestion: "DocumentIngestionResult",
     preferred: list[DocumentCategory],
@@ -713,66 +824,37 @@ def extract_planning_facts(
     all_docs = _prioritised_docs(ingestion, _SEARCH_PRIORITY)
 
     # ---- Ridge height ----
-    val, src = _search_docs_for_pattern(height_docs, [
-        (r'ridge\s*(?:height|level|ht)?[:\s=]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'ridge'),
-        (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:to\s*)?ridge', 'ridge'),
-        (r'max(?:imum)?\s*(?:ridge\s*)?height[:\s=]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'height'),
-        (r'(?:proposed\s*)?(?:ridge|overall)\s*(?:height)?[:\s=]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'ridge'),
-        (r'height\s*(?:of\s*)?(?:the\s*)?(?:proposed\s*)?(?:dwelling|building|house|roof)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'height'),
-        (r'(?:ffl|finished\s*floor)\s*.*?ridge\s*.*?(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'ridge'),
-    ])
+    val, src = _search_docs_for_pattern(height_docs, _RIDGE_HEIGHT_RULES)
     if val:
         facts.ridge_height_m = val
         facts.ridge_height_source = src or ""
 
     # ---- Eaves height ----
-    val, src = _search_docs_for_pattern(height_docs, [
-        (r'eaves?\s*(?:height)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'eaves'),
-        (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:to\s*)?eaves?', 'eaves'),
-    ])
+    val, src = _search_docs_for_pattern(height_docs, _EAVES_HEIGHT_RULES)
     if val:
         facts.eaves_height_m = val
         facts.eaves_height_source = src or ""
 
     # ---- Floor area ----
-    val, src = _search_docs_for_pattern(area_docs, [
-        (r'(?:total\s*)?(?:floor\s*)?area[:\s]*(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)', 'area'),
-        (r'(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)\s*(?:floor\s*)?area', 'area'),
-        (r'gi(?:f)?a[:\s]*(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)', 'gia'),
-        (r'(\d+(?:\.\d+)?)\s*(?:square\s*)?met(?:re|er)s?\s*(?:floor\s*)?area', 'area'),
-    ])
+    val, src = _search_docs_for_pattern(area_docs, _FLOOR_AREA_RULES)
     if val:
         facts.floor_area_sqm = val
         facts.floor_area_source = src or ""
 
     # ---- Number of storeys ----
-    val, src = _search_docs_for_pattern(all_docs, [
-        (r'(\d+)\s*(?:storey|story|stories|storeys)', 'storeys'),
-        (r'(\d+)[\s\-]*storey', 'storeys'),
-        (r'(?:number\s*of\s*)?(?:floor|storey)s?\s*[:=]\s*(\d+)', 'storeys'),
-        (r'over\s+(\d+)\s+floors?', 'floors'),
-    ])
+    val, src = _search_docs_for_pattern(all_docs, _STOREYS_RULES)
     if val:
         facts.storeys = val
         facts.storeys_source = src or ""
 
     # ---- Parking spaces ----
-    val, src = _search_docs_for_pattern(site_docs, [
-        (r'(\d+)\s*(?:no\.?\s*)?(?:car\s*)?(?:parking\s*)?(?:space|bay)s?\s*(?:provided|proposed)?', 'parking'),
-        (r'(?:parking|car\s*park(?:ing)?)\s*(?:provision|spaces?|bays?)?[:\s]*(\d+)', 'parking'),
-        (r'(\d+)\s*(?:off[\-\s]*street|on[\-\s]*site)\s*(?:parking\s*)?(?:space|bay)?s?', 'parking'),
-        (r'(?:provide|provision\s*of)\s*(\d+)\s*(?:car\s*)?(?:parking\s*)?(?:space|bay)s?', 'parking'),
-    ])
+    val, src = _search_docs_for_pattern(site_docs, _PARKING_RULES)
     if val:
         facts.parking_spaces = val
         facts.parking_source = src or ""
 
     # ---- Access width ----
-    val, src = _search_docs_for_pattern(site_docs, [
-        (r'access\s*(?:width)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'access'),
-        (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:wide\s*)?access', 'access'),
-        (r'vehicular\s*access[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:wide)?', 'access'),
-    ])
+    val, src = _search_docs_for_pattern(site_docs, _ACCESS_WIDTH_RULES)
     if val:
         facts.access_width_m = val
         facts.access_width_source = src or ""
@@ -786,29 +868,13 @@ def extract_planning_facts(
         DocumentCategory.PLANNING_STATEMENT,
     ]
     separation_docs = _prioritised_docs(ingestion, separation_cats)
-    val, src = _search_docs_for_pattern(separation_docs, [
-        (r'separation\s*(?:distance)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'separation'),
-        (r'separation\s*distance\s*(?:to|from)\s*\w+[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'separation'),
-        (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:between|separation|from\s*(?:the\s*)?(?:nearest|adjacent))', 'separation'),
-        (r'(?:distance|gap)\s*(?:to|from|between)\s*(?:the\s*)?(?:nearest|adjacent|neighbouring)\s*(?:dwelling|property|building|boundary)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'separation'),
-        (r'(?:nearest|adjacent)\s*(?:neighbour|dwelling|property|building)\s*.*?(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'separation'),
-        (r'(?:approximately|approx\.?|circa|~)\s*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:to|from)', 'separation'),
-        (r'(?:minimum|min)\s*(?:distance|separation)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'separation'),
-        (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:from|to)\s*(?:no\.?\s*\d+|boundary)', 'separation'),
-        (r'(?:distance\s*(?:to|from)\s*)?(?:no\.?\s*\d+)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'separation'),
-    ])
+    val, src = _search_docs_for_pattern(separation_docs, _SEPARATION_RULES)
     if val:
         facts.separation_distance_m = val
         facts.separation_distance_source = src or ""
 
     # ---- Window-to-window distance ----
-    val, src = _search_docs_for_pattern(all_docs, [
-        (r'window[\s\-]*to[\s\-]*window[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'w2w'),
-        (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*window[\s\-]*to[\s\-]*window', 'w2w'),
-        (r'facing\s*(?:habitable\s*)?window[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'w2w'),
-        (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:between|to)\s*(?:nearest\s*)?(?:habitable\s*)?window', 'w2w'),
-        (r'(?:21|18|12)\s*(?:m|metre|meter)s?\s*(?:privacy|overlooking|standard)', 'privacy'),
-    ])
+    val, src = _search_docs_for_pattern(all_docs, _WINDOW_TO_WINDOW_RULES)
     if val:
         facts.window_to_window_m = val
         facts.window_to_window_source = src or ""
@@ -820,24 +886,13 @@ def extract_planning_facts(
         DocumentCategory.DESIGN_ACCESS_STATEMENT,
     ]
     elevation_docs = _prioritised_docs(ingestion, elevation_cats)
-    val, src = _search_docs_for_pattern(elevation_docs, [
-        (r'(\d+)\s*(?:no\.?\s*)?(?:new\s*)?windows?\s*(?:on|to|in)\s*(?:the\s*)?(?:rear|side|front|north|south|east|west)', 'windows'),
-        (r'(?:rear|side|front|north|south|east|west)\s*elevation[:\s]*(\d+)\s*(?:no\.?\s*)?windows?', 'windows'),
-        (r'(\d+)\s*(?:no\.?\s*)?(?:proposed\s*)?(?:windows?|openings?|rooflights?)', 'windows'),
-        (r'(?:fenestration|glazing)[:\s].*?(\d+)\s*(?:no\.?\s*)?(?:windows?|openings?)', 'windows'),
-        (r'(?:obscure|obscured|frosted)[\s\-]*glaz(?:ed|ing)', 'obscure'),
-    ])
+    val, src = _search_docs_for_pattern(elevation_docs, _WINDOW_POSITIONS_RULES)
     if val:
         facts.window_positions = val
         facts.window_positions_source = src or ""
 
     # ---- Boundary distance ----
-    val, src = _search_docs_for_pattern(site_docs, [
-        (r'(?:from|to)\s*(?:the\s*)?(?:site\s*)?boundary[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'boundary'),
-        (r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:from|to)\s*(?:the\s*)?boundary', 'boundary'),
-        (r'(?:set\s*back|offset|clearance)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'boundary'),
-        (r'boundary\s*(?:distance|clearance|setback)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?', 'boundary'),
-    ])
+    val, src = _search_docs_for_pattern(site_docs, _BOUNDARY_DISTANCE_RULES)
     if val:
         facts.boundary_distance_m = val
         facts.boundary_distance_source = src or ""
@@ -847,7 +902,7 @@ def extract_planning_facts(
     # from document_analysis.py which has wider pattern coverage.
     if not facts.separation_distance_m or not facts.ridge_height_m or not facts.parking_spaces:
         try:
-            from plana.api.document_analysis import extract_from_text as _api_extract
+            from plana.api.document_analysis import cached_extract_from_text as _api_extract
             for doc in all_docs:
                 if not doc.extracted_text:
                     continue
@@ -891,24 +946,24 @@ class MaterialInfoItem:
 
 def _search_docs_for_pattern(
     docs: List[ProcessedDocument],
-    patterns: list[tuple[str, str]],
+    rules: RuleSet,
 ) -> tuple[Optional[str], Optional[str]]:
-    """Search extracted text of *docs* for the first regex match.
+    """Search extracted text of *docs* for the first rule match.
 
-    *patterns* is a list of ``(regex, label)`` tuples.  Each regex must
-    contain exactly one capture group for the numeric value.
+    Documents are searched in order, and within a document the rules
+    are tried in order.  Each document's text is scanned through the
+    shared pattern registry, so the many fields searched over the same
+    documents lowercase and search each text once per rule.
 
     Returns ``(matched_value, source_document_title)`` or ``(None, None)``.
     """
-    for doc in docs:
-        if not doc.extracted_text:
-            continue
-        text_lower = doc.extracted_text.lower()
-        for pattern, _label in patterns:
-            m = re.search(pattern, text_lower)
-            if m:
-                return m.group(1), doc.title
-    return None, None
+    hit = first_hit_in(
+        (scan_document(doc.extracted_text, doc.title) for doc in docs if doc.extracted_text),
+        rules,
+    )
+    if hit is None:
+        return None, None
+    return hit.value, hit.document
 
 
 def extract_material_info(
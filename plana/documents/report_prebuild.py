@@ -0,0 +1,183 @@
+"""
+Debounced report pre-generation for the in-process background worker.
+
+When the worker finishes the last queued document of a reference, the
+next ``GET /reports`` for it would otherwise pay the whole report build
+while the user waits.  ``schedule_report_prebuild`` instead builds the
+report in the background and stores it in the reports route cache, so
+the first poll is usually a cache hit.
+
+Builds are:
+
+- **debounced** — each new drain of a reference restarts its timer, so a
+  burst of late uploads triggers one build, after the burst;
+- **low priority** — one build runs at a time, and a build waits (up to
+  ``PREBUILD_MAX_DEFER`` seconds) while documents are still queued, so
+  document processing goes first;
+- **re-checked** — a reference whose queue has refilled by the time its
+  timer fires is skipped; its next drain schedules it again.
+
+Reports are built through the shared report cache, whose disk tier
+sits next to the database file: a build here is served by the API even
+when this runs in the standalone worker (``python -m
+plana.documents.worker --loop --prebuild-reports``), and a build racing
+a user's poll is shared rather than done twice.
+"""
+
+import asyncio
+import time
+from typing import Any, Optional
+
+from plana.core.logging import get_logger
+from plana.storage.database import Database
+
+logger = get_logger(__name__)
+
+PREBUILD_DEBOUNCE = 5.0  # seconds of quiet before a reference is built
+PREBUILD_MAX_DEFER = 60.0  # longest a build waits for the document queue
+PREBUILD_POLL = 1.0  # seconds between document queue checks
+
+_pending: dict[str, asyncio.Task] = {}  # Still inside their debounce window
+_running: set[asyncio.Task] = set()  # Past it, waiting for or running a build
+_build_lock: Optional[asyncio.Lock] = None
+_stats: dict[str, Any] = {
+    "scheduled": 0,
+    "debounced": 0,
+    "built": 0,
+    "skipped": 0,
+    "failed": 0,
+    "last_built_at": None,
+    "last_build_seconds": None,
+}
+
+
+def get_prebuild_stats() -> dict:
+    """Counters for scheduled, debounced, built and skipped pre-generations."""
+    return {**_stats, "pending": len(_pending), "running": len(_running)}
+
+
+def queue_drained(counts: dict[str, int]) -> bool:
+    """True if a reference has documents and none are queued or processing."""
+    return counts["total"] > 0 and counts["queued"] == 0 and counts["processing"] == 0
+
+
+def schedule_report_prebuild(
+    reference: str,
+    db: Database,
+    delay: Optional[float] = None,
+) -> None:
+    """(Re)start the debounce timer for pre-generating ``reference``'s report.
+
+    Must be called from the event loop the worker runs on.
+    """
+    loop = asyncio.get_running_loop()
+    previous = _pending.pop(reference, None)
+    if previous is not None and not previous.done():
+        previous.cancel()
+        _stats["debounced"] += 1
+    _stats["scheduled"] += 1
+    _pending[reference] = loop.create_task(
+        _prebuild_after(reference, db, PREBUILD_DEBOUNCE if delay is None else delay)
+    )
+
+
+async def cancel_report_prebuilds() -> None:
+    """Cancel outstanding builds (used when the worker stops)."""
+    global _build_lock
+    tasks = [task for task in [*_pending.values(), *_running] if not task.done()]
+    _pending.clear()
+    _running.clear()
+    _build_lock = None
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _global_queue_length(db: Database) -> int:
+    with db._get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*) AS cnt FROM documents WHERE processing_status = 'queued'"
+        )
+        row = cursor.fetchone()
+        return row["cnt"] if row else 0
+
+
+def _build(reference: str, db: Database) -> bool:
+    """Build and cache the report, if the reference's queue is still drained."""
+    if not queue_drained(db.get_processing_counts(reference)):
+        return False
+    from plana.api.routes.reports import _cached_report_from_db
+
+    if _cached_report_from_db(reference) is None:
+        raise RuntimeError("report regeneration returned no report")
+    return True
+
+
+def prebuild_reports(references: list[str], db: Database) -> int:
+    """Build the reports of drained references now (for the standalone worker).
+
+    Returns the number built; failures are logged and skipped.
+    """
+    built = 0
+    for reference in references:
+        t_start = time.monotonic()
+        try:
+            if not _build(reference, db):
+                _stats["skipped"] += 1
+                continue
+        except Exception as exc:
+            _stats["failed"] += 1
+            logger.warning("report_prebuild_failed", reference=reference, error=str(exc))
+            continue
+        built += 1
+        _stats["built"] += 1
+        _stats["last_built_at"] = time.time()
+        _stats["last_build_seconds"] = round(time.monotonic() - t_start, 3)
+        logger.info("report_prebuilt", reference=reference, duration_s=_stats["last_build_seconds"])
+    return built
+
+
+async def _prebuild_after(reference: str, db: Database, delay: float) -> None:
+    global _build_lock
+
+    await asyncio.sleep(delay)
+    # Past the debounce window: later drains start a new build rather
+    # than cancelling this one mid-way.
+    task = asyncio.current_task()
+    if task is not None:
+        if _pending.get(reference) is task:
+            del _pending[reference]
+        _running.add(task)
+        task.add_done_callback(_running.discard)
+
+    if _build_lock is None:
+        _build_lock = asyncio.Lock()
+    async with _build_lock:
+        deadline = time.monotonic() + PREBUILD_MAX_DEFER
+        while time.monotonic() < deadline:
+            try:
+                if await asyncio.to_thread(_global_queue_length, db) == 0:
+                    break
+            except Exception:
+                break
+            await asyncio.sleep(PREBUILD_POLL)
+
+        t_start = time.monotonic()
+        try:
+            built = await asyncio.to_thread(_build, reference, db)
+        except Exception as exc:
+            _stats["failed"] += 1
+            logger.warning("report_prebuild_failed", reference=reference, error=str(exc))
+            return
+
+        if not built:
+            _stats["skipped"] += 1
+            logger.info("report_prebuild_skipped", reference=reference, reason="documents_pending")
+            return
+
+        elapsed = round(time.monotonic() - t_start, 3)
+        _stats["built"] += 1
+        _stats["last_built_at"] = time.time()
+        _stats["last_build_seconds"] = elapsed
+        logger.info("report_prebuilt", reference=reference, duration_s=elapsed)
@@ -9,6 +9,7 @@ from plana.improvement.feedback import (
     process_feedback,
     get_feedback_stats,
     get_mismatch_rate,
+    get_mismatch_rates,
 )
 from plana.improvement.reranking import (
     get_policy_boost,
@@ -21,6 +22,7 @@ __all__ = [
     "process_feedback",
     "get_feedback_stats",
     "get_mismatch_rate",
+    "get_mismatch_rates",
     "get_policy_boost",
     "get_confidence_adjustment",
     "rerank_policies",
@@ -162,11 +162,13 @@ def get_feedback_stats(reference: Optional[str] = None) -> FeedbackStats:
         if decision:
             stats.by_decision[decision] = stats.by_decision.get(decision, 0) + 1
 
-    # Compare against run logs to calculate match rate
+    # Compare against run logs to calculate match rate (one batched lookup
+    # instead of one query per feedback row)
+    latest_runs = db.get_latest_run_logs([fb.reference for fb in feedback_list])
     for fb in feedback_list:
-        run_logs = db.get_run_logs_for_reference(fb.reference, limit=1)
-        if run_logs:
-            plana_decision = run_logs[0].calibrated_decision or run_logs[0].raw_decision
+        run_log = latest_runs.get(fb.reference)
+        if run_log:
+            plana_decision = run_log.calibrated_decision or run_log.raw_decision
             actual_decision = fb.actual_decision or fb.decision
             if _is_decision_mismatch(plana_decision, actual_decision):
                 stats.mismatch_count += 1
@@ -188,30 +190,39 @@ def get_mismatch_rate(application_type: str) -> float:
     Returns:
         Mismatch rate (0.0 to 1.0)
     """
-    db = get_database()
+    return get_mismatch_rates([application_type]).get(application_type, 0.0)
 
-    # Get run logs for this type
-    run_logs = db.get_run_logs_by_type(application_type, success_only=True, limit=100)
 
-    if not run_logs:
-        return 0.0
+def get_mismatch_rates(application_types: List[str]) -> Dict[str, float]:
+    """Get mismatch rates for several application types in one query.
 
-    mismatch_count = 0
-    total_with_feedback = 0
+    Considers the 100 most recent successful runs per type and compares
+    each against the latest feedback for its reference.
 
-    for run in run_logs:
-        feedback_list = db.get_feedback(run.reference)
-        if feedback_list:
-            total_with_feedback += 1
-            actual_decision = feedback_list[0].actual_decision or feedback_list[0].decision
-            plana_decision = run.calibrated_decision or run.raw_decision
-            if _is_decision_mismatch(plana_decision, actual_decision):
-                mismatch_count += 1
+    Args:
+        application_types: Application type codes (e.g., HOU, LBC)
 
-    if total_with_feedback == 0:
-        return 0.0
+    Returns:
+        Dict of application type -> mismatch rate (0.0 to 1.0). Types
+        without any run that has feedback map to 0.0.
+    """
+    db = get_database()
+    pairs = db.get_run_feedback_pairs_by_type(
+        application_types, success_only=True, limit=100,
+    )
 
-    return mismatch_count / total_with_feedback
+    totals: Dict[str, int] = {}
+    mismatches: Dict[str, int] = {}
+    for pair in pairs:
+        app_type = pair["application_type"]
+        totals[app_type] = totals.get(app_type, 0) + 1
+        if _is_decision_mismatch(pair["plana_decision"], pair["actual_decision"]):
+            mismatches[app_type] = mismatches.get(app_type, 0) + 1
+
+    return {
+        app_type: (mismatches.get(app_type, 0) / totals[app_type]) if totals.get(app_type) else 0.0
+        for app_type in application_types
+    }
 
 
 def get_feedback_summary() -> Dict[str, any]:
@@ -220,13 +231,12 @@ def get_feedback_summary() -> Dict[str, any]:
     Returns:
         Dictionary with feedback summary
     """
-    db = get_database()
     stats = get_feedback_stats()
 
     # Get mismatch rates by type
     type_rates = {}
-    for app_type in ["HOU", "LBC", "DET", "LDC", "DCC", "TPO", "TCA"]:
-        rate = get_mismatch_rate(app_type)
+    rates = get_mismatch_rates(["HOU", "LBC", "DET", "LDC", "DCC", "TPO", "TCA"])
+    for app_type, rate in rates.items():
         if rate > 0:
             type_rates[app_type] = round(rate * 100, 1)
 
@@ -240,48 +240,57 @@ def calculate_similar_case_boost(
     Returns:
         List of (case, boost_factor) tuples
     """
-    db = get_database()
-    app_type = parse_application_type(reference)
-
-    boosted_cases = []
-    for case in similar_cases:
-        # Get case reference
+    def _case_ref(case: Any) -> Optional[str]:
         case_ref = getattr(case, 'reference', None)
         if case_ref is None and isinstance(case, dict):
             case_ref = case.get('reference')
+        return case_ref
 
-        if not case_ref:
-            boosted_cases.append((case, 1.0))
-            continue
+    # One joined lookup for every candidate instead of two queries per case
+    case_refs = [_case_ref(case) for case in similar_cases]
+    boosts = get_similar_case_boosts([ref for ref in case_refs if ref])
 
-        # Check if we have feedback for this case
-        feedback_list = db.get_feedback(case_ref)
-        if not feedback_list:
-            boosted_cases.append((case, 1.0))
-            continue
+    boosted_cases = [
+        (case, boosts.get(case_ref, 1.0) if case_ref else 1.0)
+        for case, case_ref in zip(similar_cases, case_refs)
+    ]
 
-        # Check if the case's run matched the feedback
-        run_logs = db.get_run_logs_for_reference(case_ref, limit=1)
-        if not run_logs:
-            boosted_cases.append((case, 1.0))
-            continue
+    # Sort by boost factor (highest first)
+    boosted_cases.sort(key=lambda x: -x[1])
+
+    return boosted_cases
 
-        plana_decision = run_logs[0].calibrated_decision or run_logs[0].raw_decision
-        actual_decision = feedback_list[0].actual_decision or feedback_list[0].decision
+
+def get_similar_case_boosts(
+    references: Optional[List[str]] = None,
+) -> Dict[str, float]:
+    """Get feedback-based boost factors keyed by case reference.
+
+    Cases with correct feedback get boosted (gradated by feedback count),
+    those with mismatches get demoted.  Cases without feedback, or without
+    a run to compare against, are omitted (implicit boost of 1.0).
+
+    Args:
+        references: Case references to look up, or None for every case
+            that has feedback
+
+    Returns:
+        Dict of reference -> boost factor
+    """
+    db = get_database()
+    boosts: Dict[str, float] = {}
+    for case_ref, outcome in db.get_feedback_outcomes(references).items():
+        plana_decision = outcome["plana_decision"]
+        if not plana_decision:
+            continue
 
         # Graduated boost based on feedback count (more feedback = more confidence)
-        feedback_count = len(feedback_list)
+        feedback_count = outcome["feedback_count"]
 
-        if _is_match(plana_decision, actual_decision):
+        if _is_match(plana_decision, outcome["actual_decision"]):
             # Graduated boost: 1.1 for 1 feedback, up to 1.3 for 5+
-            boost = min(1.3, 1.05 + (feedback_count * 0.05))
-            boosted_cases.append((case, boost))
+            boosts[case_ref] = min(1.3, 1.05 + (feedback_count * 0.05))
         else:
             # Graduated demotion: 0.9 for 1 mismatch, down to 0.7 for 5+
-            demotion = max(0.7, 0.95 - (feedback_count * 0.05))
-            boosted_cases.append((case, demotion))
-
-    # Sort by boost factor (highest first)
-    boosted_cases.sort(key=lambda x: -x[1])
-
-    return boosted_cases
+            boosts[case_ref] = max(0.7, 0.95 - (feedback_count * 0.05))
+    return boosts
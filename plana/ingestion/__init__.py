@@ -9,25 +9,31 @@ from plana.ingestion.base import (
     CouncilAdapter,
     ApplicationDetails,
     PortalDocument,
+    DocumentDownload,
     PortalAccessError,
 )
 from plana.ingestion.newcastle import NewcastleAdapter
+from plana.ingestion.response_cache import PortalResponseCache, get_portal_response_cache
 
 __all__ = [
     "CouncilAdapter",
     "ApplicationDetails",
     "PortalDocument",
+    "DocumentDownload",
     "PortalAccessError",
     "NewcastleAdapter",
+    "PortalResponseCache",
+    "get_portal_response_cache",
     "get_adapter",
 ]
 
 
-def get_adapter(council_id: str) -> CouncilAdapter:
+def get_adapter(council_id: str, **options) -> CouncilAdapter:
     """Get the appropriate adapter for a council.
 
     Args:
         council_id: Council identifier (e.g., 'newcastle')
+        **options: Passed to the adapter (e.g. ``bypass_cache``)
 
     Returns:
         CouncilAdapter instance
@@ -44,4 +50,4 @@ def get_adapter(council_id: str) -> CouncilAdapter:
         supported = ", ".join(adapters.keys())
         raise ValueError(f"Unsupported council: {council_id}. Supported: {supported}")
 
-    return adapter_class()
+    return adapter_class(**options)
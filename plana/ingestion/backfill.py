@@ -0,0 +1,286 @@
+"""
+Historic backfill: crawl a council's decided applications into the database.
+
+``BackfillCrawler`` walks a date range in weekly or monthly windows.  For
+each window it pages through the portal's list of applications decided
+in it (``CouncilAdapter.iter_decided_applications``), fetches their
+details with bounded concurrency (``stream_concurrent``; every request
+still goes through the portal host's shared rate limit and circuit
+breaker) and upserts them into ``applications`` in batches.
+
+Progress is checkpointed to a JSON file after every batch: completed
+windows, and the references already saved in the window in progress,
+so an interrupted crawl resumes where it stopped.  Applications that
+fail are recorded in the checkpoint rather than retried; if the portal's
+circuit breaker opens, the crawl stops (checkpointed) instead of failing
+every remaining application.
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from plana.core.concurrent import AdaptiveLimit, TaskResult, stream_concurrent
+from plana.core.exceptions import CircuitOpenError
+from plana.core.logging import get_logger
+from plana.ingestion.base import ApplicationDetails, CouncilAdapter, PortalAccessError
+from plana.storage.database import Database
+from plana.storage.models import StoredApplication
+
+logger = get_logger(__name__)
+
+WINDOWS = ("week", "month")
+
+# Listed statuses whose stored applications need not be fetched again
+_DECIDED = {"approved", "approved_with_conditions", "refused", "withdrawn"}
+
+
+def decision_windows(start: date, end: date, window: str = "month") -> List[Tuple[date, date]]:
+    """Split ``start``..``end`` (inclusive) into weekly or calendar-month windows.
+
+    Args:
+        start: First day
+        end: Last day
+        window: "week" or "month"
+
+    Returns:
+        (first day, last day) pairs covering the range
+    """
+    if window not in WINDOWS:
+        raise ValueError(f"window must be one of {WINDOWS}, not {window!r}")
+    windows = []
+    first = start
+    while first <= end:
+        if window == "week":
+            last = first + timedelta(days=6)
+        else:
+            next_month = date(first.year + first.month // 12, first.month % 12 + 1, 1)
+            last = next_month - timedelta(days=1)
+        last = min(last, end)
+        windows.append((first, last))
+        first = last + timedelta(days=1)
+    return windows
+
+
+@dataclass
+class BackfillCheckpoint:
+    """Crawl progress, saved as JSON."""
+
+    completed: List[str] = field(default_factory=list)
+    current: Optional[str] = None
+    saved: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    totals: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "BackfillCheckpoint":
+        """Read a checkpoint, or start a new one if the file does not exist."""
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the checkpoint atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def _window_key(window: Tuple[date, date]) -> str:
+    return f"{window[0].isoformat()}:{window[1].isoformat()}"
+
+
+def _to_stored(details: ApplicationDetails, council_name: str) -> StoredApplication:
+    return StoredApplication(
+        reference=details.reference,
+        council_id=details.council_id,
+        council_name=council_name,
+        address=details.address,
+        proposal=details.proposal,
+        application_type=details.application_type.value,
+        status=details.status.value,
+        date_received=details.date_received,
+        date_validated=details.date_validated,
+        decision_date=details.decision_date,
+        decision=details.decision,
+        ward=details.ward,
+        postcode=details.postcode,
+        constraints_json=json.dumps([
+            {"type": c.constraint_type, "name": c.name}
+            for c in details.constraints
+        ]),
+        applicant_name=details.applicant_name,
+        portal_url=details.portal_url,
+        portal_key=details.portal_key,
+        fetched_at=datetime.now().isoformat(),
+    )
+
+
+class BackfillCrawler:
+    """Resumable crawl of decided applications into the database."""
+
+    def __init__(
+        self,
+        adapter: CouncilAdapter,
+        db: Database,
+        checkpoint_path: Union[str, Path],
+        window: str = "month",
+        max_concurrent: int = 4,
+        batch_size: int = 25,
+        refresh: bool = False,
+    ):
+        """Initialize the crawler.
+
+        Args:
+            adapter: Council adapter to crawl
+            db: Database to upsert applications into
+            checkpoint_path: JSON checkpoint file (resumed if it exists)
+            window: "week" or "month"
+            max_concurrent: Detail pages fetched at once (reduced while the
+                portal answers 429/503)
+            batch_size: Applications per database write and checkpoint
+            refresh: Fetch applications already stored with a decision
+        """
+        if window not in WINDOWS:
+            raise ValueError(f"window must be one of {WINDOWS}, not {window!r}")
+        self.adapter = adapter
+        self.db = db
+        self.checkpoint_path = Path(checkpoint_path)
+        self.window = window
+        self.max_concurrent = max_concurrent
+        self.batch_size = batch_size
+        self.refresh = refresh
+        self.checkpoint = BackfillCheckpoint.load(self.checkpoint_path)
+        self.stats = {"windows": 0, "listed": 0, "skipped": 0, "fetched": 0, "saved": 0, "failed": 0}
+
+    def _count(self, name: str, n: int = 1) -> None:
+        self.stats[name] += n
+        self.checkpoint.totals[name] = self.checkpoint.totals.get(name, 0) + n
+
+    def _already_stored(self, summary: ApplicationDetails) -> bool:
+        if self.refresh or summary.status.value not in _DECIDED:
+            return False
+        stored = self.db.get_application(summary.reference)
+        return stored is not None and bool(stored.decision_date) and stored.status in _DECIDED
+
+    def _prefetch_postcodes(self, batch: List[StoredApplication]) -> None:
+        """Resolve the batch's postcodes in bulk so later lookups hit the cache."""
+        from plana.location.postcodes import bulk_lookup_postcodes
+
+        postcodes = list(dict.fromkeys(app.postcode for app in batch if app.postcode))
+        if not postcodes:
+            return
+        try:
+            bulk_lookup_postcodes(postcodes)
+        except Exception as e:
+            logger.debug("backfill_postcode_prefetch_failed", count=len(postcodes), error=str(e))
+
+    def _flush(self, batch: List[StoredApplication]) -> None:
+        if batch:
+            self._prefetch_postcodes(batch)
+            self.db.save_applications(batch)
+            self.checkpoint.saved.extend(app.reference for app in batch)
+            self._count("saved", len(batch))
+            batch.clear()
+        self.checkpoint.save(self.checkpoint_path)
+
+    async def crawl_window(self, first: date, last: date) -> None:
+        """Crawl one window, resuming from the checkpoint if it was in progress."""
+        key = _window_key((first, last))
+        if self.checkpoint.current != key:
+            self.checkpoint.current = key
+            self.checkpoint.saved = []
+        done = set(self.checkpoint.saved)
+
+        async def pending():
+            async for summary in self.adapter.iter_decided_applications(first, last):
+                self._count("listed")
+                if summary.reference in done:
+                    continue
+                if self._already_stored(summary):
+                    self._count("skipped")
+                    continue
+                yield summary
+
+        portal_down: List[PortalAccessError] = []
+
+        async def fetch(summary: ApplicationDetails) -> Optional[ApplicationDetails]:
+            try:
+                return await self.adapter.fetch_listed_application(summary)
+            except PortalAccessError as e:
+                if isinstance(e.__context__, CircuitOpenError) or portal_down:
+                    portal_down.append(e)
+                    return None
+                raise
+
+        batch: List[StoredApplication] = []
+        result: TaskResult[Optional[ApplicationDetails]]
+        async for result in stream_concurrent(
+            pending(),
+            fetch,
+            limit=AdaptiveLimit(self.max_concurrent),
+            get_item_id=lambda summary: summary.reference,
+        ):
+            if portal_down:
+                self._flush(batch)
+                raise portal_down[0]
+            reference = result.item_id or ""
+            if not result.success or result.value is None:
+                self._count("failed")
+                self.checkpoint.failed[reference] = result.error or "not found"
+                logger.warning("backfill_fetch_failed", reference=reference, error=result.error)
+                continue
+            self._count("fetched")
+            self.checkpoint.failed.pop(reference, None)
+            batch.append(_to_stored(result.value, self.adapter.council_name))
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+
+        self._flush(batch)
+        self.checkpoint.completed.append(key)
+        self.checkpoint.current = None
+        self.checkpoint.saved = []
+        self.checkpoint.save(self.checkpoint_path)
+        self._count("windows")
+
+    async def run(
+        self,
+        start: date,
+        end: date,
+        on_window: Optional[Callable[[date, date, Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Crawl every window of ``start``..``end`` not completed yet.
+
+        Args:
+            start: First decision date
+            end: Last decision date
+            on_window: Called after each window with its dates and the
+                running stats
+
+        Returns:
+            Stats for this run, with ``elapsed_s`` and ``per_second``
+        """
+        t_start = time.monotonic()
+        completed = set(self.checkpoint.completed)
+        for first, last in decision_windows(start, end, self.window):
+            if _window_key((first, last)) in completed:
+                continue
+            await self.crawl_window(first, last)
+            logger.info("backfill_window_done", window=_window_key((first, last)), **self.stats)
+            if on_window is not None:
+                on_window(first, last, dict(self.stats))
+
+        elapsed = time.monotonic() - t_start
+        return {
+            **self.stats,
+            "elapsed_s": round(elapsed, 3),
+            "per_second": round(self.stats["fetched"] / elapsed, 2) if elapsed > 0 else 0.0,
+        }
@@ -8,7 +8,10 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import Enum
-from typing import List, Optional
+from pathlib import Path
+from typing import AsyncIterator, Iterable, List, Mapping, Optional
+
+from plana.core.constants import DocumentConfig
 
 
 class PortalAccessError(Exception):
@@ -81,6 +84,22 @@ class PortalDocument:
     content_type: Optional[str] = None
     local_path: Optional[str] = None
     content_hash: Optional[str] = None
+    etag: Optional[str] = None
+
+
+@dataclass
+class DocumentDownload:
+    """Outcome of downloading one portal document."""
+
+    document: PortalDocument
+    local_path: Optional[str] = None
+    unchanged: bool = False  # Same ETag or content hash as the known copy
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the document is on disk (downloaded or unchanged)."""
+        return self.local_path is not None
 
 
 @dataclass
@@ -227,6 +246,84 @@ class CouncilAdapter(ABC):
         """
         pass
 
+    # Parallel document downloads per adapter (the portal host's limit)
+    max_concurrent_downloads: int = DocumentConfig.MAX_CONCURRENT_DOWNLOADS
+
+    async def download_document_if_changed(
+        self,
+        document: PortalDocument,
+        dest_dir: str,
+        known: Optional[PortalDocument] = None,
+    ) -> DocumentDownload:
+        """Download a document unless ``known`` shows it is unchanged.
+
+        The default compares content hashes the portal listed; adapters
+        that can make conditional requests (ETag) override this.
+
+        Args:
+            document: Document to download
+            dest_dir: Destination directory
+            known: The copy downloaded previously, if any
+
+        Returns:
+            DocumentDownload for the document
+        """
+        if (
+            known is not None
+            and document.content_hash
+            and document.content_hash == known.content_hash
+            and known.local_path
+            and Path(known.local_path).is_file()
+        ):
+            document.local_path = known.local_path
+            return DocumentDownload(document, known.local_path, unchanged=True)
+        local_path = await self.download_document(document, dest_dir)
+        if not local_path:
+            return DocumentDownload(document, error="Download failed")
+        return DocumentDownload(document, local_path)
+
+    async def download_documents(
+        self,
+        documents: Iterable[PortalDocument],
+        dest_dir: str,
+        known: Optional[Mapping[str, PortalDocument]] = None,
+    ) -> AsyncIterator[DocumentDownload]:
+        """Download documents in parallel, yielding each as it completes.
+
+        At most ``max_concurrent_downloads`` run at once, so callers can
+        start extracting a file while the rest are still downloading.
+
+        Args:
+            documents: Documents to download
+            dest_dir: Destination directory
+            known: Previously downloaded copies by document id; unchanged
+                documents are not downloaded again
+
+        Yields:
+            DocumentDownload per document, in completion order
+        """
+        from plana.core.concurrent import TaskResult, stream_concurrent
+
+        known = known or {}
+
+        async def download(document: PortalDocument) -> DocumentDownload:
+            try:
+                return await self.download_document_if_changed(
+                    document, dest_dir, known.get(document.id)
+                )
+            except Exception as e:
+                return DocumentDownload(document, error=str(e))
+
+        result: TaskResult[DocumentDownload]
+        async for result in stream_concurrent(
+            documents,
+            download,
+            max_concurrent=self.max_concurrent_downloads,
+            get_item_id=lambda document: document.id,
+        ):
+            if result.value is not None:
+                yield result.value
+
     @abstractmethod
     async def search_applications(
         self,
@@ -254,6 +351,41 @@ class CouncilAdapter(ABC):
         """
         pass
 
+    async def iter_decided_applications(
+        self, date_from: date, date_to: date
+    ) -> AsyncIterator[ApplicationDetails]:
+        """List applications decided in a date range, page by page.
+
+        Yields summaries as listed by the portal (reference, address,
+        proposal, status and ``portal_url``); ``fetch_listed_application``
+        turns one into full details.  Used by the historic backfill.
+
+        Args:
+            date_from: First decision date (inclusive)
+            date_to: Last decision date (inclusive)
+
+        Yields:
+            ApplicationDetails summaries
+        """
+        raise NotImplementedError(f"{self.council_name} does not list decided applications")
+        yield  # pragma: no cover
+
+    async def fetch_listed_application(
+        self, summary: ApplicationDetails
+    ) -> Optional[ApplicationDetails]:
+        """Fetch full details for a summary from ``iter_decided_applications``.
+
+        The default searches for the reference again; adapters whose
+        summaries carry the details URL override this to skip the search.
+
+        Args:
+            summary: Listed application
+
+        Returns:
+            ApplicationDetails or None if not found
+        """
+        return await self.fetch_application(summary.reference)
+
     async def close(self) -> None:
         """Clean up resources. Override if needed."""
         pass
@@ -17,25 +17,38 @@ CLI access with HTTP 406 (IDX002 error) from datacenter IPs.
 
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import json
+import os
 import re
 import time
 from datetime import date, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 from urllib.parse import urlencode, urljoin, urlparse, quote
 
+from plana.core.exceptions import CircuitOpenError
+from plana.core.resilience import (
+    RetryableHTTPStatus,
+    get_host_policy,
+    raise_for_retryable_status,
+)
 from plana.ingestion.base import (
     ApplicationDetails,
     ApplicationStatus,
     ApplicationType,
     Constraint,
     CouncilAdapter,
+    DocumentDownload,
     PortalAccessError,
     PortalDocument,
 )
+from plana.ingestion.parsing import FieldMap, parse_html
+from plana.ingestion.response_cache import (
+    CachedPage,
+    PortalResponseCache,
+    get_portal_response_cache,
+)
 
 # Optional dependencies for live mode
 _LIVE_DEPS_AVAILABLE = False
@@ -127,6 +140,7 @@ class NewcastleAdapter(CouncilAdapter):
     - Rate limiting (min 1 second between requests)
     - Retry with exponential backoff
     - HTML parsing for results
+    - An on-disk cache of search and view pages (see ``response_cache``)
     """
 
     # Current portal URL
@@ -142,22 +156,54 @@ class NewcastleAdapter(CouncilAdapter):
     _LEGACY_SEARCH_DO = "search.do"  # OLD IDOX - DO NOT USE
     _LEGACY_DETAILS_DO = "applicationDetails.do"  # OLD IDOX - DO NOT USE
 
-    # Rate limiting
+    # Rate limiting (shared by every adapter in the process via the host policy)
     MIN_REQUEST_INTERVAL = 1.0  # seconds
     MAX_RETRIES = 3
-    RETRY_BACKOFF = 2.0  # exponential backoff multiplier
+
+    # Dates in the search form (e.g. decision_issued_date_from)
+    FORM_DATE_FORMAT = "%d/%m/%Y"
 
     # Request settings
     TIMEOUT = 30.0
     USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
 
-    def __init__(self):
-        """Initialize the Newcastle adapter."""
+    def __init__(
+        self,
+        max_concurrent_downloads: Optional[int] = None,
+        response_cache: Optional[PortalResponseCache] = None,
+        bypass_cache: bool = False,
+        base_url: Optional[str] = None,
+    ):
+        """Initialize the Newcastle adapter.
+
+        Args:
+            max_concurrent_downloads: Parallel document downloads (defaults
+                to ``DocumentConfig.MAX_CONCURRENT_DOWNLOADS``)
+            response_cache: Page cache (defaults to the shared one next to
+                the database)
+            bypass_cache: Fetch pages again rather than use ones cached
+                before this adapter was created
+            base_url: Portal origin, to point the adapter at a stand-in
+                server (defaults to ``BASE_URL``)
+        """
         _check_live_deps()
 
-        self._last_request_time = 0
+        if max_concurrent_downloads:
+            self.max_concurrent_downloads = max_concurrent_downloads
+        if base_url:
+            self.BASE_URL = base_url.rstrip("/")
+
         self._client: Optional[httpx.AsyncClient] = None
         self._cache: dict = {}
+        self._page_cache = response_cache
+        self._cache_since = time.time() if bypass_cache else 0.0
+        self._session_established = False
+        self._host = get_host_policy(
+            self.BASE_URL,
+            rate=1.0 / self.MIN_REQUEST_INTERVAL,
+            burst=1,
+            max_attempts=self.MAX_RETRIES,
+        )
 
     def get_search_url(self, reference: str) -> str:
         """Build the search URL for display purposes.
@@ -205,16 +251,129 @@ class NewcastleAdapter(CouncilAdapter):
                 follow_redirects=True,
                 # Enable cookie jar for session persistence
                 cookies=httpx.Cookies(),
+                # Keep-alive connections for the parallel downloads plus pages
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrent_downloads + 2,
+                    max_keepalive_connections=self.max_concurrent_downloads + 2,
+                ),
             )
         return self._client
 
     async def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self.MIN_REQUEST_INTERVAL:
-            await asyncio.sleep(self.MIN_REQUEST_INTERVAL - elapsed)
-        self._last_request_time = time.time()
+        """Wait for the portal's token bucket (for requests made outside ``_request``)."""
+        await self._host.throttle()
+
+    async def _request(
+        self, url: str, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Make a portal request under the host's rate limit, retries and breaker.
+
+        Args:
+            url: URL being requested (for errors)
+            send: Coroutine function making one attempt; it raises
+                ``PortalAccessError`` for responses that must not be retried
+
+        Returns:
+            The response
+
+        Raises:
+            PortalAccessError: If access is blocked, the portal keeps failing,
+                or its circuit is open
+        """
+
+        async def attempt() -> httpx.Response:
+            response = await send()
+            # Check for Idox WAF block (can return any status with error page)
+            if is_idox_waf_block(response.text, response.status_code):
+                raise PortalAccessError(
+                    "Portal blocked automated access (Idox IDX002)",
+                    url=url,
+                    status_code=response.status_code,
+                )
+            raise_for_retryable_status(response, url)
+            return response
+
+        try:
+            return await self._host.call(attempt)
+        except CircuitOpenError as e:
+            raise PortalAccessError(
+                f"Portal unavailable after repeated failures; retry in {e.retry_after:.0f}s",
+                url=url,
+                status_code=503,
+            ) from e
+        except RetryableHTTPStatus as e:
+            raise PortalAccessError(
+                "Portal temporarily unavailable",
+                url=url,
+                status_code=e.status_code,
+            ) from e
+        except httpx.HTTPError as e:
+            raise PortalAccessError(f"Connection failed: {e}", url=url) from e
+
+    def _response_cache(self) -> PortalResponseCache:
+        if self._page_cache is None:
+            self._page_cache = get_portal_response_cache()
+        return self._page_cache
+
+    @staticmethod
+    def _cached_response(page: CachedPage) -> httpx.Response:
+        return httpx.Response(
+            200,
+            text=page.text,
+            headers={"content-type": page.content_type},
+            request=httpx.Request(page.method, page.url),
+        )
+
+    async def _cached_request(
+        self,
+        url: str,
+        send: Callable[[Dict[str, str]], Awaitable[httpx.Response]],
+        reference: Optional[str] = None,
+        method: str = "GET",
+        data: Optional[Dict[str, str]] = None,
+        cacheable: Callable[[str], bool] = lambda text: True,
+        before_fetch: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> httpx.Response:
+        """``_request`` through the portal response cache.
+
+        A fresh cached page is returned without a request.  A stale one is
+        revalidated (GET only) and returned again on a 304.  200 responses
+        whose text passes ``cacheable`` are stored.
+
+        Args:
+            url: URL being requested
+            send: Coroutine function making one attempt with extra
+                (conditional) headers
+            reference: Application the page belongs to (sets its freshness)
+            method: Request method
+            data: Form body (part of the cache key)
+            cacheable: Whether a 200 response's text may be stored
+            before_fetch: Awaited before going to the network
+
+        Returns:
+            The response, rebuilt from the cache on a hit
+        """
+        cache = self._response_cache()
+        key = cache.key(method, url, data)
+        page = cache.get(key, since=self._cache_since)
+        if page is not None and page.is_fresh:
+            return self._cached_response(page)
+
+        if before_fetch is not None:
+            await before_fetch()
+        conditional = page.validators() if page is not None and method == "GET" else {}
+        response = await self._request(url, lambda: send(conditional))
+
+        if response.status_code == 304 and page is not None:
+            return self._cached_response(cache.revalidated(key, page))
+        if response.status_code == 200 and cacheable(response.text):
+            cache.store(key, method, url, response.text, response.headers, reference)
+        return response
+
+    async def _ensure_session(self) -> None:
+        """Establish the session once per adapter (see ``_establish_session``)."""
+        if not self._session_established:
+            await self._establish_session()
 
     async def _establish_session(self) -> None:
         """Establish session by doing initial GET to set cookies.
@@ -225,16 +384,7 @@ class NewcastleAdapter(CouncilAdapter):
         client = await self._get_client()
         url = f"{self.BASE_URL}{self.SEARCH_ENDPOINT}"
 
-        await self._rate_limit()
-        response = await client.get(url)
-
-        # Check for WAF block
-        if is_idox_waf_block(response.text, response.status_code):
-            raise PortalAccessError(
-                "Portal blocked automated access (Idox IDX002)",
-                url=url,
-                status_code=response.status_code,
-            )
+        response = await self._request(url, lambda: client.get(url))
 
         if response.status_code != 200:
             raise PortalAccessError(
@@ -242,11 +392,13 @@ class NewcastleAdapter(CouncilAdapter):
                 url=url,
                 status_code=response.status_code,
             )
+        self._session_established = True
 
     async def _search_post(self, reference: str) -> str:
         """Execute search POST request to the portal.
 
-        IMPORTANT: Must call _establish_session() first to set cookies.
+        The session (cookies) is established first unless the results are
+        served from the response cache.  Empty form pages are not cached.
 
         This replicates the exact form submission from clicking Search in the browser.
 
@@ -264,12 +416,22 @@ class NewcastleAdapter(CouncilAdapter):
         Raises:
             PortalAccessError: If portal blocks access or returns error
         """
-        client = await self._get_client()
-        url = f"{self.BASE_URL}{self.SEARCH_ENDPOINT}"
+        return await self._submit_search(
+            self._search_form(application_reference_number=reference), reference
+        )
+
+    def _search_form(self, **fields: str) -> Dict[str, str]:
+        """Search form data with the given fields filled in.
+
+        Args:
+            **fields: Form fields to set (e.g. ``decision_issued_date_from``)
 
+        Returns:
+            Form data
+        """
         # Build form data exactly as captured from DevTools
         form_data = {
-            "application_reference_number": reference,
+            "application_reference_number": "",
             "application_type_id": "",
             "proposal": "",
             "decision_type_id": "",
@@ -297,88 +459,64 @@ class NewcastleAdapter(CouncilAdapter):
             "fa": "search",
             "submitted": "true",
         }
+        form_data.update(fields)
+        return form_data
 
-        last_error = None
-        last_status_code = None
-
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                await self._rate_limit()
-                response = await client.post(
-                    url,
-                    data=form_data,
-                    headers={
-                        "Content-Type": "application/x-www-form-urlencoded",
-                        "Origin": self.BASE_URL,
-                        "Referer": f"{self.BASE_URL}{self.PLANNING_PATH}/index.html",
-                    },
-                )
-                last_status_code = response.status_code
-
-                # Check for Idox WAF block (can return any status with error page)
-                if is_idox_waf_block(response.text, response.status_code):
-                    raise PortalAccessError(
-                        "Portal blocked automated access (Idox IDX002)",
-                        url=url,
-                        status_code=response.status_code,
-                    )
-
-                if response.status_code == 200:
-                    return response.text
-                elif response.status_code == 404:
-                    raise PortalAccessError(
-                        "Search endpoint not found",
-                        url=url,
-                        status_code=404,
-                    )
-                elif response.status_code in (403, 406):
-                    raise PortalAccessError(
-                        f"Portal blocked automated access ({response.status_code})",
-                        url=url,
-                        status_code=response.status_code,
-                    )
-                elif response.status_code >= 500:
-                    if attempt < self.MAX_RETRIES - 1:
-                        wait_time = self.RETRY_BACKOFF ** (attempt + 1)
-                        await asyncio.sleep(wait_time)
-                    else:
-                        raise PortalAccessError(
-                            "Portal temporarily unavailable",
-                            url=url,
-                            status_code=response.status_code,
-                        )
-                else:
-                    if attempt < self.MAX_RETRIES - 1:
-                        wait_time = self.RETRY_BACKOFF ** (attempt + 1)
-                        await asyncio.sleep(wait_time)
-
-            except httpx.TimeoutException as e:
-                last_error = str(e)
-                if attempt < self.MAX_RETRIES - 1:
-                    wait_time = self.RETRY_BACKOFF ** (attempt + 1)
-                    await asyncio.sleep(wait_time)
-            except httpx.HTTPError as e:
-                last_error = str(e)
-                if attempt < self.MAX_RETRIES - 1:
-                    wait_time = self.RETRY_BACKOFF ** (attempt + 1)
-                    await asyncio.sleep(wait_time)
-            except PortalAccessError:
-                raise
-
-        # All retries exhausted
-        if last_status_code:
+    async def _submit_search(
+        self, form_data: Dict[str, str], reference: Optional[str] = None
+    ) -> str:
+        """POST a search form and return the results page.
+
+        Args:
+            form_data: Form data from ``_search_form``
+            reference: Application searched for, if a single one
+
+        Returns:
+            HTML response text
+
+        Raises:
+            PortalAccessError: If portal blocks access or returns error
+        """
+        client = await self._get_client()
+        url = f"{self.BASE_URL}{self.SEARCH_ENDPOINT}"
+
+        response = await self._cached_request(
+            url,
+            lambda conditional: client.post(
+                url,
+                data=form_data,
+                headers={
+                    "Content-Type": "application/x-www-form-urlencoded",
+                    "Origin": self.BASE_URL,
+                    "Referer": f"{self.BASE_URL}{self.PLANNING_PATH}/index.html",
+                },
+            ),
+            reference=reference,
+            method="POST",
+            data=form_data,
+            cacheable=lambda text: not self._is_empty_form_page(text),
+            before_fetch=self._ensure_session,
+        )
+
+        if response.status_code == 200:
+            return response.text
+        elif response.status_code == 404:
             raise PortalAccessError(
-                f"Failed after {self.MAX_RETRIES} retries",
+                "Search endpoint not found",
                 url=url,
-                status_code=last_status_code,
+                status_code=404,
             )
-        elif last_error:
+        elif response.status_code in (403, 406):
             raise PortalAccessError(
-                f"Connection failed: {last_error}",
+                f"Portal blocked automated access ({response.status_code})",
                 url=url,
+                status_code=response.status_code,
             )
-
-        raise PortalAccessError("Unknown error", url=url)
+        raise PortalAccessError(
+            f"HTTP error {response.status_code}",
+            url=url,
+            status_code=response.status_code,
+        )
 
     async def _fetch_with_retry(self, url: str) -> Optional[str]:
         """Fetch URL with retry and rate limiting (GET request fallback).
@@ -395,81 +533,23 @@ class NewcastleAdapter(CouncilAdapter):
             PortalAccessError: If access is blocked (403/406) or other HTTP error persists
         """
         client = await self._get_client()
-        last_status_code = None
-        last_error = None
-
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                await self._rate_limit()
-                response = await client.get(url)
-                last_status_code = response.status_code
-
-                # Check for Idox WAF block
-                if is_idox_waf_block(response.text, response.status_code):
-                    raise PortalAccessError(
-                        "Portal blocked automated access (Idox IDX002)",
-                        url=url,
-                        status_code=response.status_code,
-                    )
-
-                if response.status_code == 200:
-                    return response.text
-                elif response.status_code == 404:
-                    return None
-                elif response.status_code in (403, 406):
-                    raise PortalAccessError(
-                        f"Portal blocked automated access ({response.status_code})",
-                        url=url,
-                        status_code=response.status_code,
-                    )
-                elif response.status_code >= 500:
-                    if attempt < self.MAX_RETRIES - 1:
-                        wait_time = self.RETRY_BACKOFF ** (attempt + 1)
-                        await asyncio.sleep(wait_time)
-                    else:
-                        raise PortalAccessError(
-                            "Portal temporarily unavailable",
-                            url=url,
-                            status_code=response.status_code,
-                        )
-                else:
-                    if attempt < self.MAX_RETRIES - 1:
-                        wait_time = self.RETRY_BACKOFF ** (attempt + 1)
-                        await asyncio.sleep(wait_time)
-                    else:
-                        raise PortalAccessError(
-                            f"HTTP error {response.status_code}",
-                            url=url,
-                            status_code=response.status_code,
-                        )
-
-            except httpx.TimeoutException as e:
-                last_error = str(e)
-                if attempt < self.MAX_RETRIES - 1:
-                    wait_time = self.RETRY_BACKOFF ** (attempt + 1)
-                    await asyncio.sleep(wait_time)
-            except httpx.HTTPError as e:
-                last_error = str(e)
-                if attempt < self.MAX_RETRIES - 1:
-                    wait_time = self.RETRY_BACKOFF ** (attempt + 1)
-                    await asyncio.sleep(wait_time)
-            except PortalAccessError:
-                raise
-
-        # All retries exhausted
-        if last_status_code:
-            raise PortalAccessError(
-                f"Failed after {self.MAX_RETRIES} retries",
-                url=url,
-                status_code=last_status_code,
-            )
-        elif last_error:
+        response = await self._request(url, lambda: client.get(url))
+
+        if response.status_code == 200:
+            return response.text
+        elif response.status_code == 404:
+            return None
+        elif response.status_code in (403, 406):
             raise PortalAccessError(
-                f"Connection failed: {last_error}",
+                f"Portal blocked automated access ({response.status_code})",
                 url=url,
+                status_code=response.status_code,
             )
-
-        return None
+        raise PortalAccessError(
+            f"HTTP error {response.status_code}",
+            url=url,
+            status_code=response.status_code,
+        )
 
     def _parse_reference(self, reference: str) -> str:
         """Normalize application reference format."""
@@ -548,6 +628,10 @@ class NewcastleAdapter(CouncilAdapter):
         3. Parse HTML to find "View" link for the matching application
         4. GET the "View" URL to fetch full application details
 
+        Steps 1, 2 and 4 are skipped for pages in the response cache; once
+        the application's status is parsed, its pages are kept fresh for
+        longer if it is decided.
+
         Args:
             reference: Application reference number
 
@@ -559,10 +643,8 @@ class NewcastleAdapter(CouncilAdapter):
         """
         reference = self._parse_reference(reference)
 
-        # Step 1: Establish session (GET to set cookies)
-        await self._establish_session()
-
-        # Step 2: Execute search POST (same as browser form submission)
+        # Steps 1-2: Establish session (GET to set cookies) and execute
+        # search POST (same as browser form submission)
         html = await self._search_post(reference)
 
         # Step 3: Parse HTML to find "View" link and extract application details
@@ -571,6 +653,7 @@ class NewcastleAdapter(CouncilAdapter):
         if view_url is None:
             # Check if HTML looks like empty form (no results block)
             if self._is_empty_form_page(html):
+                self._session_established = False
                 raise PortalAccessError(
                     "Search returned empty form (likely missing cookies or session expired)",
                     url=f"{self.BASE_URL}{self.SEARCH_ENDPOINT}",
@@ -580,11 +663,34 @@ class NewcastleAdapter(CouncilAdapter):
             return None
 
         # Step 4: Follow "View" link to get full application details
-        details_html = await self._fetch_view_page(view_url)
+        return await self._fetch_details(reference, view_url)
+
+    async def _fetch_details(self, reference: str, view_url: str) -> Optional[ApplicationDetails]:
+        """Fetch and parse an application's "View" page.
+
+        Args:
+            reference: Application reference
+            view_url: Full URL to the view page
+
+        Returns:
+            ApplicationDetails or None if not found
+        """
+        details_html = await self._fetch_view_page(view_url, reference)
         if details_html is None:
             return None
 
-        return self._parse_application_page(details_html, reference, view_url)
+        details = self._parse_application_page(details_html, reference, view_url)
+        if details is not None:
+            self._response_cache().settle(reference, details.status.value)
+        return details
+
+    async def fetch_listed_application(
+        self, summary: ApplicationDetails
+    ) -> Optional[ApplicationDetails]:
+        """Fetch details for a listed application straight from its view URL."""
+        if not summary.portal_url:
+            return await self.fetch_application(summary.reference)
+        return await self._fetch_details(summary.reference, summary.portal_url)
 
     def _extract_view_url(self, html: str, reference: str) -> Optional[str]:
         """Extract the "View" link URL for an application from search results.
@@ -609,7 +715,7 @@ class NewcastleAdapter(CouncilAdapter):
         Raises:
             PortalAccessError: If matching row found but view_application button missing data-id
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = parse_html(html)
 
         # Normalize reference for comparison
         ref_normalized = reference.upper().strip()
@@ -677,7 +783,7 @@ class NewcastleAdapter(CouncilAdapter):
         Returns:
             True if this looks like the empty form page
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = parse_html(html)
 
         # Check for search form
         has_form = soup.find("form") is not None
@@ -703,11 +809,12 @@ class NewcastleAdapter(CouncilAdapter):
 
         return False
 
-    async def _fetch_view_page(self, url: str) -> Optional[str]:
-        """Fetch the application "View" page.
+    async def _fetch_view_page(self, url: str, reference: Optional[str] = None) -> Optional[str]:
+        """Fetch the application "View" page (through the response cache).
 
         Args:
             url: Full URL to the view page
+            reference: Application reference (sets the cached page's freshness)
 
         Returns:
             HTML content or None if not found
@@ -717,12 +824,16 @@ class NewcastleAdapter(CouncilAdapter):
         """
         client = await self._get_client()
 
-        await self._rate_limit()
-        response = await client.get(
+        response = await self._cached_request(
             url,
-            headers={
-                "Referer": f"{self.BASE_URL}{self.PLANNING_PATH}/index.html",
-            },
+            lambda conditional: client.get(
+                url,
+                headers={
+                    "Referer": f"{self.BASE_URL}{self.PLANNING_PATH}/index.html",
+                    **conditional,
+                },
+            ),
+            reference=reference,
         )
 
         # Check for AWS WAF challenge (HTTP 202 with x-amzn-waf-action: challenge)
@@ -735,14 +846,6 @@ class NewcastleAdapter(CouncilAdapter):
                 status_code=response.status_code,
             )
 
-        # Check for Idox WAF block (IDX002)
-        if is_idox_waf_block(response.text, response.status_code):
-            raise PortalAccessError(
-                "Portal blocked automated access (Idox IDX002)",
-                url=url,
-                status_code=response.status_code,
-            )
-
         if response.status_code == 200:
             return response.text
         elif response.status_code == 404:
@@ -758,31 +861,8 @@ class NewcastleAdapter(CouncilAdapter):
         self, html: str, reference: str, url: str
     ) -> Optional[ApplicationDetails]:
         """Parse application details from HTML page."""
-        soup = BeautifulSoup(html, "html.parser")
-
-        def get_field(label: str) -> Optional[str]:
-            """Extract field value by label text."""
-            # Try table cell format
-            for th in soup.find_all(["th", "td"]):
-                if label.lower() in th.get_text().lower():
-                    next_td = th.find_next_sibling("td")
-                    if next_td:
-                        return next_td.get_text(strip=True)
-
-            # Try definition list format
-            for dt in soup.find_all("dt"):
-                if label.lower() in dt.get_text().lower():
-                    dd = dt.find_next_sibling("dd")
-                    if dd:
-                        return dd.get_text(strip=True)
-
-            # Try span with class format
-            for span in soup.find_all("span", class_=re.compile(r".*value.*", re.I)):
-                prev = span.find_previous(["span", "label"])
-                if prev and label.lower() in prev.get_text().lower():
-                    return span.get_text(strip=True)
-
-            return None
+        soup = parse_html(html)
+        get_field = FieldMap(soup).get
 
         # Extract key fields
         address = get_field("address") or get_field("site") or get_field("location") or ""
@@ -823,7 +903,7 @@ class NewcastleAdapter(CouncilAdapter):
             status=self._parse_status(status_text),
             date_received=get_field("received") or get_field("date received"),
             date_validated=get_field("validated") or get_field("valid date"),
-            decision_date=get_field("decision") or get_field("decision date"),
+            decision_date=get_field("decision date") or get_field("decision"),
             target_date=get_field("target") or get_field("determination date"),
             applicant_name=get_field("applicant"),
             agent_name=get_field("agent"),
@@ -871,7 +951,6 @@ class NewcastleAdapter(CouncilAdapter):
         reference = self._parse_reference(reference)
 
         # Use the same session-based flow as fetch_application
-        await self._establish_session()
         html = await self._search_post(reference)
 
         # Find and follow the View link to get the documents page
@@ -880,7 +959,7 @@ class NewcastleAdapter(CouncilAdapter):
             return []
 
         # Fetch the view page which contains document links
-        view_html = await self._fetch_view_page(view_url)
+        view_html = await self._fetch_view_page(view_url, reference)
         if view_html is None:
             return []
 
@@ -889,7 +968,7 @@ class NewcastleAdapter(CouncilAdapter):
 
     def _parse_documents_page(self, html: str, reference: str) -> List[PortalDocument]:
         """Parse documents list from HTML page."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = parse_html(html)
         documents = []
 
         # Find document table or list
@@ -978,52 +1057,99 @@ class NewcastleAdapter(CouncilAdapter):
         Returns:
             Local file path or None if download failed
         """
-        client = await self._get_client()
-        dest_path = Path(dest_dir)
-        dest_path.mkdir(parents=True, exist_ok=True)
-
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                await self._rate_limit()
+        result = await self.download_document_if_changed(document, dest_dir)
+        return result.local_path
 
-                async with client.stream("GET", document.url) as response:
-                    if response.status_code != 200:
-                        continue
-
-                    # Get content type
-                    content_type = response.headers.get("content-type", "")
-                    document.content_type = content_type
+    async def download_document_if_changed(
+        self,
+        document: PortalDocument,
+        dest_dir: str,
+        known: Optional[PortalDocument] = None,
+    ) -> DocumentDownload:
+        """Download a document, skipping it if ``known`` is still current.
 
-                    # Determine file extension
-                    ext = self._get_extension(content_type, document.title)
+        Sends ``If-None-Match`` with the known ETag (a 304 means
+        unchanged), and otherwise streams the file to a temporary name
+        while hashing it; a file whose hash matches the known copy is
+        discarded in favour of the one already on disk.
 
-                    # Create safe filename
-                    safe_title = re.sub(r"[^\w\s-]", "_", document.title)[:50]
-                    filename = f"{document.id}_{safe_title}{ext}"
-                    filepath = dest_path / filename
+        Args:
+            document: Document to download
+            dest_dir: Destination directory
+            known: The copy downloaded previously, if any
 
-                    # Download with hash calculation
-                    hasher = hashlib.md5()
-                    total_bytes = 0
+        Returns:
+            DocumentDownload for the document
+        """
+        client = await self._get_client()
+        dest_path = Path(dest_dir)
+        dest_path.mkdir(parents=True, exist_ok=True)
 
-                    with open(filepath, "wb") as f:
-                        async for chunk in response.aiter_bytes(chunk_size=8192):
+        if known is not None and not (known.local_path and Path(known.local_path).is_file()):
+            known = None
+        headers = {"If-None-Match": known.etag} if known is not None and known.etag else {}
+
+        def keep_known(previous: PortalDocument) -> DocumentDownload:
+            document.local_path = previous.local_path
+            document.content_hash = previous.content_hash
+            document.size_bytes = document.size_bytes or previous.size_bytes
+            document.content_type = document.content_type or previous.content_type
+            document.etag = document.etag or previous.etag
+            return DocumentDownload(document, previous.local_path, unchanged=True)
+
+        async def attempt() -> DocumentDownload:
+            async with client.stream("GET", document.url, headers=headers) as response:
+                raise_for_retryable_status(response, document.url)
+                if response.status_code == 304 and known is not None:
+                    return keep_known(known)
+                if response.status_code != 200:
+                    return DocumentDownload(document, error=f"HTTP {response.status_code}")
+
+                # Get content type
+                content_type = response.headers.get("content-type", "")
+                document.content_type = content_type
+                document.etag = response.headers.get("etag")
+
+                # Determine file extension
+                ext = self._get_extension(content_type, document.title)
+
+                # Create safe filename
+                safe_title = re.sub(r"[^\w\s-]", "_", document.title)[:50]
+                filename = f"{document.id}_{safe_title}{ext}"
+                filepath = dest_path / filename
+                partial = filepath.with_name(filepath.name + ".part")
+
+                # Download with hash calculation
+                hasher = hashlib.md5()
+                total_bytes = 0
+
+                try:
+                    with open(partial, "wb") as f:
+                        async for chunk in response.aiter_bytes(chunk_size=65536):
                             f.write(chunk)
                             hasher.update(chunk)
                             total_bytes += len(chunk)
+                except BaseException:
+                    partial.unlink(missing_ok=True)
+                    raise
 
-                    document.content_hash = hasher.hexdigest()
-                    document.size_bytes = total_bytes
-                    document.local_path = str(filepath)
+                content_hash = hasher.hexdigest()
+                if known is not None and content_hash == known.content_hash:
+                    partial.unlink()
+                    return keep_known(known)
 
-                    return str(filepath)
+                os.replace(partial, filepath)
+                document.content_hash = content_hash
+                document.size_bytes = total_bytes
+                document.local_path = str(filepath)
 
-            except Exception as e:
-                if attempt < self.MAX_RETRIES - 1:
-                    wait_time = self.RETRY_BACKOFF ** (attempt + 1)
-                    await asyncio.sleep(wait_time)
+                return DocumentDownload(document, str(filepath))
 
-        return None
+        try:
+            # Bounded by download concurrency rather than the page interval
+            return await get_host_policy(document.url).call(attempt, throttle=False)
+        except Exception as e:
+            return DocumentDownload(document, error=str(e))
 
     def _get_extension(self, content_type: str, title: str) -> str:
         """Determine file extension from content type or title."""
@@ -1050,6 +1176,112 @@ class NewcastleAdapter(CouncilAdapter):
 
         return ".pdf"  # Default
 
+    def _parse_search_results(self, html: str) -> List[ApplicationDetails]:
+        """Parse the result rows of a search results page.
+
+        Args:
+            html: HTML from search results
+
+        Returns:
+            ApplicationDetails summaries, with ``portal_url`` set to the
+            application's view page
+        """
+        soup = parse_html(html)
+        results = []
+        for td in soup.find_all("td", {"data-label": "Application Reference"}):
+            row = td.find_parent("tr")
+            button = row.find("button", attrs={"data-id": True}) if row else None
+            if button is None:
+                continue
+
+            def cell(label: str, row: Any = row) -> str:
+                found = row.find("td", {"data-label": label})
+                return found.get_text(strip=True) if found else ""
+
+            address = cell("Address")
+            results.append(ApplicationDetails(
+                reference=self._parse_reference(td.get_text(strip=True)),
+                council_id=self.council_id,
+                address=address,
+                proposal=cell("Proposal"),
+                application_type=self._parse_application_type(cell("Application Type")),
+                status=self._parse_status(cell("Status")),
+                postcode=self._extract_postcode(address),
+                portal_url=(
+                    f"{self.BASE_URL}{self.PLANNING_PATH}/index.html"
+                    f"?fa=getApplication&id={button['data-id']}"
+                ),
+            ))
+        return results
+
+    def _next_page_url(self, html: str) -> Optional[str]:
+        """URL of the next results page, if the page links to one."""
+        soup = parse_html(html)
+        link = soup.find("a", rel="next", href=True)
+        if link is None:
+            item = soup.find("li", class_="next")
+            link = item.find("a", href=True) if item else None
+        if link is None:
+            return None
+        return urljoin(f"{self.BASE_URL}{self.PLANNING_PATH}/", str(link["href"]))
+
+    async def _fetch_results_page(self, url: str) -> str:
+        """Fetch a further page of search results (through the response cache)."""
+        client = await self._get_client()
+        response = await self._cached_request(
+            url,
+            lambda conditional: client.get(
+                url,
+                headers={
+                    "Referer": f"{self.BASE_URL}{self.PLANNING_PATH}/index.html",
+                    **conditional,
+                },
+            ),
+            before_fetch=self._ensure_session,
+        )
+        if response.status_code != 200:
+            raise PortalAccessError(
+                f"HTTP error {response.status_code}",
+                url=url,
+                status_code=response.status_code,
+            )
+        return response.text
+
+    async def _iter_search(self, form_data: Dict[str, str]) -> AsyncIterator[ApplicationDetails]:
+        """Submit a search and yield its results, following result pages."""
+        html = await self._submit_search(form_data)
+        seen_pages = set()
+        while True:
+            for summary in self._parse_search_results(html):
+                yield summary
+            next_url = self._next_page_url(html)
+            if next_url is None or next_url in seen_pages:
+                return
+            seen_pages.add(next_url)
+            html = await self._fetch_results_page(next_url)
+
+    async def iter_decided_applications(
+        self, date_from: date, date_to: date
+    ) -> AsyncIterator[ApplicationDetails]:
+        """List applications decided in a date range, page by page.
+
+        Uses the search form's decision issued dates.  Summaries carry the
+        view URL, so ``fetch_listed_application`` skips the search.
+
+        Args:
+            date_from: First decision date (inclusive)
+            date_to: Last decision date (inclusive)
+
+        Yields:
+            ApplicationDetails summaries
+        """
+        form_data = self._search_form(
+            decision_issued_date_from=date_from.strftime(self.FORM_DATE_FORMAT),
+            decision_issued_date_to=date_to.strftime(self.FORM_DATE_FORMAT),
+        )
+        async for summary in self._iter_search(form_data):
+            yield summary
+
     async def search_applications(
         self,
         postcode: Optional[str] = None,
@@ -1062,21 +1294,41 @@ class NewcastleAdapter(CouncilAdapter):
     ) -> List[ApplicationDetails]:
         """Search for applications.
 
+        The portal's form takes ward ids rather than names, so ``ward`` is
+        not sent; ``status`` is matched against the listed status.
+
         Args:
             postcode: Filter by postcode
             address: Filter by address text
-            ward: Filter by ward name
+            ward: Filter by ward name (not supported by the portal form)
             status: Filter by status
             date_from: Applications received from this date
             date_to: Applications received to this date
             max_results: Maximum results to return
 
         Returns:
-            List of ApplicationDetails
+            List of ApplicationDetails summaries (see ``_parse_search_results``)
         """
-        # For advanced search, we'd need to implement a separate form POST
-        # For now, this is not fully implemented
-        return []
+        fields = {}
+        if postcode:
+            fields["SiteAddress[postcode]"] = postcode
+        if address:
+            fields["SiteAddress[magic]"] = address
+        if date_from:
+            fields["received_date_from"] = date_from.strftime(self.FORM_DATE_FORMAT)
+        if date_to:
+            fields["received_date_to"] = date_to.strftime(self.FORM_DATE_FORMAT)
+        if not fields:
+            return []
+
+        results: List[ApplicationDetails] = []
+        async for summary in self._iter_search(self._search_form(**fields)):
+            if status is not None and summary.status != status:
+                continue
+            results.append(summary)
+            if len(results) >= max_results:
+                break
+        return results
 
     async def close(self) -> None:
         """Close the HTTP client."""
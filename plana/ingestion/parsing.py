@@ -0,0 +1,100 @@
+"""
+HTML parsing for council portal pages.
+
+A portal response is parsed once: ``parse_html`` keeps the last few
+trees, so the adapter's checks on one page (result row lookup, empty
+form detection, details parsing) share a tree instead of each parsing
+the text again.  Trees are built with lxml when it is installed and with
+Python's ``html.parser`` otherwise; either way the result is a
+BeautifulSoup tree, so the adapters' navigation code is the same.
+
+``FieldMap`` collects a details page's label/value pairs in one
+traversal, so looking up twenty fields does not walk the tree twenty
+times.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Optional
+
+# Optional dependency: faster tree builder
+_LXML_AVAILABLE = False
+
+try:
+    import lxml  # noqa: F401
+    _LXML_AVAILABLE = True
+except ImportError:
+    pass
+
+HTML_PARSER = "lxml" if _LXML_AVAILABLE else "html.parser"
+
+# Pages kept parsed (one search flow touches two or three)
+_PARSED_PAGES = 8
+
+_VALUE_CLASS = re.compile(r".*value.*", re.I)
+
+
+@lru_cache(maxsize=_PARSED_PAGES)
+def parse_html(html: str) -> Any:
+    """Parse a page into a BeautifulSoup tree, reusing recent trees.
+
+    Callers must treat the tree as read-only, since it is shared.
+
+    Args:
+        html: Page text
+
+    Returns:
+        BeautifulSoup tree
+    """
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+class FieldMap:
+    """Label/value pairs of a details page, collected in one traversal.
+
+    Pages lay fields out as table rows (``<th>``/``<td>`` followed by a
+    ``<td>``), definition lists (``<dt>``/``<dd>``) or value spans after a
+    label.  ``get`` matches a label as a case-insensitive substring and
+    prefers table rows, then definition lists, then spans, taking the
+    first match in page order within each layout.
+    """
+
+    def __init__(self, soup: Any):
+        """Collect the pairs.
+
+        Args:
+            soup: Parsed page (see ``parse_html``)
+        """
+        table: list[tuple[str, str]] = []
+        definitions: list[tuple[str, str]] = []
+        spans: list[tuple[str, str]] = []
+
+        for element in soup.find_all(["th", "td", "dt", "span"]):
+            name = element.name
+            if name in ("th", "td"):
+                value = element.find_next_sibling("td")
+                if value is not None:
+                    table.append((element.get_text().lower(), value.get_text(strip=True)))
+            elif name == "dt":
+                value = element.find_next_sibling("dd")
+                if value is not None:
+                    definitions.append((element.get_text().lower(), value.get_text(strip=True)))
+            elif any(_VALUE_CLASS.match(c) for c in element.get("class") or ()):
+                label = element.find_previous(["span", "label"])
+                if label is not None:
+                    spans.append((label.get_text().lower(), element.get_text(strip=True)))
+
+        self._pairs = table + definitions + spans
+        self._found: dict[str, Optional[str]] = {}
+
+    def get(self, label: str) -> Optional[str]:
+        """Value of the first field whose label contains ``label``, or None."""
+        key = label.lower()
+        if key not in self._found:
+            self._found[key] = next((v for text, v in self._pairs if key in text), None)
+        return self._found[key]
+
+    def __len__(self) -> int:
+        return len(self._pairs)
@@ -0,0 +1,238 @@
+"""
+On-disk cache of council portal pages.
+
+Live processing fetches the same search, view and documents pages every
+time a reference is processed, although pages of decided applications
+hardly ever change.  ``PortalResponseCache`` keeps successful page
+responses, keyed by method, URL and form body, in the shared SQLite
+cache file next to the database:
+
+- pages of a pending application are fresh for
+  ``CacheConfig.PORTAL_PENDING_TTL`` and those of a decided one for
+  ``CacheConfig.PORTAL_DECIDED_TTL``.  A page is stored as pending
+  until the adapter has parsed the application's status and calls
+  ``settle``;
+- stale pages are kept for ``CacheConfig.PORTAL_RETAIN_TTL`` so they can
+  be revalidated with ``If-None-Match`` / ``If-Modified-Since``; a 304
+  makes them fresh again without downloading them;
+- an adapter created with ``bypass_cache`` ignores pages stored before it
+  started (it still stores what it fetches, so one run does not fetch a
+  page twice).
+"""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Mapping, Optional, Union
+
+from plana.core.cache import TieredCache, get_tiered_cache
+from plana.core.constants import CacheConfig
+
+# Statuses after which an application's pages stop changing
+DECIDED_STATUSES = frozenset({
+    "approved",
+    "approved_with_conditions",
+    "refused",
+    "withdrawn",
+    "appeal",
+})
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """A stored page response."""
+
+    method: str
+    url: str
+    text: str
+    content_type: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+    fresh_until: float
+    reference: Optional[str] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.fresh_until > time.time()
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating the page."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PortalResponseCache:
+    """Portal page responses with status-aware freshness."""
+
+    NAMESPACE = "portal_responses"
+
+    def __init__(
+        self,
+        cache: TieredCache,
+        pending_ttl: float = CacheConfig.PORTAL_PENDING_TTL,
+        decided_ttl: float = CacheConfig.PORTAL_DECIDED_TTL,
+        retain_ttl: float = CacheConfig.PORTAL_RETAIN_TTL,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache: Tiered cache holding the pages
+            pending_ttl: Seconds a pending application's page is fresh
+            decided_ttl: Seconds a decided application's page is fresh
+            retain_ttl: Seconds a page is kept for revalidation
+        """
+        self.cache = cache
+        self.pending_ttl = pending_ttl
+        self.decided_ttl = decided_ttl
+        self.retain_ttl = retain_ttl
+        self._keys_by_reference: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0, "stored": 0}
+
+    @staticmethod
+    def key(method: str, url: str, data: Optional[Mapping[str, Any]] = None) -> str:
+        """Cache key for a request (form fields in any order give the same key)."""
+        body = json.dumps(sorted((data or {}).items()), default=str)
+        digest = hashlib.sha256(f"{method.upper()} {url}\n{body}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def get(self, key: str, since: float = 0.0) -> Optional[CachedPage]:
+        """Stored page (fresh or not) stored at or after ``since``, else None.
+
+        Only a fresh page counts as a hit.
+        """
+        page: Optional[CachedPage] = self.cache.get(key)
+        if not isinstance(page, CachedPage) or page.stored_at < since:
+            page = None
+        self._count("hits" if page is not None and page.is_fresh else "misses")
+        return page
+
+    def _ttl_for(self, reference: Optional[str]) -> float:
+        if reference and self.cache.get(f"decided:{reference}"):
+            return self.decided_ttl
+        return self.pending_ttl
+
+    def _put(self, key: str, page: CachedPage) -> None:
+        self.cache.set(key, page, ttl=self.retain_ttl)
+        if page.reference:
+            with self._lock:
+                self._keys_by_reference.setdefault(page.reference, set()).add(key)
+
+    def store(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        text: str,
+        headers: Mapping[str, str],
+        reference: Optional[str] = None,
+    ) -> CachedPage:
+        """Store a 200 response.
+
+        Args:
+            key: Key from ``key()``
+            method: Request method
+            url: Request URL
+            text: Response body
+            headers: Response headers
+            reference: Application the page belongs to (sets its freshness)
+
+        Returns:
+            The stored page
+        """
+        now = time.time()
+        page = CachedPage(
+            method=method.upper(),
+            url=url,
+            text=text,
+            content_type=headers.get("content-type", "text/html"),
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            stored_at=now,
+            fresh_until=now + self._ttl_for(reference),
+            reference=reference,
+        )
+        self._put(key, page)
+        self._count("stored")
+        return page
+
+    def revalidated(self, key: str, page: CachedPage) -> CachedPage:
+        """Make a page fresh again after the portal answered 304."""
+        now = time.time()
+        page = replace(page, stored_at=now, fresh_until=now + self._ttl_for(page.reference))
+        self._put(key, page)
+        self._count("revalidated")
+        return page
+
+    def settle(self, reference: str, status: str) -> int:
+        """Set the freshness of a reference's pages from its parsed status.
+
+        Pages of a decided application stored in this process get the
+        decided TTL, and the reference's later pages are stored with it.
+
+        Args:
+            reference: Application reference
+            status: ``ApplicationStatus`` value
+
+        Returns:
+            Number of pages updated
+        """
+        if status not in DECIDED_STATUSES:
+            return 0
+        self.cache.set(f"decided:{reference}", True, ttl=self.retain_ttl)
+        with self._lock:
+            keys = list(self._keys_by_reference.get(reference, ()))
+        updated = 0
+        for key in keys:
+            page = self.cache.get(key)
+            if isinstance(page, CachedPage):
+                self._put(key, replace(page, fresh_until=page.stored_at + self.decided_ttl))
+                updated += 1
+        return updated
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return dict(self._stats)
+
+
+_response_cache: Optional[PortalResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_portal_response_cache(path: Optional[Union[str, Path]] = None) -> PortalResponseCache:
+    """Get the shared portal response cache.
+
+    Args:
+        path: SQLite file (defaults to the cache file next to the database)
+
+    Returns:
+        PortalResponseCache
+    """
+    global _response_cache
+    if path is None:
+        from plana.storage.database import get_database
+
+        path = get_database().db_path.with_suffix(".cache.db")
+    tiered = get_tiered_cache(
+        PortalResponseCache.NAMESPACE,
+        ttl=CacheConfig.PORTAL_RETAIN_TTL,
+        disk_path=path,
+        max_size=200,
+    )
+    with _response_cache_lock:
+        if _response_cache is None or _response_cache.cache is not tiered:
+            _response_cache = PortalResponseCache(tiered)
+        return _response_cache
@@ -3,11 +3,15 @@
 from plana.location.postcodes import (
     PostcodeResult,
     lookup_postcode,
+    bulk_lookup_postcodes,
+    get_postcode_cache_stats,
     get_location_constraints,
     enrich_application_location,
 )
 from plana.location.gis import (
     check_gis_constraints,
+    get_gis_cache_stats,
+    prewarm_gis_cache,
     GISCheckResult,
     GISConstraint,
 )
@@ -15,9 +19,13 @@ from plana.location.gis import (
 __all__ = [
     "PostcodeResult",
     "lookup_postcode",
+    "bulk_lookup_postcodes",
+    "get_postcode_cache_stats",
     "get_location_constraints",
     "enrich_application_location",
     "check_gis_constraints",
+    "get_gis_cache_stats",
+    "prewarm_gis_cache",
     "GISCheckResult",
     "GISConstraint",
 ]
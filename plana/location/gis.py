@@ -10,7 +10,13 @@ given lat/lon point:
 - **Conservation areas** — Historic England Conservation Areas API
 
 All APIs are free, no authentication required, and return GeoJSON.
-Results are cached per postcode for the lifetime of the process.
+The checks run concurrently over one pooled keep-alive HTTP client, under
+an overall deadline.  Results are cached per ~11m grid cell and layer in
+the SQLite database with per-layer TTLs (failures for a short time), in
+front of which sits a small per-process cache.
+
+Layers can also be answered offline from local snapshots (see
+``plana.location.offline_layers``) by setting ``PLANA_GIS_LAYERS_PATH``.
 
 Usage::
 
@@ -22,19 +28,53 @@ Usage::
 """
 
 import json
+import os
+import threading
+import time
 import urllib.request
 import urllib.error
-from dataclasses import dataclass, field
-from functools import lru_cache
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
 
 from plana.core.logging import get_logger
+from plana.core.resilience import get_host_policy
 
 logger = get_logger(__name__)
 
+# Optional dependency: pooled keep-alive HTTP client
+_HTTPX_AVAILABLE = False
+
+try:
+    import httpx
+    _HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
 # Timeout for external API calls (seconds)
 _API_TIMEOUT = 8.0
 
+# Overall deadline for one location's checks (seconds).  Checks still
+# running when it passes are reported as errors, not as "checked".
+_CHECK_DEADLINE = 10.0
+
+# Concurrent GIS requests (shared by all callers)
+_MAX_CONCURRENT_REQUESTS = 8
+
+# Per-host limits for the GIS services: one quick retry at most, as a
+# slower answer would miss the check deadline anyway
+_HOST_POLICY = {
+    "burst": _MAX_CONCURRENT_REQUESTS,
+    "max_attempts": 2,
+    "max_delay": 1.0,
+}
+
+# Complete results kept in the per-process cache (in front of the
+# persistent per-layer cache, see _cached_check)
+_CACHE_SIZE = 256
+
 # Buffer distance for point-based searches (metres)
 _SEARCH_RADIUS_M = 100
 
@@ -89,12 +129,86 @@ class GISCheckResult:
         return result
 
 
+# =========================================================================
+# Shared HTTP client
+# =========================================================================
+
+_client: Any = None
+_executor: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _http_client() -> Any:
+    """Shared keep-alive client for all GIS requests (None without httpx).
+
+    ``httpx.Client`` is thread-safe, so the concurrent checks share one
+    connection pool and reuse TLS connections to each ArcGIS host.
+    """
+    global _client
+    if not _HTTPX_AVAILABLE:
+        return None
+    if _client is None:
+        with _pool_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    timeout=_API_TIMEOUT,
+                    headers={"Accept": "application/json"},
+                    limits=httpx.Limits(
+                        max_connections=_MAX_CONCURRENT_REQUESTS,
+                        max_keepalive_connections=_MAX_CONCURRENT_REQUESTS,
+                    ),
+                )
+    return _client
+
+
+def _check_executor() -> ThreadPoolExecutor:
+    """Shared worker pool the checks fan out on."""
+    global _executor
+    if _executor is None:
+        with _pool_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_MAX_CONCURRENT_REQUESTS,
+                    thread_name_prefix="gis-check",
+                )
+    return _executor
+
+
+def _get_json(url: str) -> dict:
+    """GET a JSON document from a GIS endpoint.
+
+    Goes through the endpoint host's shared policy, so a service that is
+    down fails fast instead of holding every check to the deadline.
+    """
+    data: dict = get_host_policy(url, **_HOST_POLICY).call_sync(lambda: _fetch_json(url))
+
+    # ArcGIS reports query errors in a 200 response body
+    if isinstance(data, dict) and data.get("error"):
+        raise RuntimeError(f"GIS service error: {data['error']}")
+    return data
+
+
+def _fetch_json(url: str) -> Any:
+    """One GET of a JSON document."""
+    client = _http_client()
+    if client is not None:
+        response = client.get(url)
+        response.raise_for_status()
+        return response.json()
+    req = urllib.request.Request(url, headers={"Accept": "application/json"})
+    with urllib.request.urlopen(req, timeout=_API_TIMEOUT) as resp:
+        return json.loads(resp.read().decode("utf-8"))
+
+
 # =========================================================================
 # Environment Agency — Flood Map for Planning
 # =========================================================================
 
-def _check_flood_zones(lat: float, lon: float) -> list[GISConstraint]:
-    """Query the EA Flood Map for Planning (flood zones 2 and 3).
+_FLOOD_ZONES = [("2", "Flood Zone 2"), ("3", "Flood Zone 3")]
+
+
+def _check_flood_zone(lat: float, lon: float, zone_id: str, zone_name: str) -> list[GISConstraint]:
+    """Query the EA Flood Map for Planning for one flood zone.
 
     Uses the EA's open GeoJSON endpoint. Free, no key required.
     Docs: https://environment.data.gov.uk/
@@ -106,34 +220,28 @@ def _check_flood_zones(lat: float, lon: float) -> list[GISConstraint]:
     delta = 0.001  # ~100m buffer
     bbox = f"{lon - delta},{lat - delta},{lon + delta},{lat + delta}"
 
-    for zone_id, zone_name in [("2", "Flood Zone 2"), ("3", "Flood Zone 3")]:
-        url = (
-            f"https://environment.data.gov.uk/arcgis/rest/services/"
-            f"EA/FloodMapForPlanningRiversAndSeaFloodZone{zone_id}/"
-            f"MapServer/0/query"
-            f"?geometry={bbox}"
-            f"&geometryType=esriGeometryEnvelope"
-            f"&inSR=4326&outSR=4326"
-            f"&spatialRel=esriSpatialRelIntersects"
-            f"&returnCountOnly=true"
-            f"&f=json"
-        )
-        try:
-            req = urllib.request.Request(url, headers={"Accept": "application/json"})
-            with urllib.request.urlopen(req, timeout=_API_TIMEOUT) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-
-            count = data.get("count", 0)
-            if count > 0:
-                constraints.append(GISConstraint(
-                    constraint_type="Flood Zone",
-                    name=zone_name,
-                    source="Environment Agency Flood Map for Planning",
-                    details=f"Site intersects {zone_name} (EA open data)",
-                    raw=data,
-                ))
-        except Exception as exc:
-            logger.warning("gis_flood_check_failed", zone=zone_name, error=str(exc))
+    url = (
+        f"https://environment.data.gov.uk/arcgis/rest/services/"
+        f"EA/FloodMapForPlanningRiversAndSeaFloodZone{zone_id}/"
+        f"MapServer/0/query"
+        f"?geometry={bbox}"
+        f"&geometryType=esriGeometryEnvelope"
+        f"&inSR=4326&outSR=4326"
+        f"&spatialRel=esriSpatialRelIntersects"
+        f"&returnCountOnly=true"
+        f"&f=json"
+    )
+    data = _get_json(url)
+
+    count = data.get("count", 0)
+    if count > 0:
+        constraints.append(GISConstraint(
+            constraint_type="Flood Zone",
+            name=zone_name,
+            source="Environment Agency Flood Map for Planning",
+            details=f"Site intersects {zone_name} (EA open data)",
+            raw=data,
+        ))
 
     return constraints
 
@@ -165,28 +273,23 @@ def _check_listed_buildings(lat: float, lon: float) -> list[GISConstraint]:
         "&f=json"
     )
 
-    try:
-        req = urllib.request.Request(url, headers={"Accept": "application/json"})
-        with urllib.request.urlopen(req, timeout=_API_TIMEOUT) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-
-        features = data.get("features", [])
-        for feat in features[:5]:
-            attrs = feat.get("attributes", {})
-            name = attrs.get("Name", "Unknown")
-            grade = attrs.get("Grade", "")
-            entry = attrs.get("ListEntry", "")
-            grade_text = f"Grade {grade}" if grade else ""
-
-            constraints.append(GISConstraint(
-                constraint_type="Listed Building",
-                name=f"{grade_text}: {name}".strip(": "),
-                source="Historic England Listed Buildings Register",
-                details=f"List Entry: {entry}" if entry else "",
-                raw=attrs,
-            ))
-    except Exception as exc:
-        logger.warning("gis_listed_buildings_check_failed", error=str(exc))
+    data = _get_json(url)
+
+    features = data.get("features", [])
+    for feat in features[:5]:
+        attrs = feat.get("attributes", {})
+        name = attrs.get("Name", "Unknown")
+        grade = attrs.get("Grade", "")
+        entry = attrs.get("ListEntry", "")
+        grade_text = f"Grade {grade}" if grade else ""
+
+        constraints.append(GISConstraint(
+            constraint_type="Listed Building",
+            name=f"{grade_text}: {name}".strip(": "),
+            source="Historic England Listed Buildings Register",
+            details=f"List Entry: {entry}" if entry else "",
+            raw=attrs,
+        ))
 
     return constraints
 
@@ -218,23 +321,18 @@ def _check_conservation_areas(lat: float, lon: float) -> list[GISConstraint]:
         "&f=json"
     )
 
-    try:
-        req = urllib.request.Request(url, headers={"Accept": "application/json"})
-        with urllib.request.urlopen(req, timeout=_API_TIMEOUT) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-
-        features = data.get("features", [])
-        for feat in features:
-            attrs = feat.get("attributes", {})
-            name = attrs.get("NAME", "Unnamed Conservation Area")
-            constraints.append(GISConstraint(
-                constraint_type="Conservation Area",
-                name=name,
-                source="Historic England Conservation Areas Dataset",
-                raw=attrs,
-            ))
-    except Exception as exc:
-        logger.warning("gis_conservation_area_check_failed", error=str(exc))
+    data = _get_json(url)
+
+    features = data.get("features", [])
+    for feat in features:
+        attrs = feat.get("attributes", {})
+        name = attrs.get("NAME", "Unnamed Conservation Area")
+        constraints.append(GISConstraint(
+            constraint_type="Conservation Area",
+            name=name,
+            source="Historic England Conservation Areas Dataset",
+            raw=attrs,
+        ))
 
     return constraints
 
@@ -266,23 +364,18 @@ def _check_sssi(lat: float, lon: float) -> list[GISConstraint]:
         "&f=json"
     )
 
-    try:
-        req = urllib.request.Request(url, headers={"Accept": "application/json"})
-        with urllib.request.urlopen(req, timeout=_API_TIMEOUT) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-
-        features = data.get("features", [])
-        for feat in features:
-            attrs = feat.get("attributes", {})
-            name = attrs.get("SSSI_NAME", "Unnamed SSSI")
-            constraints.append(GISConstraint(
-                constraint_type="SSSI",
-                name=name,
-                source="Natural England SSSI Dataset",
-                raw=attrs,
-            ))
-    except Exception as exc:
-        logger.warning("gis_sssi_check_failed", error=str(exc))
+    data = _get_json(url)
+
+    features = data.get("features", [])
+    for feat in features:
+        attrs = feat.get("attributes", {})
+        name = attrs.get("SSSI_NAME", "Unnamed SSSI")
+        constraints.append(GISConstraint(
+            constraint_type="SSSI",
+            name=name,
+            source="Natural England SSSI Dataset",
+            raw=attrs,
+        ))
 
     return constraints
 
@@ -313,21 +406,16 @@ def _check_green_belt(lat: float, lon: float) -> list[GISConstraint]:
         "&f=json"
     )
 
-    try:
-        req = urllib.request.Request(url, headers={"Accept": "application/json"})
-        with urllib.request.urlopen(req, timeout=_API_TIMEOUT) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-
-        count = data.get("count", 0)
-        if count > 0:
-            constraints.append(GISConstraint(
-                constraint_type="Green Belt",
-                name="Green Belt",
-                source="DLUHC Green Belt Dataset",
-                raw=data,
-            ))
-    except Exception as exc:
-        logger.warning("gis_green_belt_check_failed", error=str(exc))
+    data = _get_json(url)
+
+    count = data.get("count", 0)
+    if count > 0:
+        constraints.append(GISConstraint(
+            constraint_type="Green Belt",
+            name="Green Belt",
+            source="DLUHC Green Belt Dataset",
+            raw=data,
+        ))
 
     return constraints
 
@@ -336,33 +424,301 @@ def _check_green_belt(lat: float, lon: float) -> list[GISConstraint]:
 # Main entry point
 # =========================================================================
 
-@lru_cache(maxsize=256)
-def _cached_check(lat_round: float, lon_round: float) -> tuple:
-    """Internal cached implementation — rounds coords to ~11m precision."""
-    constraints = []
-    checked = []
-    errors = []
-
-    checks = [
-        ("Flood Zone", _check_flood_zones),
-        ("Listed Building", _check_listed_buildings),
-        ("Conservation Area", _check_conservation_areas),
-        ("SSSI", _check_sssi),
-        ("Green Belt", _check_green_belt),
-    ]
-
-    for check_name, check_fn in checks:
+# (layer, check type, function, extra args) — flood zones are split so
+# both requests run concurrently; results keep this order.
+_CHECKS: list[tuple[str, str, Callable[..., list[GISConstraint]], tuple]] = [
+    *(
+        (f"flood_zone_{zone[0]}", "Flood Zone", _check_flood_zone, zone)
+        for zone in _FLOOD_ZONES
+    ),
+    ("listed_building", "Listed Building", _check_listed_buildings, ()),
+    ("conservation_area", "Conservation Area", _check_conservation_areas, ()),
+    ("sssi", "SSSI", _check_sssi, ()),
+    ("green_belt", "Green Belt", _check_green_belt, ()),
+]
+
+
+# =========================================================================
+# Result caching
+# =========================================================================
+
+# How long each layer's results stay valid (seconds).  Designations change
+# rarely; listed buildings are added most often.
+_LAYER_TTLS: dict[str, float] = {
+    "flood_zone_2": 30 * 86400,
+    "flood_zone_3": 30 * 86400,
+    "listed_building": 7 * 86400,
+    "conservation_area": 30 * 86400,
+    "sssi": 90 * 86400,
+    "green_belt": 90 * 86400,
+}
+_DEFAULT_LAYER_TTL = 7 * 86400
+
+# Failed or timed-out lookups are remembered briefly so an unreachable
+# endpoint is not retried on every report
+_NEGATIVE_TTL = 15 * 60
+
+_result_cache: "OrderedDict[tuple[float, float], tuple[tuple, float]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+_stats = {
+    "offline_hits": 0,
+    "memory_hits": 0,
+    "persistent_hits": 0,
+    "negative_hits": 0,
+    "misses": 0,
+    "failures": 0,
+    "timeouts": 0,
+}
+_stats_lock = threading.Lock()
+
+
+def _count(stat: str, n: int = 1) -> None:
+    with _stats_lock:
+        _stats[stat] += n
+
+
+# Offline constraint layers: None = not loaded yet, False = not configured
+_offline: Any = None
+
+
+def _offline_index() -> Any:
+    """Offline layers from ``PLANA_GIS_LAYERS_PATH`` (index file or GeoJSON dir).
+
+    Layers present offline are answered locally; the rest still use the
+    live services.
+    """
+    global _offline
+    if _offline is None:
+        with _pool_lock:
+            if _offline is None:
+                _offline = False
+                path = os.environ.get("PLANA_GIS_LAYERS_PATH")
+                if path:
+                    try:
+                        from plana.location.offline_layers import OfflineConstraintIndex
+                        _offline = OfflineConstraintIndex.load(Path(path))
+                        logger.info("gis_offline_layers_loaded", path=path, layers=_offline.summary())
+                    except Exception as exc:
+                        logger.warning("gis_offline_layers_failed", path=path, error=str(exc))
+    return _offline or None
+
+
+def set_offline_index(index: Any) -> None:
+    """Use ``index`` (an ``OfflineConstraintIndex``, or None) for offline layers."""
+    global _offline
+    _offline = index if index is not None else False
+    with _result_cache_lock:
+        _result_cache.clear()
+
+
+def _persistent_store() -> Any:
+    """The database holding the persistent GIS cache, or None."""
+    try:
+        from plana.storage.database import get_database
+        return get_database()
+    except Exception:
+        return None
+
+
+def _load_layers(lat_round: float, lon_round: float) -> dict[str, dict]:
+    store = _persistent_store()
+    if store is None:
+        return {}
+    try:
+        entries: dict[str, dict] = store.get_gis_cache_entries(lat_round, lon_round)
+        return entries
+    except Exception as exc:
+        logger.warning("gis_cache_read_failed", error=str(exc))
+        return {}
+
+
+def _store_layer(
+    lat_round: float,
+    lon_round: float,
+    layer: str,
+    constraints: Optional[list[GISConstraint]],
+    fetched_at: Optional[float] = None,
+) -> None:
+    """Persist one layer's constraints, or a failure when None."""
+    store = _persistent_store()
+    if store is None:
+        return
+    try:
+        if constraints is None:
+            store.save_gis_cache_entry(
+                lat_round, lon_round, layer, False, None, _NEGATIVE_TTL, fetched_at,
+            )
+        else:
+            payload = json.dumps([asdict(c) for c in constraints])
+            store.save_gis_cache_entry(
+                lat_round, lon_round, layer, True, payload,
+                _LAYER_TTLS.get(layer, _DEFAULT_LAYER_TTL), fetched_at,
+            )
+    except Exception as exc:
+        logger.warning("gis_cache_write_failed", layer=layer, error=str(exc))
+
+
+def _persist_when_done(lat_round: float, lon_round: float, layer: str) -> Callable[[Future], None]:
+    """Done-callback persisting the outcome of a check that missed the deadline."""
+    def _callback(future: Future) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        _store_layer(lat_round, lon_round, layer, None if error else future.result())
+    return _callback
+
+
+def get_gis_cache_stats() -> dict:
+    """Hit/miss counters for this process plus persistent cache counts."""
+    with _stats_lock:
+        stats: dict[str, Any] = dict(_stats)
+    with _result_cache_lock:
+        stats["memory_entries"] = len(_result_cache)
+    store = _persistent_store()
+    if store is not None:
         try:
-            results = check_fn(lat_round, lon_round)
-            constraints.extend(results)
-            checked.append(check_name)  # Only mark as checked on success
-        except Exception as exc:
+            stats["persistent"] = store.get_gis_cache_counts()
+        except Exception:
+            pass  # Non-fatal
+    return stats
+
+
+def _cached_check(
+    lat_round: float,
+    lon_round: float,
+    deadline: float = _CHECK_DEADLINE,
+) -> tuple:
+    """Internal cached implementation — rounds coords to ~11m precision.
+
+    Layers are answered from offline snapshots when configured, else
+    served from the in-memory cache, then the persistent per-layer cache
+    (including recent failures).  The remaining checks
+    fan out on the shared pool and are waited on for at most ``deadline``
+    seconds overall, so latency is that of the slowest check rather than
+    the sum.  Checks that fail or miss the deadline are reported in
+    ``errors`` and left out of ``checked``; late results are persisted
+    when they arrive.
+    """
+    key = (lat_round, lon_round)
+    with _result_cache_lock:
+        cached = _result_cache.get(key)
+        if cached is not None and cached[1] > time.time():
+            _result_cache.move_to_end(key)
+            _count("memory_hits")
+            return cached[0]
+
+    offline = _offline_index()
+    offline_layers = offline.layers if offline is not None else {}
+    stored: dict[str, dict] = {}
+    if any(layer not in offline_layers for layer, *_ in _CHECKS):
+        stored = _load_layers(lat_round, lon_round)
+
+    executor = _check_executor()
+    outcomes: list[Any] = []
+    pending: list[Future] = []
+    for layer, _check_name, check_fn, args in _CHECKS:
+        entry = stored.get(layer)
+        if layer in offline_layers:
+            _count("offline_hits")
+            outcomes.append(offline.check_layer(layer, lat_round, lon_round))
+        elif entry is not None and entry["ok"]:
+            _count("persistent_hits")
+            outcomes.append([GISConstraint(**c) for c in json.loads(entry["payload_json"] or "[]")])
+        elif entry is not None:
+            _count("negative_hits")
+            outcomes.append(RuntimeError("recent lookup failed (cached)"))
+        else:
+            _count("misses")
+            future = executor.submit(check_fn, lat_round, lon_round, *args)
+            pending.append(future)
+            outcomes.append(future)
+
+    if pending:
+        wait(pending, timeout=deadline)
+    waited_until = time.time()
+
+    constraints: list[GISConstraint] = []
+    checked: list[str] = []
+    errors: list[str] = []
+    failed: set[str] = set()
+    expires_at = time.time() + min(_LAYER_TTLS.values(), default=_DEFAULT_LAYER_TTL)
+
+    for (layer, check_name, _check_fn, _args), outcome in zip(_CHECKS, outcomes):
+        if isinstance(outcome, Future):
+            if not outcome.done():
+                # Left running; its result replaces the failure if it completes
+                _count("timeouts")
+                _store_layer(lat_round, lon_round, layer, None, fetched_at=waited_until)
+                outcome.add_done_callback(_persist_when_done(lat_round, lon_round, layer))
+                outcome = TimeoutError(f"deadline of {deadline:g}s exceeded")
+            elif outcome.exception() is not None:
+                _count("failures")
+                outcome = outcome.exception()
+                _store_layer(lat_round, lon_round, layer, None)
+            else:
+                outcome = outcome.result()
+                _store_layer(lat_round, lon_round, layer, outcome)
+        if isinstance(outcome, BaseException):
             # Do NOT add to checked — the API failed, so we can't say
             # "checked and not found" vs "not checked at all"
-            errors.append(f"{check_name}: {exc}")
-            logger.warning("gis_check_failed", check=check_name, error=str(exc))
+            failed.add(check_name)
+            errors.append(f"{check_name}: {outcome}")
+            logger.warning("gis_check_failed", check=check_name, layer=layer, error=str(outcome))
+            continue
+        constraints.extend(outcome)
+
+    for _layer, check_name, _check_fn, _args in _CHECKS:
+        if check_name not in failed and check_name not in checked:
+            checked.append(check_name)  # Only mark as checked on success
+
+    result = (tuple(constraints), tuple(checked), tuple(errors))
+    if not errors:
+        with _result_cache_lock:
+            _result_cache[key] = (result, expires_at)
+            while len(_result_cache) > _CACHE_SIZE:
+                _result_cache.popitem(last=False)
+    return result
+
 
-    return tuple(constraints), tuple(checked), tuple(errors)
+def prewarm_gis_cache(
+    postcodes: list[str],
+    deadline: float = _CHECK_DEADLINE,
+) -> dict[str, Any]:
+    """Run the GIS checks for a list of postcodes to fill the caches.
+
+    Intended to run after a deploy so the first reports do not pay every
+    GIS round-trip.  Postcodes are resolved with bulk lookups, then
+    processed one at a time; each location already fans out its own checks.
+
+    Args:
+        postcodes: UK postcodes to warm
+        deadline: Per-location deadline in seconds
+
+    Returns:
+        Summary with counts of warmed, failed and unresolved postcodes.
+    """
+    from plana.location.postcodes import bulk_lookup_postcodes
+
+    resolved = bulk_lookup_postcodes(postcodes)
+    summary: dict[str, Any] = {"warmed": 0, "partial": 0, "unresolved": []}
+    for postcode in postcodes:
+        result = resolved.get(postcode)
+        if not result or not result.latitude or not result.longitude:
+            summary["unresolved"].append(postcode)
+            continue
+        _constraints, _checked, errors = _cached_check(
+            round(result.latitude, 4), round(result.longitude, 4), deadline=deadline,
+        )
+        summary["partial" if errors else "warmed"] += 1
+
+    logger.info(
+        "gis_cache_prewarmed",
+        warmed=summary["warmed"],
+        partial=summary["partial"],
+        unresolved=len(summary["unresolved"]),
+    )
+    return summary
 
 
 def check_gis_constraints(
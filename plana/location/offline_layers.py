@@ -0,0 +1,377 @@
+"""
+Offline GIS constraint layers.
+
+Loads local snapshots of the constraint datasets queried by
+``plana.location.gis`` (flood zones, listed buildings, conservation areas,
+SSSIs, Green Belt) into an in-memory R-tree, so constraint checks become
+local point-in-polygon and buffer queries instead of ArcGIS round-trips.
+
+Snapshots are GeoJSON FeatureCollections named after the layer they hold
+(``flood_zone_2.geojson``, ``listed_building.geojson`` ...), with the
+same attribute names as the ArcGIS services.  ``build_index`` packs a
+directory of snapshots into one compact binary index file, which
+``OfflineConstraintIndex.load`` reads back.
+
+Usage::
+
+    plana gis-build-index data/gis_layers --out data/gis_layers.idx
+    export PLANA_GIS_LAYERS_PATH=data/gis_layers.idx
+"""
+
+import json
+import math
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from plana.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Layers understood by the offline engine (file stem -> check type)
+LAYERS: dict[str, str] = {
+    "flood_zone_2": "Flood Zone",
+    "flood_zone_3": "Flood Zone",
+    "listed_building": "Listed Building",
+    "conservation_area": "Conservation Area",
+    "sssi": "SSSI",
+    "green_belt": "Green Belt",
+}
+
+# Search buffer per layer (metres), matching the envelopes used by the
+# live ArcGIS queries
+LAYER_BUFFERS_M: dict[str, float] = {
+    "flood_zone_2": 100.0,
+    "flood_zone_3": 100.0,
+    "listed_building": 200.0,
+    "conservation_area": 100.0,
+    "sssi": 500.0,
+    "green_belt": 100.0,
+}
+
+_INDEX_MAGIC = b"PLGISIDX1\n"
+_RTREE_NODE_SIZE = 16
+
+# Metres per degree (WGS84, adequate for buffers of a few hundred metres)
+_M_PER_DEG_LAT = 110_574.0
+_M_PER_DEG_LON_EQUATOR = 111_320.0
+
+BBox = tuple[float, float, float, float]  # (min_lon, min_lat, max_lon, max_lat)
+Ring = list[tuple[float, float]]  # [(lon, lat), ...]
+
+
+# =========================================================================
+# R-tree (STR bulk-loaded, read-only)
+# =========================================================================
+
+@dataclass(slots=True)
+class _Node:
+    bbox: BBox
+    children: list[Any]  # _Node or (bbox, item) leaf entries
+    leaf: bool
+
+
+def _union(boxes: list[BBox]) -> BBox:
+    return (
+        min(b[0] for b in boxes), min(b[1] for b in boxes),
+        max(b[2] for b in boxes), max(b[3] for b in boxes),
+    )
+
+
+def _intersects(a: BBox, b: BBox) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+class RTree:
+    """Static R-tree built with Sort-Tile-Recursive packing."""
+
+    def __init__(self, entries: list[tuple[BBox, Any]], node_size: int = _RTREE_NODE_SIZE):
+        self.size = len(entries)
+        self._root: Optional[_Node] = None
+        if not entries:
+            return
+
+        level = self._pack(list(entries), node_size, leaf=True)
+        while len(level) > 1:
+            level = self._pack([(node.bbox, node) for node in level], node_size, leaf=False)
+        self._root = level[0]
+
+    @staticmethod
+    def _pack(entries: list[tuple[BBox, Any]], node_size: int, leaf: bool) -> list[_Node]:
+        """Group one level of entries into nodes (sort by x, tile by y)."""
+        node_count = math.ceil(len(entries) / node_size)
+        slice_count = math.ceil(math.sqrt(node_count))
+        slice_size = slice_count * node_size
+
+        entries.sort(key=lambda e: e[0][0] + e[0][2])
+        nodes: list[_Node] = []
+        for start in range(0, len(entries), slice_size):
+            vertical = sorted(entries[start:start + slice_size], key=lambda e: e[0][1] + e[0][3])
+            for offset in range(0, len(vertical), node_size):
+                group = vertical[offset:offset + node_size]
+                children = group if leaf else [node for _bbox, node in group]
+                nodes.append(_Node(_union([bbox for bbox, _ in group]), children, leaf))
+        return nodes
+
+    def query(self, bbox: BBox) -> Iterator[Any]:
+        """Yield items whose bounding box intersects ``bbox``."""
+        if self._root is None or not _intersects(self._root.bbox, bbox):
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.leaf:
+                for item_bbox, item in node.children:
+                    if _intersects(item_bbox, bbox):
+                        yield item
+            else:
+                stack.extend(child for child in node.children if _intersects(child.bbox, bbox))
+
+
+# =========================================================================
+# Geometry
+# =========================================================================
+
+def _point_in_ring(lon: float, lat: float, ring: Ring) -> bool:
+    """Ray-casting test for a point inside a closed ring."""
+    inside = False
+    j = len(ring) - 1
+    for i in range(len(ring)):
+        xi, yi = ring[i]
+        xj, yj = ring[j]
+        if (yi > lat) != (yj > lat) and lon < (xj - xi) * (lat - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def _segment_distance_m(
+    lon: float, lat: float, a: tuple[float, float], b: tuple[float, float], m_per_deg_lon: float,
+) -> float:
+    """Distance in metres from a point to a segment (local flat projection)."""
+    ax, ay = (a[0] - lon) * m_per_deg_lon, (a[1] - lat) * _M_PER_DEG_LAT
+    bx, by = (b[0] - lon) * m_per_deg_lon, (b[1] - lat) * _M_PER_DEG_LAT
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else max(0.0, min(1.0, -(ax * dx + ay * dy) / length_sq))
+    return math.hypot(ax + t * dx, ay + t * dy)
+
+
+@dataclass
+class OfflineFeature:
+    """One feature of a constraint layer: polygons or a point."""
+
+    bbox: BBox
+    polygons: list[list[Ring]] = field(default_factory=list)  # [exterior, *holes] per polygon
+    point: Optional[tuple[float, float]] = None
+    properties: dict = field(default_factory=dict)
+
+    def distance_m(self, lon: float, lat: float) -> float:
+        """Distance from a point to this feature (0 when inside)."""
+        m_per_deg_lon = _M_PER_DEG_LON_EQUATOR * math.cos(math.radians(lat))
+        if self.point is not None:
+            return math.hypot(
+                (self.point[0] - lon) * m_per_deg_lon, (self.point[1] - lat) * _M_PER_DEG_LAT,
+            )
+
+        best = math.inf
+        for rings in self.polygons:
+            # Even-odd over exterior and holes
+            if sum(_point_in_ring(lon, lat, ring) for ring in rings) % 2 == 1:
+                return 0.0
+            for ring in rings:
+                for i in range(len(ring) - 1):
+                    best = min(best, _segment_distance_m(lon, lat, ring[i], ring[i + 1], m_per_deg_lon))
+        return best
+
+
+def _feature_from_geojson(feature: dict) -> Optional[OfflineFeature]:
+    geometry = feature.get("geometry") or {}
+    kind = geometry.get("type")
+    coords = geometry.get("coordinates")
+    properties = feature.get("properties") or {}
+    if not coords:
+        return None
+
+    if kind == "Point":
+        lon, lat = float(coords[0]), float(coords[1])
+        return OfflineFeature(bbox=(lon, lat, lon, lat), point=(lon, lat), properties=properties)
+
+    if kind == "Polygon":
+        raw_polygons = [coords]
+    elif kind == "MultiPolygon":
+        raw_polygons = coords
+    else:
+        return None
+
+    polygons = [
+        [[(float(x), float(y)) for x, y, *_ in ring] for ring in polygon]
+        for polygon in raw_polygons
+    ]
+    points = [p for polygon in polygons for p in polygon[0]]
+    bbox = (
+        min(p[0] for p in points), min(p[1] for p in points),
+        max(p[0] for p in points), max(p[1] for p in points),
+    )
+    return OfflineFeature(bbox=bbox, polygons=polygons, properties=properties)
+
+
+# =========================================================================
+# Layers and index
+# =========================================================================
+
+class OfflineLayer:
+    """One constraint layer with an R-tree over its features."""
+
+    def __init__(self, name: str, features: list[OfflineFeature], source: str = ""):
+        self.name = name
+        self.features = features
+        self.source = source
+        self._tree = RTree([(f.bbox, f) for f in features])
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def near(self, lat: float, lon: float, radius_m: float) -> list[tuple[float, OfflineFeature]]:
+        """Features within ``radius_m`` of a point, nearest first."""
+        d_lat = radius_m / _M_PER_DEG_LAT
+        d_lon = radius_m / (_M_PER_DEG_LON_EQUATOR * max(math.cos(math.radians(lat)), 1e-6))
+        hits = []
+        for feature in self._tree.query((lon - d_lon, lat - d_lat, lon + d_lon, lat + d_lat)):
+            distance = feature.distance_m(lon, lat)
+            if distance <= radius_m:
+                hits.append((distance, feature))
+        hits.sort(key=lambda hit: hit[0])
+        return hits
+
+
+class OfflineConstraintIndex:
+    """Offline constraint layers keyed by layer name."""
+
+    def __init__(self, layers: dict[str, OfflineLayer]):
+        self.layers = layers
+
+    @classmethod
+    def from_geojson_dir(cls, directory: Path) -> "OfflineConstraintIndex":
+        """Load every ``<layer>.geojson`` snapshot in a directory."""
+        layers: dict[str, OfflineLayer] = {}
+        for name in LAYERS:
+            path = Path(directory) / f"{name}.geojson"
+            if not path.exists():
+                continue
+            data = json.loads(path.read_text(encoding="utf-8"))
+            features = [
+                f for f in (_feature_from_geojson(raw) for raw in data.get("features", []))
+                if f is not None
+            ]
+            layers[name] = OfflineLayer(name, features, source=data.get("name") or path.name)
+        return cls(layers)
+
+    def save(self, path: Path) -> None:
+        """Write the layers as a compact binary index file."""
+        payload = {
+            name: {
+                "source": layer.source,
+                "features": [
+                    [f.bbox, f.polygons, f.point, f.properties] for f in layer.features
+                ],
+            }
+            for name, layer in self.layers.items()
+        }
+        body = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), 9)
+        Path(path).write_bytes(_INDEX_MAGIC + body)
+
+    @classmethod
+    def load(cls, path: Path) -> "OfflineConstraintIndex":
+        """Load an index file, or a directory of GeoJSON snapshots."""
+        path = Path(path)
+        if path.is_dir():
+            return cls.from_geojson_dir(path)
+
+        raw = path.read_bytes()
+        if not raw.startswith(_INDEX_MAGIC):
+            raise ValueError(f"Not an offline GIS index: {path}")
+        payload = json.loads(zlib.decompress(raw[len(_INDEX_MAGIC):]).decode("utf-8"))
+        layers = {}
+        for name, data in payload.items():
+            features = [
+                OfflineFeature(
+                    bbox=tuple(bbox),
+                    polygons=[[[tuple(p) for p in ring] for ring in polygon] for polygon in polygons],
+                    point=tuple(point) if point else None,
+                    properties=properties,
+                )
+                for bbox, polygons, point, properties in data["features"]
+            ]
+            layers[name] = OfflineLayer(name, features, source=data.get("source", ""))
+        return cls(layers)
+
+    def check_layer(self, layer: str, lat: float, lon: float) -> list[Any]:
+        """Constraints from one layer at a point, shaped like the live checks."""
+        from plana.location.gis import GISConstraint
+
+        hits = self.layers[layer].near(lat, lon, LAYER_BUFFERS_M.get(layer, 100.0))
+        constraints = []
+        if layer.startswith("flood_zone_"):
+            if hits:
+                zone_name = f"Flood Zone {layer.rsplit('_', 1)[1]}"
+                constraints.append(GISConstraint(
+                    constraint_type="Flood Zone",
+                    name=zone_name,
+                    source="Environment Agency Flood Map for Planning (offline snapshot)",
+                    details=f"Site intersects {zone_name} (EA open data)",
+                    distance_m=round(hits[0][0], 1),
+                ))
+        elif layer == "listed_building":
+            for distance, feature in hits[:5]:
+                attrs = feature.properties
+                grade = attrs.get("Grade", "")
+                grade_text = f"Grade {grade}" if grade else ""
+                entry = attrs.get("ListEntry", "")
+                constraints.append(GISConstraint(
+                    constraint_type="Listed Building",
+                    name=f"{grade_text}: {attrs.get('Name', 'Unknown')}".strip(": "),
+                    source="Historic England Listed Buildings Register (offline snapshot)",
+                    distance_m=round(distance, 1),
+                    details=f"List Entry: {entry}" if entry else "",
+                    raw=attrs,
+                ))
+        elif layer == "conservation_area":
+            for distance, feature in hits[:5]:
+                constraints.append(GISConstraint(
+                    constraint_type="Conservation Area",
+                    name=feature.properties.get("NAME", "Unnamed Conservation Area"),
+                    source="Historic England Conservation Areas Dataset (offline snapshot)",
+                    distance_m=round(distance, 1),
+                    raw=feature.properties,
+                ))
+        elif layer == "sssi":
+            for distance, feature in hits[:5]:
+                constraints.append(GISConstraint(
+                    constraint_type="SSSI",
+                    name=feature.properties.get("SSSI_NAME", "Unnamed SSSI"),
+                    source="Natural England SSSI Dataset (offline snapshot)",
+                    distance_m=round(distance, 1),
+                    raw=feature.properties,
+                ))
+        elif layer == "green_belt" and hits:
+            constraints.append(GISConstraint(
+                constraint_type="Green Belt",
+                name="Green Belt",
+                source="DLUHC Green Belt Dataset (offline snapshot)",
+                distance_m=round(hits[0][0], 1),
+            ))
+        return constraints
+
+    def summary(self) -> dict[str, int]:
+        """Feature counts per layer."""
+        return {name: len(layer) for name, layer in self.layers.items()}
+
+
+def build_index(source_dir: Path, out_path: Path) -> OfflineConstraintIndex:
+    """Build a binary index file from a directory of GeoJSON snapshots."""
+    index = OfflineConstraintIndex.from_geojson_dir(source_dir)
+    index.save(out_path)
+    logger.info("gis_offline_index_built", path=str(out_path), layers=index.summary())
+    return index
@@ -0,0 +1,214 @@
+"""
+Offline postcode centroid table.
+
+Holds postcode centroids (and optionally ward / district / LSOA names)
+from a local extract such as the ONS Postcode Directory, so postcode
+enrichment can be answered without postcodes.io.  Rows are kept in
+compact sorted arrays: fixed-width postcode keys searched by bisection,
+float32 coordinates and interned name columns.
+
+The source is a CSV with a postcode column (``pcds``, ``pcd`` or
+``postcode``), ``lat``/``latitude`` and ``long``/``longitude``, plus any
+of the optional name columns below.  ``build_table`` converts a CSV to a
+binary table file that ``PostcodeTable.load`` reads back quickly.
+
+Usage::
+
+    plana postcode-build-table onspd_extract.csv --out data/postcodes.tbl
+    export PLANA_POSTCODE_TABLE_PATH=data/postcodes.tbl
+"""
+
+import csv
+import json
+import zlib
+from array import array
+from pathlib import Path
+from typing import Optional
+
+from plana.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Optional name columns (postcodes.io field names)
+NAME_COLUMNS = ("admin_ward", "admin_district", "admin_county", "parish", "lsoa", "region", "country")
+
+_POSTCODE_HEADERS = ("pcds", "pcd", "postcode")
+_LAT_HEADERS = ("lat", "latitude")
+_LNG_HEADERS = ("long", "lng", "longitude")
+
+# Compact postcodes are at most 7 characters ("SW1A1AA")
+_KEY_WIDTH = 7
+_TABLE_MAGIC = b"PLPCTBL1\n"
+
+
+def compact_postcode(postcode: str) -> str:
+    """``"ne2 2qu"`` -> ``"NE22QU"``."""
+    return "".join(postcode.split()).upper()
+
+
+def _pick(headers: dict[str, str], candidates: tuple[str, ...]) -> Optional[str]:
+    for name in candidates:
+        if name in headers:
+            return headers[name]
+    return None
+
+
+class PostcodeTable:
+    """Sorted, compact postcode -> centroid (and names) table."""
+
+    def __init__(
+        self,
+        keys: bytes,
+        latitudes: array,
+        longitudes: array,
+        names: dict[str, tuple[list[str], array]],
+    ):
+        self._keys = keys
+        self._latitudes = latitudes
+        self._longitudes = longitudes
+        # column -> (distinct values, per-row index into them)
+        self._names = names
+        self.size = len(latitudes)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def from_rows(cls, rows: list[dict]) -> "PostcodeTable":
+        """Build from dicts with postcode, latitude, longitude and names."""
+        rows = sorted(
+            (r for r in rows if r.get("postcode") and len(compact_postcode(r["postcode"])) <= _KEY_WIDTH),
+            key=lambda r: compact_postcode(r["postcode"]),
+        )
+        keys = b"".join(
+            compact_postcode(r["postcode"]).encode("ascii").ljust(_KEY_WIDTH) for r in rows
+        )
+        latitudes = array("f", (float(r["latitude"]) for r in rows))
+        longitudes = array("f", (float(r["longitude"]) for r in rows))
+
+        names: dict[str, tuple[list[str], array]] = {}
+        for column in NAME_COLUMNS:
+            if not any(r.get(column) for r in rows):
+                continue
+            values: dict[str, int] = {"": 0}
+            codes = array("I", (values.setdefault(r.get(column) or "", len(values)) for r in rows))
+            names[column] = (list(values), codes)
+        return cls(keys, latitudes, longitudes, names)
+
+    @classmethod
+    def from_csv(cls, path: Path) -> "PostcodeTable":
+        """Load an ONS Postcode Directory style CSV extract."""
+        rows = []
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            headers = {h.strip().lower(): h for h in reader.fieldnames or []}
+            postcode_col = _pick(headers, _POSTCODE_HEADERS)
+            lat_col = _pick(headers, _LAT_HEADERS)
+            lng_col = _pick(headers, _LNG_HEADERS)
+            if not (postcode_col and lat_col and lng_col):
+                raise ValueError(f"{path}: needs postcode, latitude and longitude columns")
+            name_cols = {c: headers[c] for c in NAME_COLUMNS if c in headers}
+
+            for record in reader:
+                try:
+                    lat, lng = float(record[lat_col]), float(record[lng_col])
+                except (TypeError, ValueError):
+                    continue
+                # ONSPD uses 99.999999 for postcodes without a grid reference
+                if lat > 90:
+                    continue
+                row = {"postcode": record[postcode_col], "latitude": lat, "longitude": lng}
+                for column, header in name_cols.items():
+                    row[column] = (record[header] or "").strip()
+                rows.append(row)
+        return cls.from_rows(rows)
+
+    def save(self, path: Path) -> None:
+        """Write the table as a binary file."""
+        header = {
+            "size": self.size,
+            "names": {column: values for column, (values, _codes) in self._names.items()},
+        }
+        body = b"".join([
+            self._keys,
+            self._latitudes.tobytes(),
+            self._longitudes.tobytes(),
+            *(codes.tobytes() for _values, codes in self._names.values()),
+        ])
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        Path(path).write_bytes(
+            _TABLE_MAGIC + len(header_bytes).to_bytes(4, "little") + header_bytes + zlib.compress(body, 6)
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "PostcodeTable":
+        """Load a binary table file, or a CSV extract."""
+        path = Path(path)
+        raw = path.read_bytes()
+        if not raw.startswith(_TABLE_MAGIC):
+            return cls.from_csv(path)
+
+        offset = len(_TABLE_MAGIC)
+        header_len = int.from_bytes(raw[offset:offset + 4], "little")
+        header = json.loads(raw[offset + 4:offset + 4 + header_len])
+        body = zlib.decompress(raw[offset + 4 + header_len:])
+
+        size = header["size"]
+        pos = size * _KEY_WIDTH
+        keys = body[:pos]
+        latitudes = array("f")
+        latitudes.frombytes(body[pos:pos + size * 4])
+        pos += size * 4
+        longitudes = array("f")
+        longitudes.frombytes(body[pos:pos + size * 4])
+        pos += size * 4
+        names = {}
+        for column, values in header["names"].items():
+            codes = array("I")
+            codes.frombytes(body[pos:pos + size * codes.itemsize])
+            pos += size * codes.itemsize
+            names[column] = (values, codes)
+        return cls(keys, latitudes, longitudes, names)
+
+    def _find(self, key: bytes) -> int:
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = mid * _KEY_WIDTH
+            if self._keys[start:start + _KEY_WIDTH] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.size and self._keys[lo * _KEY_WIDTH:(lo + 1) * _KEY_WIDTH] == key:
+            return lo
+        return -1
+
+    def get(self, postcode: str) -> Optional[dict]:
+        """Row for a postcode in postcodes.io result shape, or None."""
+        compact = compact_postcode(postcode)
+        if not compact or len(compact) > _KEY_WIDTH:
+            return None
+        row = self._find(compact.encode("ascii", "replace").ljust(_KEY_WIDTH))
+        if row < 0:
+            return None
+
+        outcode, incode = compact[:-3], compact[-3:]
+        result = {
+            "postcode": f"{outcode} {incode}",
+            "outcode": outcode,
+            "incode": incode,
+            "latitude": round(self._latitudes[row], 6),
+            "longitude": round(self._longitudes[row], 6),
+            "source": "offline_table",
+        }
+        for column, (values, codes) in self._names.items():
+            result[column] = values[codes[row]] or None
+        return result
+
+
+def build_table(source_csv: Path, out_path: Path) -> PostcodeTable:
+    """Build a binary postcode table from a CSV extract."""
+    table = PostcodeTable.from_csv(source_csv)
+    table.save(out_path)
+    logger.info("postcode_table_built", path=str(out_path), postcodes=len(table))
+    return table
@@ -14,13 +14,42 @@ planning applications with:
 Also derives location-based constraints by cross-referencing the
 postcode data with known constraint zones (flood risk areas,
 conservation areas, Green Belt, etc.).
+
+Lookups are answered, in order, from an in-process LRU cache, an
+optional offline centroid table (``PLANA_POSTCODE_TABLE_PATH``, see
+``postcode_table``), the persistent ``postcode_cache`` table and finally
+postcodes.io.  Unknown postcodes and failed requests are cached too
+(negative caching), with shorter TTLs.
 """
 
-import urllib.request
-import urllib.error
 import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional
+from pathlib import Path
+from typing import Any, Optional
+
+from plana.core.logging import get_logger
+from plana.core.resilience import get_host_policy
+
+logger = get_logger(__name__)
+
+_POSTCODES_API = "https://api.postcodes.io/postcodes"
+
+# postcodes.io accepts at most 100 postcodes per bulk request
+_BULK_LIMIT = 100
+
+# Cache lifetimes in seconds.  Postcode centroids change rarely; unknown
+# postcodes may be newly issued, and failed requests are retried soon.
+_FOUND_TTL = 90 * 86400
+_NOT_FOUND_TTL = 86400
+_ERROR_TTL = 10 * 60
+
+_MEMORY_CACHE_SIZE = 4096
 
 
 @dataclass
@@ -64,40 +93,15 @@ class PostcodeResult:
         return self.outcode
 
 
-def lookup_postcode(postcode: str, timeout: float = 5.0) -> Optional[PostcodeResult]:
-    """Look up a UK postcode via the postcodes.io API.
-
-    This is a free API with no authentication required.
-    Rate limit: ~unlimited for normal usage.
-
-    Args:
-        postcode: UK postcode (e.g. "NG16 2AA" or "NE2 2QU")
-        timeout: Request timeout in seconds
-
-    Returns:
-        PostcodeResult with location data, or None if lookup failed.
-    """
-    # Normalize postcode for URL
-    clean = postcode.strip().replace(" ", "")
-    if not clean:
-        return None
-
-    url = f"https://api.postcodes.io/postcodes/{clean}"
-
-    try:
-        req = urllib.request.Request(url, headers={"Accept": "application/json"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-    except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError, OSError):
-        return None
+def _normalise(postcode: str) -> str:
+    """Cache key for a postcode: ``"ne2 2qu"`` -> ``"NE22QU"``."""
+    return "".join(postcode.split()).upper()
 
-    if data.get("status") != 200 or not data.get("result"):
-        return None
-
-    r = data["result"]
 
+def _result_from_raw(r: dict, query: str) -> PostcodeResult:
+    """Build a ``PostcodeResult`` from a postcodes.io result object."""
     return PostcodeResult(
-        postcode=r.get("postcode", postcode),
+        postcode=r.get("postcode", query),
         latitude=r.get("latitude"),
         longitude=r.get("longitude"),
         admin_district=r.get("admin_district") or "",
@@ -114,62 +118,299 @@ def lookup_postcode(postcode: str, timeout: float = 5.0) -> Optional[PostcodeRes
     )
 
 
+# =========================================================================
+# Lookup caches
+# =========================================================================
+
+# key -> (raw result or None for "not found", expires_at).  Raw dicts are
+# cached rather than PostcodeResults because callers mutate the results.
+_memory_cache: "OrderedDict[str, tuple[Optional[dict], float]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+_stats = {
+    "memory_hits": 0,
+    "table_hits": 0,
+    "persistent_hits": 0,
+    "negative_hits": 0,
+    "api_lookups": 0,
+    "api_requests": 0,
+    "failures": 0,
+}
+
+# Offline centroid table: None = not loaded yet, False = not configured
+_table: Any = None
+
+
+def _count(stat: str, n: int = 1) -> None:
+    with _cache_lock:
+        _stats[stat] += n
+
+
+def _centroid_table() -> Any:
+    """Offline centroid table from ``PLANA_POSTCODE_TABLE_PATH``, if configured."""
+    global _table
+    if _table is None:
+        with _cache_lock:
+            if _table is None:
+                _table = False
+                path = os.environ.get("PLANA_POSTCODE_TABLE_PATH")
+                if path:
+                    try:
+                        from plana.location.postcode_table import PostcodeTable
+                        _table = PostcodeTable.load(Path(path))
+                        logger.info("postcode_table_loaded", path=path, postcodes=len(_table))
+                    except Exception as exc:
+                        logger.warning("postcode_table_failed", path=path, error=str(exc))
+    return _table or None
+
+
+def set_postcode_table(table: Any) -> None:
+    """Use ``table`` (a ``PostcodeTable``, or None) for offline lookups."""
+    global _table
+    _table = table if table is not None else False
+
+
+def _persistent_store() -> Any:
+    """The database holding the persistent postcode cache, or None."""
+    try:
+        from plana.storage.database import get_database
+        return get_database()
+    except Exception:
+        return None
+
+
+def _remember(entries: dict[str, tuple[Optional[dict], float]]) -> None:
+    """Add (raw, expires_at) entries to the in-process cache."""
+    with _cache_lock:
+        for key, entry in entries.items():
+            _memory_cache[key] = entry
+            _memory_cache.move_to_end(key)
+        while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _from_caches(keys: list[str]) -> tuple[dict[str, Optional[dict]], list[str]]:
+    """Resolve keys from the local caches; returns (resolved, missing)."""
+    resolved: dict[str, Optional[dict]] = {}
+    missing: list[str] = []
+    now = time.time()
+
+    with _cache_lock:
+        for key in keys:
+            entry = _memory_cache.get(key)
+            if entry is not None and entry[1] > now:
+                _memory_cache.move_to_end(key)
+                resolved[key] = entry[0]
+                _stats["memory_hits"] += 1
+                if entry[0] is None:
+                    _stats["negative_hits"] += 1
+            else:
+                missing.append(key)
+
+    table = _centroid_table() if missing else None
+    if table is not None:
+        still_missing = []
+        for key in missing:
+            raw = table.get(key)
+            if raw is not None:
+                resolved[key] = raw
+            else:
+                still_missing.append(key)
+        _count("table_hits", len(missing) - len(still_missing))
+        missing = still_missing
+
+    store = _persistent_store() if missing else None
+    if store is not None:
+        try:
+            stored = store.get_postcode_cache_entries(missing)
+        except Exception as exc:
+            logger.warning("postcode_cache_read_failed", error=str(exc))
+            stored = {}
+        if stored:
+            loaded = {
+                key: (json.loads(entry["payload_json"]) if entry["found"] else None, entry["expires_at"])
+                for key, entry in stored.items()
+            }
+            _remember(loaded)
+            for key, (raw, _expires_at) in loaded.items():
+                resolved[key] = raw
+            _count("persistent_hits", len(loaded))
+            _count("negative_hits", sum(raw is None for raw, _expires_at in loaded.values()))
+            missing = [key for key in missing if key not in stored]
+
+    return resolved, missing
+
+
+def _cache_results(results: dict[str, tuple[Optional[dict], float]]) -> None:
+    """Store (raw or None, ttl) API results in both caches."""
+    now = time.time()
+    _remember({key: (raw, now + ttl) for key, (raw, ttl) in results.items()})
+    store = _persistent_store()
+    if store is None:
+        return
+    try:
+        store.save_postcode_cache_entries([
+            (key, raw is not None, json.dumps(raw) if raw is not None else None, ttl)
+            for key, (raw, ttl) in results.items()
+        ])
+    except Exception as exc:
+        logger.warning("postcode_cache_write_failed", error=str(exc))
+
+
+def get_postcode_cache_stats() -> dict:
+    """Hit/miss counters for the postcode caches."""
+    with _cache_lock:
+        stats = dict(_stats)
+        stats["memory_entries"] = len(_memory_cache)
+    table = _centroid_table()
+    stats["table_postcodes"] = len(table) if table is not None else 0
+    return stats
+
+
+# =========================================================================
+# postcodes.io requests
+# =========================================================================
+
+def _request_json(url: str, timeout: float, body: Optional[dict] = None) -> dict:
+    """GET (or POST ``body`` to) postcodes.io and decode the JSON response.
+
+    A 404 is returned as its JSON body (postcodes.io uses it for unknown
+    and invalid postcodes); other failures raise.  Requests share the
+    host's rate limit, retry budget and circuit breaker.
+    """
+    return get_host_policy(url, max_attempts=2, max_delay=1.0).call_sync(
+        lambda: _request_json_once(url, timeout, body)
+    )
+
+
+def _request_json_once(url: str, timeout: float, body: Optional[dict]) -> dict:
+    from plana.location.gis import _http_client
+
+    client = _http_client()
+    if client is not None:
+        if body is None:
+            response = client.get(url, timeout=timeout)
+        else:
+            response = client.post(url, json=body, timeout=timeout)
+        if response.status_code == 404:
+            return {"status": 404, "result": None}
+        response.raise_for_status()
+        payload: dict = response.json()
+        return payload
+
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    headers = {"Accept": "application/json"}
+    if data is not None:
+        headers["Content-Type"] = "application/json"
+    req = urllib.request.Request(url, data=data, headers=headers, method="POST" if data else "GET")
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            payload = json.loads(resp.read().decode("utf-8"))
+            return payload
+    except urllib.error.HTTPError as exc:
+        if exc.code == 404:
+            return {"status": 404, "result": None}
+        raise
+
+
+def _fetch_postcode(key: str, timeout: float) -> tuple[Optional[dict], float]:
+    """Fetch one postcode; returns (raw result or None, cache TTL)."""
+    _count("api_requests")
+    try:
+        data = _request_json(f"{_POSTCODES_API}/{key}", timeout)
+    except Exception:
+        _count("failures")
+        return None, _ERROR_TTL
+    if data.get("status") == 200 and data.get("result"):
+        return data["result"], _FOUND_TTL
+    if data.get("status") == 404:
+        return None, _NOT_FOUND_TTL
+    _count("failures")
+    return None, _ERROR_TTL
+
+
+def _fetch_postcodes(keys: list[str], timeout: float) -> dict[str, tuple[Optional[dict], float]]:
+    """Fetch postcodes with bulk requests of up to ``_BULK_LIMIT``."""
+    results: dict[str, tuple[Optional[dict], float]] = {}
+    for start in range(0, len(keys), _BULK_LIMIT):
+        batch = keys[start:start + _BULK_LIMIT]
+        _count("api_requests")
+        try:
+            data = _request_json(_POSTCODES_API, timeout, body={"postcodes": batch})
+        except Exception:
+            data = {}
+        if data.get("status") != 200:
+            _count("failures")
+            results.update({key: (None, _ERROR_TTL) for key in batch})
+            continue
+        for item in data.get("result") or []:
+            key = _normalise(item.get("query") or "")
+            raw = item.get("result")
+            results[key] = (raw, _FOUND_TTL) if raw else (None, _NOT_FOUND_TTL)
+        for key in batch:
+            results.setdefault(key, (None, _ERROR_TTL))
+    return results
+
+
+def lookup_postcode(postcode: str, timeout: float = 5.0) -> Optional[PostcodeResult]:
+    """Look up a UK postcode via the postcodes.io API.
+
+    This is a free API with no authentication required.
+    Rate limit: ~unlimited for normal usage.  Results (including unknown
+    postcodes) are cached, so repeat lookups do not touch the network.
+
+    Args:
+        postcode: UK postcode (e.g. "NG16 2AA" or "NE2 2QU")
+        timeout: Request timeout in seconds
+
+    Returns:
+        PostcodeResult with location data, or None if lookup failed.
+    """
+    key = _normalise(postcode)
+    if not key:
+        return None
+
+    resolved, missing = _from_caches([key])
+    if missing:
+        _count("api_lookups")
+        raw, ttl = _fetch_postcode(key, timeout)
+        _cache_results({key: (raw, ttl)})
+        resolved[key] = raw
+
+    raw = resolved[key]
+    return _result_from_raw(raw, postcode) if raw else None
+
+
 def bulk_lookup_postcodes(
     postcodes: list[str], timeout: float = 10.0
 ) -> dict[str, Optional[PostcodeResult]]:
-    """Look up multiple postcodes in a single API call (max 100).
+    """Look up multiple postcodes, using bulk API calls for cache misses.
+
+    Postcodes already cached are not requested again; the rest are sent
+    in batches of up to 100 (the API limit).
 
     Args:
         postcodes: List of UK postcodes
-        timeout: Request timeout in seconds
+        timeout: Request timeout in seconds (per batch)
 
     Returns:
-        Dict mapping postcode -> PostcodeResult (or None if failed)
+        Dict mapping each given postcode -> PostcodeResult (or None if failed)
     """
     if not postcodes:
         return {}
 
-    # API supports max 100 per request
-    batch = [p.strip().replace(" ", "") for p in postcodes[:100]]
-    url = "https://api.postcodes.io/postcodes"
-    body = json.dumps({"postcodes": batch}).encode("utf-8")
-
-    try:
-        req = urllib.request.Request(
-            url,
-            data=body,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-    except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError, OSError):
-        return {p: None for p in postcodes}
-
-    results = {}
-    for item in data.get("result", []):
-        query = item.get("query", "")
-        r = item.get("result")
-        if r:
-            results[query] = PostcodeResult(
-                postcode=r.get("postcode", query),
-                latitude=r.get("latitude"),
-                longitude=r.get("longitude"),
-                admin_district=r.get("admin_district") or "",
-                admin_county=r.get("admin_county") or "",
-                ward=r.get("admin_ward") or "",
-                parish=r.get("parish") or "",
-                lsoa=r.get("lsoa") or "",
-                region=r.get("region") or "",
-                country=r.get("country") or "",
-                parliamentary_constituency=r.get("parliamentary_constituency") or "",
-                outcode=r.get("outcode") or "",
-                incode=r.get("incode") or "",
-                raw_data=r,
-            )
-        else:
-            results[query] = None
-
+    keys = list(dict.fromkeys(key for key in map(_normalise, postcodes) if key))
+    resolved, missing = _from_caches(keys)
+    if missing:
+        _count("api_lookups", len(missing))
+        fetched = _fetch_postcodes(missing, timeout)
+        _cache_results(fetched)
+        resolved.update({key: raw for key, (raw, _ttl) in fetched.items()})
+
+    results: dict[str, Optional[PostcodeResult]] = {}
+    for postcode in postcodes:
+        raw = resolved.get(_normalise(postcode))
+        results[postcode] = _result_from_raw(raw, postcode) if raw else None
     return results
 
 
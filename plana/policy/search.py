@@ -16,9 +16,10 @@ the NPPF which is always national).  The mapping is defined in
 import math
 import re
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Dict, List, Optional
 
+from plana.core.cache import get_policy_cache, make_cache_key
 from plana.core.constants import PLANNING_AUTHORITY_SCOPE
 from plana.policy.demo_policies import DEMO_POLICIES, get_all_policies
 
@@ -502,16 +503,35 @@ class PolicySearch:
         "accessible": ["NPPF-62", "NPPF-92"],
     }
 
-    def __init__(self):
-        """Initialize the policy search index."""
-        self._all_policies = get_all_policies()
-        self._build_index()
+    def __init__(self) -> None:
+        """Initialize the policy search index.
+
+        The corpus and its index are shared between instances through
+        the policy cache, so only the first search after a cache
+        invalidation pays for building them.
+        """
+        self._policy_lookup: dict = {}  # Policy ID -> policy
+        self._term_doc_freq: Counter = Counter()  # How many docs contain each term
+        self._policy_terms: dict = {}  # Terms in each policy
+
+        cache = get_policy_cache()
+        index_key = f"policy_index:{type(self).__qualname__}"
+        index = cache.get(index_key)
+        if index is None:
+            self._all_policies = get_all_policies()
+            self._build_index()
+            cache.set(index_key, (
+                self._all_policies, self._policy_lookup, self._term_doc_freq, self._policy_terms,
+            ))
+        else:
+            self._all_policies, self._policy_lookup, self._term_doc_freq, self._policy_terms = index
+            self._total_docs = len(self._all_policies)
 
     def _build_index(self) -> None:
         """Build the search index with term frequencies."""
         self._policy_lookup = {p["id"]: p for p in self._all_policies}
-        self._term_doc_freq: Counter = Counter()  # How many docs contain each term
-        self._policy_terms: dict = {}  # Terms in each policy
+        self._term_doc_freq = Counter()
+        self._policy_terms = {}
 
         for policy in self._all_policies:
             terms = self._tokenize(policy["text"] + " " + policy["title"])
@@ -630,6 +650,18 @@ class PolicySearch:
 
         # Build query context
         context = f"{proposal} {' '.join(constraints)} {application_type} {address}".lower()
+
+        # Results depend only on the query, the scope and the weights, so
+        # a repeat of the same query under unchanged weights is a lookup.
+        cache = get_policy_cache()
+        cache_key = "policy_search:" + make_cache_key(
+            type(self).__qualname__, self._total_docs, context, allowed_doc_ids,
+            max_results, db_weights, learning_weights,
+        )
+        hit = cache.get(cache_key)
+        if hit is not None:
+            return [replace(excerpt) for excerpt in hit]
+
         query_terms = self._tokenize(context)
 
         # First, get policies triggered by keyword mappings
@@ -709,6 +741,7 @@ class PolicySearch:
                 match_reason=item["reason"],
             ))
 
+        cache.set(cache_key, tuple(replace(excerpt) for excerpt in results))
         return results
 
     def get_policy_by_id(self, policy_id: str) -> Optional[PolicyExcerpt]:
@@ -34,6 +34,7 @@ class StepResult:
     error_url: Optional[str] = None
     error_status_code: Optional[int] = None
     error_suggestion: Optional[str] = None
+    started_ms: int = 0  # Offset from the start of the pipeline
 
 
 # Pipeline step definitions
@@ -71,6 +72,12 @@ class ProgressLogger:
     [1/8] Fetch application metadata from Newcastle portal
           URL: https://portal.newcastle.gov.uk/planning/...
           ... Done (245ms)
+
+    Steps are printed one after another, but a step can run in the
+    background while earlier ones are still going: ``begin_step`` records
+    when it started and ``end_step`` when it finished, and ``start_step``
+    / ``complete_step`` then report those times.  When steps overlapped,
+    ``complete_pipeline`` prints a timeline of them.
     """
 
     def __init__(
@@ -98,8 +105,13 @@ class ProgressLogger:
         self.current_step = 0
         self.step_results: List[StepResult] = []
         self._step_start_time: Optional[float] = None
+        self._step_end_time: Optional[float] = None
         self._pipeline_start_time: Optional[float] = None
 
+        # Start/end times of steps running in the background
+        self._began: Dict[str, float] = {}
+        self._ended: Dict[str, float] = {}
+
         # Run metadata
         self.reference: Optional[str] = None
         self.council: Optional[str] = None
@@ -151,8 +163,6 @@ class ProgressLogger:
             message: Optional custom message
             url: Optional URL being accessed
         """
-        self._step_start_time = time.time()
-
         # Find step index
         step_idx = next(
             (i for i, (name, _) in enumerate(self.steps) if name == step_name),
@@ -160,6 +170,10 @@ class ProgressLogger:
         )
         self.current_step = step_idx
 
+        # A step begun in the background is timed from when it began
+        self._step_start_time = self._began.pop(step_name, None) or time.time()
+        self._step_end_time = self._ended.pop(step_name, None)
+
         # Get step description
         step_desc = message
         if not step_desc:
@@ -175,6 +189,27 @@ class ProgressLogger:
                 self._print(f"      URL: {url}")
             self._print("      ... ", end="", flush=True)
 
+    def begin_step(self, step_name: str) -> None:
+        """Record that a step has started running in the background.
+
+        Nothing is printed; the step is reported when ``start_step`` and
+        ``complete_step`` are called for it.
+
+        Args:
+            step_name: Name/ID of the step
+        """
+        self._began[step_name] = time.time()
+
+    def end_step(self, step_name: str) -> None:
+        """Record that a step begun with ``begin_step`` has finished.
+
+        Safe to call from the thread running the step.
+
+        Args:
+            step_name: Name/ID of the step
+        """
+        self._ended[step_name] = time.time()
+
     def update_step(self, message: str) -> None:
         """Update current step with additional info.
 
@@ -207,6 +242,7 @@ class ProgressLogger:
             status=status,
             message=message,
             duration_ms=duration_ms,
+            started_ms=self._get_step_offset_ms(),
             details=details or {},
         )
         self.step_results.append(result)
@@ -248,6 +284,7 @@ class ProgressLogger:
             status=StepStatus.FAILED,
             message=error_message,
             duration_ms=duration_ms,
+            started_ms=self._get_step_offset_ms(),
             details=details or {},
             error_url=url,
             error_status_code=status_code,
@@ -293,6 +330,7 @@ class ProgressLogger:
             status=StepStatus.SKIPPED,
             message=reason,
             duration_ms=duration_ms,
+            started_ms=self._get_step_offset_ms(),
         )
         self.step_results.append(result)
 
@@ -330,6 +368,7 @@ class ProgressLogger:
                 {
                     "name": r.step_name,
                     "status": r.status.value,
+                    "started_ms": r.started_ms,
                     "duration_ms": r.duration_ms,
                     "message": r.message,
                 }
@@ -353,6 +392,13 @@ class ProgressLogger:
             self._print(f"  Total duration: {total_duration_ms}ms")
             self._print(f"  Steps completed: {len([r for r in self.step_results if r.status == StepStatus.SUCCESS])}/{len(self.steps)}")
 
+            if self._overlapped():
+                self._print()
+                self._print("Step timeline:")
+                for r in self.step_results:
+                    end_ms = r.started_ms + r.duration_ms
+                    self._print(f"  +{r.started_ms:>6}ms .. +{end_ms:>6}ms  {r.step_name}")
+
             if summary:
                 self._print()
                 self._print("Summary:")
@@ -411,7 +457,23 @@ class ProgressLogger:
         """Get duration of current step in milliseconds."""
         if self._step_start_time is None:
             return 0
-        return int((time.time() - self._step_start_time) * 1000)
+        end = self._step_end_time or time.time()
+        return int((end - self._step_start_time) * 1000)
+
+    def _get_step_offset_ms(self) -> int:
+        """Get start of current step relative to the pipeline, in milliseconds."""
+        if self._step_start_time is None or self._pipeline_start_time is None:
+            return 0
+        return max(0, int((self._step_start_time - self._pipeline_start_time) * 1000))
+
+    def _overlapped(self) -> bool:
+        """Whether any step started before the previous one finished."""
+        finished = 0
+        for r in self.step_results:
+            if r.started_ms < finished:
+                return True
+            finished = max(finished, r.started_ms + r.duration_ms)
+        return False
 
     def _format_status(self, status: StepStatus) -> str:
         """Format status for display."""
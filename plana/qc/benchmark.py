@@ -69,6 +69,8 @@ def run_evaluate(
     refs: List[str],
     mode: str,
     output_dir: Path,
+    jobs: int = 1,
+    fresh: bool = False,
 ) -> Tuple[bool, Path]:
     """
     Run plana evaluate command for the given references.
@@ -77,6 +79,8 @@ def run_evaluate(
         refs: List of application references
         mode: Processing mode (demo or live)
         output_dir: Output directory for results
+        jobs: References evaluated in parallel worker processes
+        fresh: Re-evaluate references completed by an earlier run
 
     Returns:
         Tuple of (success, results_path)
@@ -96,6 +100,8 @@ def run_evaluate(
                 "--refs", str(refs_path),
                 "--mode", mode,
                 "--output", str(results_path),
+                "--jobs", str(jobs),
+                *(["--fresh"] if fresh else []),
             ],
             capture_output=True,
             text=True,
@@ -159,6 +165,8 @@ def run_benchmark(
     gold_path: Optional[Path] = None,
     mode: str = "demo",
     output_dir: Path = Path("eval_run"),
+    jobs: int = 1,
+    fresh: bool = False,
 ) -> Tuple[QCMetrics, Path]:
     """
     Run end-to-end benchmark evaluation.
@@ -175,6 +183,8 @@ def run_benchmark(
         gold_path: Path to gold file (template generated if missing)
         mode: Processing mode (demo or live)
         output_dir: Output directory for all files
+        jobs: References evaluated in parallel worker processes
+        fresh: Re-evaluate references completed by an earlier run
 
     Returns:
         Tuple of (QCMetrics, report_path)
@@ -207,7 +217,7 @@ def run_benchmark(
     # Step 3: Run evaluate
     print(f"  Running evaluation in {mode} mode...")
     results_path = output_dir / "eval_results.csv"
-    success, results_path = run_evaluate(refs, mode, output_dir)
+    success, results_path = run_evaluate(refs, mode, output_dir, jobs=jobs, fresh=fresh)
 
     if not success:
         raise RuntimeError("Evaluation failed")
@@ -284,7 +284,7 @@ def load_results_file(path: Path) -> Dict[str, tuple]:
     Load Plana evaluation results from CSV file.
 
     Expected format (from plana evaluate):
-    reference,raw_decision,decision,status
+    reference,raw_decision,decision,status[,started_s,elapsed_ms]
 
     Args:
         path: Path to results CSV file
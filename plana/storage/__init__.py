@@ -14,8 +14,10 @@ from plana.storage.models import (
     StoredReport,
     StoredRunLog,
 )
+from plana.storage.snapshot import ApplicationSnapshot
 
 __all__ = [
+    "ApplicationSnapshot",
     "Database",
     "get_database",
     "StoredApplication",
@@ -6,10 +6,13 @@ import json
 import os
 import socket
 import sqlite3
+import threading
+import time
+from collections import deque
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Generator, List, Optional
+from typing import Deque, Dict, Generator, List, Optional, Set, Tuple
 from urllib.parse import unquote
 
 from plana.core.logging import get_logger
@@ -28,6 +31,9 @@ class Database:
 
     SCHEMA_VERSION = 1
 
+    # Recorded decisions kept in the in-memory change feed
+    DECISION_LOG_SIZE = 1000
+
     def __init__(self, db_path: Optional[Path] = None):
         """Initialize the database.
 
@@ -60,6 +66,18 @@ class Database:
             git_sha=os.environ.get("RENDER_GIT_COMMIT"),
         )
 
+        # In-process change feed of recorded decisions, so precedent corpora
+        # can be updated incrementally (see decision_changes_since).  A None
+        # entry marks a change that cannot be replayed.
+        self._decision_lock = threading.Lock()
+        self._decision_version = 0
+        self._decision_log: Deque[Tuple[int, Optional[StoredApplication]]] = deque(
+            maxlen=self.DECISION_LOG_SIZE,
+        )
+        # Bumped when feedback or a run log is saved in this process, so
+        # values derived from them can be memoised (see feedback_version)
+        self._feedback_version = 0
+
         self._init_schema()
 
     @contextmanager
@@ -217,6 +235,27 @@ class Database:
                         f"ALTER TABLE documents ADD COLUMN {col_name} {col_type}"
                     )
 
+            # Migration: classification and plan set signals, stored when a
+            # document is processed (plana.documents.processor.document_signals)
+            cursor.execute("PRAGMA table_info(documents)")
+            doc_columns = [col[1] for col in cursor.fetchall()]
+            _signal_cols = {
+                "category": "TEXT",
+                "category_confidence": "REAL",
+                "document_type_guess": "TEXT",
+                "plan_set_legs": "INTEGER",
+                "signals_version": "INTEGER",
+            }
+            for col_name, col_type in _signal_cols.items():
+                if col_name not in doc_columns:
+                    cursor.execute(
+                        f"ALTER TABLE documents ADD COLUMN {col_name} {col_type}"
+                    )
+
+            # Migration: portal ETag, so unchanged documents are not re-downloaded
+            if "etag" not in doc_columns:
+                cursor.execute("ALTER TABLE documents ADD COLUMN etag TEXT")
+
             # Index on processing_status for fast claim queries
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_doc_processing_status "
@@ -280,6 +319,44 @@ class Database:
                 )
             """)
 
+            # GIS constraint cache (per ~11m grid cell and layer).  Failed
+            # lookups are stored with ok = 0 and a short expiry.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS gis_cache (
+                    cell_lat REAL NOT NULL,
+                    cell_lon REAL NOT NULL,
+                    layer TEXT NOT NULL,
+                    ok INTEGER NOT NULL,
+                    payload_json TEXT,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (cell_lat, cell_lon, layer)
+                )
+            """)
+
+            # Postcode lookup cache (postcodes.io results keyed by compact
+            # upper-case postcode).  Unknown postcodes and failed lookups
+            # are stored with found = 0.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS postcode_cache (
+                    postcode TEXT PRIMARY KEY,
+                    found INTEGER NOT NULL,
+                    payload_json TEXT,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+
+            # Structured document extractions (document_analysis) keyed by
+            # a hash of the extractor version, document type and text
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS document_extractions (
+                    content_hash TEXT PRIMARY KEY,
+                    extraction_json TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+
             # Indexes
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_app_reference ON applications(reference)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_app_postcode ON applications(postcode)")
@@ -287,15 +364,83 @@ class Database:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_app_status ON applications(status)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_doc_reference ON documents(reference)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_doc_hash ON documents(content_hash)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_doc_category ON documents(reference, category)"
+            )
+            # Covers the plan set summary, which then never touches the rows
+            # (and their extracted text)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_doc_plan_set "
+                "ON documents(reference, signals_version, plan_set_legs)"
+            )
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_feedback_reference ON feedback(reference)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_run_logs_reference ON run_logs(reference)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_run_logs_timestamp ON run_logs(timestamp)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_policy_weights_type ON policy_weights(application_type)")
+            # Composite indexes for the "latest row per reference" lookups
+            # used by the feedback / re-ranking joins.
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_run_logs_ref_ts "
+                "ON run_logs(reference, timestamp DESC)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_run_logs_success_ts "
+                "ON run_logs(success, timestamp DESC)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_feedback_ref_created "
+                "ON feedback(reference, created_at DESC)"
+            )
 
             conn.commit()
 
     # ========== Application CRUD ==========
 
+    _UPSERT_APPLICATION = """
+        INSERT INTO applications (
+            reference, council_id, council_name, address, proposal,
+            application_type, status, date_received, date_validated,
+            decision_date, decision, ward, postcode, constraints_json,
+            applicant_name, latitude, longitude,
+            portal_url, portal_key, fetched_at,
+            created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(reference) DO UPDATE SET
+            council_id = excluded.council_id,
+            council_name = excluded.council_name,
+            address = excluded.address,
+            proposal = excluded.proposal,
+            application_type = excluded.application_type,
+            status = excluded.status,
+            date_received = excluded.date_received,
+            date_validated = excluded.date_validated,
+            decision_date = excluded.decision_date,
+            decision = excluded.decision,
+            ward = excluded.ward,
+            postcode = excluded.postcode,
+            constraints_json = excluded.constraints_json,
+            applicant_name = excluded.applicant_name,
+            latitude = COALESCE(excluded.latitude, applications.latitude),
+            longitude = COALESCE(excluded.longitude, applications.longitude),
+            portal_url = excluded.portal_url,
+            portal_key = excluded.portal_key,
+            fetched_at = excluded.fetched_at,
+            updated_at = excluded.updated_at
+    """
+
+    @staticmethod
+    def _application_row(app: StoredApplication, now: str) -> tuple:
+        return (
+            app.reference, app.council_id, app.council_name,
+            app.address, app.proposal,
+            app.application_type, app.status, app.date_received,
+            app.date_validated, app.decision_date, app.decision,
+            app.ward, app.postcode, app.constraints_json,
+            app.applicant_name, app.latitude, app.longitude,
+            app.portal_url, app.portal_key,
+            app.fetched_at, now, now
+        )
+
     def save_application(self, app: StoredApplication) -> int:
         """Save or update an application.
 
@@ -310,54 +455,55 @@ class Database:
 
             now = datetime.now().isoformat()
 
-            cursor.execute("""
-                INSERT INTO applications (
-                    reference, council_id, council_name, address, proposal,
-                    application_type, status, date_received, date_validated,
-                    decision_date, decision, ward, postcode, constraints_json,
-                    applicant_name, latitude, longitude,
-                    portal_url, portal_key, fetched_at,
-                    created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(reference) DO UPDATE SET
-                    council_id = excluded.council_id,
-                    council_name = excluded.council_name,
-                    address = excluded.address,
-                    proposal = excluded.proposal,
-                    application_type = excluded.application_type,
-                    status = excluded.status,
-                    date_received = excluded.date_received,
-                    date_validated = excluded.date_validated,
-                    decision_date = excluded.decision_date,
-                    decision = excluded.decision,
-                    ward = excluded.ward,
-                    postcode = excluded.postcode,
-                    constraints_json = excluded.constraints_json,
-                    applicant_name = excluded.applicant_name,
-                    latitude = COALESCE(excluded.latitude, applications.latitude),
-                    longitude = COALESCE(excluded.longitude, applications.longitude),
-                    portal_url = excluded.portal_url,
-                    portal_key = excluded.portal_key,
-                    fetched_at = excluded.fetched_at,
-                    updated_at = excluded.updated_at
-            """, (
-                app.reference, app.council_id, app.council_name,
-                app.address, app.proposal,
-                app.application_type, app.status, app.date_received,
-                app.date_validated, app.decision_date, app.decision,
-                app.ward, app.postcode, app.constraints_json,
-                app.applicant_name, app.latitude, app.longitude,
-                app.portal_url, app.portal_key,
-                app.fetched_at, now, now
-            ))
+            # Saving without a decision clears a recorded one
+            cleared = not app.decision and bool(self._decided_references(cursor, [app.reference]))
+
+            cursor.execute(self._UPSERT_APPLICATION, self._application_row(app, now))
 
             conn.commit()
 
+            if app.decision or cleared:
+                cursor.execute("SELECT * FROM applications WHERE reference = ?", (app.reference,))
+                row = cursor.fetchone()
+                self._record_decision_change(StoredApplication(**dict(row)) if row else None)
+                return row["id"] if row else -1
+
             # Get the ID
             cursor.execute("SELECT id FROM applications WHERE reference = ?", (app.reference,))
             row = cursor.fetchone()
             return row["id"] if row else -1
 
+    def save_applications(self, apps: List[StoredApplication]) -> int:
+        """Save or update many applications in one transaction.
+
+        Args:
+            apps: Applications to save
+
+        Returns:
+            Number of applications saved
+        """
+        if not apps:
+            return 0
+        now = datetime.now().isoformat()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            # Saving without a decision clears a recorded one
+            cleared = self._decided_references(
+                cursor, [app.reference for app in apps if not app.decision],
+            )
+            cursor.executemany(
+                self._UPSERT_APPLICATION,
+                [self._application_row(app, now) for app in apps],
+            )
+            conn.commit()
+
+            changed = [app.reference for app in apps if app.decision or app.reference in cleared]
+            for reference in dict.fromkeys(changed):
+                cursor.execute("SELECT * FROM applications WHERE reference = ?", (reference,))
+                row = cursor.fetchone()
+                self._record_decision_change(StoredApplication(**dict(row)) if row else None)
+        return len(apps)
+
     def get_application(self, reference: str) -> Optional[StoredApplication]:
         """Get an application by reference.
 
@@ -390,10 +536,23 @@ class Database:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "UPDATE applications SET latitude = ?, longitude = ? WHERE reference = ?",
-                (latitude, longitude, reference),
+                "UPDATE applications SET latitude = ?, longitude = ? "
+                "WHERE reference = ? AND (latitude IS NOT ? OR longitude IS NOT ?)",
+                (latitude, longitude, reference, latitude, longitude),
             )
             conn.commit()
+            if cursor.rowcount == 0:
+                return
+
+            # Coordinates feed precedent location scoring
+            cursor.execute(
+                "SELECT * FROM applications WHERE reference = ? "
+                "AND decision IS NOT NULL AND decision != ''",
+                (reference,),
+            )
+            row = cursor.fetchone()
+            if row:
+                self._record_decision_change(StoredApplication(**dict(row)))
 
     def update_applicant_name(self, reference: str, applicant_name: str) -> None:
         """Update the applicant_name for an application (if not already set)."""
@@ -406,6 +565,76 @@ class Database:
             )
             conn.commit()
 
+    # ========== Decision Change Feed ==========
+
+    def _decided_references(self, cursor: sqlite3.Cursor, references: List[str]) -> Set[str]:
+        """The subset of ``references`` stored with a recorded decision."""
+        decided: Set[str] = set()
+        for chunk in self._chunked(references):
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT reference FROM applications WHERE reference IN ({placeholders}) "
+                "AND decision IS NOT NULL AND decision != ''",
+                chunk,
+            )
+            decided.update(row["reference"] for row in cursor.fetchall())
+        return decided
+
+    def _record_decision_change(self, app: Optional[StoredApplication]) -> None:
+        """Bump the decision version and log the changed application."""
+        with self._decision_lock:
+            self._decision_version += 1
+            self._decision_log.append((self._decision_version, app))
+
+    @property
+    def decision_version(self) -> int:
+        """Counter bumped whenever a decision is recorded in this process."""
+        return self._decision_version
+
+    def decision_changes_since(
+        self, version: int,
+    ) -> Tuple[int, Optional[List[StoredApplication]]]:
+        """Get applications whose decisions were recorded after ``version``.
+
+        Args:
+            version: A previously observed decision_version
+
+        Returns:
+            (current version, changed applications in save order).  The
+            list is None when the changes cannot be replayed (the feed no
+            longer reaches back to ``version``); callers should reload.
+            Applications whose decision was cleared are included with no
+            decision.
+        """
+        with self._decision_lock:
+            current = self._decision_version
+            if version == current:
+                return current, []
+            if (
+                version > current
+                or not self._decision_log
+                or self._decision_log[0][0] > version + 1
+            ):
+                return current, None
+            changes: List[StoredApplication] = []
+            for logged_version, app in self._decision_log:
+                if logged_version <= version:
+                    continue
+                if app is None:
+                    return current, None
+                changes.append(app)
+            return current, changes
+
+    def _record_feedback_change(self) -> None:
+        """Bump the feedback version."""
+        with self._decision_lock:
+            self._feedback_version += 1
+
+    @property
+    def feedback_version(self) -> int:
+        """Counter bumped whenever feedback or a run log is saved in this process."""
+        return self._feedback_version
+
     def get_completed_applications(self, council_id: str = "", limit: int = 100) -> List[StoredApplication]:
         """Get applications that have a recorded decision, for use as precedent.
 
@@ -498,7 +727,7 @@ class Database:
                     extraction_status, processing_status, extract_method,
                     extracted_text_chars, extracted_text, extracted_metadata_json,
                     is_plan_or_drawing, is_scanned, has_any_content_signal,
-                    created_at
+                    created_at, etag
                 ) VALUES (
                     ?, ?, ?, ?, ?,
                     ?, ?, ?, ?, ?,
@@ -506,12 +735,13 @@ class Database:
                     ?, ?, ?,
                     ?, ?, ?,
                     ?, ?, ?,
-                    ?
+                    ?, ?
                 )
                 ON CONFLICT(reference, doc_id) DO UPDATE SET
                     url = COALESCE(NULLIF(excluded.url, ''), documents.url),
                     local_path = COALESCE(excluded.local_path, documents.local_path),
                     content_hash = COALESCE(excluded.content_hash, documents.content_hash),
+                    etag = COALESCE(excluded.etag, documents.etag),
                     size_bytes = COALESCE(excluded.size_bytes, documents.size_bytes),
                     content_type = COALESCE(excluded.content_type, documents.content_type),
                     mime_type = COALESCE(NULLIF(excluded.mime_type, ''), documents.mime_type),
@@ -563,6 +793,16 @@ class Database:
                         WHEN documents.processing_status IN ('processed', 'processing')
                         THEN documents.has_any_content_signal
                         ELSE excluded.has_any_content_signal
+                    END,
+                    -- Signals depend on the URL and metadata; recompute them
+                    -- if either may have changed
+                    signals_version = CASE
+                        WHEN NULLIF(excluded.url, '') IS NOT NULL
+                             AND excluded.url IS NOT documents.url
+                        THEN NULL
+                        WHEN documents.processing_status IN ('processed', 'processing')
+                        THEN documents.signals_version
+                        ELSE NULL
                     END
             """, (
                 doc.application_id, doc.reference, doc.doc_id, doc.title,
@@ -580,6 +820,7 @@ class Database:
                 1 if doc.is_scanned else 0,
                 1 if doc.has_any_content_signal else 0,
                 now,
+                doc.etag,
             ))
 
             conn.commit()
@@ -729,6 +970,38 @@ class Database:
                 "with_content_signal": 0, "plan_drawing_count": 0,
             }
 
+    def get_report_source_version(self, reference: str) -> Optional[str]:
+        """Fingerprint of the stored rows a report for an application is built from.
+
+        Changes whenever the application is re-saved or any of its
+        documents is added, re-queued or (re)processed, so it can key
+        cached reports across processes.
+
+        Args:
+            reference: Application reference
+
+        Returns:
+            Version string, or None if the application has no documents
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    (SELECT updated_at FROM applications WHERE reference = ?) AS app_updated,
+                    COUNT(*) AS total,
+                    MAX(id) AS max_id,
+                    COALESCE(SUM(CASE WHEN processing_status = 'processed' THEN 1 ELSE 0 END), 0) AS processed,
+                    COALESCE(SUM(CASE WHEN processing_status = 'failed' THEN 1 ELSE 0 END), 0) AS failed,
+                    COALESCE(SUM(extracted_text_chars), 0) AS chars,
+                    MAX(COALESCE(updated_at, created_at)) AS docs_updated
+                FROM documents
+                WHERE reference = ?
+            """, (reference, reference))
+            row = cursor.fetchone()
+            if not row or not row["total"]:
+                return None
+            return "|".join(str(row[k]) for k in row.keys())
+
     def get_document_by_doc_id(self, doc_id: str) -> Optional[StoredDocument]:
         """Get a single document by its doc_id.
 
@@ -912,7 +1185,8 @@ class Database:
                     extracted_metadata_json = NULL,
                     has_any_content_signal = 0,
                     is_scanned = 0,
-                    failure_reason = NULL
+                    failure_reason = NULL,
+                    signals_version = NULL
                 WHERE reference = ?
             """, (reference,))
             conn.commit()
@@ -947,7 +1221,8 @@ class Database:
                     extracted_metadata_json = NULL,
                     has_any_content_signal = 0,
                     is_scanned = 0,
-                    failure_reason = NULL
+                    failure_reason = NULL,
+                    signals_version = NULL
                 WHERE reference = ?
                   AND processing_status IN ('queued', 'failed')
             """, (reference,))
@@ -1086,7 +1361,8 @@ class Database:
                     extracted_metadata_json = NULL,
                     has_any_content_signal = 0,
                     is_scanned = 0,
-                    failure_reason = NULL
+                    failure_reason = NULL,
+                    signals_version = NULL
                 WHERE doc_id = ?
             """, (doc_id,))
             conn.commit()
@@ -1205,9 +1481,17 @@ class Database:
         is_plan_or_drawing: bool = False,
         is_scanned: bool = False,
         has_any_content_signal: bool = False,
+        signals: Optional[dict] = None,
+        signals_version: Optional[int] = None,
     ) -> None:
-        """Mark a document as successfully processed."""
+        """Mark a document as successfully processed.
+
+        ``signals`` are the document's classification and plan set
+        columns (``DocumentSignals.columns()``), stored with the result
+        under ``signals_version``.
+        """
         now = datetime.now().isoformat()
+        signals = signals or {}
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -1221,6 +1505,11 @@ class Database:
                     is_plan_or_drawing = ?,
                     is_scanned = ?,
                     has_any_content_signal = ?,
+                    category = ?,
+                    category_confidence = ?,
+                    document_type_guess = ?,
+                    plan_set_legs = ?,
+                    signals_version = ?,
                     updated_at = ?
                 WHERE doc_id = ?
             """, (
@@ -1231,6 +1520,11 @@ class Database:
                 1 if is_plan_or_drawing else 0,
                 1 if is_scanned else 0,
                 1 if has_any_content_signal else 0,
+                signals.get("category"),
+                signals.get("category_confidence"),
+                signals.get("document_type_guess"),
+                signals.get("plan_set_legs"),
+                signals_version if signals else None,
                 now,
                 doc_id,
             ))
@@ -1265,6 +1559,96 @@ class Database:
             """, (local_path, doc_id))
             conn.commit()
 
+    # ========== Document Signals ==========
+
+    def get_plan_set_legs(self, reference: str, signals_version: int) -> Optional[int]:
+        """Union of the stored plan set legs of an application's documents.
+
+        Reads only the ``idx_doc_plan_set`` covering index.
+
+        Args:
+            reference: Application reference
+            signals_version: Signals version the caller understands
+
+        Returns:
+            Bitmask of plan set legs (0 if there are no documents), or
+            None if any document lacks signals of that version
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    COUNT(*) AS total,
+                    COALESCE(SUM(signals_version = ?), 0) AS current,
+                    COALESCE(MAX(plan_set_legs & 1), 0)
+                        | COALESCE(MAX(plan_set_legs & 2), 0)
+                        | COALESCE(MAX(plan_set_legs & 4), 0) AS legs
+                FROM documents
+                WHERE reference = ?
+            """, (signals_version, reference))
+            row = cursor.fetchone()
+            if row["current"] < row["total"]:
+                return None
+            return int(row["legs"])
+
+    def get_unsignalled_documents(self, reference: str, signals_version: int) -> List[dict]:
+        """Documents whose stored signals are missing or of another version.
+
+        Args:
+            reference: Application reference
+            signals_version: Current signals version
+
+        Returns:
+            Dicts with the columns signals are computed from
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT doc_id, title, doc_type, url, extracted_metadata_json
+                FROM documents
+                WHERE reference = ? AND signals_version IS NOT ?
+            """, (reference, signals_version))
+            return [dict(row) for row in cursor.fetchall()]
+
+    def update_document_signals(
+        self,
+        reference: str,
+        updates: List[dict],
+        signals_version: int,
+    ) -> None:
+        """Store classification and plan set signals for documents.
+
+        Args:
+            reference: Application reference
+            updates: Dicts with ``doc_id`` and the signal columns
+            signals_version: Version the signals were computed with
+        """
+        if not updates:
+            return
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                UPDATE documents SET
+                    category = ?,
+                    category_confidence = ?,
+                    document_type_guess = ?,
+                    plan_set_legs = ?,
+                    signals_version = ?
+                WHERE reference = ? AND doc_id = ?
+            """, [
+                (
+                    u["category"],
+                    u["category_confidence"],
+                    u["document_type_guess"],
+                    u["plan_set_legs"],
+                    signals_version,
+                    reference,
+                    u["doc_id"],
+                )
+                for u in updates
+            ])
+            conn.commit()
+
     # ========== Report CRUD ==========
 
     def save_report(self, report: StoredReport) -> int:
@@ -1345,6 +1729,7 @@ class Database:
             ))
 
             conn.commit()
+            self._record_feedback_change()
             return cursor.lastrowid or -1
 
     def get_feedback(self, reference: str) -> List[StoredFeedback]:
@@ -1425,6 +1810,7 @@ class Database:
             ))
 
             conn.commit()
+            self._record_feedback_change()
             return cursor.lastrowid or -1
 
     def get_run_log(self, run_id: str) -> Optional[StoredRunLog]:
@@ -1502,6 +1888,193 @@ class Database:
                 results.append(StoredRunLog(**data))
             return results
 
+    # ========== Feedback / Run Log Joins ==========
+
+    # SQLite's default SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds;
+    # IN (...) lookups are chunked to stay well below it.
+    _IN_CHUNK_SIZE = 500
+
+    def _chunked(self, values: List[str]) -> Generator[List[str], None, None]:
+        """Yield de-duplicated values in chunks sized for an IN (...) clause."""
+        unique = list(dict.fromkeys(v for v in values if v))
+        for i in range(0, len(unique), self._IN_CHUNK_SIZE):
+            yield unique[i:i + self._IN_CHUNK_SIZE]
+
+    def get_latest_run_logs(self, references: List[str]) -> Dict[str, StoredRunLog]:
+        """Get the most recent run log for each of many references.
+
+        Batched equivalent of calling ``get_run_logs_for_reference(ref, limit=1)``
+        per reference.
+
+        Args:
+            references: Application references
+
+        Returns:
+            Dict of reference -> latest StoredRunLog (references without
+            any run log are omitted)
+        """
+        results: Dict[str, StoredRunLog] = {}
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for chunk in self._chunked(references):
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT * FROM (
+                        SELECT r.*, ROW_NUMBER() OVER (
+                            PARTITION BY r.reference
+                            ORDER BY r.timestamp DESC, r.id DESC
+                        ) AS rn
+                        FROM run_logs r
+                        WHERE r.reference IN ({placeholders})
+                    ) WHERE rn = 1
+                """, chunk)
+                for row in cursor.fetchall():
+                    data = dict(row)
+                    data.pop('rn', None)
+                    data['success'] = bool(data.get('success', 1))
+                    results[data['reference']] = StoredRunLog(**data)
+        return results
+
+    def get_feedback_outcomes(
+        self,
+        references: Optional[List[str]] = None,
+    ) -> Dict[str, dict]:
+        """Get feedback counts and latest outcomes for many references.
+
+        One joined query per chunk: the latest feedback row per reference is
+        joined to the latest run log for the same reference.
+
+        Args:
+            references: Application references, or None for every
+                reference that has feedback
+
+        Returns:
+            Dict of reference -> {"feedback_count", "actual_decision",
+            "plana_decision"}. Only references with feedback are included;
+            ``plana_decision`` is None when there is no run log.
+        """
+        results: Dict[str, dict] = {}
+        if references is None:
+            # Single unfiltered pass (feedback is sparse relative to cases)
+            batches: List[Optional[List[str]]] = [None]
+        else:
+            batches = list(self._chunked(references))
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for chunk in batches:
+                if chunk is None:
+                    fb_filter, run_filter, params = "", "", []
+                else:
+                    placeholders = ",".join("?" * len(chunk))
+                    fb_filter = f"WHERE reference IN ({placeholders})"
+                    run_filter = f"WHERE reference IN ({placeholders})"
+                    params = chunk + chunk
+                cursor.execute(f"""
+                    WITH fb AS (
+                        SELECT reference,
+                               COALESCE(actual_decision, decision) AS actual_decision,
+                               COUNT(*) OVER (PARTITION BY reference) AS feedback_count,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY reference
+                                   ORDER BY created_at DESC, id DESC
+                               ) AS rn
+                        FROM feedback
+                        {fb_filter}
+                    ),
+                    runs AS (
+                        SELECT reference,
+                               COALESCE(calibrated_decision, raw_decision) AS plana_decision,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY reference
+                                   ORDER BY timestamp DESC, id DESC
+                               ) AS rn
+                        FROM run_logs
+                        {run_filter}
+                    )
+                    SELECT fb.reference, fb.actual_decision, fb.feedback_count,
+                           runs.plana_decision
+                    FROM fb
+                    LEFT JOIN runs ON runs.reference = fb.reference AND runs.rn = 1
+                    WHERE fb.rn = 1
+                """, params)
+                for row in cursor.fetchall():
+                    results[row["reference"]] = {
+                        "feedback_count": row["feedback_count"],
+                        "actual_decision": row["actual_decision"],
+                        "plana_decision": row["plana_decision"],
+                    }
+        return results
+
+    def get_run_feedback_pairs_by_type(
+        self,
+        application_types: List[str],
+        success_only: bool = True,
+        limit: int = 100,
+    ) -> List[dict]:
+        """Pair recent run logs with the latest feedback for their reference.
+
+        Set-based equivalent of ``get_run_logs_by_type()`` followed by one
+        ``get_feedback()`` per run log, for several application types in a
+        single statement.
+
+        Args:
+            application_types: Application type codes (e.g., HOU, LBC)
+            success_only: Only consider successful runs
+            limit: Maximum run logs considered per application type
+
+        Returns:
+            List of dicts with "application_type", "plana_decision" and
+            "actual_decision" for runs whose reference has feedback
+        """
+        types = [t for t in dict.fromkeys(application_types) if t]
+        if not types:
+            return []
+
+        # Same "%/TYPE" suffix match as get_run_logs_by_type()
+        case_expr = " ".join("WHEN r.reference LIKE ? THEN ?" for _ in types)
+        type_params: List[str] = []
+        for t in types:
+            type_params.extend([f"%/{t}", t])
+        success_clause = "AND r.success = 1" if success_only else ""
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                WITH typed AS (
+                    SELECT r.reference,
+                           COALESCE(r.calibrated_decision, r.raw_decision) AS plana_decision,
+                           CASE {case_expr} END AS application_type,
+                           r.timestamp, r.id
+                    FROM run_logs r
+                    WHERE 1 = 1 {success_clause}
+                ),
+                ranked AS (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY application_type
+                        ORDER BY timestamp DESC, id DESC
+                    ) AS rn
+                    FROM typed
+                    WHERE application_type IS NOT NULL
+                ),
+                latest_fb AS (
+                    SELECT reference,
+                           COALESCE(actual_decision, decision) AS actual_decision,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY reference
+                               ORDER BY created_at DESC, id DESC
+                           ) AS rn
+                    FROM feedback
+                )
+                SELECT ranked.application_type, ranked.plana_decision,
+                       latest_fb.actual_decision
+                FROM ranked
+                JOIN latest_fb
+                  ON latest_fb.reference = ranked.reference AND latest_fb.rn = 1
+                WHERE ranked.rn <= ?
+            """, (*type_params, limit))
+            return [dict(row) for row in cursor.fetchall()]
+
     # ========== Policy Weights CRUD ==========
 
     def save_policy_weight(self, weight: StoredPolicyWeight) -> int:
@@ -1617,6 +2190,182 @@ class Database:
 
             conn.commit()
 
+    # ========== GIS Cache ==========
+
+    def get_gis_cache_entries(self, cell_lat: float, cell_lon: float) -> Dict[str, dict]:
+        """Get unexpired cached GIS layer results for a grid cell.
+
+        Args:
+            cell_lat: Rounded latitude of the cell
+            cell_lon: Rounded longitude of the cell
+
+        Returns:
+            Dict of layer -> {ok, payload_json, fetched_at, expires_at}
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT layer, ok, payload_json, fetched_at, expires_at FROM gis_cache "
+                "WHERE cell_lat = ? AND cell_lon = ? AND expires_at > ?",
+                (cell_lat, cell_lon, time.time()),
+            )
+            return {
+                row["layer"]: {
+                    "ok": bool(row["ok"]),
+                    "payload_json": row["payload_json"],
+                    "fetched_at": row["fetched_at"],
+                    "expires_at": row["expires_at"],
+                }
+                for row in cursor.fetchall()
+            }
+
+    def save_gis_cache_entry(
+        self,
+        cell_lat: float,
+        cell_lon: float,
+        layer: str,
+        ok: bool,
+        payload_json: Optional[str],
+        ttl_seconds: float,
+        fetched_at: Optional[float] = None,
+    ) -> None:
+        """Store a GIS layer result (or failure) for a grid cell.
+
+        An existing entry is only replaced by one fetched later, so a slow
+        request completing after its failure was recorded still wins.
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        with self._get_connection() as conn:
+            conn.execute("""
+                INSERT INTO gis_cache (
+                    cell_lat, cell_lon, layer, ok, payload_json, fetched_at, expires_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(cell_lat, cell_lon, layer) DO UPDATE SET
+                    ok = excluded.ok,
+                    payload_json = excluded.payload_json,
+                    fetched_at = excluded.fetched_at,
+                    expires_at = excluded.expires_at
+                WHERE excluded.fetched_at >= gis_cache.fetched_at
+            """, (
+                cell_lat, cell_lon, layer, int(ok), payload_json,
+                fetched_at, fetched_at + ttl_seconds,
+            ))
+            conn.commit()
+
+    def get_gis_cache_counts(self) -> dict:
+        """Count cached GIS entries by state."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    COALESCE(SUM(expires_at > :now AND ok = 1), 0) AS fresh,
+                    COALESCE(SUM(expires_at > :now AND ok = 0), 0) AS negative,
+                    COALESCE(SUM(expires_at <= :now), 0) AS expired
+                FROM gis_cache
+            """, {"now": time.time()})
+            return dict(cursor.fetchone())
+
+    def prune_gis_cache(self) -> int:
+        """Delete expired GIS cache entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM gis_cache WHERE expires_at <= ?", (time.time(),))
+            conn.commit()
+            return cursor.rowcount
+
+    # ========== Postcode Cache ==========
+
+    def get_postcode_cache_entries(self, postcodes: List[str]) -> Dict[str, dict]:
+        """Get unexpired cached postcode lookups.
+
+        Args:
+            postcodes: Compact upper-case postcodes
+
+        Returns:
+            Dict of postcode -> {found, payload_json, expires_at}
+        """
+        entries: Dict[str, dict] = {}
+        now = time.time()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for chunk in self._chunked(postcodes):
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT postcode, found, payload_json, expires_at FROM postcode_cache "
+                    f"WHERE postcode IN ({placeholders}) AND expires_at > ?",
+                    (*chunk, now),
+                )
+                for row in cursor.fetchall():
+                    entries[row["postcode"]] = {
+                        "found": bool(row["found"]),
+                        "payload_json": row["payload_json"],
+                        "expires_at": row["expires_at"],
+                    }
+        return entries
+
+    def save_postcode_cache_entries(self, entries: List[Tuple[str, bool, Optional[str], float]]) -> None:
+        """Store postcode lookups.
+
+        Args:
+            entries: (postcode, found, payload_json, ttl_seconds) tuples
+        """
+        if not entries:
+            return
+        now = time.time()
+        with self._get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO postcode_cache (postcode, found, payload_json, fetched_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(postcode) DO UPDATE SET
+                    found = excluded.found,
+                    payload_json = excluded.payload_json,
+                    fetched_at = excluded.fetched_at,
+                    expires_at = excluded.expires_at
+            """, [
+                (postcode, int(found), payload_json, now, now + ttl)
+                for postcode, found, payload_json, ttl in entries
+            ])
+            conn.commit()
+
+    # ========== Document Extractions ==========
+
+    def get_document_extraction(self, content_hash: str) -> Optional[str]:
+        """Get a stored document extraction.
+
+        Args:
+            content_hash: Extraction cache key
+
+        Returns:
+            Extraction JSON, or None if not stored
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT extraction_json FROM document_extractions WHERE content_hash = ?",
+                (content_hash,),
+            )
+            row = cursor.fetchone()
+            return row["extraction_json"] if row else None
+
+    def save_document_extraction(self, content_hash: str, extraction_json: str) -> None:
+        """Store a document extraction.
+
+        Args:
+            content_hash: Extraction cache key
+            extraction_json: Serialised extraction
+        """
+        with self._get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO document_extractions (content_hash, extraction_json, created_at) "
+                "VALUES (?, ?, ?)",
+                (content_hash, extraction_json, time.time()),
+            )
+            conn.commit()
+
     # ========== Statistics ==========
 
     def get_stats(self) -> dict:
@@ -1662,6 +2411,7 @@ class Database:
 
 # Singleton instance
 _database: Optional[Database] = None
+_database_lock = threading.Lock()
 
 
 def get_database(db_path: Optional[Path] = None) -> Database:
@@ -1675,5 +2425,7 @@ def get_database(db_path: Optional[Path] = None) -> Database:
     """
     global _database
     if _database is None:
-        _database = Database(db_path)
+        with _database_lock:
+            if _database is None:
+                _database = Database(db_path)
     return _database
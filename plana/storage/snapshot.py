@@ -0,0 +1,117 @@
+"""
+Per-request snapshot of a stored application and its documents.
+
+Report generation reads the same application row and document rows from
+several places (the route, the pipeline service, the report generator's
+plan-set and applicant steps).  An ``ApplicationSnapshot`` is built once
+per request and passed along instead: the application row is read when
+the snapshot is loaded, the document rows on first use, and every view
+the pipeline needs (report inputs, extracted texts, ingestion result) is
+derived from those rows without going back to the database.
+"""
+
+import threading
+from typing import TYPE_CHECKING, List, Optional
+
+from plana.storage.models import StoredApplication, StoredDocument
+
+if TYPE_CHECKING:
+    from plana.storage.database import Database
+
+
+class ApplicationSnapshot:
+    """An application row plus its document rows, each read at most once.
+
+    Snapshots reflect the database when they were read; build a new one
+    per request rather than keeping one around.
+    """
+
+    def __init__(
+        self,
+        reference: str,
+        application: Optional[StoredApplication] = None,
+        db: Optional["Database"] = None,
+        documents: Optional[List[StoredDocument]] = None,
+    ):
+        if db is None:
+            from plana.storage.database import get_database
+            db = get_database()
+        self.reference = application.reference if application else reference
+        self.application = application
+        self._db = db
+        self._documents = documents
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        reference: str,
+        db: Optional["Database"] = None,
+        alternatives: tuple[str, ...] = (),
+    ) -> Optional["ApplicationSnapshot"]:
+        """Snapshot of a stored application, or None if it is not stored.
+
+        Args:
+            reference: Application reference
+            db: Database to read from (default: the shared database)
+            alternatives: Other spellings of the reference to try, in order
+
+        Returns:
+            ApplicationSnapshot or None
+        """
+        if db is None:
+            from plana.storage.database import get_database
+            db = get_database()
+        for candidate in (reference, *alternatives):
+            application = db.get_application(candidate)
+            if application is not None:
+                return cls(application.reference, application, db)
+        return None
+
+    @property
+    def documents(self) -> List[StoredDocument]:
+        """Stored documents for the application, loaded on first access."""
+        with self._lock:
+            if self._documents is None:
+                self._documents = self._db.get_documents(self.reference)
+            return self._documents
+
+    @property
+    def applicant_name(self) -> Optional[str]:
+        """Stored applicant name, if any."""
+        return self.application.applicant_name if self.application else None
+
+    def report_documents(self) -> List[dict]:
+        """Documents in the form ``generate_professional_report`` takes."""
+        return [
+            {
+                "filename": doc.title,
+                "document_type": doc.doc_type or "other",
+                "content_text": doc.extracted_text or "",
+            }
+            for doc in self.documents
+        ]
+
+    def extracted_texts(self) -> List[dict]:
+        """Processed documents with text, as ``Database.get_extracted_texts``."""
+        docs = [
+            doc for doc in self.documents
+            if doc.processing_status == "processed"
+            and doc.extracted_text is not None
+            and (doc.extracted_text_chars or 0) > 0
+        ]
+        docs.sort(key=lambda doc: doc.extracted_text_chars, reverse=True)
+        return [
+            {
+                "title": doc.title,
+                "extracted_text": doc.extracted_text,
+                "chars": doc.extracted_text_chars,
+                "is_plan": bool(doc.is_plan_or_drawing),
+                "method": doc.extract_method,
+            }
+            for doc in docs
+        ]
+
+    def processed_count(self) -> int:
+        """Number of documents the worker has finished processing."""
+        return sum(1 for doc in self.documents if doc.processing_status == "processed")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark: backfill crawl against a local stand-in portal.
+
+Usage:
+    python scripts/bench_backfill.py
+    python scripts/bench_backfill.py --applications 500 --latency 0.05 --jobs 1 4 8
+    python scripts/bench_backfill.py --rate 1   # the real portal's request rate
+
+Starts tests/portal_standin.py with the given per-response latency and
+crawls three months of decisions into a temporary database, once per
+--jobs value, printing applications per second.  The host rate limit is
+off unless --rate is given, so the numbers show what concurrency buys
+against a slow portal rather than the production limit.
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+from datetime import date
+
+# Ensure the project root is on sys.path
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from plana.core.cache import SQLiteCacheTier, TieredCache
+from plana.core.resilience import get_host_policy, reset_host_policies
+from plana.ingestion.backfill import BackfillCrawler
+from plana.ingestion.newcastle import NewcastleAdapter
+from plana.ingestion.response_cache import PortalResponseCache
+from plana.storage.database import Database
+from tests.portal_standin import PortalStandIn
+
+
+async def crawl(portal: PortalStandIn, workdir: Path, jobs: int, rate: float) -> dict:
+    reset_host_policies()
+    get_host_policy(portal.url, rate=rate, burst=1, base_delay=0)
+    cache = PortalResponseCache(
+        TieredCache("portal_responses", ttl=3600, disk=SQLiteCacheTier(workdir / "pages.db"))
+    )
+    adapter = NewcastleAdapter(base_url=portal.url, response_cache=cache)
+    crawler = BackfillCrawler(
+        adapter, Database(db_path=workdir / "plana.db"), workdir / "checkpoint.json",
+        max_concurrent=jobs,
+    )
+    try:
+        return await crawler.run(date(2024, 1, 1), date(2024, 3, 31))
+    finally:
+        await adapter.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the backfill crawler")
+    parser.add_argument("--applications", type=int, default=200, help="Applications decided (default: 200)")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds per response (default: 0.02)")
+    parser.add_argument("--page-size", type=int, default=20, help="Rows per result page (default: 20)")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8], help="Concurrency levels (default: 1 2 4 8)")
+    parser.add_argument("--rate", type=float, default=0.0, help="Requests per second to the portal, 0 for unlimited")
+    args = parser.parse_args()
+
+    with PortalStandIn(
+        applications=args.applications, days=90, page_size=args.page_size, latency=args.latency,
+    ) as portal:
+        print(f"Stand-in portal: {portal.url} | {args.applications} applications | "
+              f"latency {args.latency * 1000:.0f}ms | rate {args.rate or 'unlimited'}")
+        print("-" * 56)
+        print(f"{'Jobs':>4}  {'Saved':>6}  {'Requests':>8}  {'Seconds':>8}  {'Apps/s':>8}")
+        print("-" * 56)
+        for jobs in args.jobs:
+            portal.requests.clear()
+            with tempfile.TemporaryDirectory() as tmp:
+                stats = asyncio.run(crawl(portal, Path(tmp), jobs, args.rate))
+            print(f"{jobs:>4}  {stats['saved']:>6}  {sum(portal.requests.values()):>8}  "
+                  f"{stats['elapsed_s']:>8.2f}  {stats['per_second']:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: portal page parsing, per-call parsing vs parse-once.
+
+Usage:
+    python scripts/bench_portal_parsing.py
+    python scripts/bench_portal_parsing.py --repeat 200 --pages tests/fixtures/portal
+
+Runs the Newcastle adapter's search flow (result row lookup + empty form
+check) and details flow (application fields + document list) over saved
+portal pages, twice:
+
+- per-call: every method parses the page itself with ``html.parser`` and
+  each field lookup searches the whole tree (the adapter's old behaviour);
+- parse-once: the page is parsed once with ``HTML_PARSER`` (lxml when
+  installed) and fields come from a ``FieldMap``.
+
+The parse cache is cleared between pages, so parse-once timings include
+one real parse per page.
+"""
+
+import argparse
+import re
+import sys
+import time
+
+# Ensure the project root is on sys.path
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+
+import plana.ingestion.newcastle as newcastle
+from plana.ingestion.parsing import HTML_PARSER, FieldMap, parse_html
+
+REFERENCE = "2025/2002/01/TPO"
+
+
+class ScanningFieldMap:
+    """Field lookups that search the tree on every call."""
+
+    def __init__(self, soup):
+        self.soup = soup
+
+    def get(self, label):
+        for th in self.soup.find_all(["th", "td"]):
+            if label.lower() in th.get_text().lower():
+                next_td = th.find_next_sibling("td")
+                if next_td:
+                    return next_td.get_text(strip=True)
+        for dt in self.soup.find_all("dt"):
+            if label.lower() in dt.get_text().lower():
+                dd = dt.find_next_sibling("dd")
+                if dd:
+                    return dd.get_text(strip=True)
+        for span in self.soup.find_all("span", class_=re.compile(r".*value.*", re.I)):
+            prev = span.find_previous(["span", "label"])
+            if prev and label.lower() in prev.get_text().lower():
+                return span.get_text(strip=True)
+        return None
+
+
+def run_flows(adapter, html: str) -> None:
+    adapter._extract_view_url(html, REFERENCE)
+    adapter._is_empty_form_page(html)
+    adapter._parse_application_page(html, REFERENCE, "https://example.org/?keyVal=K1")
+    adapter._parse_documents_page(html, REFERENCE)
+
+
+def time_flows(adapter, html: str, repeat: int, per_call: bool) -> float:
+    """Mean milliseconds per run of both flows over ``html``."""
+    if per_call:
+        newcastle.parse_html = lambda text: BeautifulSoup(text, "html.parser")
+        newcastle.FieldMap = ScanningFieldMap
+    else:
+        newcastle.parse_html = parse_html
+        newcastle.FieldMap = FieldMap
+    try:
+        t_start = time.perf_counter()
+        for _ in range(repeat):
+            parse_html.cache_clear()
+            run_flows(adapter, html)
+        return (time.perf_counter() - t_start) * 1000 / repeat
+    finally:
+        newcastle.parse_html = parse_html
+        newcastle.FieldMap = FieldMap
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark portal page parsing")
+    parser.add_argument("--pages", type=Path,
+                        default=Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "portal",
+                        help="Directory of saved portal pages (default: tests/fixtures/portal)")
+    parser.add_argument("--repeat", type=int, default=50, help="Runs per page (default: 50)")
+    args = parser.parse_args()
+
+    pages = sorted(args.pages.glob("*.html"))
+    if not pages:
+        print(f"No .html pages in {args.pages}")
+        return 1
+
+    adapter = newcastle.NewcastleAdapter()
+    print(f"Parser: {HTML_PARSER} | Runs per page: {args.repeat}")
+    print("-" * 72)
+    print(f"{'Page':<28}  {'Size':>7}  {'Per-call ms':>11}  {'Parse-once ms':>13}  {'Speed-up':>8}")
+    print("-" * 72)
+    for page in pages:
+        html = page.read_text()
+        before = time_flows(adapter, html, args.repeat, per_call=True)
+        after = time_flows(adapter, html, args.repeat, per_call=False)
+        print(f"{page.name:<28}  {len(html) // 1024:>5}KB  {before:>11.2f}  {after:>13.2f}  {before / after:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1206,7 +1206,7 @@ def generate_broxtowe_heritage_assessment(
     _doc_text_combined = ""
     if documents:
         try:
-            from plana.api.document_analysis import extract_from_text, merge_document_extractions
+            from plana.api.document_analysis import cached_extract_from_text, merge_document_extractions
             _extractions = []
             for doc in documents:
                 doc_text = doc.get("content_text", "") or doc.get("extracted_text", "")
@@ -1217,7 +1217,7 @@ def generate_broxtowe_heritage_assessment(
                     _has_das = True
                 if doc_text:
                     _doc_text_combined += doc_text + "\n"
-                    _extractions.append(extract_from_text(doc_text, doc.get("document_type", "other"), doc.get("filename", "")))
+                    _extractions.append(cached_extract_from_text(doc_text, doc.get("document_type", "other"), doc.get("filename", "")))
             if _extractions:
                 _merged = merge_document_extractions(_extractions)
                 _doc_materials = [m.material for m in _merged.materials]
@@ -1380,12 +1380,12 @@ def generate_broxtowe_amenity_assessment(
     _doc_evidence_str = ""
     if documents:
         try:
-            from plana.api.document_analysis import extract_from_text, merge_document_extractions
+            from plana.api.document_analysis import cached_extract_from_text, merge_document_extractions
             _extractions = []
             for doc in documents:
                 doc_text = doc.get("content_text", "") or doc.get("extracted_text", "")
                 if doc_text:
-                    _extractions.append(extract_from_text(doc_text, doc.get("document_type", "other"), doc.get("filename", "")))
+                    _extractions.append(cached_extract_from_text(doc_text, doc.get("document_type", "other"), doc.get("filename", "")))
             if _extractions:
                 _merged = merge_document_extractions(_extractions)
                 _floor_area = _merged.total_floor_area_sqm
@@ -1658,12 +1658,12 @@ def generate_broxtowe_report(
     _materials_list: list[str] = []
     if documents:
         try:
-            from plana.api.document_analysis import extract_from_text, merge_document_extractions
+            from plana.api.document_analysis import cached_extract_from_text, merge_document_extractions
             _extractions = []
             for doc in documents:
                 doc_text = doc.get("content_text", "") or doc.get("extracted_text", "")
                 if doc_text:
-                    _extractions.append(extract_from_text(doc_text, doc.get("document_type", "other"), doc.get("filename", "")))
+                    _extractions.append(cached_extract_from_text(doc_text, doc.get("document_type", "other"), doc.get("filename", "")))
             if _extractions:
                 _merged = merge_document_extractions(_extractions)
                 _bedrooms = _merged.num_bedrooms
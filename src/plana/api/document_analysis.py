@@ -11,11 +11,17 @@ This module provides evidence-based data extraction to replace placeholder text
 with actual verified measurements and specifications.
 """
 
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from typing import Any
+import hashlib
+import json
 import re
+import threading
+
+from plana.documents.patterns import RuleSet, scan_document
 
 
 class DocumentConfidence(str, Enum):
@@ -182,6 +188,72 @@ class ExtractedDocumentData:
     verification_required: list[str] = field(default_factory=list)
 
 
+# Ordered extraction rules, matched against the lowercased text; the first
+# rule that matches wins.  Compiled once and shared through the document
+# pattern registry.
+_BEDROOM_RULES = RuleSet("document_analysis.bedrooms", [
+    r'(\d+)\s*(?:no\.?\s*)?bed(?:room)?s?(?:\s*dwelling)?',
+    r'(\d+)\s*(?:bed|br|bedroom)\s*(?:house|property|dwelling|home)',
+    r'bed(?:room)?s?\s*[:\-]?\s*(\d+)',
+    r'(\d+)\s*(?:single|double|master|guest)\s*bed(?:room)?s?',
+    r'number of bedrooms[:\s]*(\d+)',
+])
+
+_UNIT_RULES = RuleSet("document_analysis.units", [
+    r'(\d+)\s{0,10}(?:no\.?\s*)?(?:dwelling|unit|house|flat|apartment|home)s?',
+    r'(?:erection|construction|development)\s+of\s+(\d{1,4})\b',
+    r'(\d+)\s{0,10}(?:new\s*)?(?:residential\s*)?(?:dwelling|unit)s?',
+])
+
+_FLOOR_AREA_RULES = RuleSet("document_analysis.floor_area", [
+    r'(?:total\s*)?(?:floor\s*)?area[:\s]*(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)',
+    r'(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)\s*(?:floor\s*)?area',
+    r'gifa[:\s]*(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)',
+    r'(\d+(?:\.\d+)?)\s*(?:square\s*)?met(?:re|er)s?\s*(?:floor\s*)?area',
+])
+
+_RIDGE_HEIGHT_RULES = RuleSet("document_analysis.ridge_height", [
+    r'ridge\s*(?:height)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?',
+    r'(?:overall\s*)?height[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?',
+    r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:to\s*)?ridge',
+    r'max(?:imum)?\s*height[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?',
+])
+
+_EAVES_HEIGHT_RULES = RuleSet("document_analysis.eaves_height", [
+    r'eaves?\s*(?:height)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?',
+    r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:to\s*)?eaves?',
+])
+
+_STOREY_RULES = RuleSet("document_analysis.storeys", [
+    r'(\d+)[\s\-]*(?:storey|story|floor)(?:ed)?',
+    r'(?:single|one)[\s\-]*(?:storey|story)',
+    r'(?:two|2)[\s\-]*(?:storey|story)',
+    r'(?:three|3)[\s\-]*(?:storey|story)',
+])
+
+_PARKING_RULES = RuleSet("document_analysis.parking", [
+    r'(\d+)\s*(?:car\s*)?(?:parking\s*)?(?:space|bay)s?',
+    r'parking[:\s]*(\d+)',
+    r'(\d+)\s*(?:off[\-\s]*street|on[\-\s]*site)\s*(?:parking\s*)?(?:space|bay)?s?',
+])
+
+_SEPARATION_RULES = RuleSet("document_analysis.separation", [
+    r'separation\s*(?:distance)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?',
+    r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:from|to)\s*(?:boundary|neighbour)',
+    r'distance\s*to\s*(?:boundary|neighbour)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?',
+])
+
+_VISIBILITY_SPLAY_RULES = RuleSet("document_analysis.visibility_splay", [
+    r'visibility\s*(?:splay)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*[xX×]\s*(\d+(?:\.\d+)?)',
+    r'(\d+(?:\.\d+)?)\s*[xX×]\s*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*visibility',
+])
+
+_PLOT_AREA_RULES = RuleSet("document_analysis.plot_area", [
+    r'(?:plot|site)\s*area[:\s]*(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)',
+    r'(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)\s*(?:plot|site)',
+])
+
+
 def extract_from_text(text: str, document_type: str, filename: str = "") -> ExtractedDocumentData:
     """
     Extract structured data from document text.
@@ -197,24 +269,15 @@ def extract_from_text(text: str, document_type: str, filename: str = "") -> Extr
     data = ExtractedDocumentData()
     data.documents_analysed.append(filename)
     data.extraction_timestamp = datetime.now().isoformat()
-    text_lower = text.lower()
+    scan = scan_document(text, filename)
+    text_lower = scan.text
 
     # Extract bedrooms
-    bedroom_patterns = [
-        r'(\d+)\s*(?:no\.?\s*)?bed(?:room)?s?(?:\s*dwelling)?',
-        r'(\d+)\s*(?:bed|br|bedroom)\s*(?:house|property|dwelling|home)',
-        r'bed(?:room)?s?\s*[:\-]?\s*(\d+)',
-        r'(\d+)\s*(?:single|double|master|guest)\s*bed(?:room)?s?',
-        r'number of bedrooms[:\s]*(\d+)',
-    ]
-
-    for pattern in bedroom_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            data.num_bedrooms = int(match.group(1))
-            data.num_bedrooms_confidence = DocumentConfidence.VERIFIED
-            data.num_bedrooms_source = filename
-            break
+    hit = scan.first(_BEDROOM_RULES)
+    if hit and hit.value:
+        data.num_bedrooms = int(hit.value)
+        data.num_bedrooms_confidence = DocumentConfidence.VERIFIED
+        data.num_bedrooms_source = filename
 
     # Extract from room labels in floor plans
     bedroom_labels = re.findall(r'(?:bed(?:room)?\s*\d+|master\s*bed(?:room)?|guest\s*bed(?:room)?|single\s*bed(?:room)?|double\s*bed(?:room)?)', text_lower)
@@ -234,24 +297,18 @@ def extract_from_text(text: str, document_type: str, filename: str = "") -> Extr
 
     # Extract number of units — require the number to be close to the keyword
     # (max 10 chars gap) to avoid matching document IDs or file sizes
-    unit_patterns = [
-        r'(\d+)\s{0,10}(?:no\.?\s*)?(?:dwelling|unit|house|flat|apartment|home)s?',
-        r'(?:erection|construction|development)\s+of\s+(\d{1,4})\b',
-        r'(\d+)\s{0,10}(?:new\s*)?(?:residential\s*)?(?:dwelling|unit)s?',
-    ]
-
-    for pattern in unit_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            candidate = int(match.group(1))
-            # Sanity check: reject obviously unreasonable unit counts
-            # (document IDs, file sizes, byte counts, etc.)
-            if candidate > 500:
-                continue
-            data.num_units = candidate
-            data.num_units_confidence = DocumentConfidence.VERIFIED
-            data.num_units_source = filename
-            break
+    for hit in scan.iter_hits(_UNIT_RULES):
+        if not hit.value:
+            continue
+        candidate = int(hit.value)
+        # Sanity check: reject obviously unreasonable unit counts
+        # (document IDs, file sizes, byte counts, etc.)
+        if candidate > 500:
+            continue
+        data.num_units = candidate
+        data.num_units_confidence = DocumentConfidence.VERIFIED
+        data.num_units_source = filename
+        break
 
     # Default to 1 for single dwelling proposals
     if data.num_units == 0 and any(word in text_lower for word in ['dwelling', 'house', 'bungalow']):
@@ -259,56 +316,24 @@ def extract_from_text(text: str, document_type: str, filename: str = "") -> Extr
         data.num_units_confidence = DocumentConfidence.INFERRED
 
     # Extract floor area
-    area_patterns = [
-        r'(?:total\s*)?(?:floor\s*)?area[:\s]*(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)',
-        r'(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)\s*(?:floor\s*)?area',
-        r'gifa[:\s]*(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)',
-        r'(\d+(?:\.\d+)?)\s*(?:square\s*)?met(?:re|er)s?\s*(?:floor\s*)?area',
-    ]
-
-    for pattern in area_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            data.total_floor_area_sqm = float(match.group(1))
-            data.floor_area_confidence = DocumentConfidence.VERIFIED
-            data.floor_area_source = filename
-            break
+    hit = scan.first(_FLOOR_AREA_RULES)
+    if hit and hit.value:
+        data.total_floor_area_sqm = float(hit.value)
+        data.floor_area_confidence = DocumentConfidence.VERIFIED
+        data.floor_area_source = filename
 
     # Extract ridge height
-    height_patterns = [
-        r'ridge\s*(?:height)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?',
-        r'(?:overall\s*)?height[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?',
-        r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:to\s*)?ridge',
-        r'max(?:imum)?\s*height[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?',
-    ]
-
-    for pattern in height_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            data.ridge_height_metres = float(match.group(1))
-            data.ridge_height_confidence = DocumentConfidence.VERIFIED
-            break
+    hit = scan.first(_RIDGE_HEIGHT_RULES)
+    if hit and hit.value:
+        data.ridge_height_metres = float(hit.value)
+        data.ridge_height_confidence = DocumentConfidence.VERIFIED
 
     # Extract eaves height
-    eaves_patterns = [
-        r'eaves?\s*(?:height)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?',
-        r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:to\s*)?eaves?',
-    ]
-
-    for pattern in eaves_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            data.eaves_height_metres = float(match.group(1))
-            break
+    hit = scan.first(_EAVES_HEIGHT_RULES)
+    if hit and hit.value:
+        data.eaves_height_metres = float(hit.value)
 
     # Extract storeys
-    storey_patterns = [
-        r'(\d+)[\s\-]*(?:storey|story|floor)(?:ed)?',
-        r'(?:single|one)[\s\-]*(?:storey|story)',
-        r'(?:two|2)[\s\-]*(?:storey|story)',
-        r'(?:three|3)[\s\-]*(?:storey|story)',
-    ]
-
     if 'single' in text_lower or 'one storey' in text_lower or '1 storey' in text_lower:
         data.num_storeys = 1
     elif 'two storey' in text_lower or '2 storey' in text_lower or 'two-storey' in text_lower:
@@ -316,34 +341,24 @@ def extract_from_text(text: str, document_type: str, filename: str = "") -> Extr
     elif 'three storey' in text_lower or '3 storey' in text_lower:
         data.num_storeys = 3
     else:
-        for pattern in storey_patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                if match.group(1):
-                    data.num_storeys = int(match.group(1))
-                break
+        # Rules without a number ("one-storey") only confirm the mention
+        hit = scan.first(_STOREY_RULES)
+        if hit and hit.value:
+            data.num_storeys = int(hit.value)
 
     # Extract parking spaces
-    parking_patterns = [
-        r'(\d+)\s*(?:car\s*)?(?:parking\s*)?(?:space|bay)s?',
-        r'parking[:\s]*(\d+)',
-        r'(\d+)\s*(?:off[\-\s]*street|on[\-\s]*site)\s*(?:parking\s*)?(?:space|bay)?s?',
-    ]
-
-    for pattern in parking_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            data.total_parking_spaces = int(match.group(1))
-            # Create parking space entries
-            for i in range(data.total_parking_spaces):
-                space_type = "garage" if "garage" in text_lower else "driveway"
-                data.parking_spaces.append(ExtractedParkingSpace(
-                    space_type=space_type,
-                    is_covered="garage" in text_lower or "carport" in text_lower,
-                    ev_charging="ev" in text_lower or "electric" in text_lower,
-                    confidence=DocumentConfidence.VERIFIED
-                ))
-            break
+    hit = scan.first(_PARKING_RULES)
+    if hit and hit.value:
+        data.total_parking_spaces = int(hit.value)
+        # Create parking space entries
+        for i in range(data.total_parking_spaces):
+            space_type = "garage" if "garage" in text_lower else "driveway"
+            data.parking_spaces.append(ExtractedParkingSpace(
+                space_type=space_type,
+                is_covered="garage" in text_lower or "carport" in text_lower,
+                ev_charging="ev" in text_lower or "electric" in text_lower,
+                confidence=DocumentConfidence.VERIFIED
+            ))
 
     # Extract materials — deduplicate within a single extraction so that
     # e.g. "timber" is not recorded separately for walls, windows AND doors.
@@ -367,43 +382,22 @@ def extract_from_text(text: str, document_type: str, filename: str = "") -> Extr
                 ))
 
     # Extract separation distances
-    separation_patterns = [
-        r'separation\s*(?:distance)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?',
-        r'(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*(?:from|to)\s*(?:boundary|neighbour)',
-        r'distance\s*to\s*(?:boundary|neighbour)[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?',
-    ]
-
-    for pattern in separation_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            data.distance_to_nearest_neighbour = float(match.group(1))
-            break
+    hit = scan.first(_SEPARATION_RULES)
+    if hit and hit.value:
+        data.distance_to_nearest_neighbour = float(hit.value)
 
     # Extract visibility splays
-    visibility_patterns = [
-        r'visibility\s*(?:splay)?[:\s]*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*[xX×]\s*(\d+(?:\.\d+)?)',
-        r'(\d+(?:\.\d+)?)\s*[xX×]\s*(\d+(?:\.\d+)?)\s*(?:m|metre|meter)s?\s*visibility',
-    ]
-
-    for pattern in visibility_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            # Typically expressed as 2.4m x 43m (setback x splay distance)
-            data.visibility_splay_left = float(match.group(2))
-            data.visibility_splay_right = float(match.group(2))
-            break
+    hit = scan.first(_VISIBILITY_SPLAY_RULES)
+    splay = hit.groups[1] if hit else None
+    if splay:
+        # Typically expressed as 2.4m x 43m (setback x splay distance)
+        data.visibility_splay_left = float(splay)
+        data.visibility_splay_right = float(splay)
 
     # Extract plot/site area
-    plot_patterns = [
-        r'(?:plot|site)\s*area[:\s]*(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)',
-        r'(\d+(?:\.\d+)?)\s*(?:sq\.?\s*m|sqm|m2|m²)\s*(?:plot|site)',
-    ]
-
-    for pattern in plot_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            data.plot_area_sqm = float(match.group(1))
-            break
+    hit = scan.first(_PLOT_AREA_RULES)
+    if hit and hit.value:
+        data.plot_area_sqm = float(hit.value)
 
     # Calculate plot coverage if we have both values
     if data.plot_area_sqm > 0 and data.total_floor_area_sqm > 0:
@@ -461,6 +455,152 @@ def extract_from_text(text: str, document_type: str, filename: str = "") -> Extr
     return data
 
 
+# =============================================================================
+# EXTRACTION CACHE
+# =============================================================================
+#
+# extract_from_text() depends only on the text and document type (plus the
+# filename, which is only copied into provenance fields).  Extractions are
+# stored in the database under a hash of both, computed once by the document
+# worker, so report generation loads them instead of re-scanning the text.
+
+# Bump when extract_from_text() changes, to invalidate stored extractions
+EXTRACTION_VERSION = 1
+
+# Stands in for the filename in stored extractions
+_FILENAME_PLACEHOLDER = "\x00filename\x00"
+_PROVENANCE_FIELDS = ("num_bedrooms_source", "num_units_source", "floor_area_source")
+
+_NESTED_LIST_TYPES = {
+    "rooms": ExtractedRoom,
+    "parking_spaces": ExtractedParkingSpace,
+    "boundaries": ExtractedBoundary,
+    "materials": ExtractedMaterial,
+}
+
+_MEMORY_CACHE_SIZE = 256
+_memory_cache: "OrderedDict[str, str]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+
+def extraction_cache_key(text: str, document_type: str) -> str:
+    """Cache key for the extraction of ``text`` as ``document_type``."""
+    digest = hashlib.sha256(f"v{EXTRACTION_VERSION}\x00{document_type}\x00".encode("utf-8"))
+    digest.update(text.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def extraction_to_json(data: ExtractedDocumentData) -> str:
+    """Serialise an extraction (enums as their values)."""
+    return json.dumps(asdict(data), separators=(",", ":"))
+
+
+def _dataclass_from_dict(cls: type, values: dict) -> Any:
+    kwargs = {}
+    for f in fields(cls):
+        if f.name not in values:
+            continue
+        value = values[f.name]
+        if f.type in (DocumentConfidence, DataSource) and value is not None:
+            value = f.type(value)
+        elif f.name == "dimensions" and value is not None:
+            value = tuple(value)
+        elif f.name in _NESTED_LIST_TYPES and cls is ExtractedDocumentData:
+            value = [_dataclass_from_dict(_NESTED_LIST_TYPES[f.name], item) for item in value]
+        kwargs[f.name] = value
+    return cls(**kwargs)
+
+
+def extraction_from_json(payload: str) -> ExtractedDocumentData:
+    """Rebuild an extraction serialised by ``extraction_to_json``."""
+    data: ExtractedDocumentData = _dataclass_from_dict(ExtractedDocumentData, json.loads(payload))
+    return data
+
+
+def _with_filename(data: ExtractedDocumentData, filename: str) -> ExtractedDocumentData:
+    data.documents_analysed = [
+        filename if name == _FILENAME_PLACEHOLDER else name for name in data.documents_analysed
+    ]
+    for name in _PROVENANCE_FIELDS:
+        if getattr(data, name) == _FILENAME_PLACEHOLDER:
+            setattr(data, name, filename)
+    return data
+
+
+def _extraction_store() -> Any:
+    """The database holding stored extractions, or None."""
+    try:
+        from plana.storage.database import get_database
+        return get_database()
+    except Exception:
+        return None
+
+
+def _remember(key: str, payload: str) -> None:
+    with _memory_cache_lock:
+        _memory_cache[key] = payload
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _extract_and_store(key: str, text: str, document_type: str, store: Any = None) -> str:
+    payload = extraction_to_json(extract_from_text(text, document_type, _FILENAME_PLACEHOLDER))
+    store = store or _extraction_store()
+    if store is not None:
+        try:
+            store.save_document_extraction(key, payload)
+        except Exception:
+            pass  # Non-fatal — extraction still returned
+    _remember(key, payload)
+    return payload
+
+
+def precompute_extraction(text: str, document_type: str, store: Any = None) -> str:
+    """Run and store the extraction for a document's text.
+
+    Called by the document worker at processing time.
+
+    Args:
+        text: The extracted text content from the document
+        document_type: Type of document, as report generation will pass it
+        store: Database to store into (default: ``get_database()``)
+
+    Returns:
+        The extraction cache key
+    """
+    key = extraction_cache_key(text, document_type)
+    _extract_and_store(key, text, document_type, store)
+    return key
+
+
+def cached_extract_from_text(text: str, document_type: str, filename: str = "") -> ExtractedDocumentData:
+    """``extract_from_text`` backed by the stored extraction cache.
+
+    Returns a fresh ``ExtractedDocumentData`` equal to what
+    ``extract_from_text`` would produce (apart from its timestamp),
+    running the extraction and storing it only on a cache miss.
+    """
+    key = extraction_cache_key(text, document_type)
+    with _memory_cache_lock:
+        payload = _memory_cache.get(key)
+        if payload is not None:
+            _memory_cache.move_to_end(key)
+
+    if payload is None:
+        store = _extraction_store()
+        try:
+            payload = store.get_document_extraction(key) if store is not None else None
+        except Exception:
+            payload = None  # Non-fatal — extract below
+        if payload is not None:
+            _remember(key, payload)
+        else:
+            payload = _extract_and_store(key, text, document_type)
+
+    return _with_filename(extraction_from_json(payload), filename)
+
+
 def merge_document_extractions(extractions: list[ExtractedDocumentData]) -> ExtractedDocumentData:
     """
     Merge multiple document extractions, preferring higher confidence data.
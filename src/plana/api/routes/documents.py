@@ -11,7 +11,7 @@ from plana.api.models import (
     DocumentStatusResponse,
 )
 from plana.core.logging import get_logger
-from plana.documents.processor import check_plan_set_present
+from plana.documents.processor import PlanSetLegs, stored_plan_set_legs
 from plana.storage.database import Database
 from plana.storage.models import StoredDocument
 
@@ -23,37 +23,9 @@ router = APIRouter()
 def _build_status_documents(db: Database, reference: str) -> DocumentStatusDocuments:
     """Build a DocumentStatusDocuments from DB counts + plan set check."""
     counts = db.get_processing_counts(reference)
-    docs = db.get_documents(reference)
 
-    # Determine plan set presence from stored document metadata
-    from plana.documents.ingestion import classify_document, DocumentCategory
-
-    categories = []
-    filenames = []
-    metadata_guesses = []
-    all_detected_labels = []
-    for doc in docs:
-        cat, _ = classify_document(doc.title, doc.doc_type, doc.title)
-        categories.append(cat)
-        filenames.append(doc.title)
-        if doc.extracted_metadata_json:
-            import json
-            try:
-                meta = json.loads(doc.extracted_metadata_json)
-                guess = meta.get("document_type_guess", "")
-                if guess:
-                    metadata_guesses.append(guess)
-                labels = meta.get("detected_labels", [])
-                all_detected_labels.extend(labels)
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-    plan_set = check_plan_set_present(
-        categories=categories,
-        metadata_guesses=metadata_guesses or None,
-        filenames=filenames,
-        all_detected_labels=all_detected_labels or None,
-    )
+    # Plan set presence from the signals stored with each document
+    plan_set = stored_plan_set_legs(db, reference) == PlanSetLegs.ALL
 
     return DocumentStatusDocuments(
         total=counts["total"],
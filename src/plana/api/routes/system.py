@@ -1,10 +1,11 @@
 """System administration endpoints.
 
-Worker health monitoring and queue management.
+Worker health monitoring, queue management and cache statistics.
 """
 
 from fastapi import APIRouter
 
+from plana.core.cache import get_cache_stats
 from plana.documents.background import get_worker_stats, kick_queue
 
 router = APIRouter()
@@ -28,3 +29,13 @@ async def kick_queue_endpoint() -> dict:
     Safe to call repeatedly.
     """
     return await kick_queue()
+
+
+@router.get("/cache_stats")
+async def cache_stats() -> dict:
+    """Hit, miss, single-flight and refresh counters per cache namespace.
+
+    Counters are for this API process; the disk tiers they list are
+    shared with other processes using the same database.
+    """
+    return {"namespaces": get_cache_stats()}
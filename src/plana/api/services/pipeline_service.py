@@ -47,6 +47,7 @@ from plana.api.models import (
 from plana.core.constants import resolve_council_name
 from plana.core.exceptions import CouncilMismatchError
 from plana.storage.database import Database
+from plana.storage.snapshot import ApplicationSnapshot
 from plana.policy.search import PolicySearch
 from plana.similarity.search import SimilaritySearch
 
@@ -330,8 +331,10 @@ class PipelineService:
 
         # Build document ingestion from DB-stored processed documents
         # so the ReportGenerator can extract planning facts and cite docs.
-        document_ingestion = self._build_document_ingestion(reference)
-        document_texts = self.db.get_extracted_texts(reference)
+        # Both views come from one read of the stored documents.
+        snapshot = ApplicationSnapshot(reference, stored_app, self.db)
+        document_ingestion = self._build_document_ingestion(snapshot)
+        document_texts = snapshot.extracted_texts()
 
         # Generate report result — uses full ReportGenerator when documents
         # have been processed, falls back to simple template otherwise.
@@ -672,8 +675,10 @@ class PipelineService:
         )
 
         # Build document ingestion from DB-stored processed documents
-        document_ingestion = self._build_document_ingestion(request.reference)
-        document_texts = self.db.get_extracted_texts(request.reference)
+        # (the application row was rewritten above, so only reuse documents)
+        snapshot = ApplicationSnapshot(request.reference, db=self.db)
+        document_ingestion = self._build_document_ingestion(snapshot)
+        document_texts = snapshot.extracted_texts()
 
         # Generate report — uses full ReportGenerator when documents
         # have been processed, falls back to simple template otherwise.
@@ -1033,20 +1038,17 @@ The proposal has been assessed against the relevant development plan policies an
             lines.append(f"- ... and {len(document_texts) - 10} more documents")
         return "\n".join(lines)
 
-    def _build_document_ingestion(self, reference: str):
+    def _build_document_ingestion(self, snapshot: ApplicationSnapshot):
         """Build a DocumentIngestionResult from DB-stored processed documents.
 
         Returns the ingestion result, or None if no processed documents exist.
         """
-        stored_docs = self.db.get_documents(reference)
+        stored_docs = snapshot.documents
         if not stored_docs:
             return None
 
         # Only build ingestion if at least some documents are processed
-        processed_count = sum(
-            1 for d in stored_docs if d.processing_status == "processed"
-        )
-        if processed_count == 0:
+        if snapshot.processed_count() == 0:
             return None
 
         try:
@@ -1861,9 +1863,10 @@ The proposal has been assessed against the relevant development plan policies an
             has_documents=processing_status.total > 0,
         )
 
-        # Document ingestion + texts from DB
-        document_ingestion = self._build_document_ingestion(app.reference)
-        document_texts = self.db.get_extracted_texts(app.reference)
+        # Document ingestion + texts from one read of the stored documents
+        snapshot = ApplicationSnapshot(app.reference, app, self.db)
+        document_ingestion = self._build_document_ingestion(snapshot)
+        document_texts = snapshot.extracted_texts()
 
         # Generate report
         report_result = self._generate_report_result(
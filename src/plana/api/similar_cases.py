@@ -12,11 +12,16 @@ relevant precedents based on:
 This is the foundation for evidence-based case officer recommendations.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any
 import math
 import re
+import threading
+import time
+import weakref
+
+from plana.core.cache import get_similarity_cache, make_cache_key
 
 
 @dataclass
@@ -976,133 +981,12 @@ def calculate_similarity_score(
     - Proposal feature similarity: 25%  (detailed keyword + context matching)
     - Constraint overlap: 20%  (conservation, listed, Green Belt, TPO)
     """
-    score = 0.0
-
-    # 1. Location proximity (30%) — PRIMARY FACTOR
-    # Prefer coordinate-based distance when available; fall back to postcode tiers.
-    location_score = 0.0
-
-    case_lat = case.get("latitude")
-    case_lng = case.get("longitude")
-    if latitude and longitude and case_lat and case_lng:
-        distance_km = _haversine_km(latitude, longitude, case_lat, case_lng)
-        # Distance decay: 1.0 at 0km, ~0.5 at 5km, 0 at 15km+
-        location_score = max(0.0, 1.0 - (distance_km / 15.0))
-        # Boost very close matches
-        if distance_km < 1.0:
-            location_score = max(location_score, 0.95)
-        elif distance_km < 3.0:
-            location_score = max(location_score, 0.80)
-
-    if postcode and case["postcode"] and location_score < 0.5:
-        # Use postcode tiers as fallback (or supplement if distance is weak)
-        pc_score = 0.0
-        case_pc = case["postcode"].strip().upper().replace(" ", "")
-        current_pc = postcode.strip().upper().replace(" ", "")
-
-        # Full postcode match (same street area)
-        if case_pc == current_pc:
-            pc_score = 1.0
-        else:
-            # Extract components for tiered matching
-            case_parts = case["postcode"].strip().split()
-            current_parts = postcode.strip().split()
-            case_outcode = case_parts[0] if case_parts else ""
-            current_outcode = current_parts[0] if current_parts else ""
-
-            # Postcode sector match (e.g. "NG16 2" == "NG16 2")
-            case_sector = f"{case_parts[0]} {case_parts[1][0]}" if len(case_parts) == 2 and len(case_parts[1]) >= 1 else case_outcode
-            current_sector = f"{current_parts[0]} {current_parts[1][0]}" if len(current_parts) == 2 and len(current_parts[1]) >= 1 else current_outcode
-
-            if case_sector == current_sector:
-                # Same sector but check for development context mismatch
-                # In Broxtowe, NG16 spans urban (Eastwood/Kimberley) and
-                # semi-rural/Green Belt (Awsworth/Giltbrook). Demote matches
-                # where one is Green Belt and the other isn't.
-                case_gb = any("green belt" in c.lower() for c in case.get("constraints", []))
-                current_gb = any("green belt" in c.lower() for c in constraints)
-                if case_gb != current_gb:
-                    pc_score = 0.4  # Penalise: same postcode but different context
-                else:
-                    pc_score = 0.85  # Same sector, same context = very close
-            elif case_outcode == current_outcode:
-                pc_score = 0.65  # Same district (e.g. NG16)
-            else:
-                # Check if same broader area (e.g. NG vs NE)
-                case_area = re.match(r'^([A-Z]+)', case_outcode)
-                current_area = re.match(r'^([A-Z]+)', current_outcode)
-                if case_area and current_area and case_area.group(1) == current_area.group(1):
-                    pc_score = 0.3  # Same city/region
-
-        # Take the best of coordinate score and postcode score
-        location_score = max(location_score, pc_score)
-
-    # Ward match bonus
-    if ward and case.get("ward") and case["ward"].lower() == ward.lower():
-        location_score = max(location_score, 0.8)
-        location_score = min(1.0, location_score + 0.15)
-
-    score += location_score * 0.30
-
-    # 2. Development type & scale match (25%)
-    type_scale_score = 0.0
-    proposal_lower = proposal.lower()
-    case_proposal_lower = case["proposal"].lower()
-
-    # Application type match (base)
-    if case["application_type"].lower() == application_type.lower():
-        type_scale_score += 0.4
-    elif _similar_app_type(case["application_type"], application_type):
-        type_scale_score += 0.25
-
-    # Development type match (dwelling, extension, change of use etc.)
-    current_dev = _detect_dev_type_from_proposal(proposal)
-    case_dev = _detect_dev_type_from_proposal(case["proposal"])
-    if current_dev == case_dev:
-        type_scale_score += 0.3
-    elif current_dev in {"new_dwelling", "extension"} and case_dev in {"new_dwelling", "extension"}:
-        type_scale_score += 0.1  # Related but not same
-
-    # Scale match (storey count)
-    current_storeys = _extract_storeys(proposal_lower)
-    case_storeys = _extract_storeys(case_proposal_lower)
-    if current_storeys and case_storeys:
-        if current_storeys == case_storeys:
-            type_scale_score += 0.2
-        elif abs(current_storeys - case_storeys) == 1:
-            type_scale_score += 0.1
-
-    # Form match (detached, semi, terrace)
-    current_form = _extract_dwelling_form(proposal_lower)
-    case_form = _extract_dwelling_form(case_proposal_lower)
-    if current_form and case_form and current_form == case_form:
-        type_scale_score += 0.1
-
-    score += min(type_scale_score, 1.0) * 0.25
-
-    # 3. Proposal feature similarity (25%) — deeper keyword matching
-    feature_score = _calculate_feature_similarity(proposal_lower, case_proposal_lower)
-    score += feature_score * 0.25
-
-    # 4. Constraint overlap (20%)
-    case_constraints = set(c.lower() for c in case["constraints"])
-    current_constraints = set(c.lower() for c in constraints)
-
-    if case_constraints or current_constraints:
-        constraint_overlap = len(case_constraints & current_constraints)
-        constraint_total = len(case_constraints | current_constraints)
-        constraint_score = (constraint_overlap / constraint_total) if constraint_total > 0 else 0
-        # Bonus for sharing high-impact constraints
-        high_impact = {"conservation area", "listed building", "green belt", "article 4 direction"}
-        shared_high = (case_constraints & current_constraints) & high_impact
-        if shared_high:
-            constraint_score = min(1.0, constraint_score + 0.2 * len(shared_high))
-    else:
-        constraint_score = 0.5 if not case_constraints and not current_constraints else 0
-
-    score += constraint_score * 0.20
-
-    return min(score, 1.0)
+    return _score_case_features(
+        compile_case_features(case),
+        compile_query_features(
+            proposal, application_type, constraints, ward, postcode, latitude, longitude,
+        ),
+    )
 
 
 def _extract_storeys(proposal_lower: str) -> int | None:
@@ -1132,6 +1016,51 @@ def _extract_dwelling_form(proposal_lower: str) -> str | None:
     return None
 
 
+# Feature categories with weights used by proposal feature similarity
+_FEATURE_GROUPS: dict[str, dict[str, Any]] = {
+    'access_parking': {
+        'terms': {'parking', 'garage', 'access', 'driveway', 'vehicular',
+                  'car port', 'carport', 'hardstanding'},
+        'weight': 1.5,
+    },
+    'form_type': {
+        'terms': {'dwelling', 'house', 'bungalow', 'flat', 'apartment',
+                  'extension', 'annexe', 'outbuilding', 'conversion'},
+        'weight': 1.5,
+    },
+    'scale': {
+        'terms': {'single', 'two', 'three', 'storey', 'dormer', 'loft',
+                  'basement', 'attic', 'roof'},
+        'weight': 1.2,
+    },
+    'position': {
+        'terms': {'rear', 'side', 'front', 'infill', 'garden', 'plot',
+                  'land adjacent', 'land to'},
+        'weight': 1.0,
+    },
+    'materials': {
+        'terms': {'brick', 'render', 'stone', 'timber', 'slate', 'tile',
+                  'cladding', 'upvc'},
+        'weight': 0.8,
+    },
+    'sustainability': {
+        'terms': {'solar', 'heat pump', 'ashp', 'ev', 'charging',
+                  'renewable', 'insulation'},
+        'weight': 1.0,
+    },
+    'landscape': {
+        'terms': {'landscaping', 'boundary', 'fence', 'wall', 'tree',
+                  'hedge', 'garden'},
+        'weight': 0.7,
+    },
+    'heritage': {
+        'terms': {'listed', 'conservation', 'heritage', 'character',
+                  'historic', 'replacement'},
+        'weight': 1.3,
+    },
+}
+
+
 def _calculate_feature_similarity(proposal_lower: str, case_lower: str) -> float:
     """Calculate detailed feature-level similarity between two proposals.
 
@@ -1139,54 +1068,10 @@ def _calculate_feature_similarity(proposal_lower: str, case_lower: str) -> float
     matching on substantive features (parking, access, materials) scores
     higher than matching on common filler words.
     """
-    # Feature categories with weights
-    feature_groups = {
-        'access_parking': {
-            'terms': {'parking', 'garage', 'access', 'driveway', 'vehicular',
-                      'car port', 'carport', 'hardstanding'},
-            'weight': 1.5,
-        },
-        'form_type': {
-            'terms': {'dwelling', 'house', 'bungalow', 'flat', 'apartment',
-                      'extension', 'annexe', 'outbuilding', 'conversion'},
-            'weight': 1.5,
-        },
-        'scale': {
-            'terms': {'single', 'two', 'three', 'storey', 'dormer', 'loft',
-                      'basement', 'attic', 'roof'},
-            'weight': 1.2,
-        },
-        'position': {
-            'terms': {'rear', 'side', 'front', 'infill', 'garden', 'plot',
-                      'land adjacent', 'land to'},
-            'weight': 1.0,
-        },
-        'materials': {
-            'terms': {'brick', 'render', 'stone', 'timber', 'slate', 'tile',
-                      'cladding', 'upvc'},
-            'weight': 0.8,
-        },
-        'sustainability': {
-            'terms': {'solar', 'heat pump', 'ashp', 'ev', 'charging',
-                      'renewable', 'insulation'},
-            'weight': 1.0,
-        },
-        'landscape': {
-            'terms': {'landscaping', 'boundary', 'fence', 'wall', 'tree',
-                      'hedge', 'garden'},
-            'weight': 0.7,
-        },
-        'heritage': {
-            'terms': {'listed', 'conservation', 'heritage', 'character',
-                      'historic', 'replacement'},
-            'weight': 1.3,
-        },
-    }
-
     total_weight = 0.0
     matched_weight = 0.0
 
-    for _group_name, group in feature_groups.items():
+    for _group_name, group in _FEATURE_GROUPS.items():
         terms = group['terms']
         weight = group['weight']
         proposal_hits = {t for t in terms if t in proposal_lower}
@@ -1325,41 +1210,640 @@ def _is_comparable(
     2. Completely different constraint context (Green Belt vs none) - exclude
     3. Different use class (retail vs residential) - exclude
     """
-    current_dev_type = _detect_dev_type_from_proposal(proposal)
-    case_dev_type = _detect_dev_type_from_proposal(case["proposal"])
+    return _is_comparable_features(
+        compile_case_features(case),
+        compile_query_features(proposal, application_type, constraints, None, None),
+    )
 
-    # Rule 1: Development type must broadly match
-    if current_dev_type != case_dev_type:
-        # Allow extension/new_dwelling only if both are residential
-        residential_types = {"new_dwelling", "extension", "flats"}
-        if not (current_dev_type in residential_types and case_dev_type in residential_types):
-            return False, f"Not comparable: development type mismatch ({current_dev_type} vs {case_dev_type})"
 
-    # Rule 2: Green Belt mismatch is a hard exclusion
-    current_gb = any("green belt" in c.lower() for c in constraints)
-    case_gb = any("green belt" in c.lower() for c in case["constraints"])
-    if current_gb != case_gb:
-        return False, "Not comparable: Green Belt context mismatch"
+# =============================================================================
+# Compiled case-feature table
+# =============================================================================
+#
+# Everything ``calculate_similarity_score`` and ``_is_comparable`` derive from
+# a historic case (lowercased proposal, dev type, storeys, form, constraint
+# set, postcode components...) is independent of the query, so it is compiled
+# once per corpus version into a ``CaseFeatures`` row.  Query-time scoring
+# then only reads precomputed fields.
+
+_HIGH_IMPACT_CONSTRAINTS = ("conservation area", "listed building", "green belt", "article 4 direction")
+
+_RESIDENTIAL_KWS = ("dwelling", "house", "flat", "apartment", "residential", "extension", "bungalow")
+_COMMERCIAL_KWS = ("retail", "shop", "office", "industrial", "warehouse", "commercial")
+
+# Application type families used by ``_similar_app_type`` (one bit each)
+_APP_TYPE_GROUPS = (
+    ("householder", "det", "domestic"),
+    ("full planning", "full", "ful"),
+    ("listed building consent", "listed building", "lbc"),
+)
+
+# One bit per (feature group, term) pair, grouped per feature category
+_FEATURE_TERM_BITS: list[tuple[str, int]] = []
+_FEATURE_GROUP_MASKS: list[tuple[int, float]] = []
+for _group in _FEATURE_GROUPS.values():
+    _mask = 0
+    for _term in sorted(_group["terms"]):
+        _bit = 1 << len(_FEATURE_TERM_BITS)
+        _FEATURE_TERM_BITS.append((_term, _bit))
+        _mask |= _bit
+    _FEATURE_GROUP_MASKS.append((_mask, _group["weight"]))
+del _group, _mask, _term, _bit
+
+# Interned constraint vocabulary: lowercased constraint -> bit.  High-impact
+# constraints are interned first so their mask is fixed.
+_CONSTRAINT_BITS: dict[str, int] = {}
+_CONSTRAINT_BITS_LOCK = threading.Lock()
+
+
+def _constraint_bit(constraint_lower: str) -> int:
+    bit = _CONSTRAINT_BITS.get(constraint_lower)
+    if bit is None:
+        # Tables are compiled from worker threads; two new constraints must
+        # not be given the same bit
+        with _CONSTRAINT_BITS_LOCK:
+            bit = _CONSTRAINT_BITS.get(constraint_lower)
+            if bit is None:
+                bit = 1 << len(_CONSTRAINT_BITS)
+                _CONSTRAINT_BITS[constraint_lower] = bit
+    return bit
+
+
+_HIGH_IMPACT_MASK = 0
+for _c in _HIGH_IMPACT_CONSTRAINTS:
+    _HIGH_IMPACT_MASK |= _constraint_bit(_c)
+del _c
+
+
+@dataclass(slots=True)
+class CaseFeatures:
+    """Query-independent features of a proposal, compiled once.
+
+    Used both for historic cases (rows of a ``CaseFeatureTable``) and for the
+    current application, so scoring compares like with like.
+    """
+    reference: str
+    proposal_lower: str
+    app_type_lower: str
+    app_type_groups: int
+    dev_type: str
+    storeys: int | None
+    form: str | None
+    feature_bits: int
+    constraint_bits: int
+    constraint_extra: int  # constraints not in the interned vocabulary
+    green_belt: bool
+    residential: bool
+    commercial: bool
+    postcode_compact: str
+    outcode: str
+    sector: str
+    postcode_area: str | None
+    ward_lower: str
+    latitude: float | None
+    longitude: float | None
+    decision_ordinal: int | None = None
+    from_db: bool = False
+
+
+def compile_case_features(
+    case: dict[str, Any],
+    *,
+    intern_constraints: bool = True,
+    from_db: bool = False,
+) -> CaseFeatures:
+    """Compile the query-independent features of a case dict.
+
+    ``intern_constraints=False`` is used for query proposals so arbitrary
+    user input does not grow the shared constraint vocabulary.
+    """
+    proposal = case.get("proposal") or ""
+    proposal_lower = proposal.lower()
+    app_type_lower = (case.get("application_type") or "").lower()
+
+    type_groups = 0
+    for i, group in enumerate(_APP_TYPE_GROUPS):
+        if any(t in app_type_lower for t in group):
+            type_groups |= 1 << i
+
+    feature_bits = 0
+    for term, bit in _FEATURE_TERM_BITS:
+        if term in proposal_lower:
+            feature_bits |= bit
+
+    constraint_bits = 0
+    constraint_extra = 0
+    constraints_lower = {c.lower() for c in case.get("constraints") or []}
+    for c in constraints_lower:
+        if intern_constraints:
+            constraint_bits |= _constraint_bit(c)
+        else:
+            known = _CONSTRAINT_BITS.get(c)
+            if known is None:
+                constraint_extra += 1
+            else:
+                constraint_bits |= known
+
+    raw_postcode = case.get("postcode") or ""
+    parts = raw_postcode.strip().split()
+    outcode = parts[0] if parts else ""
+    if len(parts) == 2 and len(parts[1]) >= 1:
+        sector = f"{parts[0]} {parts[1][0]}"
+    else:
+        sector = outcode
+    area_match = re.match(r'^([A-Z]+)', outcode)
+
+    decision_ordinal = None
+    decision_date = case.get("decision_date")
+    if decision_date:
+        try:
+            decision_ordinal = datetime.strptime(decision_date, "%Y-%m-%d").toordinal()
+        except (ValueError, TypeError):
+            pass
+
+    return CaseFeatures(
+        reference=case.get("reference", ""),
+        proposal_lower=proposal_lower,
+        app_type_lower=app_type_lower,
+        app_type_groups=type_groups,
+        dev_type=_detect_dev_type_from_proposal(proposal),
+        storeys=_extract_storeys(proposal_lower),
+        form=_extract_dwelling_form(proposal_lower),
+        feature_bits=feature_bits,
+        constraint_bits=constraint_bits,
+        constraint_extra=constraint_extra,
+        green_belt=any("green belt" in c for c in constraints_lower),
+        residential=any(kw in proposal_lower for kw in _RESIDENTIAL_KWS),
+        commercial=any(kw in proposal_lower for kw in _COMMERCIAL_KWS),
+        postcode_compact=raw_postcode.strip().upper().replace(" ", ""),
+        outcode=outcode,
+        sector=sector,
+        postcode_area=area_match.group(1) if area_match else None,
+        ward_lower=(case.get("ward") or "").lower(),
+        latitude=case.get("latitude"),
+        longitude=case.get("longitude"),
+        decision_ordinal=decision_ordinal,
+        from_db=from_db,
+    )
+
+
+def compile_query_features(
+    proposal: str,
+    application_type: str,
+    constraints: list[str],
+    ward: str | None,
+    postcode: str | None,
+    latitude: float | None = None,
+    longitude: float | None = None,
+) -> CaseFeatures:
+    """Compile the current application into the same shape as a case row."""
+    return compile_case_features(
+        {
+            "reference": "",
+            "proposal": proposal,
+            "application_type": application_type,
+            "constraints": constraints,
+            "ward": ward or "",
+            "postcode": postcode or "",
+            "latitude": latitude,
+            "longitude": longitude,
+        },
+        intern_constraints=False,
+    )
+
+
+def _score_case_features(cf: CaseFeatures, qf: CaseFeatures) -> float:
+    """Similarity score from precomputed features.
+
+    Same weighting as ``calculate_similarity_score`` (location 30%, type and
+    scale 25%, proposal features 25%, constraints 20%).
+    """
+    score = 0.0
+    score += _location_score(cf, qf) * 0.30
+    score += min(_type_scale_score(cf, qf), 1.0) * 0.25
+    score += _feature_score(cf.feature_bits, qf.feature_bits) * 0.25
+    score += _constraint_score(cf, qf) * 0.20
+    return min(score, 1.0)
+
+
+def _location_score(cf: CaseFeatures, qf: CaseFeatures) -> float:
+    """Location proximity: coordinate distance, then postcode tiers and ward."""
+    location_score = 0.0
+    if qf.latitude and qf.longitude and cf.latitude and cf.longitude:
+        distance_km = _haversine_km(qf.latitude, qf.longitude, cf.latitude, cf.longitude)
+        # Distance decay: 1.0 at 0km, ~0.5 at 5km, 0 at 15km+
+        location_score = max(0.0, 1.0 - (distance_km / 15.0))
+        if distance_km < 1.0:
+            location_score = max(location_score, 0.95)
+        elif distance_km < 3.0:
+            location_score = max(location_score, 0.80)
+
+    if qf.postcode_compact and cf.postcode_compact and location_score < 0.5:
+        location_score = max(location_score, _postcode_tier_score(cf, qf))
+
+    if qf.ward_lower and cf.ward_lower and cf.ward_lower == qf.ward_lower:
+        location_score = max(location_score, 0.8)
+        location_score = min(1.0, location_score + 0.15)
+
+    return location_score
+
+
+def _postcode_tier_score(cf: CaseFeatures, qf: CaseFeatures) -> float:
+    """Postcode tier match: full postcode, sector, district, then area."""
+    if cf.postcode_compact == qf.postcode_compact:
+        return 1.0
+    if cf.sector == qf.sector:
+        # Same sector but different Green Belt context (e.g. NG16 spans
+        # urban Eastwood and semi-rural Awsworth) is only a weak match
+        return 0.4 if cf.green_belt != qf.green_belt else 0.85
+    if cf.outcode == qf.outcode:
+        return 0.65
+    if cf.postcode_area and qf.postcode_area and cf.postcode_area == qf.postcode_area:
+        return 0.3
+    return 0.0
 
-    # Rule 3: Use class mismatch
-    current_proposal_lower = proposal.lower()
-    case_proposal_lower = case["proposal"].lower()
-    residential_kws = ["dwelling", "house", "flat", "apartment", "residential", "extension", "bungalow"]
-    commercial_kws = ["retail", "shop", "office", "industrial", "warehouse", "commercial"]
 
-    current_is_resi = any(kw in current_proposal_lower for kw in residential_kws)
-    case_is_resi = any(kw in case_proposal_lower for kw in residential_kws)
-    current_is_comm = any(kw in current_proposal_lower for kw in commercial_kws)
-    case_is_comm = any(kw in case_proposal_lower for kw in commercial_kws)
+def _type_scale_score(cf: CaseFeatures, qf: CaseFeatures) -> float:
+    """Development type & scale: application type, dev type, storeys, form."""
+    type_scale_score = 0.0
+    if cf.app_type_lower == qf.app_type_lower:
+        type_scale_score += 0.4
+    elif cf.app_type_groups & qf.app_type_groups:
+        type_scale_score += 0.25
 
-    if current_is_resi and case_is_comm:
+    if qf.dev_type == cf.dev_type:
+        type_scale_score += 0.3
+    elif qf.dev_type in {"new_dwelling", "extension"} and cf.dev_type in {"new_dwelling", "extension"}:
+        type_scale_score += 0.1
+
+    if qf.storeys and cf.storeys:
+        if qf.storeys == cf.storeys:
+            type_scale_score += 0.2
+        elif abs(qf.storeys - cf.storeys) == 1:
+            type_scale_score += 0.1
+
+    if qf.form and cf.form and qf.form == cf.form:
+        type_scale_score += 0.1
+
+    return type_scale_score
+
+
+def _feature_score(case_bits: int, query_bits: int) -> float:
+    """Weighted per-category Jaccard over feature-term bitsets."""
+    total_weight = 0.0
+    matched_weight = 0.0
+    for mask, weight in _FEATURE_GROUP_MASKS:
+        q_hits = query_bits & mask
+        c_hits = case_bits & mask
+        if q_hits or c_hits:
+            total_weight += weight
+            matched_weight += ((q_hits & c_hits).bit_count() / (q_hits | c_hits).bit_count()) * weight
+    return matched_weight / total_weight if total_weight > 0 else 0.3
+
+
+def _constraint_score(cf: CaseFeatures, qf: CaseFeatures) -> float:
+    """Constraint overlap with a bonus for shared high-impact constraints."""
+    if cf.constraint_bits or qf.constraint_bits or qf.constraint_extra:
+        shared = cf.constraint_bits & qf.constraint_bits
+        constraint_total = (cf.constraint_bits | qf.constraint_bits).bit_count() + qf.constraint_extra
+        constraint_score = (shared.bit_count() / constraint_total) if constraint_total > 0 else 0
+        shared_high = (shared & _HIGH_IMPACT_MASK).bit_count()
+        if shared_high:
+            constraint_score = min(1.0, constraint_score + 0.2 * shared_high)
+        return constraint_score
+    return 0.5
+
+
+def _is_comparable_features(cf: CaseFeatures, qf: CaseFeatures) -> tuple[bool, str]:
+    """``_is_comparable`` over precomputed features."""
+    if qf.dev_type != cf.dev_type:
+        residential_types = {"new_dwelling", "extension", "flats"}
+        if not (qf.dev_type in residential_types and cf.dev_type in residential_types):
+            return False, f"Not comparable: development type mismatch ({qf.dev_type} vs {cf.dev_type})"
+
+    if qf.green_belt != cf.green_belt:
+        return False, "Not comparable: Green Belt context mismatch"
+
+    if qf.residential and cf.commercial:
         return False, "Not comparable: residential vs commercial use class"
-    if current_is_comm and case_is_resi:
+    if qf.commercial and cf.residential:
         return False, "Not comparable: commercial vs residential use class"
 
     return True, ""
 
 
+def _temporal_decay(age_days: int) -> float:
+    """Recency multiplier for a precedent decided ``age_days`` ago.
+
+    Recent cases are more relevant because they reflect current policy
+    interpretation. Cases older than 3 years get progressively demoted.
+    """
+    age_years = age_days / 365.25
+    if age_years <= 2:
+        return 1.0  # Fresh — full weight
+    if age_years <= 4:
+        return 0.95  # Slight decay
+    if age_years <= 6:
+        return 0.85  # Moderate decay
+    return 0.75  # Older but still relevant precedent
+
+
+class CaseFeatureTable:
+    """Compiled features for one council's precedent corpus.
+
+    Rows are aligned with ``cases``.  A table is identified by ``version``;
+    callers rebuild it only when the corpus version changes, reusing rows
+    whose source case is unchanged.
+    """
+
+    def __init__(
+        self,
+        cases: list[dict[str, Any]],
+        features: list[CaseFeatures],
+        version: Any = None,
+    ):
+        self.cases = cases
+        self.features = features
+        self.version = version
+        self.db_cases_by_key: dict[tuple, dict[str, Any]] = {}
+        self._ref_index: dict[str, int] | None = None
+        self._decay: tuple[int, list[float]] | None = None
+        self._matrix: Any = None
+        self._spatial: Any = None
+        self.loaded_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.cases)
+
+    @property
+    def ref_index(self) -> dict[str, int]:
+        """Row index keyed by case reference."""
+        if self._ref_index is None:
+            self._ref_index = {f.reference: i for i, f in enumerate(self.features)}
+        return self._ref_index
+
+    def decay_factors(self, today_ordinal: int) -> list[float]:
+        """Per-row temporal decay, computed once per calendar day."""
+        if self._decay is None or self._decay[0] != today_ordinal:
+            self._decay = (today_ordinal, [
+                _temporal_decay(today_ordinal - f.decision_ordinal)
+                if f.decision_ordinal is not None else 1.0
+                for f in self.features
+            ])
+        return self._decay[1]
+
+    @property
+    def matrix(self) -> Any:
+        """Columnar (NumPy) view of the table, or None without NumPy."""
+        if self._matrix is None:
+            from .case_matrix import build_case_matrix
+            self._matrix = build_case_matrix(self) or False
+        return self._matrix or None
+
+    @property
+    def spatial(self) -> Any:
+        """Grid and postcode/ward candidate index over the table rows."""
+        if self._spatial is None:
+            from .spatial_index import SpatialIndex
+            self._spatial = SpatialIndex(self.features)
+        return self._spatial
+
+    def extended(
+        self,
+        cases: list[dict[str, Any]],
+        version: Any = None,
+        from_db: bool = True,
+    ) -> "CaseFeatureTable":
+        """Return a new table with ``cases`` appended.
+
+        Existing rows, and any matrix or spatial index already built, are
+        carried over and extended rather than recompiled.  The current
+        table is left untouched for readers still using it.
+        """
+        features = [compile_case_features(case, from_db=from_db) for case in cases]
+        table = CaseFeatureTable(self.cases + cases, self.features + features, version)
+        table.db_cases_by_key = dict(self.db_cases_by_key)
+        if self._ref_index is not None:
+            table._ref_index = dict(self._ref_index)
+            for offset, f in enumerate(features):
+                table._ref_index[f.reference] = len(self.features) + offset
+        if self._matrix:
+            table._matrix = self._matrix.extended(table, features)
+        elif self._matrix is False:
+            table._matrix = False
+        if self._spatial is not None:
+            table._spatial = self._spatial.extended(features, start=len(self.features))
+        return table
+
+    @classmethod
+    def build(
+        cls,
+        static_cases: list[dict[str, Any]],
+        db_cases: list[dict[str, Any]] | None = None,
+        version: Any = None,
+        previous: "CaseFeatureTable | None" = None,
+    ) -> "CaseFeatureTable":
+        """Compile a table from static and DB-sourced case dicts.
+
+        Rows of ``previous`` are reused when the case dict is the same
+        object (static cases) so only new or changed cases are compiled.
+        """
+        reuse: dict[int, CaseFeatures] = {}
+        if previous is not None:
+            reuse = {id(c): f for c, f in zip(previous.cases, previous.features)}
+
+        cases: list[dict[str, Any]] = []
+        features: list[CaseFeatures] = []
+        for case in static_cases:
+            cases.append(case)
+            features.append(reuse.get(id(case)) or compile_case_features(case))
+        for case in db_cases or []:
+            cases.append(case)
+            features.append(reuse.get(id(case)) or compile_case_features(case, from_db=True))
+        return cls(cases, features, version)
+
+
+# council_id -> compiled table for the current corpus version
+_FEATURE_TABLES: dict[str, CaseFeatureTable] = {}
+_FEATURE_TABLES_LOCK = threading.Lock()
+
+# Stored decisions loaded into each council's corpus
+_DB_PRECEDENT_LIMIT = 10000
+
+# Full reloads pick up decisions recorded by other processes
+_CORPUS_RELOAD_SECONDS = 300.0
+
+
+def _stored_app_to_case(app: Any) -> dict[str, Any] | None:
+    """Convert a stored application with a decision into a case dict."""
+    import json as _json
+
+    if not app.decision or not app.proposal:
+        return None
+    try:
+        constraints = _json.loads(app.constraints_json) if app.constraints_json else []
+    except (ValueError, TypeError):
+        constraints = []
+    return {
+        "reference": app.reference,
+        "address": app.address or "",
+        "ward": app.ward or "",
+        "postcode": app.postcode or "",
+        "proposal": app.proposal or "",
+        "application_type": app.application_type or "",
+        "constraints": constraints,
+        "decision": app.decision,
+        "decision_date": app.decision_date or "",
+        "conditions": [],
+        "refusal_reasons": [],
+        "case_officer_reasoning": "",
+        "key_policies_cited": [],
+        "development_type": "",
+        "num_storeys": 0,
+        "dwelling_form": "",
+        "latitude": app.latitude,
+        "longitude": app.longitude,
+    }
+
+
+def _stored_app_key(app: Any) -> tuple:
+    """Identity of a stored decision's precedent-relevant fields."""
+    return (app.reference, app.updated_at, app.decision, app.proposal, app.latitude, app.longitude)
+
+
+def get_case_feature_table(council_id: str) -> CaseFeatureTable:
+    """Return the compiled feature table for a council's precedent corpus.
+
+    The corpus is the static historic dataset plus decided applications
+    stored in the DB, held in memory per council.  Decisions recorded via
+    ``save_application()`` are applied incrementally from the database's
+    decision change feed, so an unchanged corpus costs no DB round-trip
+    and stored constraints are decoded once.  The corpus is reloaded in
+    full when the feed cannot be replayed and periodically, to pick up
+    decisions recorded by other processes.
+    """
+    static_cases = ALL_HISTORIC_CASES.get(council_id, NEWCASTLE_HISTORIC_CASES)
+
+    db: Any = None
+    try:
+        from plana.storage.database import get_database as _get_db
+        db = _get_db()
+    except Exception:
+        pass  # Non-fatal: fall back to static cases only
+
+    # Holding the database (not its id) keeps identity checks unambiguous
+    source = (db, id(static_cases), len(static_cases))
+    with _FEATURE_TABLES_LOCK:
+        previous = _FEATURE_TABLES.get(council_id)
+        if previous is not None and previous.version[0] == source:
+            if db is None:
+                return previous
+            if time.monotonic() - previous.loaded_at < _CORPUS_RELOAD_SECONDS:
+                table = _apply_decision_changes(previous, db, council_id, source)
+                if table is not None:
+                    _FEATURE_TABLES[council_id] = table
+                    return table
+
+        table = _load_case_feature_table(static_cases, db, council_id, source, previous)
+        _FEATURE_TABLES[council_id] = table
+        return table
+
+
+def _apply_decision_changes(
+    table: CaseFeatureTable,
+    db: Any,
+    council_id: str,
+    source: tuple,
+) -> CaseFeatureTable | None:
+    """Apply newly recorded decisions to a table, or None to force a reload."""
+    try:
+        version, changes = db.decision_changes_since(table.version[1])
+    except Exception:
+        return None
+    if changes is None:
+        return None
+    if not changes:
+        return table
+
+    latest: dict[str, Any] = {}
+    for app in changes:
+        if app.council_id != council_id:
+            continue
+        row = table.ref_index.get(app.reference)
+        if row is not None and not table.features[row].from_db:
+            continue  # Static cases take precedence over stored copies
+        latest[app.reference] = app
+
+    if any(reference in table.ref_index for reference in latest):
+        # Existing precedents changed or lost their decision: recompile
+        # from the cases in memory, reusing the unchanged rows
+        db_cases_by_key = {
+            key: case for key, case in table.db_cases_by_key.items() if key[0] not in latest
+        }
+        for app in latest.values():
+            case = _stored_app_to_case(app)
+            if case is not None:
+                db_cases_by_key[_stored_app_key(app)] = case
+        static_cases = [case for case, f in zip(table.cases, table.features) if not f.from_db]
+        rebuilt = CaseFeatureTable.build(
+            static_cases, list(db_cases_by_key.values()), version=(source, version), previous=table,
+        )
+        rebuilt.db_cases_by_key = db_cases_by_key
+        rebuilt.loaded_at = table.loaded_at
+        return rebuilt
+
+    new_cases: list[dict[str, Any]] = []
+    new_keys: list[tuple] = []
+    for app in latest.values():
+        case = _stored_app_to_case(app)
+        if case is not None:
+            new_cases.append(case)
+            new_keys.append(_stored_app_key(app))
+
+    extended = table.extended(new_cases, version=(source, version))
+    extended.db_cases_by_key.update(zip(new_keys, new_cases))
+    extended.loaded_at = table.loaded_at
+    return extended
+
+
+def _load_case_feature_table(
+    static_cases: list[dict[str, Any]],
+    db: Any,
+    council_id: str,
+    source: tuple,
+    previous: CaseFeatureTable | None,
+) -> CaseFeatureTable:
+    """Compile a table from the static cases and the stored decisions."""
+    version = 0
+    stored_apps: list[Any] = []
+    if db is not None:
+        try:
+            # Read the version first so changes racing the query are replayed
+            version = db.decision_version
+            stored_apps = db.get_completed_applications(council_id, limit=_DB_PRECEDENT_LIMIT)
+        except Exception:
+            pass  # Non-fatal: fall back to static cases only
+
+    static_refs = {c["reference"] for c in static_cases}
+
+    # Reuse decoded case dicts for stored rows that have not changed
+    previous_db_cases = previous.db_cases_by_key if previous is not None else {}
+    db_cases_by_key: dict[tuple, dict[str, Any]] = {}
+    for app in stored_apps:
+        if app.reference in static_refs:
+            continue
+        key = _stored_app_key(app)
+        case = previous_db_cases.get(key) or _stored_app_to_case(app)
+        if case is not None:
+            db_cases_by_key[key] = case
+
+    table = CaseFeatureTable.build(
+        static_cases, list(db_cases_by_key.values()), version=(source, version), previous=previous,
+    )
+    table.db_cases_by_key = db_cases_by_key
+    return table
+
+
 def find_similar_cases(
     proposal: str,
     application_type: str,
@@ -1401,149 +1885,178 @@ def find_similar_cases(
         if detected:
             council_id = detected
 
-    # Get council-specific cases (static dataset)
-    cases_db = list(ALL_HISTORIC_CASES.get(council_id, NEWCASTLE_HISTORIC_CASES))
+    # Compiled features for the static dataset plus decided applications
+    # stored in the DB (processed applications become precedent for future
+    # ones).  Rebuilt only when the stored decisions change.
+    table = get_case_feature_table(council_id)
+
+    # Feedback adjustments are loaded once for all search stages.  With the
+    # table (the corpus version) and the day (for decay) they are all a
+    # result depends on besides the query, so a repeat query is a lookup.
+    adjustments = _case_adjustments(reference, True)
+    cache = get_similarity_cache()
+    cache_key = "similar_cases:" + make_cache_key(
+        council_id, proposal, application_type, constraints, ward, postcode,
+        latitude, longitude, reference, limit,
+        datetime.now().date().toordinal(), adjustments,
+    )
+    hit = cache.get(cache_key)
+    if hit is not None and hit[0]() is table:
+        return [replace(case) for case in hit[1]]
 
-    # ---- Augment with applications stored in the DB ----
-    # Applications that have been processed and received a decision
-    # become available as precedent for future applications.
-    try:
-        from plana.storage.database import get_database as _get_db
-        import json as _json
-        _db = _get_db()
-        _stored_apps = _db.get_completed_applications(council_id)
-        _existing_refs = {c["reference"] for c in cases_db}
-        for _app in _stored_apps:
-            if _app.reference in _existing_refs or _app.reference == reference:
-                continue  # skip duplicates and self
-            if not _app.decision or not _app.proposal:
-                continue
-            try:
-                _constraints = _json.loads(_app.constraints_json) if _app.constraints_json else []
-            except (ValueError, TypeError):
-                _constraints = []
-            cases_db.append({
-                "reference": _app.reference,
-                "address": _app.address or "",
-                "ward": _app.ward or "",
-                "postcode": _app.postcode or "",
-                "proposal": _app.proposal or "",
-                "application_type": _app.application_type or "",
-                "constraints": _constraints,
-                "decision": _app.decision,
-                "decision_date": _app.decision_date or "",
-                "conditions": [],
-                "refusal_reasons": [],
-                "case_officer_reasoning": "",
-                "key_policies_cited": [],
-                "development_type": "",
-                "num_storeys": 0,
-                "dwelling_form": "",
-            })
-    except Exception:
-        pass  # Non-fatal: fall back to static cases only
+    query = compile_query_features(
+        proposal, application_type, constraints, ward, postcode, latitude, longitude,
+    )
 
-    scored_cases = []
-    excluded_cases = []  # Track why cases were excluded
+    # Score cases near the site first, widening the search radius until
+    # enough comparable precedents are found (or the whole corpus is used)
+    matrix = table.matrix
+    for rows in table.spatial.candidate_stages(query):
+        if matrix is not None:
+            ranked = matrix.rank(
+                query, reference=reference, limit=limit, rows=rows, adjustments=adjustments,
+            )
+        else:
+            ranked = _rank_cases_python(
+                table, query, reference=reference, limit=limit, rows=rows, adjustments=adjustments,
+            )
+        if len(ranked) >= limit:
+            break
 
-    for case in cases_db:
-        # First: apply hard exclusion rules
-        is_comparable, exclusion_reason = _is_comparable(
-            case, proposal, application_type, constraints
-        )
-        if not is_comparable:
-            excluded_cases.append((case["reference"], exclusion_reason))
-            continue
+    results = []
+    for index, score in ranked:
+        case = table.cases[index]
+        results.append(HistoricCase(
+            reference=case["reference"],
+            address=case["address"],
+            ward=case["ward"],
+            postcode=case["postcode"],
+            proposal=case["proposal"],
+            application_type=case["application_type"],
+            constraints=case["constraints"],
+            decision=case["decision"],
+            decision_date=case["decision_date"],
+            conditions=case["conditions"],
+            refusal_reasons=case["refusal_reasons"],
+            case_officer_reasoning=case["case_officer_reasoning"],
+            key_policies_cited=case["key_policies_cited"],
+            similarity_score=score,
+            relevance_reason=generate_relevance_reason(case, proposal, constraints),
+        ))
+
+    # The table is held weakly: a replaced corpus should not be kept alive
+    cache.set(cache_key, (weakref.ref(table), tuple(replace(case) for case in results)))
 
-        score = calculate_similarity_score(
-            case=case,
-            proposal=proposal,
-            application_type=application_type,
-            constraints=constraints,
-            ward=ward,
-            postcode=postcode,
-            latitude=latitude,
-            longitude=longitude,
-        )
+    # Prefer tight, highly relevant matches (max 3-5)
+    return results
 
-        if score > 0.35:  # Slightly lower threshold for location-first matching
-            relevance_reason = generate_relevance_reason(case, proposal, constraints)
-
-            historic_case = HistoricCase(
-                reference=case["reference"],
-                address=case["address"],
-                ward=case["ward"],
-                postcode=case["postcode"],
-                proposal=case["proposal"],
-                application_type=case["application_type"],
-                constraints=case["constraints"],
-                decision=case["decision"],
-                decision_date=case["decision_date"],
-                conditions=case["conditions"],
-                refusal_reasons=case["refusal_reasons"],
-                case_officer_reasoning=case["case_officer_reasoning"],
-                key_policies_cited=case["key_policies_cited"],
-                similarity_score=score,
-                relevance_reason=relevance_reason,
-            )
-            scored_cases.append(historic_case)
 
-    # ---- Apply learned ranking adjustments from feedback loop ----
-    # Cases that have been cited in correct predictions get boosted;
-    # cases cited in mismatches get demoted.
-    if reference and scored_cases:
+_SCORE_THRESHOLD = 0.35  # Slightly lower threshold for location-first matching
+
+
+# Feedback boosts for every case, with the database and feedback version
+# they were loaded at and when
+_FEEDBACK_BOOSTS: tuple[Any, int, float, dict[str, float]] | None = None
+_FEEDBACK_BOOSTS_RELOAD_SECONDS = 300.0
+
+
+def _feedback_boosts() -> dict[str, float]:
+    """Feedback boosts by case reference, reloaded only when feedback changes.
+
+    Feedback and run logs saved in this process bump the database's
+    ``feedback_version``; the boosts are also reloaded periodically, to
+    pick up feedback saved by other processes.
+    """
+    global _FEEDBACK_BOOSTS
+    from plana.improvement.reranking import get_similar_case_boosts
+    from plana.storage.database import get_database
+
+    db = get_database()
+    version = db.feedback_version
+    memo = _FEEDBACK_BOOSTS
+    if (
+        memo is not None
+        and memo[0] is db
+        and memo[1] == version
+        and time.monotonic() - memo[2] < _FEEDBACK_BOOSTS_RELOAD_SECONDS
+    ):
+        return memo[3]
+    boosts = get_similar_case_boosts()
+    _FEEDBACK_BOOSTS = (db, version, time.monotonic(), boosts)
+    return boosts
+
+
+def _case_adjustments(reference: str, has_candidates: bool) -> tuple[dict[str, float], dict[str, float]]:
+    """Feedback-loop boosts and learning-system multipliers by case reference.
+
+    Cases that have been cited in correct predictions get boosted; cases
+    cited in mismatches get demoted.  Both lookups are non-fatal.
+    """
+    boosts: dict[str, float] = {}
+    if reference and has_candidates:
         try:
-            from plana.improvement.reranking import calculate_similar_case_boost
-            boosted = calculate_similar_case_boost(scored_cases, reference)
-            # Re-apply boosts to similarity scores
-            for case, boost in boosted:
-                case.similarity_score = min(1.0, case.similarity_score * boost)
-            scored_cases = [case for case, _ in boosted]
+            boosts = _feedback_boosts()
         except Exception:
             pass  # Non-fatal: fall back to base scores
 
-    # Also apply learning system adjustments
+    learning: dict[str, float] = {}
     try:
         from plana.api.learning import get_learning_system
-        ls = get_learning_system()
-        case_adjustments = ls.get_similar_case_ranking_adjustments()
-        if case_adjustments:
-            for case in scored_cases:
-                adj = case_adjustments.get(case.reference, 1.0)
-                case.similarity_score = min(1.0, case.similarity_score * adj)
+        learning = get_learning_system().get_similar_case_ranking_adjustments() or {}
     except Exception:
         pass  # Non-fatal
 
-    # ---- Apply temporal decay ----
-    # Recent cases are more relevant because they reflect current policy
-    # interpretation. Cases older than 3 years get progressively demoted.
-    try:
-        from datetime import datetime as _dt
-        _now = _dt.now()
-        for case in scored_cases:
-            if case.decision_date:
-                try:
-                    case_date = _dt.strptime(case.decision_date, "%Y-%m-%d")
-                    age_years = (_now - case_date).days / 365.25
-                    if age_years <= 2:
-                        decay = 1.0  # Fresh — full weight
-                    elif age_years <= 4:
-                        decay = 0.95  # Slight decay
-                    elif age_years <= 6:
-                        decay = 0.85  # Moderate decay
-                    else:
-                        decay = 0.75  # Older but still relevant precedent
-                    case.similarity_score *= decay
-                except (ValueError, TypeError):
-                    pass
-    except Exception:
-        pass  # Non-fatal
+    return boosts, learning
 
-    # Sort by score descending
-    scored_cases.sort(key=lambda x: x.similarity_score, reverse=True)
 
-    # Prefer tight, highly relevant matches (max 3-5)
-    return scored_cases[:limit]
+def _rank_cases_python(
+    table: CaseFeatureTable,
+    query: CaseFeatures,
+    reference: str = "",
+    limit: int = 5,
+    rows: list[int] | None = None,
+    adjustments: tuple[dict[str, float], dict[str, float]] | None = None,
+) -> list[tuple[int, float]]:
+    """Score, adjust and rank table rows one at a time (no NumPy).
+
+    Only ``rows`` (ascending row indices) are considered when given.
+    ``adjustments`` are the ``_case_adjustments`` to apply (loaded here
+    when not given).  Returns up to ``limit`` (row index, final score)
+    pairs, best first.
+    """
+    candidates: list[tuple[int, float]] = []
+    for index in range(len(table.features)) if rows is None else rows:
+        features = table.features[index]
+        if features.from_db and features.reference == reference:
+            continue  # skip self
+
+        # First: apply hard exclusion rules
+        if not _is_comparable_features(features, query)[0]:
+            continue
+
+        score = _score_case_features(features, query)
+        if score > _SCORE_THRESHOLD:
+            candidates.append((index, score))
+
+    if adjustments is None:
+        adjustments = _case_adjustments(reference, bool(candidates))
+    boosts, learning = adjustments
+    decay = table.decay_factors(datetime.now().date().toordinal())
+
+    adjusted: list[tuple[float, float, int]] = []
+    for index, score in candidates:
+        ref = table.features[index].reference
+        boost = boosts.get(ref, 1.0)
+        if boosts:
+            score = min(1.0, score * boost)
+        if learning:
+            score = min(1.0, score * learning.get(ref, 1.0))
+        score *= decay[index]
+        adjusted.append((score, boost, index))
+
+    # Highest score first; ties keep boosted cases ahead, then corpus order
+    adjusted.sort(key=lambda x: (-x[0], -x[1], x[2]))
+    return [(index, score) for score, _boost, index in adjusted[:limit]]
 
 
 def get_precedent_analysis(
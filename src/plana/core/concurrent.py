@@ -0,0 +1,675 @@
+"""
+Concurrent utilities for Plana.AI.
+
+Provides utilities for concurrent operations like parallel downloads,
+``stream_concurrent`` for bounded, streaming fan-out over large or lazy
+inputs, and ``StepGraph`` for running dependent pipeline steps across
+threads.
+"""
+
+import asyncio
+import contextvars
+import inspect
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from plana.core.constants import DocumentConfig
+from plana.core.logging import get_logger
+from plana.core.resilience import backoff_delay, get_retry_budget
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class TaskResult(Generic[T]):
+    """Result of an async task."""
+
+    success: bool
+    value: Optional[T] = None
+    error: Optional[str] = None
+    item_id: Optional[str] = None
+    index: Optional[int] = None  # Position of the item in the input
+
+
+async def run_with_semaphore(
+    semaphore: asyncio.Semaphore,
+    coro: Awaitable[T],
+    item_id: Optional[str] = None,
+) -> TaskResult[T]:
+    """Run a coroutine with semaphore control.
+
+    Args:
+        semaphore: Semaphore to control concurrency
+        coro: Coroutine to run
+        item_id: Optional identifier for logging
+
+    Returns:
+        TaskResult with success/failure info
+    """
+    async with semaphore:
+        try:
+            result = await coro
+            return TaskResult(success=True, value=result, item_id=item_id)
+        except Exception as e:
+            logger.warning(
+                "concurrent_task_failed",
+                item_id=item_id,
+                error=str(e),
+            )
+            return TaskResult(success=False, error=str(e), item_id=item_id)
+
+
+# =============================================================================
+# Streaming execution
+# =============================================================================
+
+# Responses that mean "slow down" rather than "this item is bad"
+_CONGESTION_STATUS_CODES = frozenset({429, 503})
+
+
+def is_congestion_error(error: BaseException) -> bool:
+    """True for timeouts and rate-limit responses (HTTP 429/503).
+
+    Looks for a ``status_code`` on the error itself (``PortalAccessError``)
+    or on its ``response`` (``httpx.HTTPStatusError``).
+    """
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    try:
+        import httpx
+
+        if isinstance(error, httpx.TimeoutException):
+            return True
+    except ImportError:
+        pass
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code in _CONGESTION_STATUS_CODES
+
+
+class AdaptiveLimit:
+    """Concurrency limit adjusted by AIMD (additive increase, multiplicative decrease).
+
+    Each success grows the limit by ``1 / limit``, so a full window of
+    successes adds one slot; a congestion signal (timeout or 429) cuts it
+    by ``decrease_factor``.  Cuts are at most one per ``cooldown`` seconds,
+    so a burst of failures from requests that were already in flight
+    counts once.  One limit can be shared by several streams to the same
+    host.
+    """
+
+    def __init__(
+        self,
+        initial: int = DocumentConfig.MAX_CONCURRENT_DOWNLOADS,
+        minimum: int = 1,
+        maximum: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        """Initialize the limit.
+
+        Args:
+            initial: Starting number of slots
+            minimum: Floor the limit never drops below
+            maximum: Ceiling the limit never grows past (defaults to ``initial``)
+            decrease_factor: Multiplier applied on congestion
+            cooldown: Minimum seconds between two decreases
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum if maximum is not None else initial)
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._value = float(min(self.maximum, max(self.minimum, initial)))
+        self._last_decrease = float("-inf")
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of slots."""
+        return max(self.minimum, int(self._value))
+
+    def record_success(self) -> None:
+        """Additive increase: one slot per limit's worth of successes."""
+        if self._value < self.maximum:
+            before = self.limit
+            self._value = min(float(self.maximum), self._value + 1.0 / self._value)
+            if self.limit > before:
+                self.increases += 1
+
+    def record_congestion(self) -> None:
+        """Multiplicative decrease, unless one happened within the cooldown."""
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        before = self.limit
+        self._value = max(float(self.minimum), self._value * self.decrease_factor)
+        if self.limit < before:
+            self.decreases += 1
+            logger.info("concurrency_decreased", limit=self.limit, previous=before)
+
+
+async def stream_concurrent(
+    items: Union[Iterable[T], AsyncIterable[T]],
+    func: Callable[[T], Any],
+    max_concurrent: int = DocumentConfig.MAX_CONCURRENT_DOWNLOADS,
+    get_item_id: Optional[Callable[[T], str]] = None,
+    limit: Optional[AdaptiveLimit] = None,
+    run_in_thread: bool = False,
+    is_congestion: Callable[[BaseException], bool] = is_congestion_error,
+) -> AsyncIterator[TaskResult[R]]:
+    """Apply ``func`` to items with bounded concurrency, yielding results as they finish.
+
+    Items are pulled from ``items`` (a sync or async iterable) only when
+    a slot is free, so at most ``max_concurrent`` calls - or
+    ``limit.limit`` when an ``AdaptiveLimit`` is given - are ever in
+    flight, and a generator of 10k references never becomes 10k tasks.
+
+    ``func`` may be async or return a plain value.  With
+    ``run_in_thread`` it is called in a worker thread instead, for
+    blocking work such as report generation.
+
+    Closing the stream (``await stream.aclose()``, or leaving an
+    ``async with contextlib.aclosing(...)`` block) or cancelling the
+    task that consumes it cancels the calls still in flight and stops
+    pulling items.
+
+    Args:
+        items: Items to process, consumed lazily
+        func: Function to apply to each item
+        max_concurrent: Maximum concurrent calls when no ``limit`` is given
+        get_item_id: Optional function to get item ID for logging
+        limit: Optional adaptive limit, decreased on congestion errors
+        run_in_thread: Call ``func`` via ``asyncio.to_thread``
+        is_congestion: Decides which errors decrease ``limit``
+
+    Yields:
+        TaskResults in completion order, with ``index`` set to the
+        item's position in ``items``
+    """
+    async_source: Optional[AsyncIterator[T]] = None
+    sync_source: Iterator[T] = iter(())
+    if hasattr(items, "__aiter__"):
+        async_source = items.__aiter__()
+    else:
+        sync_source = iter(items)
+
+    async def call(item: T) -> Any:
+        if run_in_thread:
+            return await asyncio.to_thread(func, item)
+        result = func(item)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    in_flight: dict[asyncio.Future, tuple[int, str]] = {}
+    next_index = 0
+    exhausted = False
+
+    try:
+        while True:
+            capacity = limit.limit if limit is not None else max_concurrent
+            while not exhausted and len(in_flight) < max(1, capacity):
+                try:
+                    if async_source is not None:
+                        item = await async_source.__anext__()
+                    else:
+                        item = next(sync_source)
+                except (StopIteration, StopAsyncIteration):
+                    exhausted = True
+                    break
+                item_id = get_item_id(item) if get_item_id else str(next_index)
+                in_flight[asyncio.ensure_future(call(item))] = (next_index, item_id)
+                next_index += 1
+
+            if not in_flight:
+                return
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda t: in_flight[t][0]):
+                index, item_id = in_flight.pop(task)
+                if task.cancelled():
+                    yield TaskResult(
+                        success=False, error="Task was cancelled",
+                        item_id=item_id, index=index,
+                    )
+                    continue
+
+                error = task.exception()
+                if error is None:
+                    if limit is not None:
+                        limit.record_success()
+                    yield TaskResult(
+                        success=True, value=task.result(),
+                        item_id=item_id, index=index,
+                    )
+                    continue
+
+                if not isinstance(error, Exception):
+                    raise error
+                if limit is not None and is_congestion(error):
+                    limit.record_congestion()
+                logger.warning("concurrent_task_failed", item_id=item_id, error=str(error))
+                yield TaskResult(
+                    success=False, error=str(error) or type(error).__name__,
+                    item_id=item_id, index=index,
+                )
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        if async_source is not None and hasattr(async_source, "aclose"):
+            await async_source.aclose()
+
+
+async def run_concurrent(
+    items: list[T],
+    async_func: Callable[[T], Awaitable[R]],
+    max_concurrent: int = DocumentConfig.MAX_CONCURRENT_DOWNLOADS,
+    get_item_id: Optional[Callable[[T], str]] = None,
+) -> list[TaskResult[R]]:
+    """Run async function on multiple items concurrently.
+
+    Collects ``stream_concurrent``; use that directly to handle results
+    as they arrive.
+
+    Args:
+        items: List of items to process
+        async_func: Async function to apply to each item
+        max_concurrent: Maximum concurrent operations
+        get_item_id: Optional function to get item ID for logging
+
+    Returns:
+        List of TaskResults in same order as input items
+    """
+    results: list[TaskResult[R]] = [None] * len(items)  # type: ignore
+    result: TaskResult[R]
+    async for result in stream_concurrent(
+        items, async_func, max_concurrent=max_concurrent, get_item_id=get_item_id,
+    ):
+        if result.index is not None:
+            results[result.index] = result
+    return results
+
+
+@dataclass
+class BatchProgress:
+    """Progress tracking for batch operations."""
+
+    total: int
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of items still pending."""
+        return self.total - self.completed
+
+    @property
+    def success_rate(self) -> float:
+        """Success rate as percentage."""
+        if self.completed == 0:
+            return 0.0
+        return (self.succeeded / self.completed) * 100
+
+    def record_success(self) -> None:
+        """Record a successful completion."""
+        self.completed += 1
+        self.succeeded += 1
+
+    def record_failure(self) -> None:
+        """Record a failed completion."""
+        self.completed += 1
+        self.failed += 1
+
+    def record_skip(self) -> None:
+        """Record a skipped item."""
+        self.completed += 1
+        self.skipped += 1
+
+
+# Marks a document ``should_skip`` passed over
+_SKIPPED = object()
+
+
+class ConcurrentDownloader:
+    """Handles concurrent document downloads with progress tracking.
+
+    Concurrency adapts to the portal: the limit starts at
+    ``max_concurrent``, halves when downloads time out or are rate
+    limited, and climbs back as they succeed.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DocumentConfig.MAX_CONCURRENT_DOWNLOADS,
+        limit: Optional[AdaptiveLimit] = None,
+    ):
+        """Initialize the downloader.
+
+        Args:
+            max_concurrent: Maximum concurrent downloads
+            limit: Optional adaptive limit to share with other downloaders
+        """
+        self.max_concurrent = max_concurrent
+        self.limit = limit or AdaptiveLimit(max_concurrent)
+
+    async def download_documents(
+        self,
+        documents: list[Any],
+        download_func: Callable[[Any], Awaitable[Optional[str]]],
+        should_skip: Optional[Callable[[Any], bool]] = None,
+    ) -> tuple[BatchProgress, list[TaskResult[str]]]:
+        """Download multiple documents concurrently.
+
+        Args:
+            documents: List of document objects
+            download_func: Async function to download a document (returns path or None)
+            should_skip: Optional function to check if document should be skipped
+
+        Returns:
+            Tuple of (progress, results)
+        """
+        progress = BatchProgress(total=len(documents))
+        results: list[TaskResult[str]] = [None] * len(documents)  # type: ignore
+
+        async for result in self.stream_documents(documents, download_func, should_skip, progress):
+            if result.index is not None:
+                results[result.index] = result
+
+        return progress, results
+
+    async def stream_documents(
+        self,
+        documents: Union[Iterable[Any], AsyncIterable[Any]],
+        download_func: Callable[[Any], Awaitable[Optional[str]]],
+        should_skip: Optional[Callable[[Any], bool]] = None,
+        progress: Optional[BatchProgress] = None,
+    ) -> AsyncIterator[TaskResult[str]]:
+        """Download documents concurrently, yielding each result as it finishes.
+
+        Args:
+            documents: Document objects, consumed lazily
+            download_func: Async function to download a document (returns path or None)
+            should_skip: Optional function to check if document should be skipped
+            progress: Optional progress to record into
+
+        Yields:
+            TaskResults in completion order; skipped documents succeed
+            with no value
+        """
+
+        async def process_document(doc: Any) -> Any:
+            if should_skip and should_skip(doc):
+                return _SKIPPED
+            return await download_func(doc)
+
+        result: TaskResult[str]
+        async for result in stream_concurrent(documents, process_document, limit=self.limit):
+            if result.success and result.value is _SKIPPED:
+                result.value = None
+                if progress:
+                    progress.record_skip()
+            elif result.success and not result.value:
+                result.success = False
+                result.error = "Download returned None"
+                if progress:
+                    progress.record_failure()
+            elif progress:
+                if result.success:
+                    progress.record_success()
+                else:
+                    progress.record_failure()
+            yield result
+
+
+async def download_with_retry(
+    download_func: Callable[[], Awaitable[T]],
+    max_retries: int = 3,
+    backoff_multiplier: float = 2.0,
+    initial_delay: float = 1.0,
+) -> TaskResult[T]:
+    """Download with jittered exponential backoff retry.
+
+    Retries draw on the process-wide retry budget, so a failing upstream
+    is not hammered by every caller at once.  For HTTP requests prefer
+    ``plana.core.resilience.get_host_policy(url).call``, which also rate
+    limits and circuit-breaks per host.
+
+    Args:
+        download_func: Async function to call
+        max_retries: Maximum retry attempts
+        backoff_multiplier: Backoff multiplier
+        initial_delay: Initial delay in seconds
+
+    Returns:
+        TaskResult with success/failure info
+    """
+    budget = get_retry_budget()
+    last_error = None
+
+    for attempt in range(max_retries):
+        budget.record_request()
+        try:
+            result = await download_func()
+            return TaskResult(success=True, value=result)
+        except Exception as e:
+            last_error = str(e)
+            logger.warning(
+                "download_retry",
+                attempt=attempt + 1,
+                max_retries=max_retries,
+                error=last_error,
+            )
+
+            if attempt < max_retries - 1:
+                if not budget.try_spend():
+                    break
+                await asyncio.sleep(backoff_delay(
+                    attempt,
+                    base_delay=initial_delay,
+                    max_delay=initial_delay * backoff_multiplier ** max_retries,
+                    multiplier=backoff_multiplier,
+                ))
+
+    return TaskResult(success=False, error=last_error)
+
+
+# =============================================================================
+# Step graphs (thread-based dependency DAGs)
+# =============================================================================
+
+# Worker threads shared by all step graphs
+_MAX_STEP_WORKERS = 8
+
+_step_executor: Optional[ThreadPoolExecutor] = None
+_step_executor_lock = threading.Lock()
+
+
+def _get_step_executor() -> ThreadPoolExecutor:
+    global _step_executor
+    if _step_executor is None:
+        with _step_executor_lock:
+            if _step_executor is None:
+                _step_executor = ThreadPoolExecutor(
+                    max_workers=_MAX_STEP_WORKERS,
+                    thread_name_prefix="pipeline-step",
+                )
+    return _step_executor
+
+
+@dataclass
+class StepTiming:
+    """Wall-clock timing of one step in a step graph run."""
+
+    name: str
+    started_ms: float  # offset from the start of the run
+    duration_ms: float
+    depends_on: tuple[str, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "step": self.name,
+            "started_ms": round(self.started_ms, 2),
+            "duration_ms": round(self.duration_ms, 2),
+            "depends_on": list(self.depends_on),
+        }
+
+
+@dataclass
+class _Step:
+    name: str
+    func: Callable[[dict[str, Any]], Any]
+    depends_on: tuple[str, ...]
+
+
+class StepGraph:
+    """A dependency DAG of synchronous steps run on a shared thread pool.
+
+    Each step is a callable taking the results of the steps run so far
+    (a dict keyed by step name; only its dependencies are guaranteed to
+    be present) and returning its own result.  Steps must be added after
+    their dependencies, so the graph is acyclic by construction.
+
+    ``run`` starts every step as soon as its dependencies have finished,
+    so wall time follows the critical path rather than the sum of steps.
+    Steps must not mutate objects that a concurrently running step reads.
+
+    Example::
+
+        graph = StepGraph()
+        graph.add("policies", lambda r: get_policies())
+        graph.add("cases", lambda r: find_cases())
+        graph.add("report", lambda r: build(r["policies"], r["cases"]),
+                  depends_on=["policies", "cases"])
+        results, timings = graph.run()
+    """
+
+    def __init__(self) -> None:
+        self._steps: dict[str, _Step] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[dict[str, Any]], Any],
+        depends_on: Optional[list[str]] = None,
+    ) -> None:
+        """Add a step that runs after ``depends_on``."""
+        if name in self._steps:
+            raise ValueError(f"Duplicate step: {name}")
+        missing = [d for d in depends_on or [] if d not in self._steps]
+        if missing:
+            raise ValueError(f"Step {name} depends on unknown steps: {missing}")
+        self._steps[name] = _Step(name, func, tuple(depends_on or []))
+
+    def run(self) -> tuple[dict[str, Any], list[StepTiming]]:
+        """Run all steps; returns (results by step name, timings in start order).
+
+        The first step to raise stops further steps from starting; steps
+        already running are waited for, then the exception is re-raised.
+        """
+        results: dict[str, Any] = {}
+        timings: list[StepTiming] = []
+        waiting = {name: set(step.depends_on) for name, step in self._steps.items()}
+        dependents: dict[str, list[str]] = {name: [] for name in self._steps}
+        for step in self._steps.values():
+            for dependency in step.depends_on:
+                dependents[dependency].append(step.name)
+
+        ready = [name for name, deps in waiting.items() if not deps]
+        running: dict[Future, str] = {}
+        run_start = time.perf_counter()
+        executor = _get_step_executor()
+        error: Optional[BaseException] = None
+
+        def timed(step: _Step, results_view: dict[str, Any]) -> tuple[Any, float, float]:
+            started = time.perf_counter()
+            value = step.func(results_view)
+            return value, started, time.perf_counter()
+
+        def finish(name: str, outcome: tuple[Any, float, float]) -> None:
+            value, started, ended = outcome
+            results[name] = value
+            timings.append(StepTiming(
+                name=name,
+                started_ms=(started - run_start) * 1000,
+                duration_ms=(ended - started) * 1000,
+                depends_on=self._steps[name].depends_on,
+            ))
+            for dependent in dependents[name]:
+                waiting[dependent].discard(name)
+                if not waiting[dependent]:
+                    ready.append(dependent)
+
+        while (ready or running) and error is None:
+            # A lone ready step with nothing else in flight runs inline,
+            # saving a thread hand-off on the sequential parts of the graph
+            if len(ready) == 1 and not running:
+                name = ready.pop()
+                try:
+                    finish(name, timed(self._steps[name], dict(results)))
+                except Exception as e:
+                    error = e
+                continue
+
+            for name in ready:
+                context = contextvars.copy_context()
+                future = executor.submit(context.run, timed, self._steps[name], dict(results))
+                running[future] = name
+            ready.clear()
+
+            done, _pending = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    finish(name, future.result())
+                except Exception as e:
+                    error = error or e
+
+        if error is not None:
+            wait(running)
+            raise error
+
+        timings.sort(key=lambda t: t.started_ms)
+        return results, timings
+
+
+def critical_path(timings: list[StepTiming]) -> tuple[float, list[str]]:
+    """The longest chain of dependent step durations in a run.
+
+    Returns:
+        Tuple of (total duration in ms, step names along the path)
+    """
+    best: dict[str, tuple[float, list[str]]] = {}
+    for timing in sorted(timings, key=lambda t: t.started_ms):
+        longest: tuple[float, list[str]] = (0.0, [])
+        for dependency in timing.depends_on:
+            if dependency in best and best[dependency][0] > longest[0]:
+                longest = best[dependency]
+        best[timing.name] = (longest[0] + timing.duration_ms, longest[1] + [timing.name])
+    if not best:
+        return 0.0, []
+    return max(best.values(), key=lambda entry: entry[0])
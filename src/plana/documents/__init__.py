@@ -21,11 +21,15 @@ from plana.documents.ingestion import (
     _reclassify_from_content,
 )
 from plana.documents.processor import (
+    DocumentSignals,
     DrawingMetadata,
+    PlanSetLegs,
     check_plan_set_present,
     detect_scanned_pdf,
+    document_signals,
     extract_drawing_metadata,
     is_plan_or_drawing_heuristic,
+    stored_plan_set_legs,
 )
 
 __all__ = [
@@ -33,19 +37,23 @@ __all__ = [
     "ApplicationDocument",
     "DocumentCategory",
     "DocumentIngestionResult",
+    "DocumentSignals",
     "DrawingMetadata",
     "ExtractedPlanningFacts",
     "ExtractionStatus",
     "MaterialInfoItem",
+    "PlanSetLegs",
     "ProcessedDocument",
     "check_plan_set_present",
     "classify_document",
     "detect_scanned_pdf",
+    "document_signals",
     "extract_drawing_metadata",
     "extract_material_info",
     "extract_planning_facts",
     "flag_external_references",
     "is_plan_or_drawing_heuristic",
     "process_documents",
+    "stored_plan_set_legs",
     "_reclassify_from_content",
 ]
@@ -24,6 +24,12 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from plana.core.logging import get_logger
+from plana.documents.report_prebuild import (
+    cancel_report_prebuilds,
+    get_prebuild_stats,
+    queue_drained,
+    schedule_report_prebuild,
+)
 from plana.storage.database import Database, get_database
 
 logger = get_logger(__name__)
@@ -76,6 +82,7 @@ def get_worker_stats() -> dict:
         **_stats,
         "alive": task_alive,  # override with actual task state
         "queue_length": queue_length,
+        "report_prebuild": get_prebuild_stats(),
     }
 
 
@@ -165,6 +172,19 @@ async def _worker_loop() -> None:
                 reference=doc.reference,
             )
 
+            # Last document of the reference done: pre-generate its report
+            # (debounced) so the first poll does not wait for the build.
+            try:
+                counts = await asyncio.to_thread(db.get_processing_counts, doc.reference)
+                if queue_drained(counts):
+                    schedule_report_prebuild(doc.reference, db)
+            except Exception as exc:
+                logger.warning(
+                    "report_prebuild_schedule_error",
+                    reference=doc.reference,
+                    error=str(exc),
+                )
+
         except asyncio.CancelledError:
             logger.info("background_worker_stopping")
             break
@@ -239,6 +259,7 @@ async def stop_background_worker() -> None:
     except asyncio.CancelledError:
         pass
     _worker_task = None
+    await cancel_report_prebuilds()
 
 
 async def kick_queue() -> dict:
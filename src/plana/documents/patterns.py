@@ -0,0 +1,327 @@
+r"""
+Shared registry of precompiled document fact patterns.
+
+Fact extraction (planning facts, material information, document analysis,
+dimensions, classification) is driven by ordered rule sets of regexes:
+the first rule that matches anywhere in the text wins.  Rule sets are
+declared once as ``RuleSet`` objects, which compile their patterns at
+import time and register themselves here by name.
+
+``scan_document`` normalises a document's text once and returns a
+``DocumentScan`` shared by every consumer of that text.  Each distinct
+pattern is searched at most once per text, whichever rule sets use it,
+and its hit (with document and offset) is remembered, so several fields,
+several extractors or several passes over the same documents do not
+lowercase or re-search the same text again.
+
+Patterns are not merged into one big alternation: a merged search cannot
+answer "first rule in order", and the stdlib ``re`` engine loses its
+per-pattern prefix skipping on one.  Instead each pattern is compiled
+with the literal substrings any match must contain, and a cheap
+substring test rules the pattern out before the regex runs.  The
+literals come from CPython's (private) regex parser; on an interpreter
+where it cannot be imported or its output is not understood, patterns
+simply get no pre-check.
+
+Usage::
+
+    RIDGE = RuleSet("example.ridge", [
+        (r"ridge\s*height[:\s]*(\d+(?:\.\d+)?)\s*m", "ridge"),
+        (r"(\d+(?:\.\d+)?)\s*m\s*to\s*ridge", "ridge"),
+    ])
+
+    hit = scan_document(text, document="Proposed elevations").first(RIDGE)
+    if hit:
+        print(hit.value, hit.document, hit.offset)
+"""
+
+import importlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional, Union
+
+# CPython's regex parser ("sre_parse" before 3.11), used only to find the
+# literals a pattern requires; without it there is no substring pre-check
+_sre_parse: Any = None
+_sre_constants: Any = None
+for _parser_name, _constants_name in (("re._parser", "re._constants"), ("sre_parse", "sre_constants")):
+    try:
+        _sre_parse = importlib.import_module(_parser_name)
+        _sre_constants = importlib.import_module(_constants_name)
+        break
+    except ImportError:
+        _sre_parse = _sre_constants = None
+
+# Scans of recently seen document texts, shared across consumers.  Each
+# entry holds the text and its normalised copy, so keep this modest.
+_SCAN_CACHE_SIZE = 32
+_scan_cache: "OrderedDict[str, _TextScan]" = OrderedDict()
+_scan_cache_lock = threading.Lock()
+
+_registry: dict[str, "RuleSet"] = {}
+_compiled: dict[tuple[str, int], "_CompiledPattern"] = {}
+_registry_lock = threading.Lock()
+
+# Shortest literal worth a substring pre-check
+_MIN_LITERAL = 2
+
+
+def normalise_text(text: str) -> str:
+    """The form of document text that rule sets are matched against."""
+    return text.lower()
+
+
+def _walk_requirements(items) -> list[tuple[str, ...]]:
+    """Substring requirements of a parsed pattern sequence.
+
+    Each requirement is a tuple of literals of which at least one must
+    occur in any match.  Runs of consecutive, non-optional literal
+    characters give single-literal requirements; a required alternation
+    whose every branch has a literal gives a multi-literal one.  Anything
+    the walk does not understand just ends the current run, so the
+    result is always safe (possibly empty).
+    """
+    requirements: list[tuple[str, ...]] = []
+    current: list[str] = []
+
+    def flush() -> None:
+        if len(current) >= _MIN_LITERAL:
+            requirements.append(("".join(current),))
+        current.clear()
+
+    def walk(items) -> None:
+        for op, av in items:
+            if op is _sre_constants.LITERAL:
+                current.append(chr(av))
+            elif op is _sre_constants.AT:
+                continue  # Zero-width anchors do not break a run
+            elif op is _sre_constants.SUBPATTERN and not av[1] & re.IGNORECASE:
+                walk(av[-1])
+            elif op in (_sre_constants.MAX_REPEAT, _sre_constants.MIN_REPEAT) and av[0] >= 1:
+                flush()
+                walk(av[2])
+                flush()
+            elif op is _sre_constants.BRANCH:
+                flush()
+                choices = []
+                for branch in av[1]:
+                    singles = [r[0] for r in _walk_requirements(branch) if len(r) == 1]
+                    if not singles:
+                        break
+                    choices.append(max(singles, key=len))
+                else:
+                    requirements.append(tuple(choices))
+            else:
+                flush()
+
+    walk(items)
+    flush()
+    return requirements
+
+
+def _required_literals(regex: re.Pattern) -> tuple[tuple[str, ...], ...]:
+    """Substrings (as sets of alternatives) every match of ``regex`` contains."""
+    if _sre_parse is None or regex.flags & (re.IGNORECASE | re.LOCALE):
+        return ()
+    try:
+        return tuple(_walk_requirements(_sre_parse.parse(regex.pattern, regex.flags)))
+    except Exception:
+        return ()  # Parser output this walk does not understand
+
+
+class _CompiledPattern:
+    """A compiled pattern plus the literals that must be present to match."""
+
+    __slots__ = ("regex", "literals")
+
+    def __init__(self, pattern: str, flags: int):
+        self.regex = re.compile(pattern, flags)
+        self.literals = _required_literals(self.regex)
+
+    def search(self, text: str) -> Optional[re.Match]:
+        for choices in self.literals:
+            if not any(literal in text for literal in choices):
+                return None
+        return self.regex.search(text)
+
+
+def _compile(pattern: str, flags: int) -> _CompiledPattern:
+    key = (pattern, flags)
+    with _registry_lock:
+        compiled = _compiled.get(key)
+        if compiled is None:
+            compiled = _compiled[key] = _CompiledPattern(pattern, flags)
+    return compiled
+
+
+@dataclass(frozen=True)
+class PatternHit:
+    """The leftmost match of one rule in one document."""
+
+    field: str  # Rule set name
+    rule: int  # Index of the rule within its set
+    label: Any
+    groups: tuple[Optional[str], ...]
+    match_text: str
+    offset: int  # Offset into the normalised text
+    document: str = ""
+
+    @property
+    def value(self) -> Optional[str]:
+        """The first capture group (None for rules without one)."""
+        return self.groups[0] if self.groups else None
+
+
+class RuleSet:
+    """An ordered, precompiled list of ``(pattern, label)`` rules.
+
+    Rules may also be given as bare patterns (label ``None``).  The set
+    registers itself under ``name``; re-declaring a name (e.g. when a
+    module is reloaded) replaces the earlier set.
+    """
+
+    def __init__(self, name: str, rules: Iterable[Union[str, tuple[str, Any]]], flags: int = 0):
+        self.name = name
+        self._patterns: list[_CompiledPattern] = []
+        self.labels: list[Any] = []
+        for rule in rules:
+            pattern, label = (rule, None) if isinstance(rule, str) else rule
+            self._patterns.append(_compile(pattern, flags))
+            self.labels.append(label)
+        with _registry_lock:
+            _registry[name] = self
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def __repr__(self) -> str:
+        return f"RuleSet({self.name!r}, {len(self)} rules)"
+
+    @property
+    def rules(self) -> list[tuple[re.Pattern, Any]]:
+        """``(compiled regex, label)`` pairs in rule order."""
+        return [(compiled.regex, label) for compiled, label in zip(self._patterns, self.labels)]
+
+    def _hit(self, index: int, match: re.Match, document: str) -> PatternHit:
+        return PatternHit(
+            field=self.name,
+            rule=index,
+            label=self.labels[index],
+            groups=match.groups(),
+            match_text=match.group(0),
+            offset=match.start(),
+            document=document,
+        )
+
+    def first(self, text: str) -> Optional[PatternHit]:
+        """First rule (in order) matching short, already-normalised text.
+
+        Uncached; for titles, filenames and other short strings.  Use
+        ``scan_document`` for document text.
+        """
+        for index, compiled in enumerate(self._patterns):
+            match = compiled.search(text)
+            if match is not None:
+                return self._hit(index, match, "")
+        return None
+
+
+def get_rule_set(name: str) -> RuleSet:
+    """Registered rule set by name."""
+    return _registry[name]
+
+
+def registered_rule_sets() -> list[RuleSet]:
+    """All registered rule sets, in registration order."""
+    with _registry_lock:
+        return list(_registry.values())
+
+
+class _TextScan:
+    """Normalised text and memoised pattern matches, shared by all views of it."""
+
+    def __init__(self, text: str):
+        self.text = normalise_text(text)
+        self.matches: dict[_CompiledPattern, Optional[re.Match]] = {}
+        self.lock = threading.Lock()
+
+    def match(self, compiled: _CompiledPattern) -> Optional[re.Match]:
+        with self.lock:
+            if compiled in self.matches:
+                return self.matches[compiled]
+        match = compiled.search(self.text)
+        with self.lock:
+            self.matches[compiled] = match
+        return match
+
+
+class DocumentScan:
+    """Rule hits over one document's normalised text.
+
+    Patterns are searched lazily, at most once each per text, so asking
+    for the first hit of a rule set costs no more than a loop over its
+    rules, and asking again (or from another consumer) costs nothing.
+    """
+
+    def __init__(self, text: str, document: str = "", _shared: Optional[_TextScan] = None):
+        self._shared = _shared or _TextScan(text)
+        self.document = document
+
+    @property
+    def text(self) -> str:
+        """The normalised text."""
+        return self._shared.text
+
+    def rule_hit(self, rule_set: RuleSet, index: int) -> Optional[PatternHit]:
+        """Hit for one rule, or None."""
+        match = self._shared.match(rule_set._patterns[index])
+        if match is None:
+            return None
+        return rule_set._hit(index, match, self.document)
+
+    def iter_hits(self, rule_set: RuleSet) -> Iterator[PatternHit]:
+        """Hits of a rule set in rule order, searching only as far as consumed."""
+        for index in range(len(rule_set)):
+            hit = self.rule_hit(rule_set, index)
+            if hit is not None:
+                yield hit
+
+    def first(self, rule_set: RuleSet) -> Optional[PatternHit]:
+        """Hit of the first matching rule, or None."""
+        return next(self.iter_hits(rule_set), None)
+
+    def hits(self, rule_sets: Optional[Iterable[RuleSet]] = None) -> list[PatternHit]:
+        """Every rule hit for the given (default: all registered) rule sets."""
+        found: list[PatternHit] = []
+        for rule_set in registered_rule_sets() if rule_sets is None else rule_sets:
+            found.extend(self.iter_hits(rule_set))
+        return found
+
+
+def scan_document(text: str, document: str = "") -> DocumentScan:
+    """Scan of a document's text, normalised once and shared by text."""
+    with _scan_cache_lock:
+        shared = _scan_cache.get(text)
+        if shared is not None:
+            _scan_cache.move_to_end(text)
+    if shared is None:
+        shared = _TextScan(text)
+        with _scan_cache_lock:
+            _scan_cache[text] = shared
+            while len(_scan_cache) > _SCAN_CACHE_SIZE:
+                _scan_cache.popitem(last=False)
+    return DocumentScan(text, document, _shared=shared)
+
+
+def first_hit_in(
+    scans: Iterable[DocumentScan],
+    rule_set: RuleSet,
+) -> Optional[PatternHit]:
+    """First hit of ``rule_set`` in the first document that has one."""
+    for scan in scans:
+        hit = scan.first(rule_set)
+        if hit is not None:
+            return hit
+    return None
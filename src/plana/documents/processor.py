@@ -21,6 +21,7 @@ The processor also computes per-document flags:
 import json
 import re
 from dataclasses import dataclass
+from enum import IntFlag
 from pathlib import Path
 from typing import List, Optional
 
@@ -435,30 +436,28 @@ def extract_drawing_metadata(
 
 # ---- Plan Set Presence Check ----
 
-def check_plan_set_present(
+class PlanSetLegs(IntFlag):
+    """The legs of a minimal plan set found so far (see ``check_plan_set_present``)."""
+
+    NONE = 0
+    LOCATION = 1  # location plan OR block plan
+    SITE = 2      # site plan
+    DETAIL = 4    # elevations OR floor plans OR sections
+    ALL = 7
+
+
+def plan_set_legs(
     categories: List[DocumentCategory],
     metadata_guesses: Optional[List[str]] = None,
     filenames: Optional[List[str]] = None,
     all_detected_labels: Optional[List[str]] = None,
-) -> bool:
-    """Determine if a minimal plan set is present.
-
-    A plan set requires **all three legs**:
-
-    1. **Location leg** — at least one of: location plan OR block plan
-    2. **Site leg** — at least one: site plan
-    3. **Detail leg** — at least one of: elevations OR floor plans OR sections
-
-    Detection uses (in priority order):
+) -> PlanSetLegs:
+    """Plan set legs evidenced by the given document signals.
 
-    1. Classified ``DocumentCategory`` values
-    2. ``extracted_metadata_json.document_type_guess`` values
-    3. Filename heuristics
-    4. ``detected_labels`` from text-content / OCR analysis
+    Each signal adds legs independently, so the legs of a set of
+    documents are the union of each document's legs.
     """
-    has_location = False   # location plan OR block plan
-    has_site = False       # site plan
-    has_detail = False     # elevations OR floor plans OR sections
+    legs = PlanSetLegs.NONE
 
     # --- Check from categories ---
     location_cats = {DocumentCategory.LOCATION_PLAN, DocumentCategory.BLOCK_PLAN}
@@ -471,28 +470,28 @@ def check_plan_set_present(
 
     for cat in categories:
         if cat in location_cats:
-            has_location = True
+            legs |= PlanSetLegs.LOCATION
         if cat in site_cats:
-            has_site = True
+            legs |= PlanSetLegs.SITE
         if cat in detail_cats:
-            has_detail = True
+            legs |= PlanSetLegs.DETAIL
 
-    if has_location and has_site and has_detail:
-        return True
+    if legs == PlanSetLegs.ALL:
+        return legs
 
     # --- Check from metadata guesses ---
     if metadata_guesses:
         for guess in metadata_guesses:
             g = guess.lower()
             if g in ("location plan", "block plan"):
-                has_location = True
+                legs |= PlanSetLegs.LOCATION
             if g == "site plan":
-                has_site = True
+                legs |= PlanSetLegs.SITE
             if g in ("elevations", "elevation", "floor plan", "sections"):
-                has_detail = True
+                legs |= PlanSetLegs.DETAIL
 
-    if has_location and has_site and has_detail:
-        return True
+    if legs == PlanSetLegs.ALL:
+        return legs
 
     # --- Check from filenames ---
     if filenames:
@@ -503,26 +502,169 @@ def check_plan_set_present(
             fn_lower = fn.lower()
             for pat in location_patterns:
                 if re.search(pat, fn_lower):
-                    has_location = True
+                    legs |= PlanSetLegs.LOCATION
             for pat in site_patterns:
                 if re.search(pat, fn_lower):
-                    has_site = True
+                    legs |= PlanSetLegs.SITE
             for pat in detail_patterns:
                 if re.search(pat, fn_lower):
-                    has_detail = True
+                    legs |= PlanSetLegs.DETAIL
 
-    if has_location and has_site and has_detail:
-        return True
+    if legs == PlanSetLegs.ALL:
+        return legs
 
     # --- Check from detected labels (text-content / OCR analysis) ---
     if all_detected_labels:
         for label in all_detected_labels:
             lbl = label.lower()
             if lbl in ("location plan", "block plan"):
-                has_location = True
+                legs |= PlanSetLegs.LOCATION
             if lbl == "site plan":
-                has_site = True
+                legs |= PlanSetLegs.SITE
             if lbl in ("elevations", "floor plan", "sections"):
-                has_detail = True
+                legs |= PlanSetLegs.DETAIL
+
+    return legs
+
+
+def check_plan_set_present(
+    categories: List[DocumentCategory],
+    metadata_guesses: Optional[List[str]] = None,
+    filenames: Optional[List[str]] = None,
+    all_detected_labels: Optional[List[str]] = None,
+) -> bool:
+    """Determine if a minimal plan set is present.
+
+    A plan set requires **all three legs**:
+
+    1. **Location leg** — at least one of: location plan OR block plan
+    2. **Site leg** — at least one: site plan
+    3. **Detail leg** — at least one of: elevations OR floor plans OR sections
+
+    Detection uses (in priority order):
+
+    1. Classified ``DocumentCategory`` values
+    2. ``extracted_metadata_json.document_type_guess`` values
+    3. Filename heuristics
+    4. ``detected_labels`` from text-content / OCR analysis
+    """
+    legs = plan_set_legs(categories, metadata_guesses, filenames, all_detected_labels)
+    return legs == PlanSetLegs.ALL
+
+
+# ---- Stored Document Signals ----
+
+# Bump when classification rules or plan set signals change, so signals
+# stored by an older version are recomputed rather than trusted.
+SIGNALS_VERSION = 1
+
 
-    return has_location and has_site and has_detail
+@dataclass
+class DocumentSignals:
+    """Classification and plan set signals of one stored document."""
+
+    category: DocumentCategory
+    confidence: float
+    document_type_guess: str
+    plan_set_legs: PlanSetLegs
+
+    def columns(self) -> dict:
+        """The signals as ``documents`` column values."""
+        return {
+            "category": self.category.value,
+            "category_confidence": self.confidence,
+            "document_type_guess": self.document_type_guess,
+            "plan_set_legs": int(self.plan_set_legs),
+        }
+
+
+def document_signals(
+    title: str,
+    doc_type: str = "",
+    url: str = "",
+    metadata_json: Optional[str] = None,
+) -> DocumentSignals:
+    """Signals of a stored document, as persisted by the worker.
+
+    ``category`` is the classification the worker uses (title, declared
+    type and the filename from the URL).  The plan set legs keep the
+    signals plan set checks have always used for stored documents: the
+    title-only classification, the title as filename, and the
+    ``document_type_guess`` and ``detected_labels`` from the drawing
+    metadata.
+    """
+    title = title or ""
+    doc_type = doc_type or ""
+    filename = title
+    if url:
+        filename = url.rsplit("/", 1)[-1] or title
+    category, confidence = classify_document(title, doc_type, filename)
+
+    guess = ""
+    labels: list[str] = []
+    if metadata_json:
+        try:
+            meta = json.loads(metadata_json)
+            guess = meta.get("document_type_guess", "") or ""
+            labels = meta.get("detected_labels", []) or []
+        except (ValueError, TypeError, AttributeError):
+            pass
+
+    title_category = category if filename == title else classify_document(title, doc_type, title)[0]
+    legs = plan_set_legs(
+        categories=[title_category],
+        metadata_guesses=[guess] if guess else None,
+        filenames=[title] if title else None,
+        all_detected_labels=labels or None,
+    )
+    return DocumentSignals(category, confidence, guess, legs)
+
+
+def stored_document_plan_set_legs(doc) -> PlanSetLegs:
+    """Plan set legs of a ``StoredDocument``, from its stored signals if current."""
+    if getattr(doc, "signals_version", None) == SIGNALS_VERSION and doc.plan_set_legs is not None:
+        return PlanSetLegs(doc.plan_set_legs)
+    return document_signals(
+        doc.title, doc.doc_type, doc.url, doc.extracted_metadata_json,
+    ).plan_set_legs
+
+
+def stored_plan_set_legs(db, reference: str) -> PlanSetLegs:
+    """Plan set legs of an application's stored documents.
+
+    Normally a single read of the per-document legs the worker stored.
+    Documents without current signals (not yet processed, failed, reset
+    or stored by an older version) have theirs computed and saved first.
+
+    Args:
+        db: ``Database`` holding the documents
+        reference: Application reference
+
+    Returns:
+        Union of the documents' plan set legs
+    """
+    legs = db.get_plan_set_legs(reference, SIGNALS_VERSION)
+    if legs is not None:
+        return PlanSetLegs(legs)
+
+    db.update_document_signals(
+        reference,
+        [
+            {
+                "doc_id": row["doc_id"],
+                **document_signals(
+                    row["title"], row["doc_type"], row["url"], row["extracted_metadata_json"],
+                ).columns(),
+            }
+            for row in db.get_unsignalled_documents(reference, SIGNALS_VERSION)
+        ],
+        SIGNALS_VERSION,
+    )
+
+    legs = db.get_plan_set_legs(reference, SIGNALS_VERSION)
+    if legs is None:
+        # Documents changed under us; fall back to the rows themselves
+        legs = PlanSetLegs.NONE
+        for doc in db.get_documents(reference):
+            legs |= stored_document_plan_set_legs(doc)
+    return PlanSetLegs(legs)
@@ -8,6 +8,7 @@ and marks them ``processed`` or ``failed``.
 Run standalone:
     python -m plana.documents.worker          # one-shot (process all then exit)
     python -m plana.documents.worker --loop    # poll continuously
+    python -m plana.documents.worker --loop --prebuild-reports
 
 The worker is designed to be safe for a single instance.  For multi-
 instance deployments, ``claim_queued_document()`` uses an atomic SQL
@@ -22,12 +23,15 @@ from pathlib import Path
 from typing import Optional
 
 from plana.core.logging import get_logger
+from plana.core.resilience import get_host_policy
 from plana.documents.ingestion import (
     ExtractionStatus,
     classify_document,
 )
 from plana.documents.processor import (
+    SIGNALS_VERSION,
     detect_scanned_pdf,
+    document_signals,
     extract_drawing_metadata,
     is_plan_or_drawing_heuristic,
 )
@@ -189,8 +193,13 @@ def _download_document(url: str, dest_dir: Path, filename: str) -> Optional[Path
                 "Accept": "application/pdf,*/*",
             },
         ) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
+            def fetch():
+                response = client.get(url)
+                response.raise_for_status()
+                return response
+
+            # Shares the host's rate limit and breaker with the portal adapter
+            resp = get_host_policy(url).call_sync(fetch)
             dest_path.write_bytes(resp.content)
             logger.info(
                 "doc_downloaded",
@@ -319,6 +328,23 @@ def process_one(doc: StoredDocument, db: Database) -> None:
 
         has_signal = bool(text) or bool(metadata_json) or plan_drawing
 
+        # ---- Structured extraction (stored per content hash so report
+        # generation does not re-scan the text) ----
+        if text:
+            try:
+                from plana.api.document_analysis import precompute_extraction
+                precompute_extraction(text, doc.doc_type or "other", store=db)
+            except Exception as exc:
+                logger.warning(
+                    "doc_extraction_precompute_failed",
+                    document_id=doc_id,
+                    error=str(exc),
+                )
+
+        # ---- Classification / plan set signals (stored so plan set
+        # checks do not reclassify every document on each read) ----
+        signals = document_signals(doc.title, doc.doc_type, doc.url, metadata_json)
+
         # ---- Mark processed ----
         db.mark_document_processed(
             doc_id,
@@ -329,6 +355,8 @@ def process_one(doc: StoredDocument, db: Database) -> None:
             is_plan_or_drawing=plan_drawing,
             is_scanned=scanned,
             has_any_content_signal=has_signal,
+            signals=signals.columns(),
+            signals_version=SIGNALS_VERSION,
         )
         elapsed_ms = round((time.monotonic() - t_start) * 1000, 1)
         logger.info(
@@ -398,14 +426,22 @@ def drain_queue(db: Optional[Database] = None) -> int:
     return processed
 
 
-def run_loop(poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+def run_loop(
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    prebuild: bool = False,
+) -> None:
     """Run the worker in a continuous polling loop.
 
+    With ``prebuild``, the reports of references whose documents have
+    all been processed are built whenever the queue runs dry, into the
+    report cache shared with the API.
+
     Ctrl-C or SIGTERM will exit gracefully.
     """
     db = Database()
     running = True
     total_processed = 0
+    drained: list[str] = []
 
     def _stop(signum, frame):
         nonlocal running
@@ -420,10 +456,21 @@ def run_loop(poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
     while running:
         doc = db.claim_queued_document()
         if doc is None:
+            if drained:
+                from plana.documents.report_prebuild import prebuild_reports
+
+                prebuild_reports(drained, db)
+                drained.clear()
+                continue
             time.sleep(poll_interval)
             continue
         process_one(doc, db)
         total_processed += 1
+        if prebuild and doc.reference not in drained:
+            from plana.documents.report_prebuild import queue_drained
+
+            if queue_drained(db.get_processing_counts(doc.reference)):
+                drained.append(doc.reference)
 
 
 def main() -> None:
@@ -442,10 +489,16 @@ def main() -> None:
         default=DEFAULT_POLL_INTERVAL,
         help=f"Poll interval in seconds (default: {DEFAULT_POLL_INTERVAL})",
     )
+    parser.add_argument(
+        "--prebuild-reports",
+        action="store_true",
+        help="With --loop, build the reports of fully processed "
+             "applications into the report cache shared with the API.",
+    )
     args = parser.parse_args()
 
     if args.loop:
-        run_loop(poll_interval=args.interval)
+        run_loop(poll_interval=args.interval, prebuild=args.prebuild_reports)
     else:
         count = drain_queue()
         logger.info("worker_drained", processed=count)
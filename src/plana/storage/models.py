@@ -59,6 +59,7 @@ class StoredDocument:
     url: str = ""
     local_path: Optional[str] = None
     content_hash: Optional[str] = None
+    etag: Optional[str] = None  # Portal ETag, for conditional re-downloads
     size_bytes: Optional[int] = None
     content_type: Optional[str] = None
     mime_type: str = ""
@@ -81,6 +82,13 @@ class StoredDocument:
     updated_at: Optional[str] = None
     claimed_at: Optional[str] = None
     claimed_by_pid: Optional[int] = None
+    # Classification and plan set signals stored at processing time
+    # (see plana.documents.processor.document_signals)
+    category: Optional[str] = None
+    category_confidence: Optional[float] = None
+    document_type_guess: Optional[str] = None
+    plan_set_legs: Optional[int] = None
+    signals_version: Optional[int] = None
 
 
 @dataclass
@@ -249,6 +249,11 @@ def reset_singletons():
     import plana.core.cache as cache_module
     cache_module._policy_cache = None
     cache_module._similarity_cache = None
+    cache_module._tiered_caches.clear()
+
+    # Reset per-host rate limits, retry budget and circuit breakers
+    from plana.core.resilience import reset_host_policies
+    reset_host_policies()
 
     # Reset settings cache
     from plana.config.settings import get_settings
@@ -0,0 +1,200 @@
+"""
+A local stand-in for the Newcastle planning portal.
+
+Serves synthetic applications in the portal's page layout (the session
+page, the search form POST with result pages, and the "View" pages) from
+a thread, so the adapter and the backfill crawler can be exercised
+offline and benchmarked without touching the real portal:
+
+    with PortalStandIn(applications=500, latency=0.05) as portal:
+        adapter = NewcastleAdapter(base_url=portal.url)
+"""
+
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+
+_KINDS = ["HOU", "DET", "TPO", "LBC", "DCC", "CPE", "TCA", "ADV"]
+_DECISIONS = [("Granted", "Grant Consent"), ("Refused", "Refuse Consent")]
+_FORM_DATE = "%d/%m/%Y"
+
+
+class PortalStandIn:
+    """A threaded HTTP server imitating the planning portal."""
+
+    def __init__(
+        self,
+        applications: int = 100,
+        start: date = date(2024, 1, 1),
+        days: int = 365,
+        page_size: int = 10,
+        latency: float = 0.0,
+        failing_ids: Optional[set] = None,
+    ):
+        """Generate the applications.
+
+        Args:
+            applications: Number of decided applications
+            start: First decision date
+            days: Decisions are spread evenly over this many days
+            page_size: Result rows per search page
+            latency: Seconds each response is delayed
+            failing_ids: Portal ids whose view page answers 503
+        """
+        self.page_size = page_size
+        self.latency = latency
+        self.failing_ids = set(failing_ids or ())
+        self.requests: Counter = Counter()
+        self._lock = threading.Lock()
+        self.applications = {}
+        for i in range(applications):
+            decided = start + timedelta(days=(i * days) // max(applications, 1))
+            status, decision = _DECISIONS[i % 3 == 2]
+            portal_id = str(400000 + i)
+            self.applications[portal_id] = {
+                "id": portal_id,
+                "reference": f"{decided.year}/{i:04d}/01/{_KINDS[i % len(_KINDS)]}",
+                "address": f"{i + 1} Osborne Road, Jesmond, Newcastle upon Tyne NE2 {i % 9 + 1}AH",
+                "proposal": f"Single storey rear extension ({i})",
+                "status": status,
+                "decision": decision,
+                "decided": decided,
+            }
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def decided_between(self, date_from: date, date_to: date) -> list:
+        """Applications decided in a date range, in listing order."""
+        return [a for a in self.applications.values() if date_from <= a["decided"] <= date_to]
+
+    def start(self) -> "PortalStandIn":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "PortalStandIn":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _count(self, kind: str) -> None:
+        with self._lock:
+            self.requests[kind] += 1
+
+    # ---- Pages ----
+
+    @staticmethod
+    def _page(title: str, body: str) -> str:
+        return (
+            f"<!DOCTYPE html><html><head><title>{title}</title></head><body>"
+            f'<form method="post" action="/planning/index.html"></form>{body}</body></html>'
+        )
+
+    def _results(self, params: dict) -> str:
+        reference = params.get("application_reference_number", "")
+        if reference:
+            rows = [a for a in self.applications.values() if a["reference"] == reference.upper()]
+            page, more = rows, False
+        else:
+            date_from = datetime.strptime(params["decision_issued_date_from"], _FORM_DATE).date()
+            date_to = datetime.strptime(params["decision_issued_date_to"], _FORM_DATE).date()
+            number = int(params.get("page", 1))
+            rows = self.decided_between(date_from, date_to)
+            page = rows[(number - 1) * self.page_size:number * self.page_size]
+            more = number * self.page_size < len(rows)
+
+        body = "<table>" + "".join(
+            f'<tr><td data-label="Application Reference">{a["reference"]}</td>'
+            f'<td data-label="Address">{a["address"]}</td>'
+            f'<td data-label="Proposal">{a["proposal"]}</td>'
+            f'<td data-label="Status">{a["status"]}</td>'
+            f'<td><button class="view_application" data-id="{a["id"]}">View</button></td></tr>'
+            for a in page
+        ) + "</table>"
+        if not page:
+            body = "<p>No results</p>"
+        if more:
+            query = {
+                "fa": "search",
+                "decision_issued_date_from": params["decision_issued_date_from"],
+                "decision_issued_date_to": params["decision_issued_date_to"],
+                "page": int(params.get("page", 1)) + 1,
+            }
+            body += f'<ul class="pagination"><li class="next"><a href="index.html?{urlencode(query)}">Next</a></li></ul>'
+        return self._page("Search Results", body)
+
+    def _details(self, application: dict) -> str:
+        decided = application["decided"].strftime(_FORM_DATE)
+        return self._page(f"Application {application['reference']}", (
+            "<table>"
+            f"<tr><th>Reference</th><td>{application['reference']}</td></tr>"
+            f"<tr><th>Site Address</th><td>{application['address']}</td></tr>"
+            f"<tr><th>Proposal</th><td>{application['proposal']}</td></tr>"
+            "<tr><th>Application Type</th><td>Householder</td></tr>"
+            f"<tr><th>Status</th><td>{application['status']}</td></tr>"
+            "<tr><th>Ward</th><td>North Jesmond</td></tr>"
+            f"<tr><th>Decision</th><td>{application['decision']}</td></tr>"
+            f"<tr><th>Decision Date</th><td>{decided}</td></tr>"
+            "</table>"
+        ))
+
+    def _handler(self):
+        portal = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def _send(self, status: int, text: str = "", headers: Optional[dict] = None) -> None:
+                if portal.latency:
+                    time.sleep(portal.latency)
+                body = text.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+                if params.get("fa") == "getApplication":
+                    portal._count("view")
+                    application = portal.applications.get(params.get("id", ""))
+                    if application is None:
+                        return self._send(404, "Not found")
+                    if application["id"] in portal.failing_ids:
+                        return self._send(503, "Service Unavailable")
+                    etag = f'"{application["id"]}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        return self._send(304)
+                    return self._send(200, portal._details(application), {"ETag": etag})
+                if params.get("fa") == "search":
+                    portal._count("results")
+                    return self._send(200, portal._results(params))
+                portal._count("session")
+                return self._send(200, portal._page("Planning", ""), {"Set-Cookie": "session=standin"})
+
+            def do_POST(self) -> None:
+                portal._count("search")
+                length = int(self.headers.get("Content-Length", 0))
+                form = parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+                return self._send(200, portal._results({k: v[0] for k, v in form.items()}))
+
+        return Handler
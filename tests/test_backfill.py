@@ -0,0 +1,153 @@
+"""
+Unit tests for the historic backfill crawler (plana.ingestion.backfill).
+
+The crawls run against tests/portal_standin.py, a local stand-in for the
+council portal.
+"""
+
+from datetime import date
+
+import pytest
+
+
+def _run(coro):
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def _adapter(portal, tmp_path):
+    """An adapter for the stand-in portal, unthrottled and with its own page cache."""
+    pytest.importorskip("httpx")
+    from plana.core.cache import SQLiteCacheTier, TieredCache
+    from plana.core.resilience import get_host_policy
+    from plana.ingestion.newcastle import NewcastleAdapter
+    from plana.ingestion.response_cache import PortalResponseCache
+
+    get_host_policy(portal.url, rate=0, base_delay=0)
+    disk = SQLiteCacheTier(tmp_path / f"pages{len(list(tmp_path.glob('pages*')))}.db")
+    cache = PortalResponseCache(TieredCache("portal_responses", ttl=3600, disk=disk))
+    return NewcastleAdapter(base_url=portal.url, response_cache=cache)
+
+
+@pytest.fixture(autouse=True)
+def _offline_postcodes(monkeypatch):
+    """Record bulk postcode lookups instead of calling postcodes.io."""
+    import plana.location.postcodes as postcodes_module
+
+    calls = []
+    monkeypatch.setattr(postcodes_module, "bulk_lookup_postcodes", lambda postcodes: calls.append(postcodes) or {})
+    return calls
+
+
+def _crawl(portal, db, tmp_path, **options):
+    from plana.ingestion.backfill import BackfillCrawler
+
+    adapter = _adapter(portal, tmp_path)
+    crawler = BackfillCrawler(adapter, db, tmp_path / "checkpoint.json", **options)
+
+    async def run():
+        try:
+            return await crawler.run(date(2024, 1, 1), date(2024, 3, 31))
+        finally:
+            await adapter.close()
+
+    return crawler, _run(run())
+
+
+class TestDecisionWindows:
+    """Tests for splitting a crawl into windows."""
+
+    def test_windows_cover_the_range(self):
+        """Test that month and week windows are contiguous and clipped to the range."""
+        from plana.ingestion.backfill import decision_windows
+
+        months = decision_windows(date(2023, 12, 15), date(2024, 2, 10), "month")
+        weeks = decision_windows(date(2024, 1, 1), date(2024, 1, 20), "week")
+
+        assert months == [
+            (date(2023, 12, 15), date(2023, 12, 31)),
+            (date(2024, 1, 1), date(2024, 1, 31)),
+            (date(2024, 2, 1), date(2024, 2, 10)),
+        ]
+        assert [w[1] for w in weeks] == [date(2024, 1, 7), date(2024, 1, 14), date(2024, 1, 20)]
+        with pytest.raises(ValueError):
+            decision_windows(date(2024, 1, 1), date(2024, 1, 2), "year")
+
+
+class TestBackfillCrawler:
+    """Tests for crawling, checkpointing and resuming."""
+
+    def test_crawl_saves_every_decision(self, test_database, tmp_path):
+        """Test that paged lists are followed and every application is saved once."""
+        from tests.portal_standin import PortalStandIn
+
+        with PortalStandIn(applications=30, days=90, page_size=4) as portal:
+            crawler, stats = _crawl(portal, test_database, tmp_path, max_concurrent=4, batch_size=5)
+            first_requests = dict(portal.requests)
+            _, again = _crawl(portal, test_database, tmp_path)
+
+        assert (stats["listed"], stats["saved"], stats["failed"]) == (30, 30, 0)
+        assert first_requests["view"] == 30
+        assert first_requests["results"] > 0  # Later pages of each list
+        assert len(crawler.checkpoint.completed) == 3
+        assert again["listed"] == 0  # Every window was already complete
+
+        stored = test_database.get_application(portal.applications["400002"]["reference"])
+        assert (stored.status, stored.decision) == ("refused", "Refuse Consent")
+        assert stored.decision_date == portal.applications["400002"]["decided"].strftime("%d/%m/%Y")
+
+    def test_interrupted_crawl_resumes(self, test_database, tmp_path, monkeypatch):
+        """Test that a crawl stopped mid-window refetches only what it had not saved."""
+        from tests.portal_standin import PortalStandIn
+
+        original = type(test_database).save_applications
+        writes = []
+
+        def failing_second_write(self, apps):
+            writes.append(len(apps))
+            if len(writes) == 2:
+                raise RuntimeError("disk full")
+            return original(self, apps)
+
+        with PortalStandIn(applications=30, days=90, page_size=4) as portal:
+            monkeypatch.setattr(type(test_database), "save_applications", failing_second_write)
+            with pytest.raises(RuntimeError):
+                _crawl(portal, test_database, tmp_path, max_concurrent=2, batch_size=3)
+            monkeypatch.setattr(type(test_database), "save_applications", original)
+
+            portal.requests.clear()
+            crawler, stats = _crawl(portal, test_database, tmp_path, max_concurrent=2, batch_size=3)
+
+        assert portal.requests["view"] == 30 - 3
+        assert stats["saved"] == 27
+        assert crawler.checkpoint.totals["saved"] == 30
+        assert all(test_database.get_application(a["reference"]) for a in portal.applications.values())
+
+    def test_failures_are_recorded(self, test_database, tmp_path):
+        """Test that an application the portal keeps failing is recorded and skipped."""
+        from tests.portal_standin import PortalStandIn
+
+        with PortalStandIn(applications=12, days=90, failing_ids={"400005"}) as portal:
+            crawler, stats = _crawl(portal, test_database, tmp_path)
+
+        reference = portal.applications["400005"]["reference"]
+        assert (stats["saved"], stats["failed"]) == (11, 1)
+        assert "temporarily unavailable" in crawler.checkpoint.failed[reference]
+        assert test_database.get_application(reference) is None
+
+    def test_postcodes_prefetched_once_per_batch(self, test_database, tmp_path, _offline_postcodes):
+        """Test that each saved batch resolves its distinct postcodes in one bulk lookup."""
+        from tests.portal_standin import PortalStandIn
+
+        with PortalStandIn(applications=12, days=90) as portal:
+            _, stats = _crawl(portal, test_database, tmp_path, batch_size=5)
+
+        saved = [test_database.get_application(a["reference"]) for a in portal.applications.values()]
+        assert stats["saved"] == 12
+        assert all(0 < len(set(call)) == len(call) <= 5 for call in _offline_postcodes)
+        assert {p for call in _offline_postcodes for p in call} == {a.postcode for a in saved if a.postcode}
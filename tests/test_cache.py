@@ -0,0 +1,241 @@
+"""
+Unit tests for the in-memory cache (plana.core.cache).
+"""
+
+import pytest
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A controllable monotonic clock for the cache module."""
+    import plana.core.cache as cache_module
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestInMemoryCache:
+    """Tests for LRU order, expiry and limits."""
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that a read refreshes an entry and the oldest unread one goes."""
+        from plana.core.cache import InMemoryCache
+
+        cache = InMemoryCache(max_size=3, shards=1)
+        for key in ("a", "b", "c"):
+            cache.set(key, key.upper())
+        assert cache.get("a") == "A"
+
+        cache.set("d", "D")
+
+        assert "b" not in cache
+        assert [cache.get(k) for k in ("a", "c", "d")] == ["A", "C", "D"]
+        assert cache.stats["evictions"] == 1
+
+    def test_entries_expire(self, clock):
+        """Test that expired entries are misses and are swept as time passes."""
+        from plana.core.cache import InMemoryCache
+
+        cache = InMemoryCache(default_ttl=10, max_size=100, shards=2)
+        cache.set("short", 1, ttl=5)
+        for i in range(20):
+            cache.set(f"k{i}", i)
+
+        clock[0] += 6
+        assert cache.get("short", "gone") == "gone"
+        assert cache.size == 20
+
+        clock[0] += 10
+        assert cache.cleanup() == 20
+        assert cache.size == 0
+        assert cache.stats["expirations"] == 21
+
+    def test_cached_none_is_a_hit(self):
+        """Test that the decorators cache None results."""
+        from plana.core.cache import cached
+
+        calls = []
+
+        @cached(ttl=60)
+        def lookup(reference):
+            calls.append(reference)
+            return None
+
+        assert lookup("2025/0001/01/DET") is None
+        assert lookup("2025/0001/01/DET") is None
+        assert calls == ["2025/0001/01/DET"]
+        assert lookup.cache.stats["hits"] == 1
+
+    def test_byte_limit(self):
+        """Test that the byte limit evicts old entries and skips oversized ones."""
+        from plana.core.cache import InMemoryCache
+
+        cache = InMemoryCache(max_size=100, max_bytes=1000, shards=1, sizer=len)
+        cache.set("a", "x" * 400)
+        cache.set("b", "x" * 400)
+        cache.set("c", "x" * 400)
+        cache.set("huge", "x" * 2000)
+
+        assert "a" not in cache and "huge" not in cache
+        assert cache.stats["bytes"] == 800
+
+
+class TestCacheKeys:
+    """Tests for structural cache keys."""
+
+    def test_keys_follow_structure(self):
+        """Test that keys ignore dict order but tell apart values that print alike."""
+        from plana.core.cache import make_cache_key
+
+        assert make_cache_key({"a": 1, "b": [1, 2]}) == make_cache_key({"b": [1, 2], "a": 1})
+        assert make_cache_key({1, 2, 3}) == make_cache_key({3, 2, 1})
+        assert make_cache_key(1) != make_cache_key("1")
+        assert make_cache_key([1]) != make_cache_key((1,))
+        assert make_cache_key(None) != make_cache_key("None")
+        assert make_cache_key(1, x=2) != make_cache_key(1, 2)
+
+
+class TestSharedCaches:
+    """Tests for the policy and similarity caches in use."""
+
+    def test_policy_search_reuses_results(self, monkeypatch):
+        """Test that a repeated search is served from the cache until the weights change."""
+        from plana.core.cache import get_policy_cache
+        from plana.policy.search import PolicySearch
+
+        weights = {}
+        monkeypatch.setattr(PolicySearch, "_load_learning_adjustments", lambda self: dict(weights))
+        args = ("Single storey rear extension", ["Conservation Area"], "Householder")
+
+        first = PolicySearch().retrieve_relevant_policies(*args)
+        first[0].score = -1.0  # Callers' changes must not leak into the cache
+        second = PolicySearch().retrieve_relevant_policies(*args)
+        assert second[0].score == 1.0
+        assert get_policy_cache().stats["hits"] >= 2  # The index and the results
+
+        weights[second[0].policy_id] = 0.5
+        third = PolicySearch().retrieve_relevant_policies(*args)
+        reduced = [p for p in third if p.policy_id == second[0].policy_id]
+        assert reduced and reduced[0].match_reason.endswith("[reduced by feedback]")
+
+    def test_similar_cases_reuse_results(self, monkeypatch):
+        """Test that a repeated similar-case search skips the ranking."""
+        from plana.api import similar_cases
+
+        calls = []
+        original = similar_cases.compile_query_features
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(similar_cases, "compile_query_features", counting)
+        args = dict(
+            proposal="Single storey rear extension", application_type="Householder",
+            constraints=["Conservation Area"], ward="South Jesmond", postcode="NE2 2QU",
+        )
+
+        first = similar_cases.find_similar_cases(**args)
+        second = similar_cases.find_similar_cases(**args)
+
+        assert second == first
+        assert len(calls) == 1
+
+
+class TestTieredCache:
+    """Tests for single-flight loading, the disk tier and stale serving."""
+
+    def test_concurrent_misses_share_one_load(self):
+        """Test that concurrent callers of a cold key run the coroutine once."""
+        import asyncio
+
+        from plana.core.cache import async_cached, get_cache_stats
+
+        calls = []
+
+        @async_cached(ttl=60, key_prefix="test.single_flight")
+        async def build(reference):
+            calls.append(reference)
+            await asyncio.sleep(0.05)
+            return None
+
+        async def polls():
+            first = await asyncio.gather(*(build("2025/0001/01/DET") for _ in range(10)))
+            return first + [await build("2025/0001/01/DET")]
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(polls())
+        finally:
+            loop.close()
+
+        assert results == [None] * 11
+        assert calls == ["2025/0001/01/DET"]
+        stats = get_cache_stats()["test.single_flight"]
+        assert (stats["loads"], stats["coalesced"], stats["memory_hits"]) == (1, 9, 1)
+
+    def test_threads_share_one_load_and_errors(self):
+        """Test that threads wait for one load, and see its error without caching it."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from plana.core.cache import TieredCache
+
+        cache = TieredCache("test.threads", ttl=60)
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(5)
+            raise ValueError("portal down")
+
+        with ThreadPoolExecutor(4) as pool:
+            first = pool.submit(cache.get_or_set, "k", failing)
+            started.wait(5)
+            others = [pool.submit(cache.get_or_set, "k", lambda: "unused") for _ in range(3)]
+            while cache.stats["coalesced"] < 3:
+                time.sleep(0.01)
+            release.set()
+            for future in [first, *others]:
+                with pytest.raises(ValueError):
+                    future.result()
+
+        assert cache.get_or_set("k", lambda: "ok") == "ok"
+        assert cache.stats["loads"] == 2
+
+    def test_disk_tier_is_shared(self, tmp_path):
+        """Test that a value stored by one cache is read back by another on the same file."""
+        from plana.core.cache import SQLiteCacheTier, TieredCache
+
+        writer = TieredCache("reports", ttl=60, disk=SQLiteCacheTier(tmp_path / "cache.db"))
+        reader = TieredCache("reports", ttl=60, disk=SQLiteCacheTier(tmp_path / "cache.db"))
+        other = TieredCache("other", ttl=60, disk=SQLiteCacheTier(tmp_path / "cache.db"))
+
+        writer.set("2025/0001/01/DET:v1", {"report_markdown": "# Report"})
+
+        assert reader.get_or_set("2025/0001/01/DET:v1", lambda: {}) == {"report_markdown": "# Report"}
+        assert reader.stats["disk_hits"] == 1
+        assert other.get("2025/0001/01/DET:v1") is None
+        assert writer.delete("2025/0001/01/DET:v1")
+        assert SQLiteCacheTier(tmp_path / "cache.db").count("reports") == 0
+
+    def test_stale_entry_is_served_while_refreshing(self):
+        """Test that an expired entry within the stale window is served and refreshed once."""
+        import time
+
+        from plana.core.cache import TieredCache
+
+        cache = TieredCache("test.stale", ttl=60, stale_ttl=60)
+        cache.set("k", "old", ttl=0)
+
+        assert cache.get("k") is None  # Not fresh
+        assert cache.get_or_set("k", lambda: "new") == "old"
+        deadline = time.monotonic() + 5
+        while cache.get("k") != "new" and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert cache.get_or_set("k", lambda: "unused") == "new"
+        assert (cache.stats["stale_served"], cache.stats["refreshes"]) == (1, 1)
@@ -11,6 +11,9 @@ from unittest.mock import patch
 
 import pytest
 
+import plana.cli
+from plana.cli import EVALUATION_COLUMNS, cmd_evaluate
+
 
 class TestCLIArgumentParsing:
     """Tests for CLI argument parsing."""
@@ -542,3 +545,68 @@ class TestFeedbackCommand:
                 "--decision", decision,
             ])
             assert args.decision == decision
+
+
+class TestBatchEvaluation:
+    """Tests for parallel, resumable `plana evaluate`."""
+
+    REFS = ["2024/0930/01/DET", "2024/0943/01/LBC", "2024/0001/01/TPO", "2024/0002/01/HOU"]
+
+    def _refs_file(self, tmp_path):
+        refs_file = tmp_path / "refs.txt"
+        refs_file.write_text("\n".join(self.REFS) + "\n", encoding="utf-8")
+        return refs_file
+
+    def _evaluate(self, *args, **kwargs):
+        import asyncio
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(cmd_evaluate(*args, **kwargs))
+        finally:
+            loop.close()
+
+    def _rows(self, path):
+        import csv
+
+        with open(path, newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+
+    def test_parallel_evaluation_writes_timed_rows(self, tmp_path, capsys):
+        """Test that worker processes evaluate every reference and each row is timed."""
+        output = tmp_path / "results.csv"
+        self._evaluate(str(self._refs_file(tmp_path)), "demo", str(output), jobs=2)
+
+        rows = self._rows(output)
+        assert sorted(r["reference"] for r in rows) == sorted(self.REFS)
+        assert list(rows[0]) == EVALUATION_COLUMNS
+        assert all(r["status"] == "success" and float(r["elapsed_ms"]) >= 0 for r in rows)
+        assert (tmp_path / "results.checkpoint.jsonl").exists()
+        assert "Throughput: 4 evaluated" in capsys.readouterr().out
+
+    def test_rerun_skips_completed_references(self, tmp_path, monkeypatch, capsys):
+        """Test that a rerun evaluates only references missing or failed in the checkpoint."""
+        refs_file = self._refs_file(tmp_path)
+        output = tmp_path / "results.csv"
+        original = plana.cli._evaluate_single
+        calls = []
+
+        def evaluate_single(reference, mode):
+            calls.append(reference)
+            if reference == self.REFS[2] and len(calls) <= len(self.REFS):
+                raise RuntimeError("portal timeout")
+            return original(reference, mode)
+
+        monkeypatch.setattr(plana.cli, "_evaluate_single", evaluate_single)
+        self._evaluate(str(refs_file), "demo", str(output))
+        first = {r["reference"]: r["status"] for r in self._rows(output)}
+        self._evaluate(str(refs_file), "demo", str(output))
+        second = self._rows(output)
+        self._evaluate(str(refs_file), "demo", str(output), fresh=True)
+
+        assert first[self.REFS[2]].startswith("error: ")
+        assert calls[len(self.REFS):len(self.REFS) + 1] == [self.REFS[2]]  # Only the failure
+        assert len(second) == len(self.REFS)
+        assert all(r["status"] == "success" for r in second)
+        assert len(calls) == 2 * len(self.REFS) + 1
+        assert "Resuming:   3 already evaluated" in capsys.readouterr().out
@@ -0,0 +1,226 @@
+"""
+Unit tests for concurrency utilities (plana.core.concurrent).
+"""
+
+import threading
+import time
+
+import pytest
+
+
+class TestStepGraph:
+    """Tests for the dependency-graph step runner."""
+
+    def test_independent_steps_overlap(self):
+        """Test that wall time follows the critical path, not the sum."""
+        from plana.core.concurrent import StepGraph
+
+        graph = StepGraph()
+        graph.add("a", lambda r: time.sleep(0.2) or 1)
+        graph.add("b", lambda r: time.sleep(0.2) or 2)
+        graph.add("c", lambda r: r["a"] + r["b"], depends_on=["a", "b"])
+
+        start = time.monotonic()
+        results, timings = graph.run()
+        elapsed = time.monotonic() - start
+
+        assert results == {"a": 1, "b": 2, "c": 3}
+        assert elapsed < 0.35
+        assert [t.name for t in timings][-1] == "c"
+        c = timings[-1]
+        assert c.depends_on == ("a", "b")
+        assert c.started_ms >= max(t.started_ms + t.duration_ms for t in timings[:2]) - 1
+
+    def test_dependencies_see_results(self):
+        """Test that a step only starts after its dependencies finish."""
+        from plana.core.concurrent import StepGraph
+
+        order = []
+        lock = threading.Lock()
+
+        def step(name, delay=0.0):
+            def run(r):
+                time.sleep(delay)
+                with lock:
+                    order.append(name)
+                return name
+            return run
+
+        graph = StepGraph()
+        graph.add("slow", step("slow", 0.1))
+        graph.add("fast", step("fast"))
+        graph.add("after_slow", step("after_slow"), depends_on=["slow"])
+
+        results, _timings = graph.run()
+
+        assert order.index("after_slow") > order.index("slow")
+        assert set(results) == {"slow", "fast", "after_slow"}
+
+    def test_failure_stops_dependents(self):
+        """Test that a failing step is re-raised and its dependents never run."""
+        from plana.core.concurrent import StepGraph
+
+        ran = []
+        graph = StepGraph()
+        graph.add("ok", lambda r: ran.append("ok"))
+        graph.add("broken", lambda r: 1 / 0)
+        graph.add("dependent", lambda r: ran.append("dependent"), depends_on=["broken"])
+
+        with pytest.raises(ZeroDivisionError):
+            graph.run()
+        assert "dependent" not in ran
+
+    def test_steps_must_follow_dependencies(self):
+        """Test that unknown or duplicate steps are rejected."""
+        from plana.core.concurrent import StepGraph
+
+        graph = StepGraph()
+        graph.add("a", lambda r: None)
+        with pytest.raises(ValueError):
+            graph.add("b", lambda r: None, depends_on=["missing"])
+        with pytest.raises(ValueError):
+            graph.add("a", lambda r: None)
+
+    def test_critical_path(self):
+        """Test the longest dependent chain of step durations."""
+        from plana.core.concurrent import StepTiming, critical_path
+
+        timings = [
+            StepTiming("policies", 0.0, 5.0),
+            StepTiming("cases", 0.0, 40.0),
+            StepTiming("assessments", 40.0, 10.0, ("policies", "cases")),
+            StepTiming("plan_set", 0.0, 30.0),
+            StepTiming("report", 50.0, 5.0, ("assessments", "plan_set")),
+        ]
+
+        total, path = critical_path(timings)
+
+        assert total == pytest.approx(55.0)
+        assert path == ["cases", "assessments", "report"]
+
+
+def _run(coro):
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestStreamConcurrent:
+    """Tests for the streaming bounded-concurrency executor."""
+
+    def test_bounded_lazy_and_as_completed(self):
+        """Test that items are pulled lazily, capped in flight and yielded as they finish."""
+        import asyncio
+
+        from plana.core.concurrent import stream_concurrent
+
+        pulled = []
+        running = [0, 0]  # current, peak
+
+        def items():
+            for i in range(10):
+                pulled.append(i)
+                yield i
+
+        async def work(i):
+            running[0] += 1
+            running[1] = max(running)
+            await asyncio.sleep(0.05 if i == 0 else 0.01)
+            running[0] -= 1
+            return i * i
+
+        async def consume():
+            seen = []
+            async for result in stream_concurrent(items(), work, max_concurrent=3):
+                if not seen:
+                    assert len(pulled) <= 4  # Three running, one just refilled
+                seen.append((result.index, result.value))
+            return seen
+
+        seen = _run(consume())
+
+        assert running[1] == 3
+        assert seen[0] != (0, 0)  # The slow first item finishes late
+        assert sorted(seen) == [(i, i * i) for i in range(10)]
+
+    def test_congestion_halves_the_limit(self):
+        """Test that 429s cut an adaptive limit and successes grow it back."""
+        from plana.core.concurrent import AdaptiveLimit, stream_concurrent
+        from plana.ingestion.base import PortalAccessError
+
+        limit = AdaptiveLimit(8, maximum=8, cooldown=0)
+
+        async def work(i):
+            if i < 2:
+                raise PortalAccessError("Too many requests", status_code=429)
+            if i == 2:
+                raise ValueError("bad document")
+            return i
+
+        async def consume():
+            return [r async for r in stream_concurrent(range(3), work, limit=limit)]
+
+        results = _run(consume())
+        assert [r.success for r in results] == [False, False, False]
+        assert limit.limit == 2 and limit.decreases == 2
+
+        for _ in range(6):  # About one window at 2, then one at 3
+            limit.record_success()
+        assert limit.limit == 4
+
+    def test_closing_cancels_in_flight(self):
+        """Test that closing the stream cancels running calls and pulls no more items."""
+        import asyncio
+
+        from plana.core.concurrent import stream_concurrent
+
+        cancelled = []
+
+        async def source():
+            for i in range(1000):
+                yield i
+
+        async def work(i):
+            try:
+                await asyncio.sleep(0 if i == 0 else 10)
+            except asyncio.CancelledError:
+                cancelled.append(i)
+                raise
+            return i
+
+        async def consume():
+            stream = stream_concurrent(source(), work, max_concurrent=4)
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+
+        first = _run(consume())
+
+        assert first.index == 0
+        assert sorted(cancelled) == [1, 2, 3]
+
+    def test_downloader_counts_skips_and_failures(self):
+        """Test that the downloader keeps results in input order with progress counts."""
+        from plana.core.concurrent import ConcurrentDownloader
+
+        async def download(doc):
+            if doc == "missing":
+                return None
+            if doc == "broken":
+                raise OSError("connection reset")
+            return f"/tmp/{doc}.pdf"
+
+        progress, results = _run(ConcurrentDownloader(max_concurrent=2).download_documents(
+            ["plan", "stored", "missing", "broken", "statement"],
+            download,
+            should_skip=lambda doc: doc == "stored",
+        ))
+
+        assert [r.value for r in results] == ["/tmp/plan.pdf", None, None, None, "/tmp/statement.pdf"]
+        assert [r.success for r in results] == [True, True, False, False, True]
+        assert results[2].error == "Download returned None"
+        assert (progress.succeeded, progress.skipped, progress.failed) == (2, 1, 2)
@@ -312,3 +312,72 @@ class TestReprocessThenWorker:
         counts = tmp_db.get_processing_counts("REF/CYCLE")
         assert counts["queued"] == 0
         assert counts["processed"] == 1
+
+
+# ---------- Stored document extractions ----------
+
+
+class TestStoredExtractions:
+    """Tests for extractions computed by the worker and reused by reports."""
+
+    TEXT = (
+        "Design and Access Statement. Two storey rear extension with a ridge "
+        "height of 7.2m. 3 bedrooms. Floor area 45 sqm. 2 parking spaces. "
+        "Materials: red brick walls and natural slate roof."
+    )
+
+    def test_worker_stores_extraction(self, tmp_db, tmp_path):
+        from plana.api.document_analysis import extraction_cache_key
+
+        txt = tmp_path / "statement.txt"
+        txt.write_text(self.TEXT)
+        doc = _make_doc("REF/1", "das1", title="Statement.txt", local_path=str(txt), mime_type="text/plain")
+        tmp_db.save_document(doc)
+
+        from plana.documents.worker import process_one
+        process_one(doc, tmp_db)
+
+        stored = tmp_db.get_document_extraction(extraction_cache_key(self.TEXT, "PDF"))
+        assert stored is not None
+        assert json.loads(stored)["num_bedrooms"] == 3
+
+    def test_cached_extraction_matches_direct(self, tmp_db, monkeypatch):
+        from dataclasses import asdict
+
+        import plana.api.document_analysis as analysis
+        import plana.storage.database as database_module
+
+        monkeypatch.setattr(database_module, "_database", tmp_db)
+        analysis._memory_cache.clear()
+
+        direct = analysis.extract_from_text(self.TEXT, "elevation", "elevations.pdf")
+        cached = analysis.cached_extract_from_text(self.TEXT, "elevation", "elevations.pdf")
+        analysis._memory_cache.clear()
+        reloaded = analysis.cached_extract_from_text(self.TEXT, "elevation", "elevations.pdf")
+
+        expected = asdict(direct)
+        expected.pop("extraction_timestamp")
+        for result in (cached, reloaded):
+            actual = asdict(result)
+            actual.pop("extraction_timestamp")
+            assert actual == expected
+        assert reloaded.num_bedrooms_source == "elevations.pdf"
+        assert reloaded.materials and isinstance(reloaded.materials[0].source, analysis.DataSource)
+
+    def test_reports_skip_extraction_for_stored_text(self, tmp_db, monkeypatch):
+        import plana.api.document_analysis as analysis
+        import plana.storage.database as database_module
+
+        monkeypatch.setattr(database_module, "_database", tmp_db)
+        analysis._memory_cache.clear()
+        analysis.precompute_extraction(self.TEXT, "other", store=tmp_db)
+        analysis._memory_cache.clear()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("text re-scanned")
+
+        monkeypatch.setattr(analysis, "extract_from_text", fail)
+        result = analysis.cached_extract_from_text(self.TEXT, "other", "statement.pdf")
+
+        assert result.num_bedrooms == 3
+        assert result.documents_analysed == ["statement.pdf"]
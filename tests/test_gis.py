@@ -0,0 +1,249 @@
+"""
+Unit tests for GIS constraint checking (plana.location.gis).
+
+The remote ArcGIS endpoints are replaced by a stub ``_get_json`` so the
+tests exercise fan-out, deadlines and caching without network access.
+The persistent cache lives in a temporary database.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+
+class _StubGIS:
+    """Records GIS requests and answers each with a positive hit."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+        self.delays: dict[str, float] = {}
+        self.failing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def count(self, fragment: str) -> int:
+        return sum(fragment in url for url in self.calls)
+
+    def get_json(self, url: str) -> dict:
+        with self._lock:
+            self.calls.append(url)
+        for fragment, delay in self.delays.items():
+            if fragment in url:
+                time.sleep(delay)
+        if any(fragment in url for fragment in self.failing):
+            raise ConnectionError("service unavailable")
+        return {"count": 1, "features": [{"attributes": {"NAME": "Test Area"}}]}
+
+
+@pytest.fixture
+def stub(test_database, monkeypatch):
+    """Stub the GIS endpoints and start from empty caches."""
+    import plana.location.gis as gis_module
+    import plana.storage.database as database_module
+
+    stub = _StubGIS()
+    gis_module._result_cache.clear()
+    monkeypatch.setattr(database_module, "_database", test_database)
+    monkeypatch.setattr(gis_module, "_get_json", stub.get_json)
+    yield stub
+    gis_module._result_cache.clear()
+
+
+class TestConcurrentChecks:
+    """Tests for the concurrent GIS check fan-out."""
+
+    def test_checks_run_concurrently(self, stub):
+        """Test that latency is the slowest check, not the sum."""
+        from plana.location.gis import check_gis_constraints
+
+        stub.delays["query"] = 0.2
+
+        start = time.monotonic()
+        result = check_gis_constraints(54.97, -1.61)
+        elapsed = time.monotonic() - start
+
+        assert len(stub.calls) == 6
+        assert elapsed < 0.2 * 3
+        assert result.checked_types == [
+            "Flood Zone", "Listed Building", "Conservation Area", "SSSI", "Green Belt",
+        ]
+        flood = [c.name for c in result.constraints if c.constraint_type == "Flood Zone"]
+        assert flood == ["Flood Zone 2", "Flood Zone 3"]
+        assert result.errors == []
+
+    def test_deadline_returns_partial_results(self, stub):
+        """Test that slow checks are reported as errors at the deadline."""
+        from plana.location.gis import _cached_check, _result_cache
+
+        stub.delays["SSSI_England"] = 1.0
+
+        start = time.monotonic()
+        constraints, checked, errors = _cached_check(54.97, -1.61, deadline=0.2)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 1.0
+        assert "SSSI" not in checked
+        assert "Green Belt" in checked
+        assert len(errors) == 1 and errors[0].startswith("SSSI:")
+        assert all(c.constraint_type != "SSSI" for c in constraints)
+
+        # Partial results are not kept in the process cache
+        assert (54.97, -1.61) not in _result_cache
+
+    def test_complete_results_are_cached(self, stub):
+        """Test that a repeat lookup for the same grid cell is free."""
+        from plana.location.gis import check_gis_constraints
+
+        check_gis_constraints(54.97, -1.61)
+        check_gis_constraints(54.970001, -1.610001)
+
+        assert len(stub.calls) == 6
+
+
+class TestPersistentCache:
+    """Tests for the SQLite-backed per-layer GIS cache."""
+
+    def test_results_survive_process_cache_loss(self, stub):
+        """Test that a restart (empty memory cache) reuses stored layers."""
+        from plana.location.gis import _result_cache, check_gis_constraints
+
+        first = check_gis_constraints(54.97, -1.61)
+        _result_cache.clear()
+        second = check_gis_constraints(54.97, -1.61)
+
+        assert len(stub.calls) == 6
+        assert second.checked_types == first.checked_types
+        assert second.constraint_strings() == first.constraint_strings()
+
+    def test_failures_are_negatively_cached(self, stub, monkeypatch):
+        """Test that a failing layer is not retried until its short TTL ends."""
+        import plana.location.gis as gis_module
+
+        stub.failing.add("SSSI_England")
+        result = gis_module.check_gis_constraints(54.97, -1.61)
+        assert "SSSI" not in result.checked_types
+        assert result.errors and result.errors[0].startswith("SSSI:")
+
+        result = gis_module.check_gis_constraints(54.97, -1.61)
+        assert stub.count("SSSI_England") == 1
+        assert "SSSI" not in result.checked_types
+        assert gis_module.get_gis_cache_stats()["negative_hits"] >= 1
+
+    def test_expired_failures_are_retried(self, stub, monkeypatch):
+        """Test that a layer is retried once its negative entry expires."""
+        import plana.location.gis as gis_module
+
+        monkeypatch.setattr(gis_module, "_NEGATIVE_TTL", -1)
+        stub.failing.add("SSSI_England")
+        gis_module.check_gis_constraints(54.97, -1.61)
+
+        stub.failing.clear()
+        result = gis_module.check_gis_constraints(54.97, -1.61)
+
+        assert stub.count("SSSI_England") == 2
+        assert "SSSI" in result.checked_types
+
+    def test_late_results_are_persisted(self, stub):
+        """Test that a check finishing after the deadline is still stored."""
+        from plana.location.gis import _cached_check
+
+        stub.delays["SSSI_England"] = 0.3
+        _constraints, checked, _errors = _cached_check(54.97, -1.61, deadline=0.05)
+        assert "SSSI" not in checked
+
+        time.sleep(0.5)
+        _constraints, checked, errors = _cached_check(54.97, -1.61)
+        assert "SSSI" in checked
+        assert errors == ()
+        assert stub.count("SSSI_England") == 1
+
+    def test_prewarm(self, stub, monkeypatch):
+        """Test pre-warming the cache for a list of postcodes."""
+        import plana.location.postcodes as postcodes_module
+        from plana.location.gis import check_gis_constraints, prewarm_gis_cache
+
+        def fake_bulk_lookup(postcodes):
+            return {
+                postcode: None if postcode == "ZZ1 1ZZ" else postcodes_module.PostcodeResult(
+                    postcode=postcode, latitude=54.9721, longitude=-1.6105,
+                )
+                for postcode in postcodes
+            }
+
+        monkeypatch.setattr(postcodes_module, "bulk_lookup_postcodes", fake_bulk_lookup)
+        summary = prewarm_gis_cache(["NE2 2QU", "ZZ1 1ZZ"])
+
+        assert summary == {"warmed": 1, "partial": 0, "unresolved": ["ZZ1 1ZZ"]}
+        check_gis_constraints(54.9721, -1.6105)
+        assert len(stub.calls) == 6
+
+
+FIXTURE_LAYERS = Path(__file__).parent / "fixtures" / "gis_layers"
+
+
+class TestOfflineLayers:
+    """Tests for offline constraint layers and the R-tree engine."""
+
+    def test_rtree_matches_brute_force(self):
+        """Test that R-tree queries return exactly the intersecting boxes."""
+        import random
+
+        from plana.location.offline_layers import RTree, _intersects
+
+        rng = random.Random(7)
+        boxes = []
+        for i in range(500):
+            x, y = rng.uniform(-5, 2), rng.uniform(50, 56)
+            boxes.append(((x, y, x + rng.uniform(0, 0.2), y + rng.uniform(0, 0.2)), i))
+        tree = RTree(boxes)
+
+        for _ in range(50):
+            x, y = rng.uniform(-5, 2), rng.uniform(50, 56)
+            query = (x, y, x + 0.5, y + 0.5)
+            expected = {i for bbox, i in boxes if _intersects(bbox, query)}
+            assert set(tree.query(query)) == expected
+
+    def test_polygon_holes_and_buffers(self):
+        """Test point-in-polygon with holes, and distances outside."""
+        from plana.location.offline_layers import OfflineConstraintIndex
+
+        layer = OfflineConstraintIndex.from_geojson_dir(FIXTURE_LAYERS).layers["conservation_area"]
+
+        assert layer.near(54.975, -1.60, 0.0)            # inside the ring
+        assert not layer.near(54.970, -1.61, 100.0)      # inside the hole
+        assert layer.near(54.9615, -1.61, 100.0)         # ~55m outside the edge
+        assert not layer.near(54.950, -1.61, 100.0)
+
+    def test_index_file_round_trip(self, tmp_path):
+        """Test that the binary index reproduces the GeoJSON layers."""
+        from plana.location.offline_layers import OfflineConstraintIndex, build_index
+
+        source = OfflineConstraintIndex.from_geojson_dir(FIXTURE_LAYERS)
+        built = build_index(FIXTURE_LAYERS, tmp_path / "layers.idx")
+        loaded = OfflineConstraintIndex.load(tmp_path / "layers.idx")
+
+        assert loaded.summary() == source.summary() == built.summary()
+        assert len(loaded.summary()) == 6
+        for lat, lon in [(54.9745, -1.6125), (54.955, -1.60), (55.035, -1.62)]:
+            for layer in loaded.layers:
+                assert loaded.check_layer(layer, lat, lon) == source.check_layer(layer, lat, lon)
+
+    def test_offline_checks_skip_remote_services(self, stub):
+        """Test that configured offline layers answer without HTTP requests."""
+        from plana.location.gis import check_gis_constraints, set_offline_index
+        from plana.location.offline_layers import OfflineConstraintIndex
+
+        set_offline_index(OfflineConstraintIndex.load(FIXTURE_LAYERS))
+        try:
+            result = check_gis_constraints(54.9745, -1.6125)
+        finally:
+            set_offline_index(None)
+
+        assert stub.calls == []
+        assert result.errors == []
+        assert result.has_conservation_area
+        listed = [c.name for c in result.constraints if c.constraint_type == "Listed Building"]
+        assert listed == ["Grade I: Grey's Monument", "Grade I: Theatre Royal"]
+        assert not result.has_flood_risk
+        assert not result.has_sssi
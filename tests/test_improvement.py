@@ -228,3 +228,85 @@ class TestFeedbackStats:
         stats = FeedbackStats()
         assert stats.by_decision is not None
         assert isinstance(stats.by_decision, dict)
+
+
+class TestBatchedFeedbackQueries:
+    """Tests for the set-based feedback / run log lookups."""
+
+    @pytest.fixture
+    def db(self, test_database):
+        """Database with run logs and feedback for a handful of references."""
+        runs = [
+            ("run-1", "2024/0001/01/HOU", "2024-01-01T10:00:00", "APPROVE"),
+            ("run-2", "2024/0001/01/HOU", "2024-02-01T10:00:00", "REFUSE"),
+            ("run-3", "2024/0002/01/HOU", "2024-01-05T10:00:00", "APPROVE"),
+            ("run-4", "2024/0003/01/LBC", "2024-01-07T10:00:00", "REFUSE"),
+        ]
+        for run_id, ref, ts, decision in runs:
+            test_database.save_run_log(StoredRunLog(
+                run_id=run_id, reference=ref, mode="demo", council="newcastle",
+                timestamp=ts, raw_decision=decision,
+            ))
+        for ref, decision in [
+            ("2024/0001/01/HOU", "APPROVE"),
+            ("2024/0001/01/HOU", "REFUSE"),
+            ("2024/0002/01/HOU", "APPROVE_WITH_CONDITIONS"),
+            ("2024/0003/01/LBC", "APPROVE"),
+            ("2024/0009/01/HOU", "APPROVE"),
+        ]:
+            test_database.save_feedback(StoredFeedback(
+                reference=ref, decision=decision, actual_decision=decision,
+            ))
+        with patch('plana.improvement.feedback.get_database', return_value=test_database), \
+                patch('plana.improvement.reranking.get_database', return_value=test_database):
+            yield test_database
+
+    def test_get_latest_run_logs_picks_most_recent(self, db):
+        """Test that the batched lookup returns the newest run per reference."""
+        latest = db.get_latest_run_logs([
+            "2024/0001/01/HOU", "2024/0002/01/HOU", "2024/9999/01/HOU",
+        ])
+
+        assert set(latest) == {"2024/0001/01/HOU", "2024/0002/01/HOU"}
+        assert latest["2024/0001/01/HOU"].run_id == "run-2"
+
+    def test_get_feedback_outcomes_joins_latest_rows(self, db):
+        """Test that outcomes carry feedback count and latest decisions."""
+        outcomes = db.get_feedback_outcomes([
+            "2024/0001/01/HOU", "2024/0009/01/HOU", "2024/8888/01/HOU",
+        ])
+
+        assert outcomes["2024/0001/01/HOU"]["feedback_count"] == 2
+        assert outcomes["2024/0001/01/HOU"]["plana_decision"] == "REFUSE"
+        assert outcomes["2024/0009/01/HOU"]["plana_decision"] is None
+        assert "2024/8888/01/HOU" not in outcomes
+
+    def test_mismatch_rates_match_per_type_rate(self, db):
+        """Test that batched rates agree with the single-type helper."""
+        from plana.improvement.feedback import get_mismatch_rate, get_mismatch_rates
+
+        rates = get_mismatch_rates(["HOU", "LBC", "DCC"])
+
+        assert rates["LBC"] == 1.0
+        assert rates["DCC"] == 0.0
+        assert rates["HOU"] == get_mismatch_rate("HOU")
+
+    def test_similar_case_boost_uses_single_query(self, db):
+        """Test that similar case boosting issues one lookup for all cases."""
+        from plana.improvement.reranking import calculate_similar_case_boost
+
+        cases = [
+            {"reference": "2024/0002/01/HOU"},
+            {"reference": "2024/0003/01/LBC"},
+            {"reference": "2024/7777/01/HOU"},
+        ]
+        with patch.object(db, 'get_feedback_outcomes', wraps=db.get_feedback_outcomes) as spy, \
+                patch.object(db, 'get_feedback') as per_case:
+            boosted = calculate_similar_case_boost(cases, "2024/0100/01/HOU")
+
+        assert spy.call_count == 1
+        per_case.assert_not_called()
+        boosts = {case["reference"]: boost for case, boost in boosted}
+        assert boosts["2024/0002/01/HOU"] > 1.0
+        assert boosts["2024/0003/01/LBC"] < 1.0
+        assert boosts["2024/7777/01/HOU"] == 1.0
@@ -7,6 +7,8 @@ These tests ensure that:
 4. Proper handling of 406 (Idox IDX002) errors
 """
 
+from pathlib import Path
+
 import pytest
 
 
@@ -638,3 +640,285 @@ class TestSessionBasedFlow:
         assert '"fa": "search"' in source or "'fa': 'search'" in source
         assert '"submitted": "true"' in source or "'submitted': 'true'" in source
         assert '"application_reference_number"' in source or "'application_reference_number'" in source
+
+
+class TestDocumentDownloads:
+    """Tests for parallel, change-aware document downloads."""
+
+    @staticmethod
+    def _adapter(handler, max_concurrent_downloads=3):
+        httpx = pytest.importorskip("httpx")
+        from plana.ingestion.newcastle import NewcastleAdapter
+
+        adapter = NewcastleAdapter(max_concurrent_downloads=max_concurrent_downloads)
+        adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return adapter
+
+    @staticmethod
+    def _download_all(adapter, documents, dest_dir, known=None):
+        import asyncio
+
+        async def collect():
+            results = [r async for r in adapter.download_documents(documents, str(dest_dir), known=known)]
+            await adapter.close()
+            return results
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(collect())
+        finally:
+            loop.close()
+
+    def test_downloads_run_in_parallel(self, tmp_path):
+        """Test that documents download concurrently up to the limit and are hashed."""
+        import asyncio
+        import hashlib
+
+        import httpx
+        from plana.ingestion.base import PortalDocument
+
+        running = [0, 0]  # current, peak
+
+        async def handler(request):
+            running[0] += 1
+            running[1] = max(running)
+            await asyncio.sleep(0.02)
+            running[0] -= 1
+            return httpx.Response(200, content=request.url.path.encode(), headers={
+                "content-type": "application/pdf", "etag": f'"{request.url.path}"',
+            })
+
+        documents = [
+            PortalDocument(id=str(i), title=f"Plan {i}", doc_type="plans",
+                           url=f"https://portal.newcastle.gov.uk/files/{i}.pdf")
+            for i in range(6)
+        ]
+        results = self._download_all(self._adapter(handler), documents, tmp_path)
+
+        assert running[1] == 3
+        assert all(r.ok and not r.unchanged for r in results)
+        doc = documents[2]
+        assert doc.etag == '"/files/2.pdf"'
+        assert doc.content_hash == hashlib.md5(b"/files/2.pdf").hexdigest()
+        assert open(doc.local_path, "rb").read() == b"/files/2.pdf"
+        assert not list(tmp_path.glob("*.part"))
+
+    def test_unchanged_documents_are_skipped(self, tmp_path):
+        """Test that a matching ETag or content hash keeps the known copy."""
+        import hashlib
+
+        import httpx
+        from plana.ingestion.base import PortalDocument
+
+        def handler(request):
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"same bytes", headers={"content-type": "application/pdf"})
+
+        old_copy = tmp_path / "old.pdf"
+        old_copy.write_bytes(b"same bytes")
+        url = "https://portal.newcastle.gov.uk/files/{}.pdf"
+        documents = [
+            PortalDocument(id="etag", title="Site plan", doc_type="plans", url=url.format("etag")),
+            PortalDocument(id="hash", title="Statement", doc_type="docs", url=url.format("hash")),
+            PortalDocument(id="new", title="Elevations", doc_type="plans", url=url.format("new")),
+        ]
+        known = {
+            "etag": PortalDocument(id="etag", title="", doc_type="", url="",
+                                   local_path=str(old_copy), etag='"v1"', content_hash="abc"),
+            "hash": PortalDocument(id="hash", title="", doc_type="", url="", local_path=str(old_copy),
+                                   content_hash=hashlib.md5(b"same bytes").hexdigest()),
+        }
+
+        results = {r.document.id: r for r in self._download_all(self._adapter(handler), documents, tmp_path, known)}
+
+        assert results["etag"].unchanged and results["etag"].local_path == str(old_copy)
+        assert results["hash"].unchanged and results["hash"].local_path == str(old_copy)
+        assert not results["new"].unchanged and results["new"].local_path != str(old_copy)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["new_Elevations.pdf", "old.pdf"]
+
+
+FIXTURE_PAGES = Path(__file__).parent / "fixtures" / "portal"
+
+
+def _scan_for_field(soup, label):
+    """Per-label tree search, as the adapter did before FieldMap."""
+    import re
+
+    for th in soup.find_all(["th", "td"]):
+        if label.lower() in th.get_text().lower():
+            next_td = th.find_next_sibling("td")
+            if next_td:
+                return next_td.get_text(strip=True)
+    for dt in soup.find_all("dt"):
+        if label.lower() in dt.get_text().lower():
+            dd = dt.find_next_sibling("dd")
+            if dd:
+                return dd.get_text(strip=True)
+    for span in soup.find_all("span", class_=re.compile(r".*value.*", re.I)):
+        prev = span.find_previous(["span", "label"])
+        if prev and label.lower() in prev.get_text().lower():
+            return span.get_text(strip=True)
+    return None
+
+
+class TestPortalParsing:
+    """Tests for parsing each portal page once."""
+
+    def test_field_map_matches_tree_search(self):
+        """Test that FieldMap answers every label the way a per-label search does."""
+        pytest.importorskip("bs4")
+        from plana.ingestion.parsing import FieldMap, parse_html
+
+        labels = [
+            "address", "site", "proposal", "status", "type", "application type",
+            "received", "validated", "decision", "decision level", "target",
+            "applicant", "agent", "ward", "parish", "contact", "missing label",
+        ]
+        for page in ("application_details.html", "search_results.html"):
+            soup = parse_html((FIXTURE_PAGES / page).read_text())
+            fields = FieldMap(soup)
+            for label in labels:
+                assert fields.get(label) == _scan_for_field(soup, label), (page, label)
+
+    def test_search_page_is_parsed_once(self, monkeypatch):
+        """Test that the result lookup and the empty form check share one tree."""
+        pytest.importorskip("httpx")
+        import bs4
+
+        from plana.ingestion.newcastle import NewcastleAdapter
+        from plana.ingestion.parsing import parse_html
+
+        builds = []
+        original = bs4.BeautifulSoup
+
+        def counting(*args, **kwargs):
+            builds.append(1)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(bs4, "BeautifulSoup", counting)
+        parse_html.cache_clear()
+        adapter = NewcastleAdapter()
+        html = (FIXTURE_PAGES / "search_results.html").read_text()
+
+        assert adapter._extract_view_url(html, "2025/9999/01/HOU") is None
+        assert adapter._is_empty_form_page(html) is False
+        assert adapter._extract_view_url(html, "2025/2002/01/TPO").endswith("id=324102")
+        assert len(builds) == 1
+
+    def test_details_fixture(self):
+        """Test that the saved details page parses into the expected application."""
+        pytest.importorskip("httpx")
+        from plana.ingestion.newcastle import NewcastleAdapter
+
+        adapter = NewcastleAdapter()
+        html = (FIXTURE_PAGES / "application_details.html").read_text()
+
+        details = adapter._parse_application_page(html, "2025/2002/01/TPO", "https://example.org/?keyVal=K1")
+        documents = adapter._parse_documents_page(html, "2025/2002/01/TPO")
+
+        assert details.address.startswith("12 Osborne Road")
+        assert (details.ward, details.applicant_name, details.agent_name) == (
+            "North Jesmond", "Mr J Smith", "Tree Services Ltd",
+        )
+        assert (details.date_received, details.decision_level, details.portal_key) == (
+            "02/06/2025", "Delegated", "K1",
+        )
+        assert len(documents) == 12
+
+
+class TestResponseCache:
+    """Tests for the on-disk portal page cache."""
+
+    @staticmethod
+    def _portal(requests):
+        """A mock portal serving the fixture pages and recording requests."""
+        import httpx
+
+        def handler(request):
+            conditional = request.headers.get("if-none-match")
+            requests.append((request.method, request.url.params.get("fa"), conditional))
+            if request.method == "POST":
+                return httpx.Response(200, text=(FIXTURE_PAGES / "search_results.html").read_text())
+            if request.url.params.get("fa") == "getApplication":
+                if conditional == '"v1"':
+                    return httpx.Response(304)
+                return httpx.Response(
+                    200,
+                    text=(FIXTURE_PAGES / "application_details.html").read_text(),
+                    headers={"etag": '"v1"'},
+                )
+            return httpx.Response(200, text="<html><form></form></html>")
+
+        return handler
+
+    @staticmethod
+    def _fetch(cache, requests, bypass_cache=False):
+        """Fetch the fixture application and its documents with a fresh adapter."""
+        import asyncio
+
+        httpx = pytest.importorskip("httpx")
+        from plana.ingestion.newcastle import NewcastleAdapter
+
+        adapter = NewcastleAdapter(response_cache=cache, bypass_cache=bypass_cache)
+        adapter._host.bucket.rate = 0
+        adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(TestResponseCache._portal(requests)))
+
+        async def fetch():
+            details = await adapter.fetch_application("2025/2002/01/TPO")
+            documents = await adapter.fetch_documents("2025/2002/01/TPO")
+            await adapter.close()
+            return details, documents
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(fetch())
+        finally:
+            loop.close()
+
+    @staticmethod
+    def _cache(tmp_path, **ttls):
+        from plana.core.cache import SQLiteCacheTier, TieredCache
+        from plana.ingestion.response_cache import PortalResponseCache
+
+        disk = SQLiteCacheTier(tmp_path / "cache.db")
+        return PortalResponseCache(TieredCache("portal_responses", ttl=3600, disk=disk), **ttls)
+
+    def test_repeat_processing_skips_the_portal(self, tmp_path):
+        """Test that a second run is served from disk, and a bypass fetches again."""
+        requests = []
+        details, documents = self._fetch(self._cache(tmp_path), requests)
+        assert [(m, fa) for m, fa, _ in requests] == [("GET", None), ("POST", None), ("GET", "getApplication")]
+
+        requests.clear()
+        again, again_documents = self._fetch(self._cache(tmp_path), requests)  # A new process
+        assert requests == []
+        assert (again.address, len(again_documents)) == (details.address, len(documents))
+
+        self._fetch(self._cache(tmp_path), requests, bypass_cache=True)
+        assert len(requests) == 3
+
+    def test_decided_pages_stay_fresh(self, tmp_path):
+        """Test that a decided application's pages outlive the pending TTL."""
+        requests = []
+        cache = self._cache(tmp_path, pending_ttl=0, decided_ttl=3600)
+
+        details, _ = self._fetch(cache, requests)
+        requests.clear()
+        self._fetch(cache, requests)
+
+        assert details.status.value == "approved"
+        assert requests == []
+
+    def test_stale_pages_are_revalidated(self, tmp_path):
+        """Test that a stale view page is revalidated with its ETag and reused on 304."""
+        requests = []
+        cache = self._cache(tmp_path, pending_ttl=0, decided_ttl=0)
+
+        self._fetch(cache, requests)
+        requests.clear()
+        details, documents = self._fetch(cache, requests)
+
+        assert ("GET", "getApplication", '"v1"') in requests
+        assert cache.stats["revalidated"] >= 1
+        assert details.ward == "North Jesmond" and len(documents) == 12
@@ -0,0 +1,143 @@
+"""
+Unit tests for the shared document pattern registry (plana.documents.patterns).
+"""
+
+import random
+
+
+def _doc(doc_id, title, category, text):
+    from plana.documents.ingestion import ProcessedDocument
+
+    return ProcessedDocument(doc_id, title, f"{doc_id}.pdf", category, 0.8, extracted_text=text)
+
+
+class TestRuleSets:
+    """Tests for rule order, hits and shared scans."""
+
+    def test_first_rule_in_order_wins(self):
+        """Test that an earlier rule beats an earlier position in the text."""
+        from plana.documents.patterns import RuleSet, scan_document
+
+        rules = RuleSet("test.height", [
+            (r"ridge\s*height[:\s]*(\d+(?:\.\d+)?)\s*m", "ridge"),
+            (r"(\d+(?:\.\d+)?)\s*m\s*to\s*ridge", "to_ridge"),
+        ])
+        text = "Eaves 5.2m, 8.1m to ridge.  Ridge height: 8.4m"
+
+        hit = scan_document(text, "Proposed elevations").first(rules)
+
+        assert (hit.label, hit.value, hit.document) == ("ridge", "8.4", "Proposed elevations")
+        assert text.lower()[hit.offset:].startswith("ridge height")
+        assert [h.label for h in scan_document(text).hits([rules])] == ["ridge", "to_ridge"]
+
+    def test_patterns_are_searched_once_per_text(self, monkeypatch):
+        """Test that consumers sharing a pattern or a text share the search."""
+        from plana.documents import patterns
+
+        calls = []
+        original = patterns._CompiledPattern.search
+
+        def counting_search(self, text):
+            calls.append(self.regex.pattern)
+            return original(self, text)
+
+        monkeypatch.setattr(patterns._CompiledPattern, "search", counting_search)
+        first = patterns.RuleSet("test.first", [r"(\d+)\s*parking\s*spaces"])
+        second = patterns.RuleSet("test.second", [(r"(\d+)\s*parking\s*spaces", "parking")])
+        text = "Parking: 2 parking spaces to the front"
+
+        assert patterns.scan_document(text, "Site plan").first(first).value == "2"
+        assert patterns.scan_document(text, "D&A").first(second).document == "D&A"
+        assert calls == [r"(\d+)\s*parking\s*spaces"]
+
+    def test_literal_prefilter_matches_regex(self):
+        """Test that the substring pre-check never changes a search result."""
+        from plana.documents.patterns import registered_rule_sets
+        import plana.api.advanced_planning_tools  # noqa: F401 - registers rule sets
+        import plana.api.document_analysis  # noqa: F401
+        import plana.documents.ingestion  # noqa: F401
+
+        words = [
+            "ridge", "height", "eaves", "8.5m", "2", "storey", "to", "the", "boundary", "sqm",
+            "floor", "area", "parking", "spaces", "no. 12", "window", "-", ":", "approx", "x",
+            "site", "plan", "design", "and", "access", "flood", "risk", "bedroom", "units", "m",
+        ]
+        rng = random.Random(7)
+        texts = [" ".join(rng.choice(words) for _ in range(rng.randint(1, 30))) for _ in range(300)]
+        compiled = {p for rule_set in registered_rule_sets() for p in rule_set._patterns}
+        assert any(p.literals for p in compiled)
+
+        for pattern in compiled:
+            for text in texts:
+                expected = pattern.regex.search(text)
+                actual = pattern.search(text)
+                assert (actual and actual.span()) == (expected and expected.span()), pattern.regex.pattern
+
+    def test_patterns_work_without_the_regex_parser(self, monkeypatch):
+        """Test that patterns still match, without a pre-check, when the parser is unavailable."""
+        from plana.documents import patterns
+
+        monkeypatch.setattr(patterns, "_sre_parse", None)
+        compiled = patterns._CompiledPattern(r"(\d+)\s*parking\s*spaces", 0)
+
+        assert compiled.literals == ()
+        assert compiled.search("2 parking spaces").group(1) == "2"
+
+
+class TestConsumers:
+    """Tests for the extractors built on the registry."""
+
+    def test_planning_facts_follow_document_priority(self):
+        """Test that facts come from the preferred document, with its title."""
+        from plana.documents.ingestion import (
+            DocumentCategory,
+            DocumentIngestionResult,
+            extract_planning_facts,
+        )
+
+        docs = [
+            _doc("a", "Planning statement", DocumentCategory.PLANNING_STATEMENT,
+                 "The ridge height: 9.5m.  4 parking spaces."),
+            _doc("b", "Proposed elevations", DocumentCategory.ELEVATION,
+                 "Ridge height 7.9m, eaves height 5.1m.  Obscure glazed side windows."),
+        ]
+        facts = extract_planning_facts(DocumentIngestionResult(documents=docs, total_count=2))
+
+        assert (facts.ridge_height_m, facts.ridge_height_source) == ("7.9", "Proposed elevations")
+        assert (facts.eaves_height_m, facts.eaves_height_source) == ("5.1", "Proposed elevations")
+        assert (facts.parking_spaces, facts.parking_source) == ("4", "Planning statement")
+        # A rule without a number only records the mention
+        assert facts.window_positions is None
+
+    def test_classification(self):
+        """Test filename and content classification through the registry."""
+        from plana.documents.ingestion import (
+            DocumentCategory,
+            _reclassify_from_content,
+            classify_document,
+        )
+
+        assert classify_document("Proposed Site Plan", "", "") == (DocumentCategory.SITE_PLAN, 0.85)
+        assert classify_document("Drawing 12", "", "block plan.pdf") == (DocumentCategory.BLOCK_PLAN, 0.65)
+        assert classify_document("Misc", "", "doc.pdf") == (DocumentCategory.OTHER, 0.3)
+
+        doc = _doc("c", "Scan 004", DocumentCategory.OTHER, "A Biodiversity Net Gain metric and a bat survey")
+        assert _reclassify_from_content(doc).category == DocumentCategory.BNG_REPORT
+
+    def test_document_analysis_and_dimensions(self):
+        """Test that the document analysis and dimension extractors use the rules."""
+        from plana.api.advanced_planning_tools import extract_dimensions_from_text
+        from plana.api.document_analysis import extract_from_text
+
+        data = extract_from_text(
+            "Erection of 2 dwellings.  One-storey.  GIFA: 95 sqm.  Visibility splay 2.4m x 43m.",
+            "das", "das.pdf",
+        )
+        assert data.num_units == 2
+        assert data.num_storeys == 0
+        assert data.total_floor_area_sqm == 95.0
+        assert data.visibility_splay_left == 43.0
+
+        dims = extract_dimensions_from_text("Rear extension 3.5 x 4.2m, 2.7m high")
+        assert (dims.width, dims.depth, dims.height) == (3.5, 4.2, 2.7)
+        assert dims.floor_area == 3.5 * 4.2
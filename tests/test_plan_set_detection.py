@@ -439,3 +439,70 @@ class TestThreeLegRule:
             DocumentCategory.COVER_LETTER,
             DocumentCategory.PHOTOGRAPH,
         ]) is False
+
+
+# ---------------------------------------------------------------------------
+# Stored per-document signals
+# ---------------------------------------------------------------------------
+
+
+class TestStoredPlanSetLegs:
+    """Test plan set detection from signals stored at processing time."""
+
+    def _save(self, db, doc_id, title, metadata=None, signals=True):
+        from plana.documents.processor import SIGNALS_VERSION, document_signals
+        from plana.storage.models import StoredDocument
+
+        db.save_document(StoredDocument(reference="25/00001/FUL", doc_id=doc_id, title=title))
+        metadata_json = json.dumps(metadata) if metadata else None
+        db.mark_document_processed(
+            doc_id,
+            extract_method="pdf_text",
+            extracted_text_chars=0,
+            extracted_metadata_json=metadata_json,
+            signals=document_signals(title, "", "", metadata_json).columns() if signals else None,
+            signals_version=SIGNALS_VERSION,
+        )
+
+    def test_legs_match_check_plan_set_present(self, test_database):
+        """Stored legs give the same answer as reclassifying every document."""
+        from plana.documents.processor import PlanSetLegs, stored_plan_set_legs
+
+        self._save(test_database, "d1", "Location Plan")
+        self._save(test_database, "d2", "Drawing 7", {"document_type_guess": "site plan"})
+        assert stored_plan_set_legs(test_database, "25/00001/FUL") == (
+            PlanSetLegs.LOCATION | PlanSetLegs.SITE
+        )
+
+        self._save(test_database, "d3", "Scan 12", {"detected_labels": ["elevations"]})
+        assert stored_plan_set_legs(test_database, "25/00001/FUL") == PlanSetLegs.ALL
+        assert check_plan_set_present(
+            [DocumentCategory.LOCATION_PLAN],
+            metadata_guesses=["site plan"],
+            filenames=["Location Plan", "Drawing 7", "Scan 12"],
+            all_detected_labels=["elevations"],
+        ) is True
+
+    def test_missing_signals_are_backfilled(self, test_database):
+        """Documents without signals are classified once and then read from the index."""
+        from plana.documents.processor import SIGNALS_VERSION, PlanSetLegs, stored_plan_set_legs
+
+        self._save(test_database, "d1", "Block plan", signals=False)
+        self._save(test_database, "d2", "Proposed site plan and elevations", signals=False)
+        assert test_database.get_plan_set_legs("25/00001/FUL", SIGNALS_VERSION) is None
+
+        assert stored_plan_set_legs(test_database, "25/00001/FUL") == PlanSetLegs.ALL
+        assert test_database.get_plan_set_legs("25/00001/FUL", SIGNALS_VERSION) == PlanSetLegs.ALL
+        stored = {d.doc_id: d for d in test_database.get_documents("25/00001/FUL")}
+        assert stored["d1"].category == DocumentCategory.BLOCK_PLAN.value
+
+    def test_reset_invalidates_signals(self, test_database):
+        """Resetting a document drops the legs that came from its metadata."""
+        from plana.documents.processor import SIGNALS_VERSION, PlanSetLegs, stored_plan_set_legs
+
+        self._save(test_database, "d1", "Scan 3", {"detected_labels": ["site plan"]})
+        assert stored_plan_set_legs(test_database, "25/00001/FUL") == PlanSetLegs.SITE
+
+        test_database.reset_single_document("d1")
+        assert test_database.get_plan_set_legs("25/00001/FUL", SIGNALS_VERSION) is None
+        assert stored_plan_set_legs(test_database, "25/00001/FUL") == PlanSetLegs.NONE
@@ -0,0 +1,181 @@
+"""
+Unit tests for postcode lookups (plana.location.postcodes).
+
+postcodes.io is replaced by a stub ``_request_json`` so the tests
+exercise the caches, negative caching and bulk batching without network
+access.  The persistent cache lives in a temporary database.
+"""
+
+from pathlib import Path
+
+import pytest
+
+FIXTURE_CSV = Path(__file__).parent / "fixtures" / "postcodes.csv"
+
+KNOWN = {
+    "NE22QU": {"postcode": "NE2 2QU", "latitude": 54.98321, "longitude": -1.60173,
+               "admin_ward": "South Jesmond", "outcode": "NE2", "incode": "2QU"},
+    "NE17RU": {"postcode": "NE1 7RU", "latitude": 54.97389, "longitude": -1.61265,
+               "admin_ward": "Monument", "outcode": "NE1", "incode": "7RU"},
+}
+
+
+class _StubPostcodesIO:
+    """Records postcodes.io requests and answers from ``KNOWN``."""
+
+    def __init__(self):
+        self.gets: list[str] = []
+        self.posts: list[list[str]] = []
+        self.down = False
+
+    def request_json(self, url, timeout, body=None):
+        if self.down:
+            raise ConnectionError("service unavailable")
+        if body is None:
+            key = url.rsplit("/", 1)[-1]
+            self.gets.append(key)
+            if key in KNOWN:
+                return {"status": 200, "result": KNOWN[key]}
+            return {"status": 404, "result": None}
+        self.posts.append(list(body["postcodes"]))
+        return {"status": 200, "result": [
+            {"query": key, "result": KNOWN.get(key)} for key in body["postcodes"]
+        ]}
+
+
+@pytest.fixture
+def stub(test_database, monkeypatch):
+    """Stub postcodes.io and start from empty caches."""
+    import plana.location.postcodes as postcodes_module
+    import plana.storage.database as database_module
+
+    stub = _StubPostcodesIO()
+    postcodes_module._memory_cache.clear()
+    postcodes_module.set_postcode_table(None)
+    monkeypatch.setattr(database_module, "_database", test_database)
+    monkeypatch.setattr(postcodes_module, "_request_json", stub.request_json)
+    yield stub
+    postcodes_module._memory_cache.clear()
+
+
+class TestPostcodeCache:
+    """Tests for the memory and persistent postcode caches."""
+
+    def test_repeat_lookups_are_cached(self, stub):
+        """Test that a postcode is fetched once, whatever its formatting."""
+        from plana.location.postcodes import lookup_postcode
+
+        first = lookup_postcode("NE2 2QU")
+        second = lookup_postcode(" ne22qu ")
+
+        assert stub.gets == ["NE22QU"]
+        assert first.ward == second.ward == "South Jesmond"
+        assert first is not second
+
+    def test_results_survive_memory_cache_loss(self, stub):
+        """Test that a restart (empty memory cache) reuses stored lookups."""
+        from plana.location.postcodes import _memory_cache, get_postcode_cache_stats, lookup_postcode
+
+        lookup_postcode("NE2 2QU")
+        _memory_cache.clear()
+        hits = get_postcode_cache_stats()["persistent_hits"]
+        result = lookup_postcode("NE2 2QU")
+
+        assert stub.gets == ["NE22QU"]
+        assert result.latitude == 54.98321
+        assert get_postcode_cache_stats()["persistent_hits"] == hits + 1
+
+    def test_unknown_postcodes_are_negatively_cached(self, stub):
+        """Test that a 404 is remembered rather than retried."""
+        from plana.location.postcodes import _memory_cache, lookup_postcode
+
+        assert lookup_postcode("ZZ1 1ZZ") is None
+        _memory_cache.clear()
+        assert lookup_postcode("ZZ1 1ZZ") is None
+
+        assert stub.gets == ["ZZ11ZZ"]
+
+    def test_failures_use_short_ttl(self, stub, monkeypatch):
+        """Test that failed requests are retried once their TTL expires."""
+        import plana.location.postcodes as postcodes_module
+
+        monkeypatch.setattr(postcodes_module, "_ERROR_TTL", -1)
+        stub.down = True
+        assert postcodes_module.lookup_postcode("NE2 2QU") is None
+        assert postcodes_module.get_postcode_cache_stats()["failures"] >= 1
+
+        stub.down = False
+        assert postcodes_module.lookup_postcode("NE2 2QU") is not None
+        assert stub.gets == ["NE22QU"]
+
+
+class TestBulkLookup:
+    """Tests for bulk lookups."""
+
+    def test_bulk_lookup_batches_misses(self, stub, monkeypatch):
+        """Test that only uncached postcodes are sent, in batches of the limit."""
+        import plana.location.postcodes as postcodes_module
+
+        monkeypatch.setattr(postcodes_module, "_BULK_LIMIT", 2)
+        postcodes_module.lookup_postcode("NE2 2QU")
+
+        postcodes = ["NE2 2QU", "ne1 7ru", "ZZ1 1ZZ", "ZZ2 2ZZ", "ZZ3 3ZZ"]
+        results = postcodes_module.bulk_lookup_postcodes(postcodes)
+
+        assert stub.posts == [["NE17RU", "ZZ11ZZ"], ["ZZ22ZZ", "ZZ33ZZ"]]
+        assert list(results) == postcodes
+        assert results["ne1 7ru"].ward == "Monument"
+        assert results["ZZ1 1ZZ"] is None
+
+        # Everything, including the unknown postcodes, is now cached
+        postcodes_module.bulk_lookup_postcodes(postcodes)
+        assert len(stub.posts) == 2
+
+
+class TestPostcodeTable:
+    """Tests for the offline postcode centroid table."""
+
+    def test_csv_lookup(self):
+        """Test lookups from a CSV extract, skipping rows without a grid reference."""
+        from plana.location.postcode_table import PostcodeTable
+
+        table = PostcodeTable.load(FIXTURE_CSV)
+
+        assert len(table) == 6
+        row = table.get("ng162aa")
+        assert row["postcode"] == "NG16 2AA"
+        assert row["outcode"] == "NG16"
+        assert row["admin_ward"] == "Eastwood St Marys"
+        assert row["latitude"] == pytest.approx(53.01747, abs=1e-5)
+        assert table.get("SW1A 1AA")["admin_district"] == "Westminster"
+        assert table.get("ZZ9 9ZZ") is None
+        assert table.get("NE2 2QV") is None
+
+    def test_table_file_round_trip(self, tmp_path):
+        """Test that the binary table reproduces the CSV rows."""
+        from plana.location.postcode_table import PostcodeTable, build_table
+
+        source = PostcodeTable.from_csv(FIXTURE_CSV)
+        build_table(FIXTURE_CSV, tmp_path / "postcodes.tbl")
+        loaded = PostcodeTable.load(tmp_path / "postcodes.tbl")
+
+        assert len(loaded) == len(source)
+        for postcode in ["NE2 2QU", "NE1 7RU", "NE5 3BX", "NG16 2AA", "NG9 1AB", "SW1A 1AA", "AB1 2CD"]:
+            assert loaded.get(postcode) == source.get(postcode)
+
+    def test_table_answers_without_network(self, stub):
+        """Test that a configured table is used before postcodes.io."""
+        from plana.location.postcode_table import PostcodeTable
+        from plana.location.postcodes import bulk_lookup_postcodes, lookup_postcode, set_postcode_table
+
+        set_postcode_table(PostcodeTable.load(FIXTURE_CSV))
+        try:
+            result = lookup_postcode("NE5 3BX")
+            results = bulk_lookup_postcodes(["NE1 7RU", "NE2 2QU"])
+        finally:
+            set_postcode_table(None)
+
+        assert stub.gets == [] and stub.posts == []
+        assert result.ward == "Westerhope"
+        assert result.outcode == "NE5"
+        assert results["NE1 7RU"].ward == "Monument"
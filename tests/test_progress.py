@@ -5,6 +5,7 @@ Tests step-by-step progress output with timing and error handling.
 """
 
 import io
+import time
 import pytest
 from unittest.mock import patch
 
@@ -265,6 +266,43 @@ class TestProgressOutputFormat:
         result = output.getvalue()
         assert "ms)" in result  # Timing format: "Done (Xms)"
 
+    def test_background_steps_report_overlapping_timings(self):
+        """Test that a step begun in the background is timed from its start and shown in a timeline."""
+        output = io.StringIO()
+        logger = ProgressLogger(mode="live", verbose=True, output_stream=output)
+        logger.start_pipeline("REF001", "newcastle")
+
+        logger.begin_step("retrieve_policies")
+        logger.start_step("fetch_documents")
+        time.sleep(0.02)
+        logger.end_step("retrieve_policies")
+        time.sleep(0.02)
+        logger.complete_step("Done")
+        logger.start_step("retrieve_policies")
+        time.sleep(0.02)
+        policies = logger.complete_step("Done")
+
+        fetch = logger.step_results[0]
+        assert policies.started_ms <= fetch.started_ms
+        assert 15 <= policies.duration_ms < fetch.duration_ms  # Ended before it was reported
+
+        result = logger.complete_pipeline(success=True)
+        assert [s["started_ms"] for s in result["steps"]] == [fetch.started_ms, policies.started_ms]
+        assert "Step timeline:" in output.getvalue()
+
+    def test_sequential_steps_print_no_timeline(self):
+        """Test that the timeline is only printed when steps overlapped."""
+        output = io.StringIO()
+        logger = ProgressLogger(mode="demo", verbose=True, output_stream=output)
+        logger.start_pipeline("REF001", "newcastle")
+        for step in ("init", "load_fixture"):
+            logger.start_step(step)
+            logger.complete_step("Done")
+
+        logger.complete_pipeline(success=True)
+
+        assert "Step timeline:" not in output.getvalue()
+
 
 class TestDocumentProgressOutput:
     """Tests for document download progress output."""
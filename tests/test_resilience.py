@@ -0,0 +1,158 @@
+"""
+Unit tests for per-host rate limiting, retries and circuit breaking (plana.core.resilience).
+"""
+
+import pytest
+
+
+def _flaky(failures, error, result="ok"):
+    """A callable failing with ``error`` ``failures`` times, then returning ``result``."""
+    calls = []
+
+    def call():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error
+        return result
+
+    return call, calls
+
+
+class TestTokenBucket:
+    """Tests for request spacing."""
+
+    def test_burst_then_spacing(self):
+        """Test that a burst is free and later tokens wait for the refill rate."""
+        from plana.core.resilience import TokenBucket
+
+        bucket = TokenBucket(rate=10.0, burst=2)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+        assert TokenBucket(rate=0).reserve() == 0.0
+
+
+class TestHostPolicy:
+    """Tests for retries, the retry budget and the circuit breaker."""
+
+    def test_retries_transient_errors_only(self):
+        """Test that 5xx responses are retried and a 404 is raised at once."""
+        from plana.core.resilience import HostPolicy, RetryableHTTPStatus
+
+        policy = HostPolicy("example.org", rate=0, base_delay=0)
+        call, calls = _flaky(2, RetryableHTTPStatus(503))
+        assert policy.call_sync(call) == "ok"
+        assert len(calls) == 3
+
+        call, calls = _flaky(5, LookupError("404"))
+        with pytest.raises(LookupError):
+            policy.call_sync(call)
+        assert len(calls) == 1
+        assert policy.breaker.state == "closed"
+
+    def test_long_retry_after_is_not_waited(self):
+        """Test that a Retry-After beyond max_delay gives up instead of sleeping."""
+        from plana.core.resilience import HostPolicy, RetryableHTTPStatus
+
+        policy = HostPolicy("example.org", rate=0, max_delay=1.0)
+        call, calls = _flaky(1, RetryableHTTPStatus(429, retry_after=120))
+
+        with pytest.raises(RetryableHTTPStatus):
+            policy.call_sync(call)
+        assert len(calls) == 1
+
+    def test_retry_budget_is_shared(self):
+        """Test that an exhausted budget stops retries on every host."""
+        from plana.core.resilience import HostPolicy, RetryableHTTPStatus, RetryBudget
+
+        budget = RetryBudget(ratio=0.0, reserve=2.0)
+        first = HostPolicy("a.example.org", rate=0, base_delay=0, budget=budget)
+        second = HostPolicy("b.example.org", rate=0, base_delay=0, budget=budget)
+
+        call, calls = _flaky(10, RetryableHTTPStatus(502))
+        with pytest.raises(RetryableHTTPStatus):
+            first.call_sync(call)
+        assert len(calls) == 3  # Two retries spent the budget
+
+        call, calls = _flaky(10, RetryableHTTPStatus(502))
+        with pytest.raises(RetryableHTTPStatus):
+            second.call_sync(call)
+        assert len(calls) == 1
+        assert budget.denied == 1
+
+    def test_circuit_opens_and_recovers(self, monkeypatch):
+        """Test that a failing host fails fast, then one probe closes the circuit."""
+        import plana.core.resilience as resilience
+        from plana.core.exceptions import CircuitOpenError
+
+        now = [100.0]
+        monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+        policy = resilience.HostPolicy(
+            "gis.example.org", rate=0, max_attempts=1,
+            failure_threshold=3, reset_timeout=30,
+        )
+        call, calls = _flaky(3, TimeoutError("timed out"))
+        for _ in range(3):
+            with pytest.raises(TimeoutError):
+                policy.call_sync(call)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            policy.call_sync(call)
+        assert exc_info.value.retry_after == 30
+        assert len(calls) == 3  # No request was made
+
+        now[0] += 31
+        assert policy.call_sync(call) == "ok"
+        assert policy.stats["circuit"] == "closed"
+        assert (policy.stats["circuit_opened"], policy.stats["rejected"]) == (1, 1)
+
+    def test_hosts_share_one_policy(self):
+        """Test that URLs on the same host get the same policy."""
+        from plana.core.resilience import get_host_policy, get_resilience_stats
+
+        policy = get_host_policy("https://Portal.example.org/planning/index.html", rate=1.0, burst=1)
+
+        assert get_host_policy("https://portal.example.org/files/1.pdf") is policy
+        assert policy.bucket.rate == 1.0
+        assert "portal.example.org" in get_resilience_stats()["hosts"]
+
+
+class TestNewcastleAdapterRequests:
+    """Tests for the portal adapter's use of the host policy."""
+
+    def test_unavailable_portal_fails_fast(self):
+        """Test that repeated 503s become PortalAccessError and then skip the network."""
+        pytest.importorskip("httpx")
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from plana.ingestion.base import PortalAccessError
+        from plana.ingestion.newcastle import NewcastleAdapter
+
+        adapter = NewcastleAdapter()
+        adapter._host.bucket.rate = 0
+        adapter._host.base_delay = 0
+        response = MagicMock(status_code=503, headers={}, text="Service Unavailable")
+        client = MagicMock()
+        client.get = AsyncMock(return_value=response)
+
+        async def fetch_three_times():
+            errors = []
+            for _ in range(3):
+                with pytest.raises(PortalAccessError) as exc_info:
+                    await adapter._fetch_with_retry("https://portal.newcastle.gov.uk/planning/index.html")
+                errors.append(str(exc_info.value))
+            return errors
+
+        loop = asyncio.new_event_loop()
+        try:
+            with patch.object(adapter, "_get_client", AsyncMock(return_value=client)):
+                errors = loop.run_until_complete(fetch_three_times())
+        finally:
+            loop.close()
+
+        assert "Portal temporarily unavailable" in errors[0]
+        assert "Portal unavailable after repeated failures" in errors[2]
+        assert client.get.await_count == 5  # Threshold reached; the third call never went out
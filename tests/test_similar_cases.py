@@ -0,0 +1,423 @@
+"""
+Unit tests for the similar-case search engine (plana.api.similar_cases).
+
+Covers the compiled case-feature table and its equivalence with the
+per-case scoring helpers.
+"""
+
+import pytest
+
+from plana.storage.models import StoredApplication
+
+
+@pytest.fixture
+def db(test_database, monkeypatch):
+    """Route get_database() to a fresh temporary database."""
+    import plana.storage.database as database_module
+
+    monkeypatch.setattr(database_module, "_database", test_database)
+    return test_database
+
+
+def _decided_app(reference: str, **overrides) -> StoredApplication:
+    fields = dict(
+        reference=reference,
+        council_id="newcastle",
+        address="1 Test Road, Newcastle upon Tyne",
+        proposal="Single storey rear extension to semi-detached house",
+        application_type="Householder",
+        decision="Approved",
+        decision_date="2025-03-01",
+        postcode="NE2 2QU",
+        constraints_json='["Conservation Area"]',
+    )
+    fields.update(overrides)
+    return StoredApplication(**fields)
+
+
+class TestCaseFeatures:
+    """Tests for compiled case features."""
+
+    def test_compiled_fields(self):
+        """Test that query-independent fields are extracted once."""
+        from plana.api.similar_cases import compile_case_features
+
+        features = compile_case_features({
+            "reference": "X/1",
+            "proposal": "Erection of two storey detached dwelling with parking",
+            "application_type": "Full Planning",
+            "constraints": ["Green Belt"],
+            "postcode": "NG16 2AB",
+            "ward": "Greasley",
+        })
+
+        assert features.dev_type == "new_dwelling"
+        assert features.storeys == 2
+        assert features.form == "detached"
+        assert features.green_belt is True
+        assert features.outcode == "NG16"
+        assert features.sector == "NG16 2"
+        assert features.postcode_area == "NG"
+        assert features.ward_lower == "greasley"
+
+    # Scores computed by the per-case scorer before the feature table was
+    # introduced: (query, council, case index, expected score)
+    _QUERIES = {
+        "conservation": (
+            ("newcastle", 0), ["Conservation Area", "Unlisted Constraint"], "NE2 2DJ",
+        ),
+        "green_belt": (("broxtowe", 0), ["Green Belt"], "NG16 2AB"),
+    }
+    _EXPECTED_SCORES = [
+        ("conservation", "newcastle", 0, 0.8816666666666666),
+        ("conservation", "newcastle", 1, 0.6504166666666666),
+        ("conservation", "newcastle", 3, 0.665709219858156),
+        ("conservation", "broxtowe", 2, 0.05067567567567567),
+        ("green_belt", "newcastle", 10, 0.3993243243243243),
+        ("green_belt", "broxtowe", 0, 0.735),
+        ("green_belt", "broxtowe", 4, 0.4436486486486486),
+        ("green_belt", "broxtowe", 5, 0.6935593220338983),
+    ]
+
+    @pytest.mark.parametrize("query_name,council,index,expected", _EXPECTED_SCORES)
+    def test_scoring_matches_recorded_scores(self, query_name, council, index, expected):
+        """Test that case scoring reproduces the per-case scorer's results."""
+        from plana.api.similar_cases import (
+            ALL_HISTORIC_CASES,
+            _score_case_features,
+            calculate_similarity_score,
+            compile_case_features,
+            compile_query_features,
+        )
+
+        (query_council, query_index), constraints, postcode = self._QUERIES[query_name]
+        query_case = ALL_HISTORIC_CASES[query_council][query_index]
+        case = ALL_HISTORIC_CASES[council][index]
+        query = compile_query_features(
+            query_case["proposal"], query_case["application_type"], constraints,
+            query_case["ward"], postcode,
+        )
+
+        assert _score_case_features(compile_case_features(case), query) == pytest.approx(expected)
+        assert calculate_similarity_score(
+            case, query_case["proposal"], query_case["application_type"],
+            constraints, query_case["ward"], postcode,
+        ) == pytest.approx(expected)
+
+
+    def test_constraints_interned_concurrently_get_distinct_bits(self):
+        """Test that new constraints interned from several threads never share a bit."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from plana.api.similar_cases import _constraint_bit
+
+        names = [f"test constraint {i}" for i in range(64)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            bits = list(pool.map(_constraint_bit, names))
+
+        assert len(set(bits)) == len(names)
+        assert bits == [_constraint_bit(name) for name in names]
+
+
+class TestCaseFeatureTable:
+    """Tests for the per-council feature table."""
+
+    def test_table_reused_until_corpus_changes(self, db):
+        """Test that the table is rebuilt only when stored decisions change."""
+        from plana.api.similar_cases import get_case_feature_table
+
+        first = get_case_feature_table("newcastle")
+        assert get_case_feature_table("newcastle") is first
+
+        db.save_application(_decided_app("2025/0001/01/DET"))
+        second = get_case_feature_table("newcastle")
+
+        assert second is not first
+        assert len(second) == len(first) + 1
+        # Static rows are carried over rather than recompiled
+        assert second.features[0] is first.features[0]
+
+    def test_decisions_applied_incrementally(self, db, monkeypatch):
+        """Test that recorded decisions extend the corpus without a DB reload."""
+        from plana.api.similar_cases import CaseFeatureTable, get_case_feature_table
+
+        db.save_application(_decided_app("2025/0005/01/DET"))
+        first = get_case_feature_table("newcastle")
+        first.matrix, first.spatial  # built lazily; carried over on extend
+
+        def _no_reload(*args, **kwargs):
+            raise AssertionError("corpus reloaded from the DB")
+
+        monkeypatch.setattr(db, "get_completed_applications", _no_reload)
+        db.save_application(_decided_app("2025/0006/01/DET", postcode="NE6 1AA"))
+        db.save_application(_decided_app("2025/0007/01/DET", council_id="broxtowe"))
+        second = get_case_feature_table("newcastle")
+
+        assert [f.reference for f in second.features[len(first):]] == ["2025/0006/01/DET"]
+        assert second.ref_index["2025/0006/01/DET"] == len(first)
+        assert get_case_feature_table("newcastle") is second
+
+        # Incrementally extended indexes agree with a fresh build
+        fresh = CaseFeatureTable.build(second.cases[:len(first)], second.cases[len(first):])
+        assert second.spatial.candidates(second.features[-1], 15.0) == \
+            fresh.spatial.candidates(fresh.features[-1], 15.0)
+        if second.matrix is not None:
+            query = second.features[-1]
+            assert second.matrix.rank(query, limit=10) == fresh.matrix.rank(query, limit=10)
+
+    def test_changed_precedent_triggers_reload(self, db):
+        """Test that re-recording an existing precedent recompiles the corpus."""
+        from plana.api.similar_cases import get_case_feature_table
+
+        db.save_application(_decided_app("2025/0008/01/DET"))
+        get_case_feature_table("newcastle")
+        db.save_application(_decided_app("2025/0008/01/DET", decision="Refused"))
+
+        table = get_case_feature_table("newcastle")
+        row = table.ref_index["2025/0008/01/DET"]
+        assert table.cases[row]["decision"] == "Refused"
+
+    def test_undecided_coordinate_update_keeps_table(self, db, monkeypatch):
+        """Test that locating an undecided application leaves the corpus alone."""
+        from plana.api.similar_cases import get_case_feature_table
+
+        db.save_application(_decided_app("2025/0010/01/DET", decision=None))
+        first = get_case_feature_table("newcastle")
+
+        def _no_reload(*args, **kwargs):
+            raise AssertionError("corpus reloaded from the DB")
+
+        monkeypatch.setattr(db, "get_completed_applications", _no_reload)
+        db.update_coordinates("2025/0010/01/DET", 54.98, -1.61)
+
+        assert get_case_feature_table("newcastle") is first
+
+    def test_precedent_updates_applied_without_reload(self, db, monkeypatch):
+        """Test that moved and withdrawn precedents are applied from the change feed."""
+        from plana.api.similar_cases import get_case_feature_table
+
+        db.save_application(_decided_app("2025/0011/01/DET"))
+        db.save_application(_decided_app("2025/0012/01/DET"))
+        first = get_case_feature_table("newcastle")
+
+        def _no_reload(*args, **kwargs):
+            raise AssertionError("corpus reloaded from the DB")
+
+        monkeypatch.setattr(db, "get_completed_applications", _no_reload)
+
+        # Unchanged coordinates are not a change
+        db.update_coordinates("2025/0011/01/DET", 54.98, -1.61)
+        moved = get_case_feature_table("newcastle")
+        db.update_coordinates("2025/0011/01/DET", 54.98, -1.61)
+        assert get_case_feature_table("newcastle") is moved
+
+        row = moved.ref_index["2025/0011/01/DET"]
+        assert (moved.cases[row]["latitude"], moved.cases[row]["longitude"]) == (54.98, -1.61)
+        assert len(moved) == len(first)
+
+        db.save_application(_decided_app("2025/0012/01/DET", decision=None))
+        withdrawn = get_case_feature_table("newcastle")
+
+        assert "2025/0012/01/DET" not in withdrawn.ref_index
+        assert len(withdrawn) == len(first) - 1
+        # Unchanged rows are carried over rather than recompiled
+        assert withdrawn.features[0] is first.features[0]
+
+    def test_stored_decision_is_searchable(self, db):
+        """Test that a decided application in the DB becomes precedent."""
+        from plana.api.similar_cases import find_similar_cases
+
+        db.save_application(_decided_app("2025/0002/01/DET"))
+
+        results = find_similar_cases(
+            proposal="Single storey rear extension to semi-detached house",
+            application_type="Householder",
+            constraints=["Conservation Area"],
+            postcode="NE2 2QU",
+            council_id="newcastle",
+            limit=20,
+        )
+        assert "2025/0002/01/DET" in {c.reference for c in results}
+
+        # ...but an application is never its own precedent
+        results = find_similar_cases(
+            proposal="Single storey rear extension to semi-detached house",
+            application_type="Householder",
+            constraints=["Conservation Area"],
+            postcode="NE2 2QU",
+            council_id="newcastle",
+            reference="2025/0002/01/DET",
+            limit=20,
+        )
+        assert "2025/0002/01/DET" not in {c.reference for c in results}
+
+    def test_feedback_boosts_reloaded_only_when_feedback_changes(self, db, monkeypatch):
+        """Test that repeat searches reuse feedback boosts until feedback is saved."""
+        from plana.api.similar_cases import find_similar_cases
+        from tests.factories import FeedbackFactory
+
+        calls = []
+        outcomes = db.get_feedback_outcomes
+
+        def _counting_outcomes(references=None):
+            calls.append(references)
+            return outcomes(references)
+
+        monkeypatch.setattr(db, "get_feedback_outcomes", _counting_outcomes)
+
+        def search():
+            return find_similar_cases(
+                proposal="Single storey rear extension to semi-detached house",
+                application_type="Householder",
+                constraints=["Conservation Area"],
+                postcode="NE2 2QU",
+                council_id="newcastle",
+                reference="2025/0009/01/DET",
+            )
+
+        search()
+        search()
+        assert len(calls) == 1
+
+        db.save_feedback(FeedbackFactory.create(reference="2025/0009/01/DET"))
+        search()
+        assert len(calls) == 2
+
+
+class TestCaseMatrix:
+    """Tests for vectorised scoring over the feature table."""
+
+    @pytest.fixture
+    def table(self, db):
+        from plana.api.similar_cases import get_case_feature_table
+
+        pytest.importorskip("numpy")
+        db.save_application(_decided_app("2025/0003/01/DET"))
+        db.save_application(_decided_app(
+            "2019/0004/01/DET", decision_date="2019-06-01", postcode="NE6 1AA",
+            proposal="Erection of two storey side extension",
+        ))
+        return get_case_feature_table("newcastle")
+
+    def test_rank_matches_python_ranking(self, table):
+        """Test that vectorised ranking reproduces the per-case ranking."""
+        from plana.api.similar_cases import _rank_cases_python, compile_query_features
+
+        queries = [
+            ("Single storey rear extension to semi-detached house", "Householder",
+             ["Conservation Area"], "", "NE2 2QU", None, None),
+            ("Erection of two storey detached dwelling", "Full Planning",
+             [], "Gosforth", "NE3 1AB", 55.0, -1.6),
+            ("Change of use of shop to restaurant", "Full Planning",
+             ["Listed Building"], "", "", None, None),
+        ]
+        for proposal, app_type, constraints, ward, postcode, lat, lng in queries:
+            query = compile_query_features(
+                proposal, app_type, constraints, ward, postcode, lat, lng,
+            )
+            for limit in (1, 5, 50):
+                expected = _rank_cases_python(table, query, "2025/0003/01/DET", limit)
+                actual = table.matrix.rank(query, "2025/0003/01/DET", limit)
+                assert [i for i, _ in actual] == [i for i, _ in expected]
+                for (_, a), (_, e) in zip(actual, expected):
+                    assert a == pytest.approx(e, abs=1e-9)
+
+    def test_decay_factors_match_table(self, table):
+        """Test that per-row decay matches the table's pure-Python decay."""
+        from datetime import date
+
+        today = date(2026, 1, 1).toordinal()
+        assert list(table.matrix.decay_factors(today)) == table.decay_factors(today)
+
+
+class TestSpatialIndex:
+    """Tests for radius-bounded candidate retrieval."""
+
+    @staticmethod
+    def _features(points):
+        from plana.api.similar_cases import compile_case_features
+
+        return [
+            compile_case_features({
+                "reference": f"S/{i}",
+                "proposal": "Single storey rear extension",
+                "application_type": "Householder",
+                "postcode": postcode,
+                "latitude": lat,
+                "longitude": lng,
+            })
+            for i, (lat, lng, postcode) in enumerate(points)
+        ]
+
+    def test_within_radius(self):
+        """Test that only rows inside the radius are returned."""
+        from plana.api.spatial_index import SpatialIndex
+
+        index = SpatialIndex(self._features([
+            (54.97, -1.61, ""),   # Newcastle centre
+            (55.01, -1.58, ""),   # ~5km away
+            (54.91, -1.38, ""),   # Sunderland, ~16km away
+            (53.48, -2.24, ""),   # Manchester
+        ]))
+
+        assert sorted(index.within_radius(54.97, -1.61, 15.0)) == [0, 1]
+        assert sorted(index.within_radius(54.97, -1.61, 30.0)) == [0, 1, 2]
+
+    def test_candidate_stages_widen(self, monkeypatch):
+        """Test that stages widen and end with the whole corpus."""
+        import plana.api.spatial_index as spatial_module
+        from plana.api.similar_cases import compile_query_features
+
+        monkeypatch.setattr(spatial_module, "_MIN_INDEXED_CORPUS", 0)
+        index = spatial_module.SpatialIndex(self._features([
+            (54.97, -1.61, ""),
+            (54.91, -1.38, ""),
+            (54.70, -1.20, ""),
+            (0, 0, "NE2 2QU"),    # same outcode, no coordinates
+            (53.48, -2.24, ""),
+            (51.50, -0.12, ""),
+            (51.45, -2.58, ""),
+            (52.48, -1.90, ""),
+        ]))
+        query = compile_query_features(
+            "Rear extension", "Householder", [], "", "NE2 1AB", 54.97, -1.61,
+        )
+
+        stages = list(index.candidate_stages(query))
+        assert stages == [[0, 3], [0, 1, 3], None]
+
+    def test_small_corpus_is_scored_in_full(self):
+        """Test that small corpora skip spatial pruning."""
+        from plana.api.spatial_index import SpatialIndex
+        from plana.api.similar_cases import compile_query_features
+
+        index = SpatialIndex(self._features([(54.97, -1.61, "")]))
+        query = compile_query_features("Rear extension", "Householder", [], "", "", 54.97, -1.61)
+
+        assert list(index.candidate_stages(query)) == [None]
+
+    def test_find_similar_cases_widens_when_too_few(self, db, monkeypatch):
+        """Test that a sparse neighbourhood falls back to distant precedent."""
+        import plana.api.spatial_index as spatial_module
+        from plana.api.similar_cases import find_similar_cases
+
+        monkeypatch.setattr(spatial_module, "_MIN_INDEXED_CORPUS", 0)
+        nearby = find_similar_cases(
+            proposal="Single storey rear extension to semi-detached house",
+            application_type="Householder",
+            constraints=["Conservation Area"],
+            postcode="NE2 2QU",
+            limit=3,
+        )
+        assert len(nearby) == 3
+
+        # A query far from every case still finds precedent by widening
+        remote = find_similar_cases(
+            proposal="Single storey rear extension to semi-detached house",
+            application_type="Householder",
+            constraints=["Conservation Area"],
+            latitude=50.1,
+            longitude=-5.5,
+            limit=3,
+        )
+        assert len(remote) == 3
@@ -0,0 +1,87 @@
+"""
+Unit tests for per-request application snapshots (plana.storage.snapshot).
+"""
+
+import pytest
+
+
+class _CountingDatabase:
+    """Wraps a Database and counts the application/document reads."""
+
+    def __init__(self, db):
+        self._db = db
+        self.calls: list[str] = []
+
+    def get_application(self, reference):
+        self.calls.append("get_application")
+        return self._db.get_application(reference)
+
+    def get_documents(self, reference):
+        self.calls.append("get_documents")
+        return self._db.get_documents(reference)
+
+
+@pytest.fixture
+def stored(test_database):
+    """An application with a processed plan, a processed statement and a queued doc."""
+    from plana.storage.models import StoredApplication, StoredDocument
+
+    test_database.save_application(StoredApplication(
+        reference="2025/0101/01/DET", council_id="newcastle",
+        address="1 High Street", proposal="Rear extension", applicant_name="A Smith",
+    ))
+    docs = [
+        ("d1", "Proposed elevations", "Ridge height 6.1m", True),
+        ("d2", "Design and access statement", "A longer statement of the design approach", False),
+        ("d3", "Site photos", None, False),
+    ]
+    for doc_id, title, text, is_plan in docs:
+        test_database.save_document(StoredDocument(
+            reference="2025/0101/01/DET", doc_id=doc_id, title=title, doc_type="plans",
+        ))
+        if text is not None:
+            test_database.mark_document_processed(
+                doc_id, extract_method="pdf_text", extracted_text_chars=len(text),
+                extracted_text=text, is_plan_or_drawing=is_plan,
+            )
+    return test_database
+
+
+class TestApplicationSnapshot:
+    """Tests for loading and reusing a snapshot."""
+
+    def test_rows_are_read_once(self, stored):
+        """Test that every view of the documents comes from one read."""
+        from plana.storage.snapshot import ApplicationSnapshot
+
+        db = _CountingDatabase(stored)
+        snapshot = ApplicationSnapshot.load("2025/0101/01/det", db, alternatives=("2025/0101/01/DET",))
+
+        assert snapshot.reference == "2025/0101/01/DET"
+        assert snapshot.applicant_name == "A Smith"
+        assert db.calls == ["get_application", "get_application"]
+
+        assert snapshot.processed_count() == 2
+        assert [d["filename"] for d in snapshot.report_documents()] == [
+            "Proposed elevations", "Design and access statement", "Site photos",
+        ]
+        assert snapshot.report_documents()[2]["content_text"] == ""
+        snapshot.extracted_texts()
+        assert db.calls == ["get_application", "get_application", "get_documents"]
+
+    def test_extracted_texts_match_database(self, stored):
+        """Test that the snapshot's texts match Database.get_extracted_texts."""
+        from plana.storage.snapshot import ApplicationSnapshot
+
+        snapshot = ApplicationSnapshot("2025/0101/01/DET", db=stored)
+
+        assert snapshot.extracted_texts() == stored.get_extracted_texts("2025/0101/01/DET")
+        assert [t["title"] for t in snapshot.extracted_texts()] == [
+            "Design and access statement", "Proposed elevations",
+        ]
+
+    def test_unknown_reference(self, stored):
+        """Test that loading an unstored application returns None."""
+        from plana.storage.snapshot import ApplicationSnapshot
+
+        assert ApplicationSnapshot.load("2099/0001/01/DET", stored) is None
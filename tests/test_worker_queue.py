@@ -408,3 +408,58 @@ class TestEndToEndStatus:
         assert docs["processed"] == 3
         assert docs["queued"] == 0
         assert docs["total_text_chars"] == 500
+
+
+# ===========================================================================
+# Report pre-generation when a reference's queue drains
+# ===========================================================================
+
+
+class TestReportPrebuild:
+    """Debounced background report builds."""
+
+    @pytest.fixture(autouse=True)
+    def _fast_prebuild(self, monkeypatch):
+        import plana.documents.report_prebuild as prebuild
+
+        monkeypatch.setattr(prebuild, "PREBUILD_DEBOUNCE", 0.05)
+        monkeypatch.setattr(prebuild, "PREBUILD_MAX_DEFER", 0)
+        yield prebuild
+
+    async def test_burst_triggers_one_build(self, tmp_db, monkeypatch, _fast_prebuild):
+        """Several drains inside the debounce window build the report once."""
+        prebuild = _fast_prebuild
+        built = []
+        monkeypatch.setattr(prebuild, "_build", lambda ref, db: built.append(ref) or True)
+        before = prebuild.get_prebuild_stats()
+
+        for _ in range(3):
+            prebuild.schedule_report_prebuild("24/00730/FUL", tmp_db)
+            await asyncio.sleep(0.01)
+        prebuild.schedule_report_prebuild("24/00731/FUL", tmp_db)
+        await asyncio.sleep(0.2)
+
+        stats = prebuild.get_prebuild_stats()
+        assert sorted(built) == ["24/00730/FUL", "24/00731/FUL"]
+        assert stats["debounced"] - before["debounced"] == 2
+        assert stats["built"] - before["built"] == 2
+        assert stats["pending"] == stats["running"] == 0
+
+    async def test_refilled_queue_is_skipped(self, tmp_db, monkeypatch, _fast_prebuild):
+        """A reference with queued documents when the timer fires is not built."""
+        import plana.api.routes.reports as reports_module
+
+        prebuild = _fast_prebuild
+        monkeypatch.setattr(
+            reports_module, "_regenerate_report_from_db",
+            lambda ref: pytest.fail("report built while documents are queued"),
+        )
+        tmp_db.save_document(StoredDocument(
+            reference="24/00730/FUL", doc_id="late", title="Late upload",
+        ))
+        skipped = prebuild.get_prebuild_stats()["skipped"]
+
+        prebuild.schedule_report_prebuild("24/00730/FUL", tmp_db)
+        await asyncio.sleep(0.2)
+
+        assert prebuild.get_prebuild_stats()["skipped"] == skipped + 1